@@ -0,0 +1,37 @@
+"""add job preview transcript
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-19 00:00:00
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "006"
+down_revision: str | None = "005"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "transcription_jobs",
+        sa.Column("preview_object_key", sa.Text(), nullable=True),
+    )
+    op.add_column(
+        "transcription_jobs",
+        sa.Column("preview_model", sa.String(length=80), nullable=True),
+    )
+    op.add_column(
+        "transcription_jobs",
+        sa.Column("preview_available_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("transcription_jobs", "preview_available_at")
+    op.drop_column("transcription_jobs", "preview_model")
+    op.drop_column("transcription_jobs", "preview_object_key")
@@ -0,0 +1,27 @@
+"""add version lyrics
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-19 00:00:00
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "007"
+down_revision: str | None = "006"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "track_versions",
+        sa.Column("lyrics_object_key", sa.Text(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("track_versions", "lyrics_object_key")
@@ -0,0 +1,32 @@
+"""add transcription job type
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-19 00:00:00
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "008"
+down_revision: str | None = "007"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "transcription_jobs",
+        sa.Column(
+            "job_type",
+            sa.String(length=32),
+            nullable=False,
+            server_default="transcription",
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("transcription_jobs", "job_type")
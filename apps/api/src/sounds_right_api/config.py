@@ -1,6 +1,7 @@
 from functools import lru_cache
+from typing import Literal
 
-from pydantic import Field
+from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -19,6 +20,22 @@ class ApiSettings(BaseSettings):
     minio_artifacts_bucket: str = Field(alias="MINIO_ARTIFACTS_BUCKET")
     minio_public_bucket: str = Field(alias="MINIO_PUBLIC_BUCKET")
     minio_secure: bool = Field(default=False, alias="MINIO_SECURE")
+    # "memory" replaces MinIO with an in-process store (load tests only).
+    storage_backend: Literal["minio", "memory"] = Field(
+        default="minio",
+        alias="STORAGE_BACKEND",
+    )
+    # Compression of published artifacts. Browsers read public objects
+    # directly, and not all of them decode zstd.
+    artifact_encoding: Literal["identity", "gzip", "zstd"] = Field(
+        default="gzip",
+        alias="ARTIFACT_ENCODING",
+    )
+    # Must match the worker's prefix: lyrics are stored beside the transcript.
+    transcript_object_prefix: str = Field(
+        default="transcripts",
+        alias="TRANSCRIPT_OBJECT_PREFIX",
+    )
     upload_url_expires_seconds: int = Field(default=900, alias="UPLOAD_URL_EXPIRES_SECONDS")
     max_audio_upload_size_bytes: int = Field(
         default=100 * 1024 * 1024,
@@ -27,6 +44,24 @@ class ApiSettings(BaseSettings):
     kafka_bootstrap_servers: str = Field(alias="KAFKA_BOOTSTRAP_SERVERS")
     kafka_client_id: str = Field(default="sounds-right-local", alias="KAFKA_CLIENT_ID")
     kafka_topic: str = Field(default="sounds-right.events", alias="KAFKA_TOPIC")
+    kafka_commands_topic: str = Field(
+        default="sounds-right.commands",
+        alias="KAFKA_COMMANDS_TOPIC",
+    )
+    # Encoding of published events. Switch to msgpack only once every consumer
+    # reads it; consumers follow each record's content-type header.
+    kafka_event_encoding: Literal["json", "msgpack"] = Field(
+        default="json",
+        alias="KAFKA_EVENT_ENCODING",
+    )
+    # "memory" keeps topics in this process instead of Kafka; it only connects
+    # producers and consumers running in the same process.
+    event_bus_backend: Literal["kafka", "memory"] = Field(
+        default="kafka",
+        alias="EVENT_BUS_BACKEND",
+    )
+    # Confirms that the API and the worker share this process, as "memory" needs.
+    event_bus_in_process: bool = Field(default=False, alias="EVENT_BUS_IN_PROCESS")
     kafka_api_consumer_group: str = Field(
         default="sounds-right-projector",
         alias="KAFKA_API_CONSUMER_GROUP",
@@ -43,6 +78,15 @@ class ApiSettings(BaseSettings):
         alias="CORS_ALLOWED_ORIGINS",
     )
 
+    @model_validator(mode="after")
+    def require_in_process_memory_bus(self) -> "ApiSettings":
+        if self.event_bus_backend == "memory" and not self.event_bus_in_process:
+            raise ValueError(
+                "EVENT_BUS_BACKEND=memory only connects clients in one process; "
+                "set EVENT_BUS_IN_PROCESS=true if the API and the worker run in this one"
+            )
+        return self
+
     @property
     def cors_origins(self) -> list[str]:
         return [origin.strip() for origin in self.cors_allowed_origins.split(",") if origin.strip()]
@@ -5,11 +5,14 @@ from .common import (
     ALLOWED_AUDIO_EXTENSIONS,
     TrackVersionStatus,
     TranscriptionJobStatus,
+    TranscriptionJobType,
     UserRole,
 )
 from .jobs import (
     JobEventPublic,
     JobEventsResponse,
+    PartialTranscriptResponse,
+    PartialTranscriptSegment,
     StartTranscriptionRequest,
     StartTranscriptionResponse,
     TranscriptionJobPublic,
@@ -46,9 +49,12 @@ from .transcripts import (
     TranscriptEngine,
     TranscriptMetadata,
     TranscriptSegment,
+    TranscriptWindow,
+    TranscriptWindowWord,
     TranscriptWord,
 )
 from .versions import (
+    LyricsUpdateRequest,
     TrackVersionCreate,
     TrackVersionPublic,
     UploadCompleteRequest,
@@ -70,6 +76,9 @@ __all__ = [
     "AuthResponse",
     "JobEventPublic",
     "JobEventsResponse",
+    "LyricsUpdateRequest",
+    "PartialTranscriptResponse",
+    "PartialTranscriptSegment",
     "PublicationListResponse",
     "PublicationPublic",
     "PublicationStatus",
@@ -100,11 +109,14 @@ __all__ = [
     "TrackVersionStatus",
     "TranscriptionJobPublic",
     "TranscriptionJobStatus",
+    "TranscriptionJobType",
     "TranscriptionOptions",
     "TranscriptDocument",
     "TranscriptEngine",
     "TranscriptMetadata",
     "TranscriptSegment",
+    "TranscriptWindow",
+    "TranscriptWindowWord",
     "TranscriptWord",
     "UnpublishVersionRequest",
     "UploadCompleteRequest",
@@ -13,6 +13,7 @@ TrackVersionStatus = Literal[
     "rejected",
     "published",
 ]
+TranscriptionJobType = Literal["transcription", "realignment"]
 TranscriptionJobStatus = Literal[
     "queued",
     "started",
@@ -4,15 +4,17 @@ import uuid
 from datetime import datetime
 from typing import Literal
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, computed_field
 
-from .common import TranscriptionJobStatus
+from .common import TranscriptionJobStatus, TranscriptionJobType
 
 
 class TranscriptionOptions(BaseModel):
     language: str = Field(default="auto", min_length=1, max_length=32)
     model: str = Field(default="base", min_length=1, max_length=80)
     separate_vocals: bool = False
+    # Force-align the version's lyrics instead of transcribing, when it has any.
+    align_lyrics: bool = True
 
 
 class StartTranscriptionRequest(BaseModel):
@@ -32,6 +34,7 @@ class TranscriptionJobPublic(BaseModel):
 
     id: uuid.UUID
     track_version_id: uuid.UUID
+    job_type: TranscriptionJobType = "transcription"
     status: TranscriptionJobStatus
     engine: str
     progress: int
@@ -41,6 +44,27 @@ class TranscriptionJobPublic(BaseModel):
     created_at: datetime
     started_at: datetime | None
     completed_at: datetime | None
+    preview_object_key: str | None = None
+    preview_model: str | None = None
+    preview_available_at: datetime | None = None
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def preview_available(self) -> bool:
+        return self.preview_object_key is not None
+
+
+class PartialTranscriptSegment(BaseModel):
+    start: float
+    end: float
+    text: str
+
+
+class PartialTranscriptResponse(BaseModel):
+    job_id: uuid.UUID
+    status: TranscriptionJobStatus
+    decoded_seconds: float
+    segments: list[PartialTranscriptSegment]
 
 
 class JobEventPublic(BaseModel):
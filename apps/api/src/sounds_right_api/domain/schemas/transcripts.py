@@ -21,6 +21,20 @@ class TranscriptSegment(BaseModel):
     words: list[TranscriptWord] = Field(default_factory=list)
 
 
+class TranscriptWindowWord(TranscriptWord):
+    segment_id: int | str
+
+
+class TranscriptWindow(BaseModel):
+    """The segments and words overlapping ``[start, end]`` seconds."""
+
+    start: float
+    end: float
+    segment_count: int
+    segments: list[TranscriptSegment]
+    words: list[TranscriptWindowWord]
+
+
 class TranscriptEngine(BaseModel):
     name: str
     model: str | None = None
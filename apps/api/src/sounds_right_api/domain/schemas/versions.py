@@ -24,6 +24,7 @@ class TrackVersionPublic(BaseModel):
     original_audio_filename: str | None
     audio_content_type: str | None
     audio_size_bytes: int | None
+    lyrics_object_key: str | None = None
     transcript_object_key: str | None = None
     manifest_object_key: str | None = None
     transcript_sha256: str | None = None
@@ -38,6 +39,17 @@ class TrackVersionPublic(BaseModel):
     updated_at: datetime
 
 
+class LyricsUpdateRequest(BaseModel):
+    text: str = Field(min_length=1, max_length=20000)
+
+    @field_validator("text")
+    @classmethod
+    def validate_text(cls, value: str) -> str:
+        if not value.strip():
+            raise ValueError("Lyrics must not be blank")
+        return value
+
+
 class UploadUrlRequest(BaseModel):
     filename: str = Field(min_length=1, max_length=260)
     content_type: str
@@ -3,9 +3,16 @@ import uuid
 from dataclasses import dataclass
 
 from aiokafka import AIOKafkaProducer  # type: ignore[import-untyped]
+from sounds_right_contracts.bus import BusProducer, get_memory_bus
+from sounds_right_contracts.codec import ENCODINGS
+from sounds_right_contracts.events import (
+    COMMAND_EVENT_TYPES,
+    EventEnvelope,
+    encode_event,
+    event_headers,
+)
 
 from sounds_right_api.config import ApiSettings
-from sounds_right_api.events.schemas import EventEnvelope
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +22,9 @@ class EventProducerConfig:
     bootstrap_servers: str
     client_id: str
     topic: str
+    commands_topic: str
+    backend: str = "kafka"
+    content_type: str = ENCODINGS["json"]
 
     @classmethod
     def from_settings(cls, settings: ApiSettings) -> "EventProducerConfig":
@@ -22,19 +32,25 @@ class EventProducerConfig:
             bootstrap_servers=settings.kafka_bootstrap_servers,
             client_id=settings.kafka_client_id,
             topic=settings.kafka_topic,
+            commands_topic=settings.kafka_commands_topic,
+            backend=settings.event_bus_backend,
+            content_type=ENCODINGS[settings.kafka_event_encoding],
         )
 
 
 class EventProducer:
     def __init__(self, config: EventProducerConfig) -> None:
         self.config = config
-        self._producer: AIOKafkaProducer | None = None
+        self._producer: BusProducer | None = None
 
     async def start(self) -> None:
-        self._producer = AIOKafkaProducer(
-            bootstrap_servers=self.config.bootstrap_servers,
-            client_id=self.config.client_id,
-        )
+        if self.config.backend == "memory":
+            self._producer = get_memory_bus().producer()
+        else:
+            self._producer = AIOKafkaProducer(
+                bootstrap_servers=self.config.bootstrap_servers,
+                client_id=self.config.client_id,
+            )
         await self._producer.start()
 
     async def stop(self) -> None:
@@ -46,10 +62,16 @@ class EventProducer:
         if self._producer is None:
             raise RuntimeError("event producer is not started")
 
+        topic = (
+            self.config.commands_topic
+            if event.event_type in COMMAND_EVENT_TYPES
+            else self.config.topic
+        )
         await self._producer.send_and_wait(
-            self.config.topic,
+            topic,
             key=str(key).encode("utf-8"),
-            value=event.model_dump_json().encode("utf-8"),
+            value=encode_event(event, self.config.content_type),
+            headers=event_headers(event.event_type, self.config.content_type),
         )
         logger.info(
             "published event",
@@ -58,6 +80,6 @@ class EventProducer:
                 "event_type": event.event_type,
                 "job_id": str(key),
                 "producer": event.producer,
-                "topic": self.config.topic,
+                "topic": topic,
             },
         )
@@ -8,23 +8,37 @@ from typing import cast
 
 from aiokafka import AIOKafkaConsumer  # type: ignore[import-untyped]
 from litestar import Litestar
-from sqlalchemy import select
-
-from sounds_right_api.config import get_settings
-from sounds_right_api.db.session import SessionLocal
-from sounds_right_api.events.schemas import (
+from sounds_right_contracts.bus import BusConsumer, get_memory_bus
+from sounds_right_contracts.events import (
     EventEnvelope,
     TranscriptionCompletedPayload,
     TranscriptionFailedPayload,
+    TranscriptionPartialPayload,
+    TranscriptionPreviewPayload,
     TranscriptionProgressPayload,
     TranscriptionStartedPayload,
-    event_envelope_adapter,
+    decode_event,
 )
+from sqlalchemy import select
+
+from sounds_right_api.config import get_settings
+from sounds_right_api.db.session import SessionLocal
 from sounds_right_api.models import JobEvent, TrackVersion, TranscriptionJob
 
 logger = logging.getLogger(__name__)
 projector_task: asyncio.Task[None] | None = None
 
+PROJECTED_EVENT_TYPES = frozenset(
+    {
+        "transcription.started",
+        "transcription.progress",
+        "transcription.preview",
+        "transcription.partial",
+        "transcription.completed",
+        "transcription.failed",
+    }
+)
+
 
 async def start_projector(app: Litestar) -> None:
     settings = get_settings()
@@ -46,27 +60,35 @@ async def stop_projector(app: Litestar) -> None:
 
 async def run_projector() -> None:
     settings = get_settings()
-    consumer = AIOKafkaConsumer(
-        settings.kafka_topic,
-        bootstrap_servers=settings.kafka_bootstrap_servers,
-        client_id=f"{settings.kafka_client_id}-projector",
-        group_id=settings.kafka_api_consumer_group,
-        auto_offset_reset="earliest",
-    )
+    consumer: BusConsumer
+    if settings.event_bus_backend == "memory":
+        consumer = get_memory_bus().consumer(
+            settings.kafka_topic,
+            group_id=settings.kafka_api_consumer_group,
+        )
+    else:
+        consumer = AIOKafkaConsumer(
+            settings.kafka_topic,
+            bootstrap_servers=settings.kafka_bootstrap_servers,
+            client_id=f"{settings.kafka_client_id}-projector",
+            group_id=settings.kafka_api_consumer_group,
+            auto_offset_reset="earliest",
+            # Skip events from aborted worker transactions.
+            isolation_level="read_committed",
+        )
     await consumer.start()
     try:
         async for message in consumer:
             try:
-                event = event_envelope_adapter.validate_json(message.value)
+                event = decode_event(
+                    message.value,
+                    event_types=PROJECTED_EVENT_TYPES,
+                    headers=message.headers,
+                )
             except Exception:
                 logger.exception("skipping malformed event")
                 continue
-            if event.event_type not in {
-                "transcription.started",
-                "transcription.progress",
-                "transcription.completed",
-                "transcription.failed",
-            }:
+            if event is None:
                 continue
             await project_event(event)
     finally:
@@ -91,6 +113,8 @@ async def project_event(event: EventEnvelope) -> None:
             (
                 TranscriptionStartedPayload,
                 TranscriptionProgressPayload,
+                TranscriptionPreviewPayload,
+                TranscriptionPartialPayload,
                 TranscriptionCompletedPayload,
                 TranscriptionFailedPayload,
             ),
@@ -107,6 +131,8 @@ async def project_event(event: EventEnvelope) -> None:
         if job.status in {"completed", "failed"} and event.event_type in {
             "transcription.started",
             "transcription.progress",
+            "transcription.preview",
+            "transcription.partial",
         }:
             return
 
@@ -130,10 +156,23 @@ async def project_event(event: EventEnvelope) -> None:
             job.status = "processing"
             job.progress = max(job.progress, payload.progress)
             version.status = "processing"
+        elif isinstance(payload, TranscriptionPreviewPayload):
+            job.status = "processing"
+            job.preview_object_key = payload.preview_object_key
+            job.preview_model = payload.model
+            job.preview_available_at = now
+            version.status = "processing"
+        elif isinstance(payload, TranscriptionPartialPayload):
+            # Segments stay on the job event; the partial endpoint reads them back.
+            job.status = "processing"
+            job.progress = max(job.progress, payload.progress)
+            version.status = "processing"
         elif isinstance(payload, TranscriptionCompletedPayload):
             job.status = "completed"
             job.progress = 100
             job.completed_at = now
+            # The worker replaces the preview with the full transcript.
+            job.preview_object_key = None
             version.status = "completed"
             version.transcript_object_key = payload.transcript_object_key
             version.manifest_object_key = payload.manifest_object_key
@@ -145,7 +184,10 @@ async def project_event(event: EventEnvelope) -> None:
             job.error_code = payload.error_code
             job.error_message = payload.error_message
             job.completed_at = now
-            version.status = "failed"
+            # The worker deletes the preview of a failed run.
+            job.preview_object_key = None
+            # A failed re-alignment leaves the previous transcript untouched.
+            version.status = "completed" if job.job_type == "realignment" else "failed"
 
         session.add(
             JobEvent(
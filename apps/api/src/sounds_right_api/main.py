@@ -49,11 +49,17 @@ def create_app() -> Litestar:
             versions.get_track_version_route,
             versions.create_upload_url_route,
             versions.complete_upload_route,
+            versions.set_version_lyrics_route,
             versions.start_transcription_route,
+            versions.start_realignment_route,
             jobs.get_job_route,
             jobs.list_job_events_route,
+            jobs.job_preview_transcript_route,
+            jobs.job_partial_transcript_route,
             review.review_queue_route,
             review.version_transcript_route,
+            review.version_transcript_window_route,
+            review.version_transcript_seek_route,
             review.review_events_route,
             review.approve_version_route,
             review.reject_version_route,
@@ -64,6 +70,9 @@ def create_app() -> Litestar:
             publications.public_manifest_route,
             publications.public_latest_route,
             publications.public_version_route,
+            publications.public_word_timings_route,
+            publications.public_window_route,
+            publications.public_seek_route,
         ],
         cors_config=CORSConfig(
             allow_origins=settings.cors_origins,
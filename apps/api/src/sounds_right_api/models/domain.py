@@ -108,6 +108,7 @@ class TrackVersion(Base, TimestampMixin):
     original_audio_filename: Mapped[str | None] = mapped_column(Text, nullable=True)
     audio_content_type: Mapped[str | None] = mapped_column(String(120), nullable=True)
     audio_size_bytes: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    lyrics_object_key: Mapped[str | None] = mapped_column(Text, nullable=True)
     transcript_object_key: Mapped[str | None] = mapped_column(Text, nullable=True)
     manifest_object_key: Mapped[str | None] = mapped_column(Text, nullable=True)
     transcript_sha256: Mapped[str | None] = mapped_column(String(64), nullable=True)
@@ -170,6 +171,12 @@ class TranscriptionJob(Base, TimestampMixin):
         ForeignKey("track_versions.id"),
         nullable=False,
     )
+    job_type: Mapped[str] = mapped_column(
+        String(32),
+        nullable=False,
+        default="transcription",
+        server_default="transcription",
+    )
     status: Mapped[str] = mapped_column(String(32), nullable=False)
     engine: Mapped[str] = mapped_column(String(80), nullable=False)
     progress: Mapped[int] = mapped_column(
@@ -187,6 +194,12 @@ class TranscriptionJob(Base, TimestampMixin):
     )
     started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    preview_object_key: Mapped[str | None] = mapped_column(Text, nullable=True)
+    preview_model: Mapped[str | None] = mapped_column(String(80), nullable=True)
+    preview_available_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
 
     track_version: Mapped[TrackVersion] = relationship(back_populates="transcription_jobs")
     events: Mapped[list[JobEvent]] = relationship(back_populates="job")
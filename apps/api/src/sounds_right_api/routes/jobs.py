@@ -6,10 +6,24 @@ from typing import Any
 from litestar import Request, get
 from litestar.exceptions import HTTPException
 
+from sounds_right_api.config import get_settings
 from sounds_right_api.db.session import SessionLocal
-from sounds_right_api.domain.schemas import JobEventsResponse, TranscriptionJobPublic
+from sounds_right_api.domain.schemas import (
+    JobEventsResponse,
+    PartialTranscriptResponse,
+    TranscriptDocument,
+    TranscriptionJobPublic,
+)
 from sounds_right_api.routes.auth import get_current_user_from_request
-from sounds_right_api.services.jobs import JobNotFoundError, get_job, list_job_events
+from sounds_right_api.services.jobs import (
+    JobNotFoundError,
+    PreviewNotAvailableError,
+    get_job,
+    get_partial_transcript,
+    get_preview_transcript,
+    list_job_events,
+)
+from sounds_right_api.services.review import TranscriptMissingError, TranscriptStorageError
 
 
 @get("/api/jobs/{job_id:uuid}")
@@ -36,3 +50,39 @@ async def list_job_events_route(
             return JobEventsResponse(job_id=job_id, events=await list_job_events(session, job_id))
         except JobNotFoundError:
             raise HTTPException(status_code=404, detail="Job not found") from None
+
+
+@get("/api/jobs/{job_id:uuid}/preview")
+async def job_preview_transcript_route(
+    request: Request[Any, Any, Any],
+    job_id: uuid.UUID,
+) -> TranscriptDocument:
+    async with SessionLocal() as session:
+        await get_current_user_from_request(request, session)
+        try:
+            return await get_preview_transcript(session, job_id, get_settings())
+        except JobNotFoundError:
+            raise HTTPException(status_code=404, detail="Job not found") from None
+        except (PreviewNotAvailableError, TranscriptMissingError):
+            raise HTTPException(
+                status_code=404,
+                detail="Preview transcript is not available",
+            ) from None
+        except TranscriptStorageError:
+            raise HTTPException(
+                status_code=500,
+                detail="Preview transcript could not be loaded",
+            ) from None
+
+
+@get("/api/jobs/{job_id:uuid}/partial")
+async def job_partial_transcript_route(
+    request: Request[Any, Any, Any],
+    job_id: uuid.UUID,
+) -> PartialTranscriptResponse:
+    async with SessionLocal() as session:
+        await get_current_user_from_request(request, session)
+        try:
+            return await get_partial_transcript(session, job_id)
+        except JobNotFoundError:
+            raise HTTPException(status_code=404, detail="Job not found") from None
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import uuid
-from typing import Any
+from typing import Any, Literal
 
-from litestar import Request, get, post
+from litestar import Request, Response, get, post
 from litestar.exceptions import HTTPException
+from sounds_right_contracts.word_timings import WORD_TIMINGS_BINARY_CONTENT_TYPE
 
 from sounds_right_api.config import get_settings
 from sounds_right_api.db.session import SessionLocal
@@ -15,6 +16,7 @@ from sounds_right_api.domain.schemas import (
     PublicKaraokeDocument,
     PublicKaraokeManifest,
     PublishVersionRequest,
+    TranscriptWindow,
     UnpublishVersionRequest,
 )
 from sounds_right_api.routes.auth import get_current_user_from_request
@@ -30,6 +32,8 @@ from sounds_right_api.services.publications import (
     get_public_latest,
     get_public_manifest,
     get_public_version,
+    get_public_window,
+    get_public_word_timings,
     get_publication,
     list_publications,
     publish_version,
@@ -40,6 +44,7 @@ from sounds_right_api.services.review import (
     TranscriptMissingError,
     TranscriptStorageError,
 )
+from sounds_right_api.services.transcript_windows import seek_bounds
 
 
 @post("/api/versions/{version_id:uuid}/publish")
@@ -196,3 +201,99 @@ async def public_version_route(
                 status_code=500,
                 detail="Published karaoke version could not be loaded",
             ) from None
+
+
+@get("/api/public/karaoke/{artist_slug:str}/{track_slug:str}/versions/{version:int}/word-timings")
+async def public_word_timings_route(
+    artist_slug: str,
+    track_slug: str,
+    version: int,
+    layout: Literal["json", "binary"] = "json",
+) -> Response[bytes]:
+    async with SessionLocal() as session:
+        try:
+            body = await get_public_word_timings(
+                session,
+                artist_slug,
+                track_slug,
+                version,
+                get_settings(),
+                binary=layout == "binary",
+            )
+        except (PublicationNotFoundError, PublicArtifactMissingError):
+            raise HTTPException(
+                status_code=404,
+                detail="Published word timings not found",
+            ) from None
+        except PublicArtifactStorageError:
+            raise HTTPException(
+                status_code=500,
+                detail="Published word timings could not be loaded",
+            ) from None
+    media_type = WORD_TIMINGS_BINARY_CONTENT_TYPE if layout == "binary" else "application/json"
+    return Response(content=body, media_type=media_type)
+
+
+@get("/api/public/karaoke/{artist_slug:str}/{track_slug:str}/versions/{version:int}/window")
+async def public_window_route(
+    artist_slug: str,
+    track_slug: str,
+    version: int,
+    start: float = 0.0,
+    end: float = 30.0,
+) -> TranscriptWindow:
+    bounded_start = max(start, 0.0)
+    return await _public_window(
+        artist_slug,
+        track_slug,
+        version,
+        bounded_start,
+        max(end, bounded_start),
+    )
+
+
+@get("/api/public/karaoke/{artist_slug:str}/{track_slug:str}/versions/{version:int}/seek")
+async def public_seek_route(
+    artist_slug: str,
+    track_slug: str,
+    version: int,
+    at: float,
+    before: float = 0.0,
+    after: float = 30.0,
+) -> TranscriptWindow:
+    return await _public_window(
+        artist_slug,
+        track_slug,
+        version,
+        *seek_bounds(at, before, after),
+    )
+
+
+async def _public_window(
+    artist_slug: str,
+    track_slug: str,
+    version: int,
+    start: float,
+    end: float,
+) -> TranscriptWindow:
+    async with SessionLocal() as session:
+        try:
+            return await get_public_window(
+                session,
+                artist_slug,
+                track_slug,
+                version,
+                get_settings(),
+                start,
+                end,
+            )
+        except (PublicationNotFoundError, PublicArtifactMissingError):
+            raise HTTPException(
+                status_code=404,
+                detail="Published karaoke version not found",
+            ) from None
+        except PublicArtifactStorageError:
+            raise HTTPException(
+                status_code=500,
+                detail="Published karaoke version could not be loaded",
+            ) from None
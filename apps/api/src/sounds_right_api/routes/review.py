@@ -16,6 +16,7 @@ from sounds_right_api.domain.schemas import (
     ReviewQueueStatus,
     TrackVersionPublic,
     TranscriptDocument,
+    TranscriptWindow,
 )
 from sounds_right_api.routes.auth import get_current_user_from_request
 from sounds_right_api.services.review import (
@@ -27,10 +28,12 @@ from sounds_right_api.services.review import (
     approve_version,
     ensure_reviewer,
     get_transcript,
+    get_transcript_window,
     list_review_events,
     list_review_queue,
     reject_version,
 )
+from sounds_right_api.services.transcript_windows import seek_bounds
 
 
 @get("/api/review/queue")
@@ -74,6 +77,52 @@ async def version_transcript_route(
             ) from None
 
 
+@get("/api/versions/{version_id:uuid}/transcript/window")
+async def version_transcript_window_route(
+    request: Request[Any, Any, Any],
+    version_id: uuid.UUID,
+    start: float = 0.0,
+    end: float = 30.0,
+) -> TranscriptWindow:
+    bounded_start = max(start, 0.0)
+    return await _transcript_window(request, version_id, bounded_start, max(end, bounded_start))
+
+
+@get("/api/versions/{version_id:uuid}/transcript/seek")
+async def version_transcript_seek_route(
+    request: Request[Any, Any, Any],
+    version_id: uuid.UUID,
+    at: float,
+    before: float = 0.0,
+    after: float = 30.0,
+) -> TranscriptWindow:
+    return await _transcript_window(request, version_id, *seek_bounds(at, before, after))
+
+
+async def _transcript_window(
+    request: Request[Any, Any, Any],
+    version_id: uuid.UUID,
+    start: float,
+    end: float,
+) -> TranscriptWindow:
+    async with SessionLocal() as session:
+        await get_current_user_from_request(request, session)
+        try:
+            return await get_transcript_window(session, version_id, get_settings(), start, end)
+        except VersionNotFoundError:
+            raise HTTPException(status_code=404, detail="Version not found") from None
+        except TranscriptMissingError:
+            raise HTTPException(
+                status_code=404,
+                detail="Transcript artifact was not found",
+            ) from None
+        except TranscriptStorageError:
+            raise HTTPException(
+                status_code=500,
+                detail="Transcript artifact could not be loaded",
+            ) from None
+
+
 @get("/api/versions/{version_id:uuid}/review-events")
 async def review_events_route(
     request: Request[Any, Any, Any],
@@ -3,12 +3,13 @@ from __future__ import annotations
 import uuid
 from typing import Any
 
-from litestar import Request, get, post
+from litestar import Request, get, post, put
 from litestar.exceptions import HTTPException
 
 from sounds_right_api.config import get_settings
 from sounds_right_api.db.session import SessionLocal
 from sounds_right_api.domain.schemas import (
+    LyricsUpdateRequest,
     StartTranscriptionRequest,
     StartTranscriptionResponse,
     TrackVersionCreate,
@@ -21,7 +22,9 @@ from sounds_right_api.routes.auth import get_current_user_from_request
 from sounds_right_api.services.jobs import (
     ActiveJobExistsError,
     MissingAudioObjectError,
+    TranscriptNotAvailableError,
     VersionNotUploadedError,
+    start_realignment,
     start_transcription,
 )
 from sounds_right_api.services.jobs import (
@@ -29,6 +32,7 @@ from sounds_right_api.services.jobs import (
 )
 from sounds_right_api.services.versions import (
     InvalidVersionStatusError,
+    LyricsStorageError,
     UploadObjectNotFoundError,
     UploadSessionNotFoundError,
     UploadTooLargeError,
@@ -39,6 +43,7 @@ from sounds_right_api.services.versions import (
     create_upload_url,
     get_track_version,
     list_track_versions,
+    set_version_lyrics,
 )
 
 
@@ -115,6 +120,22 @@ async def complete_upload_route(
             raise HTTPException(status_code=413, detail="Audio file is too large") from None
 
 
+@put("/api/versions/{version_id:uuid}/lyrics")
+async def set_version_lyrics_route(
+    request: Request[Any, Any, Any],
+    version_id: uuid.UUID,
+    data: LyricsUpdateRequest,
+) -> TrackVersionPublic:
+    async with SessionLocal() as session:
+        await get_current_user_from_request(request, session)
+        try:
+            return await set_version_lyrics(session, version_id, data, get_settings())
+        except VersionNotFoundError:
+            raise HTTPException(status_code=404, detail="Version not found") from None
+        except LyricsStorageError:
+            raise HTTPException(status_code=500, detail="Lyrics could not be stored") from None
+
+
 @post("/api/versions/{version_id:uuid}/start-transcription", status_code=202)
 async def start_transcription_route(
     request: Request[Any, Any, Any],
@@ -149,3 +170,37 @@ async def start_transcription_route(
                 status_code=409,
                 detail="A transcription job is already active for this version",
             ) from None
+
+
+@post("/api/versions/{version_id:uuid}/realign", status_code=202)
+async def start_realignment_route(
+    request: Request[Any, Any, Any],
+    version_id: uuid.UUID,
+    data: LyricsUpdateRequest,
+) -> StartTranscriptionResponse:
+    async with SessionLocal() as session:
+        user = await get_current_user_from_request(request, session)
+        try:
+            producer = request.app.state.event_producer
+            return await start_realignment(
+                session,
+                version_id,
+                data,
+                user,
+                producer,
+                get_settings(),
+            )
+        except JobVersionNotFoundError:
+            raise HTTPException(status_code=404, detail="Version not found") from None
+        except TranscriptNotAvailableError:
+            raise HTTPException(
+                status_code=409,
+                detail="Version has no completed transcript to re-align",
+            ) from None
+        except ActiveJobExistsError:
+            raise HTTPException(
+                status_code=409,
+                detail="A transcription job is already active for this version",
+            ) from None
+        except LyricsStorageError:
+            raise HTTPException(status_code=500, detail="Lyrics could not be stored") from None
@@ -3,23 +3,33 @@ from __future__ import annotations
 import uuid
 from typing import cast
 
+from sounds_right_contracts.events import (
+    EventEnvelope,
+    TranscriptionOptionsPayload,
+    TranscriptionPartialPayload,
+    TranscriptionRealignRequestedPayload,
+    TranscriptionRequestedPayload,
+    TranscriptionStartedPayload,
+)
 from sqlalchemy import Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from sounds_right_api.config import ApiSettings
 from sounds_right_api.domain.schemas import (
     JobEventPublic,
+    LyricsUpdateRequest,
+    PartialTranscriptResponse,
+    PartialTranscriptSegment,
     StartTranscriptionRequest,
     StartTranscriptionResponse,
+    TranscriptDocument,
     TranscriptionJobPublic,
 )
 from sounds_right_api.events.producer import EventProducer
-from sounds_right_api.events.schemas import (
-    EventEnvelope,
-    TranscriptionOptionsPayload,
-    TranscriptionRequestedPayload,
-)
 from sounds_right_api.models import JobEvent, TrackVersion, TranscriptionJob, User
+from sounds_right_api.services.review import read_transcript_object
+from sounds_right_api.services.versions import store_lyrics
 
 ACTIVE_JOB_STATUSES = {"queued", "started", "processing"}
 
@@ -44,6 +54,14 @@ class MissingAudioObjectError(Exception):
     pass
 
 
+class PreviewNotAvailableError(Exception):
+    pass
+
+
+class TranscriptNotAvailableError(Exception):
+    pass
+
+
 async def start_transcription(
     session: AsyncSession,
     version_id: uuid.UUID,
@@ -69,14 +87,7 @@ async def start_transcription(
     ):
         raise MissingAudioObjectError
 
-    active_job = await session.scalar(
-        select(TranscriptionJob).where(
-            TranscriptionJob.track_version_id == version.id,
-            TranscriptionJob.status.in_(ACTIVE_JOB_STATUSES),
-        ),
-    )
-    if active_job is not None:
-        raise ActiveJobExistsError
+    await _ensure_no_active_job(session, version.id)
 
     job = TranscriptionJob(
         track_version_id=version.id,
@@ -104,9 +115,86 @@ async def start_transcription(
             audio_content_type=version.audio_content_type,
             audio_size_bytes=version.audio_size_bytes,
             engine=payload.engine,
-            options=TranscriptionOptionsPayload(**payload.options.model_dump()),
+            options=TranscriptionOptionsPayload(
+                language=payload.options.language,
+                model=payload.options.model,
+                separate_vocals=payload.options.separate_vocals,
+                lyrics_object_key=(
+                    version.lyrics_object_key if payload.options.align_lyrics else None
+                ),
+            ),
+        ),
+    )
+    return await _enqueue(session, producer, job, event)
+
+
+async def start_realignment(
+    session: AsyncSession,
+    version_id: uuid.UUID,
+    payload: LyricsUpdateRequest,
+    user: User,
+    producer: EventProducer,
+    settings: ApiSettings,
+) -> StartTranscriptionResponse:
+    """Queue a job that re-aligns only the edited lines of a completed transcript.
+
+    The edited text (one line per segment) replaces the version's lyrics, so a
+    later full alignment starts from the corrected text too.
+    """
+    version = await session.get(TrackVersion, version_id)
+    if version is None:
+        raise VersionNotFoundError
+    if version.status != "completed" or not version.transcript_object_key:
+        raise TranscriptNotAvailableError
+    await _ensure_no_active_job(session, version.id)
+
+    lyrics_key = store_lyrics(settings, version.id, payload.text)
+    version.lyrics_object_key = lyrics_key
+    job = TranscriptionJob(
+        track_version_id=version.id,
+        job_type="realignment",
+        status="queued",
+        engine="lyrics-dtw",
+        progress=0,
+        correlation_id=uuid.uuid4(),
+        requested_by_user_id=user.id,
+    )
+    version.status = "queued_for_processing"
+    session.add(job)
+    await session.flush()
+
+    event = EventEnvelope(
+        event_type="transcription.realign_requested",
+        correlation_id=job.correlation_id,
+        producer="sounds-right-api",
+        payload=TranscriptionRealignRequestedPayload(
+            job_id=job.id,
+            track_version_id=version.id,
+            transcript_object_key=version.transcript_object_key,
+            lyrics_object_key=lyrics_key,
+        ),
+    )
+    return await _enqueue(session, producer, job, event)
+
+
+async def _ensure_no_active_job(session: AsyncSession, version_id: uuid.UUID) -> None:
+    active_job = await session.scalar(
+        select(TranscriptionJob).where(
+            TranscriptionJob.track_version_id == version_id,
+            TranscriptionJob.status.in_(ACTIVE_JOB_STATUSES),
         ),
     )
+    if active_job is not None:
+        raise ActiveJobExistsError
+
+
+async def _enqueue(
+    session: AsyncSession,
+    producer: EventProducer,
+    job: TranscriptionJob,
+    event: EventEnvelope,
+) -> StartTranscriptionResponse:
+    """Record the request on the job's event log, commit, then publish it."""
     session.add(
         JobEvent(
             job_id=job.id,
@@ -124,7 +212,7 @@ async def start_transcription(
 
     return StartTranscriptionResponse(
         job_id=job.id,
-        track_version_id=version.id,
+        track_version_id=job.track_version_id,
         status="queued",
         correlation_id=job.correlation_id,
     )
@@ -137,6 +225,75 @@ async def get_job(session: AsyncSession, job_id: uuid.UUID) -> TranscriptionJobP
     return TranscriptionJobPublic.model_validate(job)
 
 
+async def get_preview_transcript(
+    session: AsyncSession,
+    job_id: uuid.UUID,
+    settings: ApiSettings,
+) -> TranscriptDocument:
+    job = await session.get(TranscriptionJob, job_id)
+    if job is None:
+        raise JobNotFoundError
+    if not job.preview_object_key:
+        raise PreviewNotAvailableError
+    return read_transcript_object(settings, job.preview_object_key)
+
+
+async def get_partial_transcript(
+    session: AsyncSession,
+    job_id: uuid.UUID,
+) -> PartialTranscriptResponse:
+    job = await session.get(TranscriptionJob, job_id)
+    if job is None:
+        raise JobNotFoundError
+
+    statement = (
+        select(JobEvent.event_type, JobEvent.payload_json)
+        .where(
+            JobEvent.job_id == job_id,
+            JobEvent.event_type.in_(("transcription.started", "transcription.partial")),
+        )
+        .order_by(JobEvent.created_at)
+    )
+    payloads: list[TranscriptionStartedPayload | TranscriptionPartialPayload] = [
+        TranscriptionStartedPayload.model_validate(raw)
+        if event_type == "transcription.started"
+        else TranscriptionPartialPayload.model_validate(raw)
+        for event_type, raw in (await session.execute(statement)).all()
+    ]
+    return assemble_partial_transcript(job, payloads)
+
+
+def assemble_partial_transcript(
+    job: TranscriptionJob,
+    payloads: list[TranscriptionStartedPayload | TranscriptionPartialPayload],
+) -> PartialTranscriptResponse:
+    """Stitch the latest attempt's partial batches together in ``sequence`` order.
+
+    ``payloads`` are the job's started and partial events in projection
+    order. A retried job emits ``transcription.started`` again and restarts
+    its sequence at zero, so only batches after the last start count; a
+    redelivered batch replaces the earlier copy of its sequence number.
+    """
+    batches: dict[int, TranscriptionPartialPayload] = {}
+    for payload in payloads:
+        if isinstance(payload, TranscriptionStartedPayload):
+            batches.clear()
+        else:
+            batches[payload.sequence] = payload
+    segments = [
+        PartialTranscriptSegment(start=segment.start, end=segment.end, text=segment.text)
+        for sequence in sorted(batches)
+        for segment in batches[sequence].segments
+    ]
+    decoded_seconds = max((payload.decoded_seconds for payload in batches.values()), default=0.0)
+    return PartialTranscriptResponse(
+        job_id=job.id,
+        status=job.status,  # type: ignore[arg-type]
+        decoded_seconds=decoded_seconds,
+        segments=segments,
+    )
+
+
 async def list_job_events(session: AsyncSession, job_id: uuid.UUID) -> list[JobEventPublic]:
     exists = await session.get(TranscriptionJob, job_id)
     if exists is None:
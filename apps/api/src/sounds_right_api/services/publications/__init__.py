@@ -13,6 +13,8 @@ from .service import (
     get_public_latest,
     get_public_manifest,
     get_public_version,
+    get_public_window,
+    get_public_word_timings,
     get_publication,
     list_publications,
     publish_version,
@@ -32,6 +34,8 @@ __all__ = [
     "get_public_latest",
     "get_public_manifest",
     "get_public_version",
+    "get_public_window",
+    "get_public_word_timings",
     "get_publication",
     "list_publications",
     "publish_version",
@@ -4,8 +4,13 @@ import json
 from io import BytesIO
 from typing import Any
 
-from minio import Minio
 from minio.error import S3Error
+from sounds_right_contracts.artifacts import (
+    ArtifactEncodingError,
+    content_encoding_header,
+    decode_artifact,
+    encode_artifact,
+)
 
 from sounds_right_api.config import ApiSettings
 from sounds_right_api.domain.schemas import (
@@ -14,8 +19,11 @@ from sounds_right_api.domain.schemas import (
     TranscriptDocument,
 )
 from sounds_right_api.models import TrackVersion
-from sounds_right_api.services.review import TranscriptMissingError, TranscriptStorageError
-from sounds_right_api.storage.minio_client import create_minio_client
+from sounds_right_api.services.review import (
+    TranscriptMissingError,
+    read_transcript_object,
+)
+from sounds_right_api.storage.minio_client import ObjectStore, create_minio_client
 
 from .errors import (
     PublicArtifactMissingError,
@@ -30,30 +38,10 @@ async def load_internal_transcript(
 ) -> TranscriptDocument:
     if not version.transcript_object_key:
         raise TranscriptMissingError
+    return read_transcript_object(settings, version.transcript_object_key)
 
-    client = create_minio_client(settings)
-    try:
-        response = client.get_object(
-            settings.minio_transcripts_bucket,
-            version.transcript_object_key,
-        )
-        try:
-            body = response.read()
-        finally:
-            response.close()
-            response.release_conn()
-    except S3Error as exc:
-        if exc.code in {"NoSuchKey", "NoSuchBucket", "NoSuchObject"}:
-            raise TranscriptMissingError from exc
-        raise TranscriptStorageError from exc
 
-    try:
-        return TranscriptDocument.model_validate(json.loads(body.decode("utf-8")))
-    except (json.JSONDecodeError, UnicodeDecodeError, ValueError) as exc:
-        raise TranscriptStorageError from exc
-
-
-def ensure_public_bucket(client: Minio, settings: ApiSettings) -> None:
+def ensure_public_bucket(client: ObjectStore, settings: ApiSettings) -> None:
     try:
         if not client.bucket_exists(settings.minio_public_bucket):
             client.make_bucket(settings.minio_public_bucket)
@@ -62,7 +50,7 @@ def ensure_public_bucket(client: Minio, settings: ApiSettings) -> None:
 
 
 def ensure_immutable_objects_absent(
-    client: Minio,
+    client: ObjectStore,
     settings: ApiSettings,
     object_keys: list[str],
 ) -> None:
@@ -77,7 +65,7 @@ def ensure_immutable_objects_absent(
 
 
 def write_json_object(
-    client: Minio,
+    client: ObjectStore,
     settings: ApiSettings,
     object_key: str,
     payload: Any,
@@ -86,13 +74,26 @@ def write_json_object(
         body = payload.model_dump_json().encode("utf-8")
     else:
         body = json.dumps(payload, separators=(",", ":"), sort_keys=True).encode("utf-8")
+    write_binary_object(client, settings, object_key, body, "application/json")
+
+
+def write_binary_object(
+    client: ObjectStore,
+    settings: ApiSettings,
+    object_key: str,
+    body: bytes,
+    content_type: str,
+) -> None:
+    body = encode_artifact(body, settings.artifact_encoding)
+    encoding = content_encoding_header(settings.artifact_encoding)
     try:
         client.put_object(
             settings.minio_public_bucket,
             object_key,
             BytesIO(body),
             length=len(body),
-            content_type="application/json",
+            content_type=content_type,
+            metadata={"Content-Encoding": encoding} if encoding is not None else None,
         )
     except S3Error as exc:
         raise PublicArtifactStorageError from exc
@@ -105,6 +106,15 @@ def read_public_json[
     object_key: str,
     schema: type[PublicJsonModel],
 ) -> PublicJsonModel:
+    body = read_public_bytes(settings, object_key)
+    try:
+        return schema.model_validate(json.loads(body.decode("utf-8")))
+    except (json.JSONDecodeError, UnicodeDecodeError, ValueError) as exc:
+        raise PublicArtifactStorageError from exc
+
+
+def read_public_bytes(settings: ApiSettings, object_key: str) -> bytes:
+    """Read a public artifact, undoing its storage compression."""
     client = create_minio_client(settings)
     try:
         response = client.get_object(settings.minio_public_bucket, object_key)
@@ -119,6 +129,6 @@ def read_public_json[
         raise PublicArtifactStorageError from exc
 
     try:
-        return schema.model_validate(json.loads(body.decode("utf-8")))
-    except (json.JSONDecodeError, UnicodeDecodeError, ValueError) as exc:
+        return decode_artifact(body)
+    except ArtifactEncodingError as exc:
         raise PublicArtifactStorageError from exc
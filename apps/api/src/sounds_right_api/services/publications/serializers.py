@@ -1,3 +1,5 @@
+from sounds_right_contracts.word_timings import WordTimings
+
 from sounds_right_api.domain.schemas import (
     ArtistSummary,
     PublicationPublic,
@@ -8,6 +10,10 @@ from sounds_right_api.domain.schemas import (
     TranscriptDocument,
 )
 from sounds_right_api.models import Publication, TrackVersion
+from sounds_right_api.services.transcript_windows import SEEK_INDEX_FILE
+
+WORD_TIMINGS_JSON = "word-timings.json"
+WORD_TIMINGS_BINARY = "word-timings.bin"
 
 
 def public_object_keys(version: TrackVersion) -> dict[str, str]:
@@ -20,13 +26,20 @@ def public_object_keys(version: TrackVersion) -> dict[str, str]:
         "latest": f"{root}/latest.json",
         "version_manifest": f"{version_root}/manifest.json",
         "transcript": f"{version_root}/transcript.json",
+        "seek_index": f"{version_root}/{SEEK_INDEX_FILE}",
         "segments": f"{version_root}/segments.json",
         "words": f"{version_root}/words.json",
+        "word_timings": f"{version_root}/{WORD_TIMINGS_JSON}",
+        "word_timings_binary": f"{version_root}/{WORD_TIMINGS_BINARY}",
     }
 
 
 def version_manifest_key(artist_slug: str, track_slug: str, version: int) -> str:
-    return f"karaoke/{artist_slug}/{track_slug}/versions/v{version}/manifest.json"
+    return version_object_key(artist_slug, track_slug, version, "manifest.json")
+
+
+def version_object_key(artist_slug: str, track_slug: str, version: int, file_name: str) -> str:
+    return f"karaoke/{artist_slug}/{track_slug}/versions/v{version}/{file_name}"
 
 
 def public_manifest(
@@ -110,3 +123,7 @@ def word_artifact(transcript: TranscriptDocument) -> list[dict[str, object]]:
                 },
             )
     return words
+
+
+def word_timings(transcript: TranscriptDocument) -> WordTimings:
+    return WordTimings.from_segments(transcript.segments)
@@ -4,6 +4,9 @@ import uuid
 from collections.abc import Sequence
 from datetime import UTC, datetime
 
+from minio.error import S3Error
+from sounds_right_contracts.seek_index import SeekIndex
+from sounds_right_contracts.word_timings import WORD_TIMINGS_BINARY_CONTENT_TYPE
 from sqlalchemy import Select, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -16,20 +19,29 @@ from sounds_right_api.domain.schemas import (
     PublicKaraokeDocument,
     PublicKaraokeManifest,
     TranscriptDocument,
+    TranscriptWindow,
 )
 from sounds_right_api.models import Publication, Track, User
 from sounds_right_api.services.review import ensure_reviewer
+from sounds_right_api.services.transcript_windows import (
+    read_stored_transcript,
+    transcript_seek_index,
+    transcript_window,
+)
 from sounds_right_api.storage.minio_client import create_minio_client
 
 from .artifacts import (
     ensure_immutable_objects_absent,
     ensure_public_bucket,
     load_internal_transcript,
+    read_public_bytes,
     read_public_json,
+    write_binary_object,
     write_json_object,
 )
 from .errors import (
     PublicArtifactMissingError,
+    PublicArtifactStorageError,
     PublicationAlreadyExistsError,
     PublicationNotFoundError,
     VersionNotApprovedError,
@@ -38,12 +50,16 @@ from .errors import (
 from .permissions import ensure_admin
 from .queries import get_publication_by_slugs, get_version_for_publish
 from .serializers import (
+    WORD_TIMINGS_BINARY,
+    WORD_TIMINGS_JSON,
     public_manifest,
     public_manifest_version,
     public_object_keys,
     publication_public,
     version_manifest_key,
+    version_object_key,
     word_artifact,
+    word_timings,
 )
 
 
@@ -77,8 +93,11 @@ async def publish_version(
         [
             object_keys["version_manifest"],
             object_keys["transcript"],
+            object_keys["seek_index"],
             object_keys["segments"],
             object_keys["words"],
+            object_keys["word_timings"],
+            object_keys["word_timings_binary"],
         ],
     )
 
@@ -121,7 +140,21 @@ async def publish_version(
     document = PublicKaraokeDocument(manifest=manifest, transcript=transcript)
 
     write_json_object(client, settings, object_keys["version_manifest"], manifest)
-    write_json_object(client, settings, object_keys["transcript"], transcript)
+    # The seek index holds byte offsets, so it is built from the exact bytes stored.
+    transcript_bytes = transcript.model_dump_json().encode("utf-8")
+    write_binary_object(
+        client,
+        settings,
+        object_keys["transcript"],
+        transcript_bytes,
+        "application/json",
+    )
+    write_json_object(
+        client,
+        settings,
+        object_keys["seek_index"],
+        SeekIndex.from_transcript_json(transcript_bytes).to_json(),
+    )
     write_json_object(
         client,
         settings,
@@ -129,6 +162,15 @@ async def publish_version(
         [segment.model_dump(mode="json") for segment in transcript.segments],
     )
     write_json_object(client, settings, object_keys["words"], word_artifact(transcript))
+    timings = word_timings(transcript)
+    write_json_object(client, settings, object_keys["word_timings"], timings.to_json())
+    write_binary_object(
+        client,
+        settings,
+        object_keys["word_timings_binary"],
+        timings.to_bytes(),
+        WORD_TIMINGS_BINARY_CONTENT_TYPE,
+    )
     write_json_object(client, settings, root_manifest_key, manifest)
     if latest_key is not None:
         write_json_object(client, settings, latest_key, document)
@@ -260,3 +302,45 @@ async def get_public_version(
         TranscriptDocument,
     )
     return PublicKaraokeDocument(manifest=manifest, transcript=transcript)
+
+
+async def get_public_word_timings(
+    session: AsyncSession,
+    artist_slug: str,
+    track_slug: str,
+    version: int,
+    settings: ApiSettings,
+    binary: bool = False,
+) -> bytes:
+    """Return a published version's columnar word timings, JSON or binary layout."""
+    publication = await get_publication_by_slugs(session, artist_slug, track_slug, version)
+    file_name = WORD_TIMINGS_BINARY if binary else WORD_TIMINGS_JSON
+    return read_public_bytes(
+        settings,
+        version_object_key(artist_slug, track_slug, publication.version, file_name),
+    )
+
+
+async def get_public_window(
+    session: AsyncSession,
+    artist_slug: str,
+    track_slug: str,
+    version: int,
+    settings: ApiSettings,
+    start: float,
+    end: float,
+) -> TranscriptWindow:
+    publication = await get_publication_by_slugs(session, artist_slug, track_slug, version)
+    client = create_minio_client(settings)
+    bucket = settings.minio_public_bucket
+    object_key = publication.public_transcript_object_key
+    try:
+        transcript = read_stored_transcript(client, bucket, object_key)
+        index = transcript_seek_index(client, bucket, object_key, transcript)
+        return transcript_window(transcript.document, index, start, end)
+    except S3Error as exc:
+        if exc.code in {"NoSuchKey", "NoSuchBucket", "NoSuchObject"}:
+            raise PublicArtifactMissingError from exc
+        raise PublicArtifactStorageError from exc
+    except ValueError as exc:
+        raise PublicArtifactStorageError from exc
@@ -6,6 +6,7 @@ from datetime import UTC, datetime
 from typing import Any
 
 from minio.error import S3Error
+from sounds_right_contracts.artifacts import ArtifactEncodingError, decode_artifact
 from sqlalchemy import Select, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -23,8 +24,14 @@ from sounds_right_api.domain.schemas import (
     ReviewUserSummary,
     TrackVersionPublic,
     TranscriptDocument,
+    TranscriptWindow,
 )
 from sounds_right_api.models import ReviewEvent, Track, TrackVersion, TranscriptionJob, User
+from sounds_right_api.services.transcript_windows import (
+    read_stored_transcript,
+    transcript_seek_index,
+    transcript_window,
+)
 from sounds_right_api.storage.minio_client import create_minio_client
 
 REVIEWER_ROLES = {"reviewer", "admin"}
@@ -96,13 +103,48 @@ async def get_transcript(
         raise VersionNotFoundError
     if not version.transcript_object_key:
         raise TranscriptMissingError
+    return read_transcript_object(settings, version.transcript_object_key)
+
 
+async def get_transcript_window(
+    session: AsyncSession,
+    version_id: uuid.UUID,
+    settings: ApiSettings,
+    start: float,
+    end: float,
+) -> TranscriptWindow:
+    version = await session.get(TrackVersion, version_id)
+    if version is None:
+        raise VersionNotFoundError
+    if not version.transcript_object_key:
+        raise TranscriptMissingError
     client = create_minio_client(settings)
+    bucket = settings.minio_transcripts_bucket
     try:
-        response = client.get_object(
-            settings.minio_transcripts_bucket,
-            version.transcript_object_key,
-        )
+        transcript = read_stored_transcript(client, bucket, version.transcript_object_key)
+        index = transcript_seek_index(client, bucket, version.transcript_object_key, transcript)
+        return transcript_window(transcript.document, index, start, end)
+    except S3Error as exc:
+        if exc.code in {"NoSuchKey", "NoSuchBucket", "NoSuchObject"}:
+            raise TranscriptMissingError from exc
+        raise TranscriptStorageError from exc
+    except ValueError as exc:
+        raise TranscriptStorageError from exc
+
+
+def read_transcript_object(settings: ApiSettings, object_key: str) -> TranscriptDocument:
+    body = read_transcript_bytes(settings, object_key)
+    try:
+        return TranscriptDocument.model_validate(json.loads(body.decode("utf-8")))
+    except (json.JSONDecodeError, UnicodeDecodeError, ValueError) as exc:
+        raise TranscriptStorageError from exc
+
+
+def read_transcript_bytes(settings: ApiSettings, object_key: str) -> bytes:
+    """Read a stored transcript, undoing its storage compression."""
+    client = create_minio_client(settings)
+    try:
+        response = client.get_object(settings.minio_transcripts_bucket, object_key)
         try:
             body = response.read()
         finally:
@@ -114,8 +156,8 @@ async def get_transcript(
         raise TranscriptStorageError from exc
 
     try:
-        return TranscriptDocument.model_validate(json.loads(body.decode("utf-8")))
-    except (json.JSONDecodeError, UnicodeDecodeError, ValueError) as exc:
+        return decode_artifact(body)
+    except ArtifactEncodingError as exc:
         raise TranscriptStorageError from exc
 
 
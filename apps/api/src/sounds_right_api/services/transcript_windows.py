@@ -0,0 +1,156 @@
+"""Time windows over stored transcripts, answered from their seek index.
+
+The worker and publishing store ``seek-index.json`` beside every
+``transcript.json``. A window is found by binary search on the index and
+only the segments it covers are cut out of the transcript and validated.
+
+Transcripts are stored compressed, so every window still reads the whole
+object. Its index is checked against the transcript's SHA-256 only once per
+object version: verified indexes are cached by object key and ETag. A
+transcript without an index, or whose index describes other bytes, is
+indexed on the fly (and logged), and that index is cached the same way.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import posixpath
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from minio.error import S3Error
+from sounds_right_contracts.artifacts import decode_artifact
+from sounds_right_contracts.seek_index import SeekIndex
+
+from sounds_right_api.domain.schemas import (
+    TranscriptSegment,
+    TranscriptWindow,
+    TranscriptWindowWord,
+)
+from sounds_right_api.storage.minio_client import ObjectStore
+
+logger = logging.getLogger(__name__)
+
+SEEK_INDEX_FILE = "seek-index.json"
+# Verified indexes kept per (bucket, transcript key, ETag), least recently used first.
+_INDEX_CACHE_SIZE = 256
+_index_cache: OrderedDict[tuple[str, str, str], SeekIndex] = OrderedDict()
+_index_cache_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class StoredTranscript:
+    """A decoded ``transcript.json`` and the ETag of the object holding it."""
+
+    document: bytes
+    etag: str | None
+
+
+def seek_index_key(transcript_object_key: str) -> str:
+    return posixpath.join(posixpath.dirname(transcript_object_key), SEEK_INDEX_FILE)
+
+
+def seek_bounds(at: float, before: float, after: float) -> tuple[float, float]:
+    """The window around a seek position."""
+    return max(at - max(before, 0.0), 0.0), max(at, 0.0) + max(after, 0.0)
+
+
+def read_seek_index(client: ObjectStore, bucket: str, object_key: str) -> SeekIndex | None:
+    """The stored index, or ``None`` when it is missing or unreadable."""
+    try:
+        response = client.get_object(bucket, object_key)
+        try:
+            body = response.read()
+        finally:
+            response.close()
+            response.release_conn()
+        return SeekIndex.from_json(json.loads(decode_artifact(body).decode("utf-8")))
+    except (S3Error, ValueError):
+        # Older transcripts have no index; the window is then indexed on the fly.
+        return None
+
+
+def read_stored_transcript(client: ObjectStore, bucket: str, object_key: str) -> StoredTranscript:
+    """Read and decode a transcript object.
+
+    Raises ``S3Error`` when it cannot be read and ``ValueError`` when its
+    storage encoding is broken.
+    """
+    response = client.get_object(bucket, object_key)
+    try:
+        body = response.read()
+        etag = response.headers.get("ETag")
+    finally:
+        response.close()
+        response.release_conn()
+    return StoredTranscript(document=decode_artifact(body), etag=etag)
+
+
+def transcript_seek_index(
+    client: ObjectStore,
+    bucket: str,
+    transcript_object_key: str,
+    transcript: StoredTranscript,
+) -> SeekIndex:
+    """The index describing ``transcript``, from the cache, storage or built here.
+
+    Raises ``ValueError`` when the transcript has to be indexed and is malformed.
+    """
+    cache_key = (bucket, transcript_object_key, transcript.etag) if transcript.etag else None
+    if cache_key is not None:
+        with _index_cache_lock:
+            cached = _index_cache.get(cache_key)
+            if cached is not None:
+                _index_cache.move_to_end(cache_key)
+                return cached
+
+    index = read_seek_index(client, bucket, seek_index_key(transcript_object_key))
+    if index is None or not index.describes(transcript.document):
+        logger.warning(
+            "transcript has no matching seek index, indexing it on the fly",
+            extra={"bucket": bucket, "object_key": transcript_object_key},
+        )
+        index = SeekIndex.from_transcript_json(transcript.document)
+    if cache_key is not None:
+        with _index_cache_lock:
+            _index_cache[cache_key] = index
+            while len(_index_cache) > _INDEX_CACHE_SIZE:
+                _index_cache.popitem(last=False)
+    return index
+
+
+def transcript_window(
+    document: bytes,
+    index: SeekIndex,
+    start: float,
+    end: float,
+) -> TranscriptWindow:
+    """Segments and words of a decoded ``transcript.json`` overlapping the window.
+
+    ``index`` must describe ``document`` (see ``transcript_seek_index``).
+    Raises ``ValueError`` when the transcript is malformed.
+    """
+    start_ms, end_ms = round(start * 1000), round(end * 1000)
+    segment_positions = index.segments_between(start_ms, end_ms)
+    word_positions = index.words_between(start_ms, end_ms)
+    needed = set(segment_positions) | {index.word_segment(word) for word in word_positions}
+    segments = {
+        position: TranscriptSegment.model_validate_json(index.segment_slice(document, position))
+        for position in sorted(needed)
+    }
+
+    words: list[TranscriptWindowWord] = []
+    for word_position in word_positions:
+        position = index.word_segment(word_position)
+        segment = segments[position]
+        word = segment.words[word_position - index.word_offsets[position]]
+        words.append(TranscriptWindowWord(segment_id=segment.id, **word.model_dump()))
+    return TranscriptWindow(
+        start=start,
+        end=end,
+        segment_count=len(index.segment_start_ms),
+        segments=[segments[position] for position in segment_positions],
+        words=words,
+    )
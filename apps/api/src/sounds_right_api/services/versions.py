@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import uuid
 from datetime import UTC, datetime, timedelta
+from io import BytesIO
 
 from minio.error import S3Error
 from sqlalchemy import func, select
@@ -9,6 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from sounds_right_api.config import ApiSettings
 from sounds_right_api.domain.schemas import (
+    LyricsUpdateRequest,
     TrackVersionPublic,
     UploadCompleteRequest,
     UploadUrlRequest,
@@ -42,6 +44,32 @@ class UploadTooLargeError(Exception):
     pass
 
 
+class LyricsStorageError(Exception):
+    pass
+
+
+def lyrics_object_key(prefix: str, version_id: uuid.UUID) -> str:
+    return f"{prefix}/{version_id}/lyrics.txt"
+
+
+def store_lyrics(settings: ApiSettings, version_id: uuid.UUID, text: str) -> str:
+    """Upload lyrics text for a version and return its object key."""
+    object_key = lyrics_object_key(settings.transcript_object_prefix, version_id)
+    body = text.encode("utf-8")
+    client = create_minio_client(settings)
+    try:
+        client.put_object(
+            settings.minio_transcripts_bucket,
+            object_key,
+            BytesIO(body),
+            length=len(body),
+            content_type="text/plain; charset=utf-8",
+        )
+    except S3Error as exc:
+        raise LyricsStorageError from exc
+    return object_key
+
+
 async def create_track_version(
     session: AsyncSession,
     track_id: uuid.UUID,
@@ -180,3 +208,19 @@ async def complete_upload(
     await session.commit()
     await session.refresh(version)
     return TrackVersionPublic.model_validate(version)
+
+
+async def set_version_lyrics(
+    session: AsyncSession,
+    version_id: uuid.UUID,
+    payload: LyricsUpdateRequest,
+    settings: ApiSettings,
+) -> TrackVersionPublic:
+    version = await session.get(TrackVersion, version_id)
+    if version is None:
+        raise VersionNotFoundError
+
+    version.lyrics_object_key = store_lyrics(settings, version.id, payload.text)
+    await session.commit()
+    await session.refresh(version)
+    return TrackVersionPublic.model_validate(version)
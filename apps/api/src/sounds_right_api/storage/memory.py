@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from functools import lru_cache
+from typing import BinaryIO
+
+from minio.error import S3Error
+from minio.helpers import DictType
+from urllib3 import HTTPResponse
+
+
+@dataclass(frozen=True)
+class MemoryObject:
+    bucket_name: str
+    object_name: str
+    data: bytes
+    content_type: str
+    content_encoding: str | None
+    last_modified: datetime
+
+    @property
+    def size(self) -> int:
+        return len(self.data)
+
+    @property
+    def etag(self) -> str:
+        return hashlib.md5(self.data, usedforsecurity=False).hexdigest()
+
+
+class MemoryObjectResponse:
+    def __init__(self, data: bytes, etag: str) -> None:
+        self._data = data
+        self.headers = {"ETag": f'"{etag}"'}
+
+    def read(self) -> bytes:
+        return self._data
+
+    def close(self) -> None:
+        pass
+
+    def release_conn(self) -> None:
+        pass
+
+
+class MemoryObjectStore:
+    """In-process stand-in for MinIO, for load tests that run without it.
+
+    Presigned upload URLs use the ``memory://`` scheme: whoever holds one must
+    write the object with ``put_object`` from the same process. Objects are
+    returned as stored, without decoding their Content-Encoding. Missing
+    objects raise ``S3Error`` with MinIO's codes.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._buckets: dict[str, dict[str, MemoryObject]] = {}
+
+    def get_object(self, bucket_name: str, object_name: str) -> MemoryObjectResponse:
+        stored = self.stat_object(bucket_name, object_name)
+        return MemoryObjectResponse(stored.data, stored.etag)
+
+    def stat_object(self, bucket_name: str, object_name: str) -> MemoryObject:
+        with self._lock:
+            bucket = self._buckets.get(bucket_name)
+            stored = None if bucket is None else bucket.get(object_name)
+        if stored is None:
+            code = "NoSuchBucket" if bucket is None else "NoSuchKey"
+            raise _not_found(code, bucket_name, object_name)
+        return stored
+
+    def put_object(
+        self,
+        bucket_name: str,
+        object_name: str,
+        data: BinaryIO,
+        length: int,
+        content_type: str = "application/octet-stream",
+        metadata: DictType | None = None,
+    ) -> MemoryObject:
+        encoding = (metadata or {}).get("Content-Encoding")
+        stored = MemoryObject(
+            bucket_name=bucket_name,
+            object_name=object_name,
+            data=data.read(length),
+            content_type=content_type,
+            content_encoding=encoding if isinstance(encoding, str) else None,
+            last_modified=datetime.now(UTC),
+        )
+        with self._lock:
+            # Buckets are created on first write, like the pre-created local ones.
+            self._buckets.setdefault(bucket_name, {})[object_name] = stored
+        return stored
+
+    def presigned_put_object(
+        self,
+        bucket_name: str,
+        object_name: str,
+        expires: timedelta = timedelta(days=7),
+    ) -> str:
+        return f"memory://{bucket_name}/{object_name}"
+
+    def bucket_exists(self, bucket_name: str) -> bool:
+        with self._lock:
+            return bucket_name in self._buckets
+
+    def make_bucket(self, bucket_name: str) -> None:
+        with self._lock:
+            self._buckets.setdefault(bucket_name, {})
+
+
+def _not_found(code: str, bucket_name: str, object_name: str) -> S3Error:
+    return S3Error(
+        response=HTTPResponse(status=404),
+        code=code,
+        message="The specified key does not exist.",
+        resource=f"/{bucket_name}/{object_name}",
+        request_id="",
+        host_id="",
+        bucket_name=bucket_name,
+        object_name=object_name,
+    )
+
+
+@lru_cache
+def get_memory_object_store() -> MemoryObjectStore:
+    """The store shared by every client in this process."""
+    return MemoryObjectStore()
@@ -1,9 +1,62 @@
+from collections.abc import Mapping
+from datetime import timedelta
+from typing import BinaryIO, Protocol
+
 from minio import Minio
+from minio.helpers import DictType
 
 from sounds_right_api.config import ApiSettings
+from sounds_right_api.storage.memory import get_memory_object_store
+
+
+class ObjectResponse(Protocol):
+    @property
+    def headers(self) -> Mapping[str, str]: ...
+
+    def read(self) -> bytes: ...
+
+    def close(self) -> None: ...
+
+    def release_conn(self) -> None: ...
+
+
+class ObjectStat(Protocol):
+    @property
+    def size(self) -> int | None: ...
+
+
+class ObjectStore(Protocol):
+    """The part of the ``Minio`` client the API uses."""
+
+    def get_object(self, bucket_name: str, object_name: str) -> ObjectResponse: ...
+
+    def stat_object(self, bucket_name: str, object_name: str) -> ObjectStat: ...
+
+    def put_object(
+        self,
+        bucket_name: str,
+        object_name: str,
+        data: BinaryIO,
+        length: int,
+        content_type: str = "application/octet-stream",
+        metadata: DictType | None = None,
+    ) -> object: ...
+
+    def presigned_put_object(
+        self,
+        bucket_name: str,
+        object_name: str,
+        expires: timedelta = ...,
+    ) -> str: ...
+
+    def bucket_exists(self, bucket_name: str) -> bool: ...
+
+    def make_bucket(self, bucket_name: str) -> None: ...
 
 
-def create_minio_client(settings: ApiSettings) -> Minio:
+def create_minio_client(settings: ApiSettings) -> ObjectStore:
+    if settings.storage_backend == "memory":
+        return get_memory_object_store()
     return Minio(
         settings.minio_endpoint,
         access_key=settings.minio_access_key,
@@ -12,7 +65,9 @@ def create_minio_client(settings: ApiSettings) -> Minio:
     )
 
 
-def create_public_minio_client(settings: ApiSettings) -> Minio:
+def create_public_minio_client(settings: ApiSettings) -> ObjectStore:
+    if settings.storage_backend == "memory":
+        return get_memory_object_store()
     return Minio(
         settings.minio_public_endpoint,
         access_key=settings.minio_access_key,
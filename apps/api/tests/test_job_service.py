@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import uuid
+
+import pytest
+from sounds_right_contracts.events import (
+    PartialSegmentPayload,
+    TranscriptionPartialPayload,
+    TranscriptionStartedPayload,
+)
+
+from sounds_right_api.models import TranscriptionJob
+from sounds_right_api.services.jobs import assemble_partial_transcript
+
+
+def make_partial(
+    job: TranscriptionJob,
+    sequence: int,
+    texts: list[str],
+    decoded_seconds: float,
+) -> TranscriptionPartialPayload:
+    return TranscriptionPartialPayload(
+        job_id=job.id,
+        track_version_id=job.track_version_id,
+        sequence=sequence,
+        segments=[
+            PartialSegmentPayload(start=float(index), end=float(index + 1), text=text)
+            for index, text in enumerate(texts)
+        ],
+        decoded_seconds=decoded_seconds,
+        progress=50,
+        message="partial",
+    )
+
+
+def test_assemble_partial_transcript_orders_batches_and_keeps_latest_copy() -> None:
+    job = TranscriptionJob(id=uuid.uuid4(), track_version_id=uuid.uuid4(), status="processing")
+
+    response = assemble_partial_transcript(
+        job,
+        [
+            make_partial(job, 1, ["stale"], 20.0),
+            make_partial(job, 0, ["first", "second"], 10.0),
+            make_partial(job, 1, ["third"], 30.0),
+        ],
+    )
+
+    assert response.status == "processing"
+    assert [segment.text for segment in response.segments] == ["first", "second", "third"]
+    assert response.decoded_seconds == pytest.approx(30.0)
+
+
+def test_assemble_partial_transcript_ignores_batches_of_earlier_attempts() -> None:
+    job = TranscriptionJob(id=uuid.uuid4(), track_version_id=uuid.uuid4(), status="processing")
+
+    def started() -> TranscriptionStartedPayload:
+        return TranscriptionStartedPayload(
+            job_id=job.id,
+            track_version_id=job.track_version_id,
+            worker_id="worker-1",
+            engine="whisper.cpp",
+            message="started",
+        )
+
+    response = assemble_partial_transcript(
+        job,
+        [
+            started(),
+            make_partial(job, 0, ["old first"], 10.0),
+            make_partial(job, 1, ["old second"], 20.0),
+            make_partial(job, 2, ["old third"], 30.0),
+            started(),
+            make_partial(job, 0, ["new first"], 5.0),
+        ],
+    )
+
+    assert [segment.text for segment in response.segments] == ["new first"]
+    assert response.decoded_seconds == pytest.approx(5.0)
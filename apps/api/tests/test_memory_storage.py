@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from io import BytesIO
+
+import pytest
+from minio.error import S3Error
+
+from sounds_right_api.storage.memory import MemoryObjectStore
+
+
+def test_memory_store_round_trips_objects() -> None:
+    store = MemoryObjectStore()
+    store.put_object("transcripts", "a/transcript.json", BytesIO(b"{}"), 2, "application/json")
+
+    response = store.get_object("transcripts", "a/transcript.json")
+
+    assert response.read() == b"{}"
+    assert store.stat_object("transcripts", "a/transcript.json").content_type == "application/json"
+    assert store.presigned_put_object("temp", "b/audio.mp3") == "memory://temp/b/audio.mp3"
+
+
+def test_memory_store_raises_minio_not_found_codes() -> None:
+    store = MemoryObjectStore()
+
+    with pytest.raises(S3Error) as missing_bucket:
+        store.stat_object("transcripts", "missing.json")
+    store.make_bucket("transcripts")
+    with pytest.raises(S3Error) as missing_key:
+        store.get_object("transcripts", "missing.json")
+
+    assert missing_bucket.value.code == "NoSuchBucket"
+    assert missing_key.value.code == "NoSuchKey"
@@ -7,11 +7,15 @@ from types import SimpleNamespace
 from typing import Any
 
 import pytest
+from sounds_right_contracts.artifacts import decode_artifact
+from sounds_right_contracts.seek_index import SeekIndex
+from sounds_right_contracts.word_timings import WORD_TIMINGS_BINARY_CONTENT_TYPE, WordTimings
 
 from sounds_right_api.domain.schemas import TranscriptDocument
 from sounds_right_api.models import Artist, Publication, Track, TrackVersion, User
 from sounds_right_api.services import publications
-from sounds_right_api.services.publications import service
+from sounds_right_api.services.publications import artifacts, service
+from sounds_right_api.storage.memory import MemoryObjectStore
 
 
 class FakeScalarResult:
@@ -69,6 +73,8 @@ class FakeMinioClient:
     def __init__(self, transcript: dict[str, Any]) -> None:
         self.transcript = transcript
         self.objects: dict[str, bytes] = {}
+        self.encodings: dict[str, str | None] = {}
+        self.content_types: dict[str, str] = {}
 
     def get_object(self, _bucket: str, _key: str) -> FakeResponse:
         return FakeResponse(json.dumps(self.transcript).encode("utf-8"))
@@ -80,9 +86,11 @@ class FakeMinioClient:
         data: Any,
         length: int,
         content_type: str,
+        metadata: dict[str, str] | None = None,
     ) -> None:
-        assert content_type == "application/json"
         self.objects[object_key] = data.read(length)
+        self.content_types[object_key] = content_type
+        self.encodings[object_key] = (metadata or {}).get("Content-Encoding")
 
 
 def make_user(role: str = "reviewer") -> User:
@@ -151,6 +159,7 @@ async def test_publish_approved_version_writes_public_artifacts(
     settings = SimpleNamespace(
         minio_transcripts_bucket="transcripts",
         minio_public_bucket="public",
+        artifact_encoding="gzip",
     )
 
     async def load_transcript(_version: TrackVersion, _settings: object) -> TranscriptDocument:
@@ -166,14 +175,33 @@ async def test_publish_approved_version_writes_public_artifacts(
     )
 
     result = await publications.publish_version(
-        session, version.id, make_user(), settings  # type: ignore[arg-type]
+        session,
+        version.id,
+        make_user(),
+        settings,  # type: ignore[arg-type]
     )
 
     assert result.status == "published"
     assert version.status == "published"
     assert session.committed is True
     assert "karaoke/kendrick-lamar/squabble-up/latest.json" in client.objects
-    assert "karaoke/kendrick-lamar/squabble-up/versions/v1/transcript.json" in client.objects
+    transcript_key = "karaoke/kendrick-lamar/squabble-up/versions/v1/transcript.json"
+    assert client.content_types[transcript_key] == "application/json"
+    assert client.encodings[transcript_key] == "gzip"
+    assert json.loads(decode_artifact(client.objects[transcript_key]))["text"] == "hello world"
+    version_root = "karaoke/kendrick-lamar/squabble-up/versions/v1"
+    seek_index = SeekIndex.from_json(
+        json.loads(decode_artifact(client.objects[f"{version_root}/seek-index.json"])),
+    )
+    assert seek_index.describes(decode_artifact(client.objects[transcript_key]))
+    timings = json.loads(decode_artifact(client.objects[f"{version_root}/word-timings.json"]))
+    assert timings["strings"] == ["hello", "world"]
+    assert timings["start_ms"] == [0, 1000]
+    binary = decode_artifact(client.objects[f"{version_root}/word-timings.bin"])
+    assert WordTimings.from_bytes(binary) == WordTimings.from_json(timings)
+    assert client.content_types[f"{version_root}/word-timings.bin"] == (
+        WORD_TIMINGS_BINARY_CONTENT_TYPE
+    )
     assert result.public_urls.latest == "/api/public/karaoke/kendrick-lamar/squabble-up/latest"
 
 
@@ -191,3 +219,27 @@ async def test_publish_rejects_non_approved_version() -> None:
         )
 
     assert session.committed is False
+
+
+def test_public_artifacts_round_trip_compressed(monkeypatch: pytest.MonkeyPatch) -> None:
+    store = MemoryObjectStore()
+    settings = SimpleNamespace(minio_public_bucket="public", artifact_encoding="gzip")
+    transcript = TranscriptDocument.model_validate(transcript_payload(uuid.uuid4()))
+    monkeypatch.setattr(artifacts, "create_minio_client", lambda _settings: store)
+
+    artifacts.write_json_object(
+        store,
+        settings,  # type: ignore[arg-type]
+        "transcript.json",
+        transcript,
+    )
+
+    stored = store.get_object("public", "transcript.json").read()
+    assert stored.startswith(b"\x1f\x8b")
+    assert store.stat_object("public", "transcript.json").content_encoding == "gzip"
+    read_back = artifacts.read_public_json(
+        settings,  # type: ignore[arg-type]
+        "transcript.json",
+        TranscriptDocument,
+    )
+    assert read_back == transcript
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import json
+import logging
+import uuid
+from io import BytesIO
+
+import pytest
+from sounds_right_contracts.artifacts import encode_artifact
+from sounds_right_contracts.seek_index import SeekIndex
+
+from sounds_right_api.domain.schemas import TranscriptDocument
+from sounds_right_api.services.transcript_windows import (
+    read_seek_index,
+    read_stored_transcript,
+    seek_bounds,
+    seek_index_key,
+    transcript_seek_index,
+    transcript_window,
+)
+from sounds_right_api.storage.memory import MemoryObjectResponse, MemoryObjectStore
+
+
+class CountingStore(MemoryObjectStore):
+    def __init__(self) -> None:
+        super().__init__()
+        self.reads: list[str] = []
+
+    def get_object(self, bucket_name: str, object_name: str) -> MemoryObjectResponse:
+        self.reads.append(object_name)
+        return super().get_object(bucket_name, object_name)
+
+
+def _put(store: MemoryObjectStore, key: str, data: bytes) -> None:
+    body = encode_artifact(data, "gzip")
+    store.put_object("transcripts", key, BytesIO(body), len(body), "application/json")
+
+
+def transcript_bytes() -> bytes:
+    segments = [
+        {
+            "id": index,
+            "start": index * 4.0,
+            "end": index * 4.0 + 3.5,
+            "text": f"line {index}",
+            "words": [
+                {"word": "line", "start": index * 4.0, "end": index * 4.0 + 1.0},
+                {"word": str(index), "start": index * 4.0 + 1.0, "end": index * 4.0 + 3.5},
+            ],
+        }
+        for index in range(50)
+    ]
+    document = TranscriptDocument.model_validate(
+        {
+            "schema_version": "1.0",
+            "engine": {"name": "whisper.cpp"},
+            "metadata": {"duration_seconds": 200.0},
+            "segments": segments,
+        },
+    )
+    return document.model_dump_json().encode("utf-8")
+
+
+def test_window_returns_only_overlapping_segments_and_words() -> None:
+    document = transcript_bytes()
+    index = SeekIndex.from_transcript_json(document)
+
+    window = transcript_window(document, index, 100.5, 108.2)
+
+    assert window.segment_count == 50
+    assert [segment.id for segment in window.segments] == [25, 26, 27]
+    assert [(word.segment_id, word.word) for word in window.words] == [
+        (25, "line"),
+        (25, "25"),
+        (26, "line"),
+        (26, "26"),
+        (27, "line"),
+    ]
+
+
+def test_verified_index_is_cached_per_transcript_etag() -> None:
+    store = CountingStore()
+    document = transcript_bytes()
+    key = f"transcripts/{uuid.uuid4()}/transcript.json"
+    _put(store, key, document)
+    index = SeekIndex.from_transcript_json(document)
+    _put(store, seek_index_key(key), json.dumps(index.to_json()).encode("utf-8"))
+
+    first = read_stored_transcript(store, "transcripts", key)
+    assert transcript_seek_index(store, "transcripts", key, first) == index
+    second = read_stored_transcript(store, "transcripts", key)
+    assert transcript_seek_index(store, "transcripts", key, second) == index
+
+    assert first.etag is not None and first.etag == second.etag
+    assert store.reads == [key, seek_index_key(key), key]
+
+
+def test_transcripts_without_a_matching_index_are_indexed_and_logged(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    store = CountingStore()
+    document = transcript_bytes()
+    key = f"transcripts/{uuid.uuid4()}/transcript.json"
+    _put(store, key, document)
+    stale = SeekIndex.from_transcript_json(document.replace(b"line 1", b"line one"))
+    _put(store, seek_index_key(key), json.dumps(stale.to_json()).encode("utf-8"))
+    caplog.set_level(logging.WARNING, logger="sounds_right_api.services.transcript_windows")
+
+    transcript = read_stored_transcript(store, "transcripts", key)
+    index = transcript_seek_index(store, "transcripts", key, transcript)
+    transcript_seek_index(store, "transcripts", key, transcript)
+
+    assert index == SeekIndex.from_transcript_json(document)
+    assert [record.getMessage() for record in caplog.records] == [
+        "transcript has no matching seek index, indexing it on the fly"
+    ]
+
+
+def test_seek_index_is_read_beside_the_transcript() -> None:
+    store = MemoryObjectStore()
+    document = transcript_bytes()
+    body = encode_artifact(
+        json.dumps(SeekIndex.from_transcript_json(document).to_json()).encode("utf-8"),
+        "gzip",
+    )
+    key = seek_index_key("transcripts/version/transcript.json")
+    store.put_object("transcripts", key, BytesIO(body), len(body), "application/json")
+
+    assert key == "transcripts/version/seek-index.json"
+    assert read_seek_index(store, "transcripts", key) is not None
+    assert read_seek_index(store, "transcripts", "transcripts/other/seek-index.json") is None
+    assert seek_bounds(3.0, 5.0, 30.0) == (0.0, 33.0)
@@ -0,0 +1 @@
+"""End-to-end load test of the API, projector and mock worker in one process."""
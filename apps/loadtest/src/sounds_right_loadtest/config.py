@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import argparse
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from sounds_right_worker.jobs.mock import MockProfile, load_latency_samples, parse_failure_rates
+
+
+@dataclass(frozen=True)
+class LoadTestConfig:
+    # Virtual users of each stage, run one after the other.
+    stages: tuple[int, ...] = (10,)
+    stage_seconds: float = 60
+    # Users of a stage start spread over this window.
+    ramp_up_seconds: float = 10
+    think_seconds: float = 0.5
+    poll_seconds: float = 0.5
+    job_timeout_seconds: float = 120
+    worker_replicas: int = 1
+    mock_profile: MockProfile = field(default_factory=MockProfile)
+    sample_seconds: float = 1.0
+    # A stage passes when every endpoint's p95 and the error rate stay within these.
+    max_p95_ms: float = 500
+    max_error_rate: float = 0.01
+    report_path: Path | None = None
+
+
+def parse_args(argv: Sequence[str] | None = None) -> LoadTestConfig:
+    parser = argparse.ArgumentParser(
+        prog="sounds-right-loadtest",
+        description="Drive the API with virtual users against local Postgres, with an "
+        "in-process event bus, object store and mock workers.",
+    )
+    parser.add_argument(
+        "--users",
+        default="10",
+        help="virtual users per stage, comma-separated (e.g. 10,20,40)",
+    )
+    parser.add_argument("--stage-seconds", type=float, default=60)
+    parser.add_argument("--ramp-up-seconds", type=float, default=10)
+    parser.add_argument("--think-seconds", type=float, default=0.5)
+    parser.add_argument("--poll-seconds", type=float, default=0.5)
+    parser.add_argument("--job-timeout-seconds", type=float, default=120)
+    add_mock_worker_arguments(parser)
+    parser.add_argument("--sample-seconds", type=float, default=1.0)
+    parser.add_argument("--max-p95-ms", type=float, default=500)
+    parser.add_argument("--max-error-rate", type=float, default=0.01)
+    parser.add_argument("--report", type=Path, help="write the JSON report here")
+    args = parser.parse_args(argv)
+
+    stages = tuple(int(users) for users in args.users.split(",") if users.strip())
+    if not stages or min(stages) < 1:
+        parser.error("--users needs at least one positive count")
+    return LoadTestConfig(
+        stages=stages,
+        stage_seconds=args.stage_seconds,
+        ramp_up_seconds=args.ramp_up_seconds,
+        think_seconds=args.think_seconds,
+        poll_seconds=args.poll_seconds,
+        job_timeout_seconds=args.job_timeout_seconds,
+        worker_replicas=max(args.workers, 1),
+        mock_profile=mock_profile_from_args(args),
+        sample_seconds=args.sample_seconds,
+        max_p95_ms=args.max_p95_ms,
+        max_error_rate=args.max_error_rate,
+        report_path=args.report,
+    )
+
+
+def add_mock_worker_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--workers", type=int, default=1, help="mock worker replicas")
+    parser.add_argument("--worker-concurrency", type=int, default=32)
+    parser.add_argument("--step-delay-seconds", type=float, default=0.5)
+    parser.add_argument("--latency-samples", type=Path, help="file of real job durations")
+    parser.add_argument("--time-scale", type=float, default=1.0)
+    parser.add_argument("--progress-events", type=int, default=4)
+    parser.add_argument(
+        "--failure-rates",
+        type=_failure_rates,
+        default="",
+        help="error_code=probability pairs, comma-separated",
+    )
+    parser.add_argument("--seed", type=int)
+
+
+def mock_profile_from_args(args: argparse.Namespace) -> MockProfile:
+    return MockProfile(
+        step_delay_seconds=args.step_delay_seconds,
+        latency_samples=load_latency_samples(args.latency_samples) if args.latency_samples else (),
+        time_scale=args.time_scale,
+        progress_events=max(args.progress_events, 0),
+        failure_rates=args.failure_rates,
+        concurrency=max(args.worker_concurrency, 1),
+        seed=args.seed,
+    )
+
+
+def _failure_rates(value: str) -> dict[str, float]:
+    try:
+        return parse_failure_rates(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from exc
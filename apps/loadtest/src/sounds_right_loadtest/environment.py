@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import os
+
+# The broker and object store are replaced by in-process stand-ins, so their
+# connection settings only need to be present.
+_STAND_IN_ENV = {
+    "EVENT_BUS_BACKEND": "memory",
+    # The API, its projector and the stand-in workers share this process.
+    "EVENT_BUS_IN_PROCESS": "true",
+    "STORAGE_BACKEND": "memory",
+    "API_ENABLE_PROJECTOR": "true",
+}
+_PLACEHOLDER_ENV = {
+    "KAFKA_BOOTSTRAP_SERVERS": "in-process",
+    "MINIO_ENDPOINT": "in-process",
+    "MINIO_PUBLIC_ENDPOINT": "in-process",
+    "MINIO_ACCESS_KEY": "loadtest",
+    "MINIO_SECRET_KEY": "loadtest",
+    "MINIO_TEMP_AUDIO_BUCKET": "temp-audio",
+    "MINIO_TRANSCRIPTS_BUCKET": "transcripts",
+    "MINIO_ARTIFACTS_BUCKET": "artifacts",
+    "MINIO_PUBLIC_BUCKET": "public",
+    "JWT_SECRET": "loadtest-secret",
+}
+
+
+def use_stand_in_backends() -> None:
+    """Select the in-process backends; call before importing API modules.
+
+    The API reads its settings and creates its database engine at import.
+    """
+    os.environ.update(_STAND_IN_ENV)
+    for name, value in _PLACEHOLDER_ENV.items():
+        os.environ.setdefault(name, value)
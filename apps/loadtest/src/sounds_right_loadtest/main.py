@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import json
+import sys
+from collections.abc import Sequence
+
+from sounds_right_loadtest.config import parse_args
+from sounds_right_loadtest.environment import use_stand_in_backends
+from sounds_right_loadtest.metrics import LoadTestReport
+
+
+def format_report(report: LoadTestReport) -> str:
+    lines = []
+    for stage in report.stages:
+        resources = stage.resources
+        lines.append(
+            f"{stage.users} users, {stage.seconds}s: "
+            f"{'PASS' if stage.passed else 'FAIL'} "
+            f"error_rate={stage.error_rate} "
+            f"jobs={stage.jobs_completed}/{stage.jobs_started} "
+            f"failed={stage.jobs_failed} timed_out={stage.jobs_timed_out} "
+            f"jobs/min={stage.jobs_per_minute} job_p95_ms={stage.job_latency.p95_ms}"
+        )
+        lines.append(
+            f"  projector lag max={resources.projector_lag_max_records} records "
+            f"p95={resources.projector_lag_p95_seconds}s; "
+            f"db pool max={resources.db_pool_max_checked_out}/{resources.db_pool_limit} "
+            f"saturated={resources.db_pool_saturated_share:.1%}"
+        )
+        for endpoint, summary in stage.endpoints.items():
+            lines.append(
+                f"  {endpoint:<64} n={summary.count:<6} err={summary.errors:<4} "
+                f"p50={summary.p50_ms}ms p95={summary.p95_ms}ms p99={summary.p99_ms}ms"
+            )
+    capacity = report.capacity
+    lines.append(
+        f"capacity: {capacity.users} concurrent users"
+        if capacity is not None
+        else "capacity: no stage passed"
+    )
+    return "\n".join(lines)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    config = parse_args(argv)
+    use_stand_in_backends()
+
+    # Imported late: the API reads its settings when its modules load.
+    from sounds_right_loadtest.runner import run_load_test
+    from sounds_right_loadtest.users import FlowError
+
+    report = None
+    try:
+        report = asyncio.run(run_load_test(config))
+    except* FlowError as group:
+        # Raised while creating the reviewer, before any stage ran.
+        print(f"load test setup failed: {group.exceptions[0]}", file=sys.stderr)
+        print("is DATABASE_URL pointing at a migrated database?", file=sys.stderr)
+    if report is None:
+        return 2
+    print(format_report(report))
+    if config.report_path is not None:
+        payload = dataclasses.asdict(report)
+        capacity = report.capacity
+        payload["capacity_users"] = capacity.users if capacity is not None else None
+        config.report_path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    return 0 if report.capacity is not None else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
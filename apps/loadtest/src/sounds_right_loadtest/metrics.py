@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import asyncio
+import math
+from collections import Counter, defaultdict
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Protocol
+
+from sounds_right_contracts.bus import GroupLag, MemoryBus
+
+
+def percentile(values: Sequence[float], share: float) -> float:
+    """Nearest-rank percentile of ``values`` (0 when empty)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(math.ceil(share * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+@dataclass(frozen=True)
+class LatencySummary:
+    count: int
+    errors: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+
+    @classmethod
+    def from_seconds(cls, durations: Sequence[float], errors: int = 0) -> LatencySummary:
+        return cls(
+            count=len(durations),
+            errors=errors,
+            p50_ms=round(percentile(durations, 0.50) * 1000, 1),
+            p95_ms=round(percentile(durations, 0.95) * 1000, 1),
+            p99_ms=round(percentile(durations, 0.99) * 1000, 1),
+            max_ms=round(max(durations, default=0.0) * 1000, 1),
+        )
+
+
+class EndpointRecorder:
+    """Response times per endpoint template, e.g. ``GET /api/jobs/{job_id}``."""
+
+    def __init__(self) -> None:
+        self._durations: defaultdict[str, list[float]] = defaultdict(list)
+        self._errors: Counter[str] = Counter()
+
+    def record(self, endpoint: str, seconds: float, ok: bool) -> None:
+        self._durations[endpoint].append(seconds)
+        if not ok:
+            self._errors[endpoint] += 1
+
+    def summary(self) -> dict[str, LatencySummary]:
+        return {
+            endpoint: LatencySummary.from_seconds(durations, self._errors[endpoint])
+            for endpoint, durations in sorted(self._durations.items())
+        }
+
+
+@dataclass
+class JobOutcomes:
+    started: int = 0
+    completed: int = 0
+    failed: int = 0
+    timed_out: int = 0
+    # Seconds from start-transcription until the API reported the terminal status.
+    durations: list[float] = field(default_factory=list)
+
+
+class PoolStatus(Protocol):
+    """The ``QueuePool`` counters the sampler reads."""
+
+    def size(self) -> int: ...
+
+    def checkedout(self) -> int: ...
+
+
+@dataclass(frozen=True)
+class LagSummary:
+    max_records: int
+    p95_seconds: float
+    max_seconds: float
+
+
+class LagSampler:
+    """Samples a consumer group's lag on one topic of the in-process bus."""
+
+    def __init__(self, bus: MemoryBus, topic: str, group_id: str) -> None:
+        self._bus = bus
+        self._topic = topic
+        self._group = group_id
+        self._records: list[int] = []
+        self._seconds: list[float] = []
+
+    def sample(self) -> GroupLag:
+        lag = self._bus.group_lag(self._group, self._topic)
+        self._records.append(lag.records)
+        self._seconds.append(lag.oldest_age_seconds)
+        return lag
+
+    def summary(self) -> LagSummary:
+        return LagSummary(
+            max_records=max(self._records, default=0),
+            p95_seconds=round(percentile(self._seconds, 0.95), 3),
+            max_seconds=round(max(self._seconds, default=0.0), 3),
+        )
+
+
+@dataclass(frozen=True)
+class ResourceSummary:
+    projector_lag_max_records: int
+    projector_lag_p95_seconds: float
+    projector_lag_max_seconds: float
+    db_pool_limit: int
+    db_pool_max_checked_out: int
+    # Share of samples with every pooled connection (overflow included) checked out.
+    db_pool_saturated_share: float
+
+
+class ResourceSampler:
+    """Samples projector lag on the in-process bus and DB pool usage."""
+
+    def __init__(
+        self,
+        bus: MemoryBus,
+        topic: str,
+        projector_group: str,
+        pool: PoolStatus,
+        pool_limit: int,
+        interval_seconds: float,
+    ) -> None:
+        self._lag = LagSampler(bus, topic, projector_group)
+        self._pool = pool
+        self._pool_limit = pool_limit
+        self._interval = interval_seconds
+        self._checked_out: list[int] = []
+
+    async def run(self) -> None:
+        while True:
+            self.sample()
+            await asyncio.sleep(self._interval)
+
+    def sample(self) -> None:
+        self._lag.sample()
+        self._checked_out.append(self._pool.checkedout())
+
+    def summary(self) -> ResourceSummary:
+        lag = self._lag.summary()
+        saturated = sum(1 for count in self._checked_out if count >= self._pool_limit)
+        return ResourceSummary(
+            projector_lag_max_records=lag.max_records,
+            projector_lag_p95_seconds=lag.p95_seconds,
+            projector_lag_max_seconds=lag.max_seconds,
+            db_pool_limit=self._pool_limit,
+            db_pool_max_checked_out=max(self._checked_out, default=0),
+            db_pool_saturated_share=round(saturated / max(len(self._checked_out), 1), 3),
+        )
+
+
+@dataclass(frozen=True)
+class StageReport:
+    users: int
+    seconds: float
+    endpoints: dict[str, LatencySummary]
+    jobs_started: int
+    jobs_completed: int
+    jobs_failed: int
+    jobs_timed_out: int
+    job_latency: LatencySummary
+    jobs_per_minute: float
+    resources: ResourceSummary
+    error_rate: float
+    passed: bool
+
+    @classmethod
+    def build(
+        cls,
+        users: int,
+        seconds: float,
+        recorder: EndpointRecorder,
+        outcomes: JobOutcomes,
+        resources: ResourceSummary,
+        max_p95_ms: float,
+        max_error_rate: float,
+    ) -> StageReport:
+        endpoints = recorder.summary()
+        requests = sum(summary.count for summary in endpoints.values())
+        errors = sum(summary.errors for summary in endpoints.values())
+        error_rate = errors / requests if requests else 0.0
+        finished = outcomes.completed + outcomes.failed
+        passed = (
+            requests > 0
+            and error_rate <= max_error_rate
+            and outcomes.timed_out == 0
+            and all(summary.p95_ms <= max_p95_ms for summary in endpoints.values())
+        )
+        return cls(
+            users=users,
+            seconds=round(seconds, 1),
+            endpoints=endpoints,
+            jobs_started=outcomes.started,
+            jobs_completed=outcomes.completed,
+            jobs_failed=outcomes.failed,
+            jobs_timed_out=outcomes.timed_out,
+            job_latency=LatencySummary.from_seconds(outcomes.durations),
+            jobs_per_minute=round(finished * 60 / seconds, 1) if seconds else 0.0,
+            resources=resources,
+            error_rate=round(error_rate, 4),
+            passed=passed,
+        )
+
+
+@dataclass(frozen=True)
+class LoadTestReport:
+    stages: list[StageReport]
+
+    @property
+    def capacity(self) -> StageReport | None:
+        """The largest stage passed before the first failing one."""
+        best = None
+        for stage in self.stages:
+            if not stage.passed:
+                break
+            best = stage
+        return best
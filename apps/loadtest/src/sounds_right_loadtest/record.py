@@ -0,0 +1,118 @@
+"""Record event topics from Kafka into a replayable file.
+
+    python -m sounds_right_loadtest.record --output events.jsonl.gz --duration-seconds 3600
+
+The recorder reads without a consumer group, so it commits nothing and does
+not take partitions from the services it observes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import os
+import signal
+import sys
+import time
+from collections.abc import Sequence
+from pathlib import Path
+
+from aiokafka import AIOKafkaConsumer  # type: ignore[import-untyped]
+
+from sounds_right_loadtest.recording import RecordingWriter
+
+
+async def record_topics(
+    writer: RecordingWriter,
+    consumer: AIOKafkaConsumer,
+    stop: asyncio.Event,
+    *,
+    duration_seconds: float | None = None,
+    max_events: int | None = None,
+) -> None:
+    deadline = time.monotonic() + duration_seconds if duration_seconds else None
+    await consumer.start()
+    try:
+        while not stop.is_set():
+            if deadline is not None and time.monotonic() >= deadline:
+                return
+            batches = await consumer.getmany(timeout_ms=500)
+            for records in batches.values():
+                for record in records:
+                    writer.add(
+                        record.topic,
+                        record.key,
+                        record.value,
+                        record.headers or (),
+                        # Broker timestamps keep the traffic's shape when
+                        # recording from the beginning of the retained log.
+                        record.timestamp / 1000,
+                    )
+                    if max_events is not None and writer.count >= max_events:
+                        return
+    finally:
+        await consumer.stop()
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="sounds-right-record",
+        description="Record event topics with their timing into a gzip-compressed file.",
+    )
+    parser.add_argument("--output", type=Path, required=True)
+    parser.add_argument(
+        "--topic",
+        action="append",
+        dest="topics",
+        help="topic to record; repeat for several (default: KAFKA_TOPIC and KAFKA_COMMANDS_TOPIC)",
+    )
+    parser.add_argument(
+        "--bootstrap-servers",
+        default=os.environ.get("KAFKA_BOOTSTRAP_SERVERS", "localhost:19092"),
+    )
+    parser.add_argument(
+        "--from-beginning",
+        action="store_true",
+        help="start at the oldest retained records instead of new ones",
+    )
+    parser.add_argument("--duration-seconds", type=float)
+    parser.add_argument("--max-events", type=int)
+    args = parser.parse_args(argv)
+    topics = args.topics or [
+        os.environ.get("KAFKA_TOPIC", "sounds-right.events"),
+        os.environ.get("KAFKA_COMMANDS_TOPIC", "sounds-right.commands"),
+    ]
+
+    async def run() -> int:
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, stop.set)
+        consumer = AIOKafkaConsumer(
+            *topics,
+            bootstrap_servers=args.bootstrap_servers,
+            client_id="sounds-right-recorder",
+            group_id=None,
+            enable_auto_commit=False,
+            auto_offset_reset="earliest" if args.from_beginning else "latest",
+            # Skip events from aborted worker transactions, like the projector.
+            isolation_level="read_committed",
+        )
+        with RecordingWriter(args.output, topics) as writer:
+            with contextlib.suppress(asyncio.CancelledError):
+                await record_topics(
+                    writer,
+                    consumer,
+                    stop,
+                    duration_seconds=args.duration_seconds,
+                    max_events=args.max_events,
+                )
+        print(f"recorded {writer.count} events from {', '.join(topics)} to {args.output}")
+        return 0
+
+    return asyncio.run(run())
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+"""Recordings of event topics: one gzip-compressed JSON object per line.
+
+The first line describes the recording; every other line is one record with
+its offset in seconds from the first record, so replays keep the traffic's
+shape. Keys, values and header values are base64-encoded bytes, as recorded.
+"""
+
+from __future__ import annotations
+
+import base64
+import gzip
+import json
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import IO, Any
+
+RECORDING_FORMAT = "sounds-right-events"
+RECORDING_VERSION = 1
+
+
+class RecordingError(Exception):
+    """The file is not a recording this version can read."""
+
+
+@dataclass(frozen=True)
+class RecordedEvent:
+    offset_seconds: float
+    topic: str
+    key: bytes | None
+    value: bytes
+    headers: tuple[tuple[str, bytes], ...]
+
+
+class RecordingWriter:
+    """Appends records to a recording, timing them from the first record.
+
+    Offsets never decrease: a record timestamped before the previous one (other
+    partitions, producer clock skew) is placed at the previous record's offset,
+    so replays keep the recorded order.
+    """
+
+    def __init__(self, path: Path, topics: Sequence[str]) -> None:
+        self.path = path
+        self.count = 0
+        self._file: IO[str] = gzip.open(path, "wt", encoding="utf-8")
+        self._first: float | None = None
+        self._last_offset = 0.0
+        self._write(
+            {
+                "format": RECORDING_FORMAT,
+                "version": RECORDING_VERSION,
+                "topics": list(topics),
+                "recorded_at": datetime.now(UTC).isoformat(),
+            }
+        )
+
+    def add(
+        self,
+        topic: str,
+        key: bytes | None,
+        value: bytes,
+        headers: Sequence[tuple[str, bytes]],
+        timestamp: float,
+    ) -> RecordedEvent:
+        """Append a record; ``timestamp`` is in epoch seconds."""
+        if self._first is None:
+            self._first = timestamp
+        self._last_offset = max(timestamp - self._first, self._last_offset)
+        event = RecordedEvent(
+            offset_seconds=round(self._last_offset, 6),
+            topic=topic,
+            key=key,
+            value=value,
+            headers=tuple(headers),
+        )
+        self._write(
+            {
+                "t": event.offset_seconds,
+                "topic": topic,
+                "key": _b64(key) if key is not None else None,
+                "value": _b64(value),
+                "headers": [[name, _b64(header)] for name, header in event.headers],
+            }
+        )
+        self.count += 1
+        return event
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> RecordingWriter:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    def _write(self, line: dict[str, Any]) -> None:
+        self._file.write(json.dumps(line, separators=(",", ":")) + "\n")
+
+
+def read_recording(path: Path) -> Iterator[RecordedEvent]:
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        header = json.loads(file.readline() or "null")
+        if not isinstance(header, dict) or header.get("format") != RECORDING_FORMAT:
+            raise RecordingError(f"{path} is not an event recording")
+        if header.get("version") != RECORDING_VERSION:
+            raise RecordingError(f"unsupported recording version {header.get('version')!r}")
+        for line in file:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            yield RecordedEvent(
+                offset_seconds=float(record["t"]),
+                topic=record["topic"],
+                key=base64.b64decode(record["key"]) if record["key"] is not None else None,
+                value=base64.b64decode(record["value"]),
+                headers=tuple((name, base64.b64decode(value)) for name, value in record["headers"]),
+            )
+
+
+def _b64(value: bytes) -> str:
+    return base64.b64encode(value).decode("ascii")
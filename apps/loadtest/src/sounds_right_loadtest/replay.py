@@ -0,0 +1,476 @@
+"""Replay a recording into the projector or mock workers at a chosen speed.
+
+    python -m sounds_right_loadtest.replay events.jsonl.gz --target projector --speed 10
+
+Events go through the in-process bus. Every id in them is replaced with a
+fresh one, so one recording can be replayed repeatedly into the same
+database. The projector target seeds a version and a job row for each
+replayed job before sending, so the projector does the same database work as
+for live traffic.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import dataclasses
+import json
+import sys
+import time
+import uuid
+from collections.abc import Callable, Collection, Iterable, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Literal
+
+from sounds_right_contracts.bus import BusConsumer, BusProducer, MemoryBus, get_memory_bus
+from sounds_right_contracts.events import (
+    COMMAND_EVENT_TYPES,
+    EventEnvelope,
+    decode_event,
+    encode_event,
+    event_headers,
+    header_content_type,
+)
+from sounds_right_worker.jobs.mock import MockProfile
+
+from sounds_right_loadtest.config import add_mock_worker_arguments, mock_profile_from_args
+from sounds_right_loadtest.environment import use_stand_in_backends
+from sounds_right_loadtest.metrics import LagSampler, LagSummary, LatencySummary
+from sounds_right_loadtest.recording import RecordedEvent, read_recording
+
+ReplayTarget = Literal["projector", "worker"]
+
+# The topics only need to agree within this process.
+COMMANDS_TOPIC = "sounds-right.commands"
+EVENTS_TOPIC = "sounds-right.events"
+_OBSERVER_GROUP = "sounds-right-replay-observer"
+_TERMINAL_EVENT_TYPES = frozenset({"transcription.completed", "transcription.failed"})
+_LIFECYCLE_EVENT_TYPES = frozenset(
+    {
+        "transcription.started",
+        "transcription.progress",
+        "transcription.preview",
+        "transcription.partial",
+        "transcription.completed",
+        "transcription.failed",
+    }
+)
+
+
+@dataclass(frozen=True)
+class ReplayConfig:
+    recording: Path
+    target: ReplayTarget = "projector"
+    # 1 keeps the recorded timing, 10 sends ten times faster, 0 as fast as possible.
+    speed: float = 1.0
+    worker_replicas: int = 1
+    mock_profile: MockProfile = field(default_factory=MockProfile)
+    sample_seconds: float = 1.0
+    # How long to wait after the last event for the target to catch up.
+    drain_timeout_seconds: float = 300
+    report_path: Path | None = None
+
+
+@dataclass(frozen=True)
+class ReplayedEvent:
+    # Seconds after the first replayed event, in recorded time.
+    offset_seconds: float
+    key: bytes
+    value: bytes
+    headers: list[tuple[str, bytes]]
+    event: EventEnvelope
+
+    @property
+    def job_id(self) -> uuid.UUID:
+        return self.event.payload.job_id
+
+
+@dataclass(frozen=True)
+class ReplayReport:
+    target: ReplayTarget
+    speed: float
+    events_replayed: int
+    # Records of the replayed types that could not be decoded.
+    events_skipped: int
+    recorded_seconds: float
+    replay_seconds: float
+    # From the last sent event until the target caught up (or gave up).
+    drain_seconds: float
+    drained: bool
+    events_per_second: float
+    # How far sending fell behind the recorded schedule.
+    replay_behind_max_seconds: float
+    lag: LagSummary
+    jobs: int
+    jobs_completed: int
+    jobs_failed: int
+    jobs_unfinished: int
+    # Worker target only: from sending a request until its terminal event.
+    job_latency: LatencySummary
+
+
+class IdRemapper:
+    """Maps every recorded id to a fresh one, consistently within a replay."""
+
+    def __init__(self) -> None:
+        self._ids: dict[uuid.UUID, uuid.UUID] = {}
+
+    def __call__(self, recorded: uuid.UUID) -> uuid.UUID:
+        mapped = self._ids.get(recorded)
+        if mapped is None:
+            mapped = self._ids[recorded] = uuid.uuid4()
+        return mapped
+
+    def event(self, event: EventEnvelope) -> EventEnvelope:
+        payload = event.payload
+        ids = {
+            name: self(getattr(payload, name))
+            for name in ("job_id", "track_version_id", "track_id", "artist_id")
+            if hasattr(payload, name)
+        }
+        return event.model_copy(
+            update={
+                "event_id": self(event.event_id),
+                "correlation_id": self(event.correlation_id),
+                "causation_id": (
+                    self(event.causation_id) if event.causation_id is not None else None
+                ),
+                "payload": payload.model_copy(update=ids),
+            }
+        )
+
+
+def prepare_replay(
+    recorded: Iterable[RecordedEvent],
+    event_types: Collection[str],
+    remapper: IdRemapper | None = None,
+) -> tuple[list[ReplayedEvent], int]:
+    """Decode, re-id and re-encode the recorded events of ``event_types``.
+
+    Returns the events to send and how many could not be decoded. Encoding
+    happens up front so it does not slow the replay itself.
+    """
+    remapper = remapper or IdRemapper()
+    prepared: list[ReplayedEvent] = []
+    skipped = 0
+    first: float | None = None
+    for record in recorded:
+        try:
+            event = decode_event(record.value, event_types=event_types, headers=record.headers)
+        except Exception:
+            skipped += 1
+            continue
+        if event is None:
+            continue
+        if first is None:
+            first = record.offset_seconds
+        event = remapper.event(event)
+        content_type = header_content_type(record.headers)
+        prepared.append(
+            ReplayedEvent(
+                offset_seconds=record.offset_seconds - first,
+                key=str(event.payload.job_id).encode("utf-8"),
+                value=encode_event(event, content_type),
+                headers=event_headers(event.event_type, content_type),
+                event=event,
+            )
+        )
+    return prepared, skipped
+
+
+async def send_paced(
+    producer: BusProducer,
+    topic: str,
+    events: Sequence[ReplayedEvent],
+    speed: float,
+    sent_at: dict[uuid.UUID, float],
+) -> float:
+    """Send ``events`` on the recorded schedule scaled by ``speed``.
+
+    Records when each job's first event went out in ``sent_at`` and returns
+    the most the sends fell behind schedule, in seconds.
+    """
+    started = time.monotonic()
+    behind = 0.0
+    for item in events:
+        if speed > 0:
+            delay = started + item.offset_seconds / speed - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            else:
+                behind = max(behind, -delay)
+        else:
+            # Let the target consume while the replay runs flat out.
+            await asyncio.sleep(0)
+        await producer.send_and_wait(topic, item.value, item.key, headers=item.headers)
+        sent_at.setdefault(item.job_id, time.monotonic())
+    return behind
+
+
+class JobObserver:
+    """Notes when each job's terminal event appears on the events topic."""
+
+    def __init__(self) -> None:
+        self.finished: dict[uuid.UUID, tuple[str, float]] = {}
+
+    async def run(self, consumer: BusConsumer) -> None:
+        await consumer.start()
+        try:
+            async for message in consumer:
+                event = decode_event(
+                    message.value,
+                    event_types=_TERMINAL_EVENT_TYPES,
+                    headers=message.headers,
+                )
+                if event is not None:
+                    self.finished.setdefault(
+                        event.payload.job_id, (event.event_type, time.monotonic())
+                    )
+        finally:
+            await consumer.stop()
+
+
+async def replay(
+    config: ReplayConfig,
+    bus: MemoryBus,
+    events: Sequence[ReplayedEvent],
+    skipped: int,
+    topic: str,
+    group_id: str,
+    observer: JobObserver | None = None,
+) -> ReplayReport:
+    """Send ``events`` to ``topic`` and wait until ``group_id`` has consumed them.
+
+    With an ``observer``, also wait for every job to finish and report job
+    latency from the first sent event.
+    """
+    sampler = LagSampler(bus, topic, group_id)
+    sent_at: dict[uuid.UUID, float] = {}
+
+    def caught_up() -> bool:
+        if sampler.sample().records:
+            return False
+        return observer is None or all(job in observer.finished for job in sent_at)
+
+    async def sample() -> None:
+        while True:
+            sampler.sample()
+            await asyncio.sleep(config.sample_seconds)
+
+    sampling = asyncio.create_task(sample())
+    started = time.monotonic()
+    try:
+        behind = await send_paced(bus.producer(), topic, events, config.speed, sent_at)
+        last_sent = time.monotonic()
+        drained = await _wait_until(caught_up, config.drain_timeout_seconds)
+        finished = time.monotonic()
+    finally:
+        sampling.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await sampling
+
+    terminal = observer.finished if observer is not None else {}
+    statuses = [terminal[job][0] for job in sent_at if job in terminal]
+    return ReplayReport(
+        target=config.target,
+        speed=config.speed,
+        events_replayed=len(events),
+        events_skipped=skipped,
+        recorded_seconds=round(events[-1].offset_seconds, 3) if events else 0.0,
+        replay_seconds=round(last_sent - started, 3),
+        drain_seconds=round(finished - last_sent, 3),
+        drained=drained,
+        events_per_second=round(len(events) / max(finished - started, 1e-9), 1),
+        replay_behind_max_seconds=round(behind, 3),
+        lag=sampler.summary(),
+        jobs=len(sent_at),
+        jobs_completed=statuses.count("transcription.completed"),
+        jobs_failed=statuses.count("transcription.failed"),
+        jobs_unfinished=len(sent_at) - len(statuses) if observer is not None else 0,
+        job_latency=LatencySummary.from_seconds(
+            [terminal[job][1] - sent_time for job, sent_time in sent_at.items() if job in terminal]
+        ),
+    )
+
+
+async def replay_into_workers(
+    config: ReplayConfig,
+    recorded: Iterable[RecordedEvent],
+) -> ReplayReport:
+    """Replay the recorded job requests to mock workers on the in-process bus."""
+    from sounds_right_api.storage.memory import get_memory_object_store
+
+    from sounds_right_loadtest.worker import WORKER_GROUP, run_stand_in_worker
+
+    events, skipped = prepare_replay(recorded, COMMAND_EVENT_TYPES)
+    bus = get_memory_bus()
+    observer = JobObserver()
+    tasks = [
+        asyncio.create_task(observer.run(bus.consumer(EVENTS_TOPIC, group_id=_OBSERVER_GROUP)))
+    ]
+    tasks.extend(
+        asyncio.create_task(
+            run_stand_in_worker(
+                f"replay-worker-{index}",
+                COMMANDS_TOPIC,
+                EVENTS_TOPIC,
+                config.mock_profile,
+                get_memory_object_store(),
+                "transcripts",
+            )
+        )
+        for index in range(config.worker_replicas)
+    )
+    try:
+        return await replay(
+            config, bus, events, skipped, COMMANDS_TOPIC, WORKER_GROUP, observer=observer
+        )
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def replay_into_projector(
+    config: ReplayConfig,
+    recorded: Iterable[RecordedEvent],
+) -> ReplayReport:
+    """Replay the recorded lifecycle events to the API projector and local Postgres."""
+    from sounds_right_api.config import get_settings
+    from sounds_right_api.events.projector import run_projector
+
+    settings = get_settings()
+    events, skipped = prepare_replay(recorded, _LIFECYCLE_EVENT_TYPES)
+    await _seed_jobs(events)
+    projector = asyncio.create_task(run_projector())
+    try:
+        return await replay(
+            config,
+            get_memory_bus(),
+            events,
+            skipped,
+            settings.kafka_topic,
+            settings.kafka_api_consumer_group,
+        )
+    finally:
+        projector.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await projector
+
+
+async def _seed_jobs(events: Sequence[ReplayedEvent]) -> None:
+    """Create a version and a queued job for every job the events refer to."""
+    from sounds_right_api.db.session import SessionLocal
+    from sounds_right_api.models import Artist, Track, TrackVersion, TranscriptionJob
+
+    run = uuid.uuid4().hex[:8]
+    artist = Artist(id=uuid.uuid4(), slug=f"replay-{run}", display_name=f"Replay {run}")
+    track = Track(id=uuid.uuid4(), artist_id=artist.id, title=f"Replay {run}", slug="replay")
+    versions: dict[uuid.UUID, TrackVersion] = {}
+    jobs: dict[uuid.UUID, TranscriptionJob] = {}
+    for item in events:
+        payload = item.event.payload
+        if payload.track_version_id not in versions:
+            versions[payload.track_version_id] = TrackVersion(
+                id=payload.track_version_id,
+                track_id=track.id,
+                version=len(versions) + 1,
+                status="queued_for_processing",
+            )
+        if payload.job_id not in jobs:
+            jobs[payload.job_id] = TranscriptionJob(
+                id=payload.job_id,
+                track_version_id=payload.track_version_id,
+                status="queued",
+                engine="whisper.cpp",
+                progress=0,
+                correlation_id=item.event.correlation_id,
+            )
+    async with SessionLocal() as session:
+        session.add_all([artist, track])
+        await session.flush()
+        session.add_all(list(versions.values()))
+        await session.flush()
+        session.add_all(list(jobs.values()))
+        await session.commit()
+
+
+async def _wait_until(done: Callable[[], bool], timeout_seconds: float) -> bool:
+    deadline = time.monotonic() + timeout_seconds
+    while not done():
+        if time.monotonic() >= deadline:
+            return False
+        await asyncio.sleep(0.05)
+    return True
+
+
+def format_replay_report(report: ReplayReport) -> str:
+    lines = [
+        f"{report.target} replay at {'max' if report.speed <= 0 else f'{report.speed}x'}: "
+        f"{report.events_replayed} events ({report.events_skipped} skipped) "
+        f"recorded over {report.recorded_seconds}s",
+        f"  sent in {report.replay_seconds}s (max {report.replay_behind_max_seconds}s behind), "
+        f"{'drained' if report.drained else 'NOT drained'} {report.drain_seconds}s later, "
+        f"{report.events_per_second} events/s",
+        f"  lag max={report.lag.max_records} records "
+        f"p95={report.lag.p95_seconds}s max={report.lag.max_seconds}s",
+    ]
+    if report.target == "worker":
+        lines.append(
+            f"  jobs={report.jobs} completed={report.jobs_completed} "
+            f"failed={report.jobs_failed} unfinished={report.jobs_unfinished} "
+            f"p50={report.job_latency.p50_ms}ms p95={report.job_latency.p95_ms}ms"
+        )
+    return "\n".join(lines)
+
+
+def parse_args(argv: Sequence[str] | None = None) -> ReplayConfig:
+    parser = argparse.ArgumentParser(
+        prog="sounds-right-replay",
+        description="Replay a recorded event stream into the projector or mock workers.",
+    )
+    parser.add_argument("recording", type=Path)
+    parser.add_argument("--target", choices=("projector", "worker"), default="projector")
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=1.0,
+        help="1 keeps the recorded timing, 10 is ten times faster, 0 is as fast as possible",
+    )
+    add_mock_worker_arguments(parser)
+    parser.add_argument("--sample-seconds", type=float, default=1.0)
+    parser.add_argument("--drain-timeout-seconds", type=float, default=300)
+    parser.add_argument("--report", type=Path, help="write the JSON report here")
+    args = parser.parse_args(argv)
+    return ReplayConfig(
+        recording=args.recording,
+        target=args.target,
+        speed=max(args.speed, 0.0),
+        worker_replicas=max(args.workers, 1),
+        mock_profile=mock_profile_from_args(args),
+        sample_seconds=args.sample_seconds,
+        drain_timeout_seconds=args.drain_timeout_seconds,
+        report_path=args.report,
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    config = parse_args(argv)
+    use_stand_in_backends()
+    recorded = read_recording(config.recording)
+    if config.target == "worker":
+        report = asyncio.run(replay_into_workers(config, recorded))
+    else:
+        report = asyncio.run(replay_into_projector(config, recorded))
+    print(format_replay_report(report))
+    if config.report_path is not None:
+        config.report_path.write_text(
+            json.dumps(dataclasses.asdict(report), indent=2) + "\n", encoding="utf-8"
+        )
+    return 0 if report.drained else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,157 @@
+"""Runs load test stages against the API app in this process.
+
+The API, its projector and the mock workers share the in-process event bus and
+object store, so only Postgres is external. Import this module only after the
+stand-in backends are selected in the environment (see ``cli``): the API reads
+its settings and creates its database engine at import.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+import uuid
+
+import httpx
+from sounds_right_api.config import ApiSettings, get_settings
+from sounds_right_api.db.session import SessionLocal, engine
+from sounds_right_api.main import create_app
+from sounds_right_api.models import User
+from sounds_right_api.storage.memory import MemoryObjectStore, get_memory_object_store
+from sounds_right_contracts.bus import get_memory_bus
+from sqlalchemy import update
+from sqlalchemy.pool import QueuePool
+
+from sounds_right_loadtest.config import LoadTestConfig
+from sounds_right_loadtest.metrics import (
+    EndpointRecorder,
+    JobOutcomes,
+    LoadTestReport,
+    ResourceSampler,
+    StageReport,
+)
+from sounds_right_loadtest.users import VirtualUser, sign_up
+from sounds_right_loadtest.worker import run_stand_in_worker
+
+
+async def run_load_test(config: LoadTestConfig) -> LoadTestReport:
+    settings = get_settings()
+    if settings.event_bus_backend != "memory" or settings.storage_backend != "memory":
+        raise RuntimeError(
+            "the load test needs EVENT_BUS_BACKEND=memory and STORAGE_BACKEND=memory"
+        )
+    store = get_memory_object_store()
+    run_id = uuid.uuid4().hex[:8]
+    app = create_app()
+
+    async with app.lifespan():
+        # Litestar types its ASGI callable more narrowly than httpx expects.
+        transport = httpx.ASGITransport(app=app)  # type: ignore[arg-type]
+        async with httpx.AsyncClient(transport=transport, base_url="http://loadtest") as client:
+            workers = [
+                asyncio.create_task(
+                    run_stand_in_worker(
+                        f"loadtest-worker-{index}",
+                        settings.kafka_commands_topic,
+                        settings.kafka_topic,
+                        config.mock_profile,
+                        store,
+                        settings.minio_transcripts_bucket,
+                    )
+                )
+                for index in range(config.worker_replicas)
+            ]
+            try:
+                reviewer_token = await _create_reviewer(client, f"lt-{run_id}-reviewer")
+                stages = []
+                for number, users in enumerate(config.stages):
+                    stages.append(
+                        await _run_stage(
+                            config,
+                            settings,
+                            client,
+                            store,
+                            reviewer_token,
+                            users,
+                            f"lt-{run_id}-s{number}",
+                        )
+                    )
+            finally:
+                for worker in workers:
+                    worker.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+    return LoadTestReport(stages=stages)
+
+
+async def _run_stage(
+    config: LoadTestConfig,
+    settings: ApiSettings,
+    client: httpx.AsyncClient,
+    store: MemoryObjectStore,
+    reviewer_token: str,
+    users: int,
+    name_prefix: str,
+) -> StageReport:
+    recorder = EndpointRecorder()
+    outcomes = JobOutcomes()
+    pool = engine.sync_engine.pool
+    if not isinstance(pool, QueuePool):
+        raise RuntimeError("the load test samples a QueuePool")
+    sampler = ResourceSampler(
+        get_memory_bus(),
+        settings.kafka_topic,
+        settings.kafka_api_consumer_group,
+        pool,
+        pool.size() + max(pool._max_overflow, 0),
+        config.sample_seconds,
+    )
+    virtual_users = [
+        VirtualUser(
+            f"{name_prefix}-u{index}",
+            client,
+            recorder,
+            outcomes,
+            store,
+            settings.minio_temp_audio_bucket,
+            reviewer_token,
+            config.poll_seconds,
+            config.job_timeout_seconds,
+            config.think_seconds,
+        )
+        for index in range(users)
+    ]
+
+    async def start(index: int, user: VirtualUser, deadline: float) -> None:
+        await asyncio.sleep(config.ramp_up_seconds * index / users)
+        await user.run(deadline)
+
+    started = time.monotonic()
+    deadline = started + config.stage_seconds
+    sampling = asyncio.create_task(sampler.run())
+    try:
+        await asyncio.gather(
+            *(start(index, user, deadline) for index, user in enumerate(virtual_users))
+        )
+    finally:
+        sampling.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await sampling
+    return StageReport.build(
+        users,
+        time.monotonic() - started,
+        recorder,
+        outcomes,
+        sampler.summary(),
+        config.max_p95_ms,
+        config.max_error_rate,
+    )
+
+
+async def _create_reviewer(client: httpx.AsyncClient, name: str) -> str:
+    # Reviewer sign-up is setup, not load; its timing is discarded.
+    token = await sign_up(client, EndpointRecorder(), name)
+    async with SessionLocal() as session:
+        await session.execute(update(User).where(User.username == name).values(role="reviewer"))
+        await session.commit()
+    return token
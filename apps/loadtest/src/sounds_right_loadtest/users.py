@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from io import BytesIO
+from typing import Any
+
+import httpx
+from sounds_right_api.storage.memory import MemoryObjectStore
+
+from sounds_right_loadtest.metrics import EndpointRecorder, JobOutcomes
+
+# Stand-in audio; mock workers never read it.
+_AUDIO = b"\0" * 4096
+
+
+class FlowError(Exception):
+    """An API call of a user flow did not succeed; the flow is abandoned."""
+
+
+class VirtualUser:
+    """One simulated artist: upload, transcribe, and get each version reviewed and published.
+
+    Uploads go straight into the in-process object store, standing in for the
+    browser's PUT to the presigned URL.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        client: httpx.AsyncClient,
+        recorder: EndpointRecorder,
+        outcomes: JobOutcomes,
+        store: MemoryObjectStore,
+        temp_audio_bucket: str,
+        reviewer_token: str,
+        poll_seconds: float,
+        job_timeout_seconds: float,
+        think_seconds: float,
+    ) -> None:
+        self.name = name
+        self._client = client
+        self._recorder = recorder
+        self._outcomes = outcomes
+        self._store = store
+        self._temp_audio_bucket = temp_audio_bucket
+        self._reviewer_token = reviewer_token
+        self._poll_seconds = poll_seconds
+        self._job_timeout_seconds = job_timeout_seconds
+        self._think_seconds = think_seconds
+        self._token = ""
+
+    async def run(self, deadline: float) -> None:
+        """Sign up, then repeat the version flow until ``deadline`` (``time.monotonic``)."""
+        try:
+            self._token = await sign_up(self._client, self._recorder, self.name)
+            artist = await self._call(
+                "POST /api/artists",
+                "POST",
+                "/api/artists",
+                json={"display_name": f"Artist {self.name}"},
+            )
+            track = await self._call(
+                "POST /api/tracks",
+                "POST",
+                "/api/tracks",
+                json={"artist_id": artist["id"], "title": f"Track {self.name}"},
+            )
+        except FlowError:
+            return
+        while time.monotonic() < deadline:
+            try:
+                await self.transcribe_and_publish(track, artist["slug"])
+            except FlowError:
+                pass
+            await asyncio.sleep(self._think_seconds)
+
+    async def transcribe_and_publish(self, track: dict[str, Any], artist_slug: str) -> None:
+        version = await self._call(
+            "POST /api/tracks/{track_id}/versions",
+            "POST",
+            f"/api/tracks/{track['id']}/versions",
+            json={},
+        )
+        version_path = f"/api/versions/{version['id']}"
+        upload = await self._call(
+            "POST /api/versions/{version_id}/upload-url",
+            "POST",
+            f"{version_path}/upload-url",
+            json={"filename": "song.mp3", "content_type": "audio/mpeg", "size_bytes": len(_AUDIO)},
+        )
+        self._store.put_object(
+            self._temp_audio_bucket,
+            upload["object_key"],
+            BytesIO(_AUDIO),
+            length=len(_AUDIO),
+            content_type="audio/mpeg",
+        )
+        await self._call(
+            "POST /api/versions/{version_id}/upload-complete",
+            "POST",
+            f"{version_path}/upload-complete",
+            json={"object_key": upload["object_key"]},
+        )
+        started = time.monotonic()
+        job = await self._call(
+            "POST /api/versions/{version_id}/start-transcription",
+            "POST",
+            f"{version_path}/start-transcription",
+            json={},
+        )
+        self._outcomes.started += 1
+
+        status = await self._wait_for_job(job["job_id"], started)
+        if status != "completed":
+            return
+        await self._call(
+            "POST /api/versions/{version_id}/approve",
+            "POST",
+            f"{version_path}/approve",
+            json={},
+            token=self._reviewer_token,
+        )
+        await self._call(
+            "POST /api/versions/{version_id}/publish",
+            "POST",
+            f"{version_path}/publish",
+            json={"make_latest": True},
+            token=self._reviewer_token,
+        )
+        await self._call(
+            "GET /api/public/karaoke/{artist_slug}/{track_slug}/latest",
+            "GET",
+            f"/api/public/karaoke/{artist_slug}/{track['slug']}/latest",
+        )
+
+    async def _wait_for_job(self, job_id: str, started: float) -> str | None:
+        while time.monotonic() - started < self._job_timeout_seconds:
+            await asyncio.sleep(self._poll_seconds)
+            job = await self._call("GET /api/jobs/{job_id}", "GET", f"/api/jobs/{job_id}")
+            status = job["status"]
+            if status in {"completed", "failed"}:
+                self._outcomes.durations.append(time.monotonic() - started)
+                if status == "completed":
+                    self._outcomes.completed += 1
+                else:
+                    self._outcomes.failed += 1
+                return str(status)
+        self._outcomes.timed_out += 1
+        return None
+
+    async def _call(
+        self,
+        endpoint: str,
+        method: str,
+        path: str,
+        *,
+        json: dict[str, Any] | None = None,
+        token: str | None = None,
+    ) -> Any:
+        return await call(
+            self._client,
+            self._recorder,
+            endpoint,
+            method,
+            path,
+            json=json,
+            token=token if token is not None else self._token,
+        )
+
+
+async def sign_up(client: httpx.AsyncClient, recorder: EndpointRecorder, name: str) -> str:
+    """Register ``name`` and return its access token."""
+    account = await call(
+        client,
+        recorder,
+        "POST /api/auth/register",
+        "POST",
+        "/api/auth/register",
+        json={
+            "email": f"{name}@loadtest.example.com",
+            "username": name,
+            "password": "load-test-password",
+        },
+    )
+    return str(account["access_token"])
+
+
+async def call(
+    client: httpx.AsyncClient,
+    recorder: EndpointRecorder,
+    endpoint: str,
+    method: str,
+    path: str,
+    *,
+    json: dict[str, Any] | None = None,
+    token: str = "",
+) -> Any:
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    started = time.perf_counter()
+    try:
+        response = await client.request(method, path, json=json, headers=headers)
+    except httpx.HTTPError as exc:
+        recorder.record(endpoint, time.perf_counter() - started, ok=False)
+        raise FlowError(f"{endpoint}: {exc}") from exc
+    recorder.record(endpoint, time.perf_counter() - started, ok=response.is_success)
+    if not response.is_success:
+        raise FlowError(f"{endpoint}: HTTP {response.status_code}")
+    return response.json()
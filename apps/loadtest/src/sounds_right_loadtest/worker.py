@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import uuid
+from io import BytesIO
+
+from sounds_right_api.storage.memory import MemoryObjectStore
+from sounds_right_contracts.events import EventEnvelope, TranscriptionCompletedPayload
+from sounds_right_worker.events.consumer import ConsumerConfig, consume_requested_events
+from sounds_right_worker.events.producer import (
+    ConsumedOffset,
+    EventProducer,
+    EventProducerConfig,
+)
+from sounds_right_worker.jobs.mock import MockProfile, MockWorker
+from sounds_right_worker.storage.object_keys import manifest_object_key, transcript_object_key
+
+_TRANSCRIPT_TEXT = "load test line one load test line two"
+# The deployed workers' consumer group (WORKER_CONSUMER_GROUP's default).
+WORKER_GROUP = "sounds-right-workers"
+
+
+class ArtifactWritingProducer(EventProducer):
+    """Worker producer that stores a transcript and manifest for each completed job.
+
+    Mock jobs do not produce artifacts; without them a completed version could
+    not be approved or published.
+    """
+
+    def __init__(
+        self,
+        config: EventProducerConfig,
+        store: MemoryObjectStore,
+        bucket: str,
+        prefix: str,
+    ) -> None:
+        super().__init__(config)
+        self._store = store
+        self._bucket = bucket
+        self._prefix = prefix
+
+    async def publish(
+        self,
+        event: EventEnvelope,
+        key: uuid.UUID,
+        *,
+        commit: ConsumedOffset | None = None,
+    ) -> None:
+        if isinstance(event.payload, TranscriptionCompletedPayload):
+            event = event.model_copy(update={"payload": self._write_artifacts(event.payload)})
+        await super().publish(event, key, commit=commit)
+
+    def _write_artifacts(
+        self,
+        payload: TranscriptionCompletedPayload,
+    ) -> TranscriptionCompletedPayload:
+        words = _TRANSCRIPT_TEXT.split()
+        transcript = {
+            "schema_version": "1.0",
+            "track_version_id": str(payload.track_version_id),
+            "job_id": str(payload.job_id),
+            "engine": {"name": "mock", "model": "mock", "language": "en"},
+            "metadata": {
+                "duration_seconds": float(len(words)),
+                "word_count": len(words),
+                "segment_count": 1,
+            },
+            "text": _TRANSCRIPT_TEXT,
+            "segments": [
+                {
+                    "id": 0,
+                    "start": 0.0,
+                    "end": float(len(words)),
+                    "text": _TRANSCRIPT_TEXT,
+                    "words": [
+                        {"word": word, "start": float(index), "end": index + 0.9}
+                        for index, word in enumerate(words)
+                    ],
+                }
+            ],
+        }
+        body = json.dumps(transcript).encode("utf-8")
+        transcript_key = transcript_object_key(self._prefix, payload.track_version_id)
+        manifest_key = manifest_object_key(self._prefix, payload.track_version_id)
+        manifest = json.dumps({"transcript_object_key": transcript_key}).encode("utf-8")
+        self._put(transcript_key, body)
+        self._put(manifest_key, manifest)
+        return payload.model_copy(
+            update={
+                "transcript_object_key": transcript_key,
+                "manifest_object_key": manifest_key,
+                "duration_seconds": float(len(words)),
+                "word_count": len(words),
+                "segment_count": 1,
+                "engine": "mock",
+                "sha256": hashlib.sha256(body).hexdigest(),
+            }
+        )
+
+    def _put(self, object_key: str, body: bytes) -> None:
+        self._store.put_object(
+            self._bucket,
+            object_key,
+            BytesIO(body),
+            length=len(body),
+            content_type="application/json",
+        )
+
+
+async def run_stand_in_worker(
+    name: str,
+    commands_topic: str,
+    events_topic: str,
+    profile: MockProfile,
+    store: MemoryObjectStore,
+    transcripts_bucket: str,
+) -> None:
+    """Consume job requests from the in-process bus and run mock jobs until cancelled."""
+    producer = ArtifactWritingProducer(
+        EventProducerConfig(
+            bootstrap_servers="",
+            client_id=name,
+            topic=events_topic,
+            backend="memory",
+        ),
+        store,
+        transcripts_bucket,
+        "transcripts",
+    )
+    consumer_config = ConsumerConfig(
+        bootstrap_servers="",
+        client_id=name,
+        topic=commands_topic,
+        group_id=WORKER_GROUP,
+        backend="memory",
+    )
+    mock = MockWorker(producer, name, profile)
+    await producer.start()
+    try:
+        async for consumed in consume_requested_events(consumer_config):
+            await mock.submit(consumed.event, consumed.offset)
+    finally:
+        await mock.drain()
+        await producer.stop()
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from sounds_right_contracts.bus import MemoryBus
+
+from sounds_right_loadtest.config import parse_args
+from sounds_right_loadtest.metrics import (
+    EndpointRecorder,
+    JobOutcomes,
+    LoadTestReport,
+    ResourceSampler,
+    ResourceSummary,
+    StageReport,
+    percentile,
+)
+
+_RESOURCES = ResourceSummary(0, 0.0, 0.0, 10, 0, 0.0)
+
+
+class FakePool:
+    def __init__(self, checked_out: int) -> None:
+        self.checked_out = checked_out
+
+    def size(self) -> int:
+        return 5
+
+    def checkedout(self) -> int:
+        return self.checked_out
+
+
+def build_stage(users: int, seconds: float, errors: int = 0) -> StageReport:
+    recorder = EndpointRecorder()
+    for index in range(100):
+        recorder.record("GET /api/jobs/{job_id}", seconds, ok=index >= errors)
+    return StageReport.build(users, 60, recorder, JobOutcomes(), _RESOURCES, 500, 0.01)
+
+
+def test_percentile_uses_nearest_rank() -> None:
+    values = [float(value) for value in range(1, 101)]
+
+    assert percentile(values, 0.50) == 50
+    assert percentile(values, 0.95) == 95
+    assert percentile(values, 1.0) == 100
+    assert percentile([], 0.95) == 0
+
+
+def test_stage_fails_on_slow_p95_or_errors() -> None:
+    assert build_stage(10, 0.1).passed
+    assert not build_stage(10, 0.6).passed
+    assert not build_stage(10, 0.1, errors=2).passed
+
+
+def test_stage_fails_when_a_job_times_out() -> None:
+    recorder = EndpointRecorder()
+    recorder.record("GET /api/jobs/{job_id}", 0.01, ok=True)
+    outcomes = JobOutcomes(started=2, completed=1, timed_out=1, durations=[3.0])
+
+    stage = StageReport.build(4, 30, recorder, outcomes, _RESOURCES, 500, 0.01)
+
+    assert not stage.passed
+    assert stage.jobs_per_minute == 2
+    assert stage.job_latency.p95_ms == 3000
+
+
+def test_capacity_is_the_last_stage_before_the_first_failure() -> None:
+    report = LoadTestReport(
+        stages=[
+            build_stage(10, 0.1),
+            build_stage(20, 0.2),
+            build_stage(40, 0.9),
+            build_stage(80, 0.1),
+        ]
+    )
+
+    assert report.capacity is not None
+    assert report.capacity.users == 20
+    assert LoadTestReport(stages=[build_stage(10, 0.9)]).capacity is None
+
+
+def test_sampler_reports_pool_saturation_and_projector_lag() -> None:
+    bus = MemoryBus(partitions=1)
+    pool = FakePool(checked_out=3)
+    sampler = ResourceSampler(bus, "events", "projector", pool, 5, 0.1)
+
+    sampler.sample()
+    asyncio.run(bus.producer().send_and_wait("events", b"v", b"k"))
+    pool.checked_out = 5
+    sampler.sample()
+    summary = sampler.summary()
+
+    assert summary.projector_lag_max_records == 1
+    assert summary.db_pool_max_checked_out == 5
+    assert summary.db_pool_saturated_share == 0.5
+
+
+def test_parse_args_reads_stages_and_mock_profile() -> None:
+    config = parse_args(
+        ["--users", "5,10,20", "--workers", "2", "--failure-rates", "whisper_cpp_failed=0.1"]
+    )
+
+    assert config.stages == (5, 10, 20)
+    assert config.worker_replicas == 2
+    assert config.mock_profile.failure_rates == {"whisper_cpp_failed": 0.1}
+    assert parse_args([]).mock_profile.failure_rates == {}
+
+
+def test_parse_args_rejects_unknown_failure_codes() -> None:
+    with pytest.raises(SystemExit):
+        parse_args(["--failure-rates", "ENGINE_ERROR=0.1"])
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import asyncio
+import uuid
+from pathlib import Path
+
+from sounds_right_contracts.bus import get_memory_bus
+from sounds_right_contracts.events import (
+    COMMAND_EVENT_TYPES,
+    EventEnvelope,
+    TranscriptionProgressPayload,
+    TranscriptionRequestedPayload,
+    decode_event,
+    encode_event,
+    event_headers,
+)
+from sounds_right_worker.jobs.mock import MockProfile
+
+from sounds_right_loadtest.recording import RecordingWriter, read_recording
+from sounds_right_loadtest.replay import ReplayConfig, prepare_replay, replay_into_workers
+
+
+def requested_event() -> EventEnvelope:
+    return EventEnvelope(
+        event_type="transcription.requested",
+        correlation_id=uuid.uuid4(),
+        producer="sounds-right-api",
+        payload=TranscriptionRequestedPayload(
+            job_id=uuid.uuid4(),
+            track_version_id=uuid.uuid4(),
+            track_id=uuid.uuid4(),
+            artist_id=uuid.uuid4(),
+            audio_object_key="temp-audio/version/input.mp3",
+            original_audio_filename="song.mp3",
+            audio_content_type="audio/mpeg",
+            audio_size_bytes=123,
+            engine="whisper.cpp",
+            options={"language": "auto", "model": "base", "separate_vocals": False},
+        ),
+    )
+
+
+def progress_event(job_id: uuid.UUID, track_version_id: uuid.UUID) -> EventEnvelope:
+    return EventEnvelope(
+        event_type="transcription.progress",
+        correlation_id=uuid.uuid4(),
+        producer="sounds-right-worker",
+        payload=TranscriptionProgressPayload(
+            job_id=job_id,
+            track_version_id=track_version_id,
+            progress=50,
+            stage="transcribing",
+            message="halfway",
+        ),
+    )
+
+
+def write(path: Path, events: list[tuple[float, EventEnvelope]]) -> None:
+    with RecordingWriter(path, ["sounds-right.commands", "sounds-right.events"]) as writer:
+        for timestamp, event in events:
+            writer.add(
+                "sounds-right.events",
+                str(event.payload.job_id).encode("utf-8"),
+                encode_event(event),
+                event_headers(event.event_type),
+                timestamp,
+            )
+
+
+def test_recording_round_trips_with_non_decreasing_offsets(tmp_path: Path) -> None:
+    path = tmp_path / "events.jsonl.gz"
+    first, second = requested_event(), requested_event()
+    write(path, [(1000.0, first), (1002.5, second), (1001.0, first)])
+
+    recorded = list(read_recording(path))
+
+    assert [record.offset_seconds for record in recorded] == [0.0, 2.5, 2.5]
+    assert recorded[1].value == encode_event(second)
+    assert recorded[0].headers == tuple(event_headers("transcription.requested"))
+
+
+def test_prepare_replay_remaps_ids_consistently(tmp_path: Path) -> None:
+    path = tmp_path / "events.jsonl.gz"
+    request = requested_event()
+    payload = request.payload
+    assert isinstance(payload, TranscriptionRequestedPayload)
+    progress = progress_event(payload.job_id, payload.track_version_id)
+    write(path, [(10.0, progress), (12.0, request), (13.0, progress)])
+
+    events, skipped = prepare_replay(read_recording(path), COMMAND_EVENT_TYPES)
+    lifecycle, _ = prepare_replay(read_recording(path), {"transcription.progress"})
+
+    assert skipped == 0
+    assert len(events) == 1
+    assert events[0].offset_seconds == 0
+    assert events[0].job_id != payload.job_id
+    assert events[0].key == str(events[0].job_id).encode("utf-8")
+    assert decode_event(events[0].value, headers=events[0].headers) == events[0].event
+    # One replay maps a recorded id to the same fresh id every time.
+    assert lifecycle[0].job_id == lifecycle[1].job_id != payload.job_id
+    assert lifecycle[0].event.event_id == lifecycle[1].event.event_id
+
+
+def test_replay_into_mock_workers_reports_every_job(tmp_path: Path) -> None:
+    path = tmp_path / "events.jsonl.gz"
+    write(path, [(100.0 + index, requested_event()) for index in range(5)])
+    get_memory_bus.cache_clear()
+    config = ReplayConfig(
+        recording=path,
+        target="worker",
+        speed=0,
+        mock_profile=MockProfile(step_delay_seconds=0, progress_events=1, concurrency=5),
+        sample_seconds=0.01,
+        drain_timeout_seconds=10,
+    )
+
+    report = asyncio.run(replay_into_workers(config, read_recording(path)))
+
+    assert report.drained
+    assert report.events_replayed == 5
+    assert report.recorded_seconds == 4
+    assert report.jobs == report.jobs_completed == 5
+    assert report.jobs_unfinished == 0
+    assert report.job_latency.count == 5
@@ -9,6 +9,7 @@ import type {
   CreateTrackBody,
   HealthResponse,
   JobEventsResponse,
+  PartialTranscriptResponse,
   PublicKaraokeDocument,
   PublicKaraokeManifest,
   Publication,
@@ -27,7 +28,7 @@ import type {
   UploadUrlBody,
 } from "./types";
 
-type RequestMethod = "GET" | "POST" | "PATCH";
+type RequestMethod = "GET" | "POST" | "PATCH" | "PUT";
 
 type RequestOptions = {
   method?: RequestMethod;
@@ -89,6 +90,18 @@ export class ApiClient {
         auth: true,
         body: {},
       }),
+    setLyrics: (versionId: string, text: string) =>
+      this.request<TrackVersion>(`/api/versions/${versionId}/lyrics`, {
+        method: "PUT",
+        auth: true,
+        body: { text },
+      }),
+    realign: (versionId: string, text: string) =>
+      this.request<StartTranscriptionResponse>(`/api/versions/${versionId}/realign`, {
+        method: "POST",
+        auth: true,
+        body: { text },
+      }),
     transcript: (versionId: string) =>
       this.request<TranscriptDocument>(`/api/versions/${versionId}/transcript`, { auth: true }),
     reviewEvents: (versionId: string) =>
@@ -142,6 +155,10 @@ export class ApiClient {
     get: (jobId: string) => this.request<TranscriptionJob>(`/api/jobs/${jobId}`, { auth: true }),
     events: (jobId: string) =>
       this.request<JobEventsResponse>(`/api/jobs/${jobId}/events`, { auth: true }),
+    preview: (jobId: string) =>
+      this.request<TranscriptDocument>(`/api/jobs/${jobId}/preview`, { auth: true }),
+    partial: (jobId: string) =>
+      this.request<PartialTranscriptResponse>(`/api/jobs/${jobId}/partial`, { auth: true }),
   };
 
   health = (options: Omit<RequestOptions, "method" | "body" | "auth"> = {}) =>
@@ -44,6 +44,7 @@ export type TrackVersion = {
   original_audio_filename: string | null;
   audio_content_type: string | null;
   audio_size_bytes: number | null;
+  lyrics_object_key?: string | null;
   transcript_object_key?: string | null;
   manifest_object_key?: string | null;
   transcript_sha256?: string | null;
@@ -75,6 +76,7 @@ export type StartTranscriptionResponse = {
 export type TranscriptionJob = {
   id: string;
   track_version_id: string;
+  job_type?: "transcription" | "realignment";
   status: "queued" | "started" | "processing" | "completed" | "failed" | "cancelled";
   engine: string;
   progress: number;
@@ -84,6 +86,10 @@ export type TranscriptionJob = {
   created_at: string;
   started_at: string | null;
   completed_at: string | null;
+  preview_object_key: string | null;
+  preview_model: string | null;
+  preview_available_at: string | null;
+  preview_available: boolean;
 };
 
 export type JobEvent = {
@@ -98,6 +104,19 @@ export type JobEventsResponse = {
   events: JobEvent[];
 };
 
+export type PartialTranscriptSegment = {
+  start: number;
+  end: number;
+  text: string;
+};
+
+export type PartialTranscriptResponse = {
+  job_id: string;
+  status: TranscriptionJob["status"];
+  decoded_seconds: number;
+  segments: PartialTranscriptSegment[];
+};
+
 export type ReviewQueueStatus = "completed" | "approved" | "rejected" | "failed";
 
 export type ReviewQueueItem = {
@@ -3,12 +3,34 @@ from __future__ import annotations
 import asyncio
 from pathlib import Path
 
-from sounds_right_worker.errors import NORMALIZATION_FAILED, PipelineError
+from sounds_right_worker.audio.ffprobe import AudioProbeResult
+from sounds_right_worker.errors import (
+    NORMALIZATION_FAILED,
+    VOCAL_SEPARATION_FAILED,
+    PipelineError,
+)
 from sounds_right_worker.logging import get_logger
 
 logger = get_logger(__name__)
 
 _STAGE = "audio_normalization"
+_SAMPLE_RATE = 16000
+_CODEC = "pcm_s16le"
+# Identifies the conversion in cache keys; change it whenever the arguments change.
+NORMALIZED_FORMAT = f"{_SAMPLE_RATE}hz-mono-{_CODEC}"
+# Demucs models are trained on 44.1 kHz stereo.
+SEPARATION_SAMPLE_RATE = 44100
+SEPARATION_CHANNELS = 2
+
+
+def is_normalized(probe: AudioProbeResult) -> bool:
+    """True when the input already is the 16 kHz mono PCM16 WAV the engine expects."""
+    return (
+        probe.codec_name == _CODEC
+        and probe.sample_rate == _SAMPLE_RATE
+        and probe.channels == 1
+        and "wav" in probe.format_name.split(",")
+    )
 
 
 async def normalize_to_wav(
@@ -23,13 +45,51 @@ async def normalize_to_wav(
         "-i",
         str(input_file),
         "-ar",
-        "16000",
+        str(_SAMPLE_RATE),
         "-ac",
         "1",
         "-c:a",
-        "pcm_s16le",
+        _CODEC,
+        str(output_file),
+    ]
+    if not await _run_ffmpeg(args, output_file, "ffmpeg normalization failed"):
+        raise PipelineError(
+            NORMALIZATION_FAILED,
+            "Could not normalize audio for transcription",
+            stage=_STAGE,
+        )
+    return output_file
+
+
+async def convert_for_separation(
+    ffmpeg_path: str,
+    input_file: Path,
+    output_file: Path,
+) -> Path:
+    """Convert audio to the 44.1 kHz stereo pcm_s16le WAV the vocal separator expects."""
+    args = [
+        ffmpeg_path,
+        "-y",
+        "-i",
+        str(input_file),
+        "-ar",
+        str(SEPARATION_SAMPLE_RATE),
+        "-ac",
+        str(SEPARATION_CHANNELS),
+        "-c:a",
+        _CODEC,
         str(output_file),
     ]
+    if not await _run_ffmpeg(args, output_file, "ffmpeg conversion for separation failed"):
+        raise PipelineError(
+            VOCAL_SEPARATION_FAILED,
+            "Could not prepare audio for vocal separation",
+            stage="vocal_separation",
+        )
+    return output_file
+
+
+async def _run_ffmpeg(args: list[str], output_file: Path, failure_message: str) -> bool:
     process = await asyncio.create_subprocess_exec(
         *args,
         stdout=asyncio.subprocess.PIPE,
@@ -38,12 +98,8 @@ async def normalize_to_wav(
     _, stderr = await process.communicate()
     if process.returncode != 0 or not output_file.exists():
         logger.error(
-            "ffmpeg normalization failed",
+            failure_message,
             extra={"returncode": process.returncode, "stderr": stderr.decode(errors="replace")},
         )
-        raise PipelineError(
-            NORMALIZATION_FAILED,
-            "Could not normalize audio for transcription",
-            stage=_STAGE,
-        )
-    return output_file
+        return False
+    return True
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import numpy.typing as npt
+from numpy.lib.stride_tricks import sliding_window_view
+
+from sounds_right_worker.audio.wav import read_pcm16, to_float32
+
+# Fingerprints are computed on 8 kHz audio: enough for the melodic landmarks that
+# survive re-encoding, and half the FFT work of the 16 kHz engine input.
+FINGERPRINT_SAMPLE_RATE = 8000
+_FRAME_LENGTH = 1024
+_HOP_LENGTH = 256
+FRAME_SECONDS = _HOP_LENGTH / FINGERPRINT_SAMPLE_RATE
+# Frequency bands (FFT bins) in which one landmark per frame can be picked.
+_BAND_EDGES = (10, 20, 40, 80, 160, 320, 513)
+# A landmark must be the strongest in its band within this many frames either side.
+_PEAK_NEIGHBOURHOOD = 3
+# Each anchor is paired with up to this many later landmarks ...
+_FAN_OUT = 3
+# ... no further than this many frames ahead.
+_MAX_PAIR_FRAMES = 63
+_FFT_BLOCK_FRAMES = 2048
+
+
+@dataclass(frozen=True)
+class Fingerprint:
+    """Landmark-pair hashes of one recording, sorted by hash.
+
+    ``offsets`` holds the anchor frame of each hash (``FRAME_SECONDS`` apart).
+    """
+
+    hashes: npt.NDArray[np.uint32]
+    offsets: npt.NDArray[np.uint32]
+
+    def __len__(self) -> int:
+        return len(self.hashes)
+
+
+@dataclass(frozen=True)
+class FingerprintMatch:
+    matched_hashes: int
+    score: float
+    # Seconds to subtract from the reference timeline to land on the query's.
+    offset_seconds: float
+
+
+def _downsample(samples: npt.NDArray[np.float32], sample_rate: int) -> npt.NDArray[np.float32]:
+    factor = max(sample_rate // FINGERPRINT_SAMPLE_RATE, 1)
+    if factor == 1:
+        return samples
+    usable = len(samples) - len(samples) % factor
+    # Averaging neighbours doubles as a crude anti-aliasing filter.
+    return samples[:usable].reshape(-1, factor).mean(axis=1, dtype=np.float32)
+
+
+def _log_spectrogram(samples: npt.NDArray[np.float32]) -> npt.NDArray[np.float32]:
+    frame_count = 1 + (len(samples) - _FRAME_LENGTH) // _HOP_LENGTH
+    if frame_count <= 0:
+        return np.zeros((0, _FRAME_LENGTH // 2 + 1), dtype=np.float32)
+    frames = sliding_window_view(samples, _FRAME_LENGTH)[::_HOP_LENGTH][:frame_count]
+    window = np.hanning(_FRAME_LENGTH).astype(np.float32)
+    spectrogram = np.empty((frame_count, _FRAME_LENGTH // 2 + 1), dtype=np.float32)
+    for offset in range(0, frame_count, _FFT_BLOCK_FRAMES):
+        block = frames[offset : offset + _FFT_BLOCK_FRAMES] * window
+        magnitude = np.abs(np.fft.rfft(block, axis=1))
+        spectrogram[offset : offset + len(block)] = np.log1p(magnitude * 1000.0)
+    return spectrogram
+
+
+def _landmarks(
+    spectrogram: npt.NDArray[np.float32],
+) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+    """Return (frame, bin) of band peaks that dominate their time neighbourhood."""
+    frame_indices: list[npt.NDArray[np.int64]] = []
+    bin_indices: list[npt.NDArray[np.int64]] = []
+    window = 2 * _PEAK_NEIGHBOURHOOD + 1
+    for low, high in zip(_BAND_EDGES, _BAND_EDGES[1:], strict=False):
+        band = spectrogram[:, low:high]
+        peak_bins = np.argmax(band, axis=1)
+        peak_values = band[np.arange(len(band)), peak_bins]
+        padded = np.pad(peak_values, _PEAK_NEIGHBOURHOOD, constant_values=-np.inf)
+        local_max = sliding_window_view(padded, window).max(axis=1)
+        keep = (peak_values >= local_max) & (peak_values > np.mean(peak_values))
+        frames = np.flatnonzero(keep)
+        frame_indices.append(frames)
+        bin_indices.append(peak_bins[frames] + low)
+    frames_all = np.concatenate(frame_indices)
+    bins_all = np.concatenate(bin_indices)
+    order = np.lexsort((bins_all, frames_all))
+    return frames_all[order], bins_all[order]
+
+
+def compute_fingerprint(samples: npt.NDArray[np.float32], sample_rate: int) -> Fingerprint:
+    """Hash pairs of spectral peaks (anchor bin, target bin, frame delta)."""
+    spectrogram = _log_spectrogram(_downsample(samples, sample_rate))
+    frames, bins = _landmarks(spectrogram)
+    if len(frames) < 2:
+        empty = np.zeros(0, dtype=np.uint32)
+        return Fingerprint(hashes=empty, offsets=empty)
+
+    # Pair every anchor with the next landmarks strictly later in time.
+    first_target = np.searchsorted(frames, frames + 1, side="left")
+    targets = first_target[:, None] + np.arange(_FAN_OUT)[None, :]
+    valid = targets < len(frames)
+    targets = np.minimum(targets, len(frames) - 1)
+    deltas = frames[targets] - frames[:, None]
+    valid &= deltas <= _MAX_PAIR_FRAMES
+
+    anchors = np.broadcast_to(np.arange(len(frames))[:, None], targets.shape)[valid]
+    target_bins = bins[targets[valid]]
+    hashes = (
+        (bins[anchors].astype(np.uint32) << np.uint32(15))
+        | (target_bins.astype(np.uint32) << np.uint32(6))
+        | deltas[valid].astype(np.uint32)
+    )
+    offsets = frames[anchors].astype(np.uint32)
+    order = np.argsort(hashes, kind="stable")
+    return Fingerprint(hashes=hashes[order], offsets=offsets[order])
+
+
+def fingerprint_wav(path: Path) -> Fingerprint:
+    pcm, sample_rate = read_pcm16(path)
+    return compute_fingerprint(to_float32(pcm), sample_rate)
+
+
+def match_fingerprints(query: Fingerprint, reference: Fingerprint) -> FingerprintMatch:
+    """Count hashes that agree on a single time offset between two recordings."""
+    if len(query) == 0 or len(reference) == 0:
+        return FingerprintMatch(matched_hashes=0, score=0.0, offset_seconds=0.0)
+
+    left = np.searchsorted(reference.hashes, query.hashes, side="left")
+    right = np.searchsorted(reference.hashes, query.hashes, side="right")
+    counts = right - left
+    if not counts.any():
+        return FingerprintMatch(matched_hashes=0, score=0.0, offset_seconds=0.0)
+
+    query_index = np.repeat(np.arange(len(query)), counts)
+    starts = np.repeat(left, counts)
+    within = np.arange(len(query_index)) - np.repeat(np.cumsum(counts) - counts, counts)
+    reference_offsets = reference.offsets[starts + within].astype(np.int64)
+    deltas = reference_offsets - query.offsets[query_index].astype(np.int64)
+
+    values, votes = np.unique(deltas, return_counts=True)
+    best = int(np.argmax(votes))
+    matched = int(votes[best])
+    return FingerprintMatch(
+        matched_hashes=matched,
+        score=matched / len(query),
+        offset_seconds=float(values[best]) * FRAME_SECONDS,
+    )
@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+import struct
+from dataclasses import dataclass
+
+# Bytes read from the start of an upload to identify it; enough for the
+# container header and, for most files, the codec parameters and duration.
+HEADER_BYTES = 64 * 1024
+
+_MPEG_BITRATES = {
+    # (is MPEG-1, layer): kbit/s by bitrate index 1..14
+    (True, 3): (32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (True, 2): (32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (False, 3): (8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (False, 2): (8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+_MPEG_SAMPLE_RATES = (44100, 48000, 32000)
+# How far into the header to look for the first MPEG frame.
+_MPEG_SYNC_WINDOW = 4096
+# Boxes from moov down to the sample table holding the codec.
+_MP4_SAMPLE_TABLE_PATH = (b"trak", b"mdia", b"minf", b"stbl")
+_MP4_CODECS = {b"mp4a": "aac", b"alac": "alac", b"fLaC": "flac", b"Opus": "opus"}
+
+
+@dataclass(frozen=True)
+class AudioHeader:
+    """What the first bytes of an upload say about it.
+
+    Names follow ffprobe's where they overlap. ``None`` fields were not
+    determinable from the header alone; the full ffprobe pass fills them in.
+    """
+
+    format_name: str
+    codec_name: str | None = None
+    sample_rate: int | None = None
+    channels: int | None = None
+    duration_seconds: float | None = None
+
+
+def id3v2_size(data: bytes) -> int:
+    """Length of a leading ID3v2 tag (0 when there is none)."""
+    if len(data) < 10 or data[:3] != b"ID3":
+        return 0
+    size = 0
+    for byte in data[6:10]:
+        size = (size << 7) | (byte & 0x7F)
+    has_footer = bool(data[5] & 0x10)
+    return 10 + size + (10 if has_footer else 0)
+
+
+def sniff_audio_header(data: bytes) -> AudioHeader | None:
+    """Identify the container (and where cheap, codec and duration) of an upload.
+
+    ``data`` is the start of the file, after any ID3v2 tag. Returns ``None``
+    when it is none of the formats recognised here; that is not a verdict on
+    whether ffprobe can read it.
+    """
+    if data[:4] in (b"RIFF", b"RF64") and data[8:12] == b"WAVE":
+        return _wav(data)
+    if data[:4] == b"fLaC":
+        return _flac(data)
+    if data[:4] == b"OggS":
+        return _ogg(data)
+    if data[4:8] == b"ftyp":
+        return _mp4(data)
+    return _mpeg(data)
+
+
+def _wav(data: bytes) -> AudioHeader:
+    codec: str | None = None
+    sample_rate: int | None = None
+    channels: int | None = None
+    byte_rate = 0
+    data_size: int | None = None
+    position = 12
+    while position + 8 <= len(data):
+        chunk_id = data[position : position + 4]
+        size = int.from_bytes(data[position + 4 : position + 8], "little")
+        body = data[position + 8 : position + 8 + size]
+        if chunk_id == b"fmt " and len(body) >= 16:
+            tag, channels, sample_rate, byte_rate, _, bits = struct.unpack_from("<HHIIHH", body)
+            if tag == 0xFFFE and len(body) >= 26:
+                tag = int.from_bytes(body[24:26], "little")
+            codec = _wav_codec(tag, bits)
+        elif chunk_id == b"data":
+            data_size = size
+            break
+        position += 8 + size + (size & 1)
+
+    duration: float | None = None
+    # Streamed and RF64 files carry a placeholder size.
+    if data[:4] == b"RIFF" and byte_rate and data_size not in (None, 0, 0xFFFFFFFF):
+        duration = data_size / byte_rate
+    return AudioHeader(
+        format_name="wav",
+        codec_name=codec,
+        sample_rate=sample_rate,
+        channels=channels,
+        duration_seconds=duration,
+    )
+
+
+def _wav_codec(tag: int, bits: int) -> str:
+    if tag == 1:
+        return "pcm_u8" if bits == 8 else f"pcm_s{bits}le"
+    if tag == 3:
+        return f"pcm_f{bits}le"
+    return f"wav_0x{tag:04x}"
+
+
+def _flac(data: bytes) -> AudioHeader:
+    # STREAMINFO is always the first metadata block.
+    if len(data) < 26 or data[4] & 0x7F != 0:
+        return AudioHeader(format_name="flac", codec_name="flac")
+    packed = int.from_bytes(data[18:26], "big")
+    sample_rate = packed >> 44
+    total_samples = packed & ((1 << 36) - 1)
+    return AudioHeader(
+        format_name="flac",
+        codec_name="flac",
+        sample_rate=sample_rate or None,
+        channels=((packed >> 41) & 0x7) + 1,
+        duration_seconds=total_samples / sample_rate if total_samples and sample_rate else None,
+    )
+
+
+def _ogg(data: bytes) -> AudioHeader:
+    if len(data) < 27:
+        return AudioHeader(format_name="ogg")
+    packet = data[27 + data[26] :]
+    if packet[:7] == b"\x01vorbis" and len(packet) >= 16:
+        return AudioHeader(
+            format_name="ogg",
+            codec_name="vorbis",
+            sample_rate=int.from_bytes(packet[12:16], "little"),
+            channels=packet[11],
+        )
+    if packet[:8] == b"OpusHead" and len(packet) >= 10:
+        return AudioHeader(
+            format_name="ogg", codec_name="opus", sample_rate=48000, channels=packet[9]
+        )
+    if packet[:5] == b"\x7fFLAC":
+        return AudioHeader(format_name="ogg", codec_name="flac")
+    return AudioHeader(format_name="ogg")
+
+
+def _mp4_boxes(data: bytes, start: int, end: int) -> dict[bytes, tuple[int, int]]:
+    """Map box type to the (start, end) of its body, for boxes within ``data``."""
+    boxes: dict[bytes, tuple[int, int]] = {}
+    position = start
+    while position + 8 <= end:
+        size = int.from_bytes(data[position : position + 4], "big")
+        box_type = data[position + 4 : position + 8]
+        header = 8
+        if size == 1 and position + 16 <= end:
+            size = int.from_bytes(data[position + 8 : position + 16], "big")
+            header = 16
+        elif size == 0:
+            size = end - position
+        if size < header:
+            break
+        boxes.setdefault(box_type, (position + header, min(position + size, end)))
+        position += size
+    return boxes
+
+
+def _mp4(data: bytes) -> AudioHeader:
+    """Read duration and codec from ``moov`` when it precedes the media data."""
+    moov = _mp4_boxes(data, 0, len(data)).get(b"moov")
+    if moov is None:
+        return AudioHeader(format_name="mp4")
+    duration: float | None = None
+    mvhd = _mp4_boxes(data, *moov).get(b"mvhd")
+    if mvhd is not None:
+        body = data[mvhd[0] : mvhd[1]]
+        if body[:1] == b"\x01" and len(body) >= 32:
+            timescale, length = struct.unpack_from(">IQ", body, 20)
+        elif len(body) >= 20:
+            timescale, length = struct.unpack_from(">II", body, 12)
+        else:
+            timescale, length = 0, 0
+        duration = length / timescale if timescale else None
+
+    codec: str | None = None
+    span: tuple[int, int] | None = moov
+    for box_type in _MP4_SAMPLE_TABLE_PATH:
+        span = _mp4_boxes(data, *span).get(box_type) if span is not None else None
+    stsd = _mp4_boxes(data, *span).get(b"stsd") if span is not None else None
+    # stsd: version/flags (4) and entry count (4), then sample entries.
+    if stsd is not None and stsd[1] - stsd[0] >= 16:
+        entry_type = data[stsd[0] + 12 : stsd[0] + 16]
+        codec = _MP4_CODECS.get(entry_type, entry_type.decode("latin-1").strip())
+    return AudioHeader(format_name="mp4", codec_name=codec, duration_seconds=duration)
+
+
+def _mpeg(data: bytes) -> AudioHeader | None:
+    """Find the first MPEG audio frame; read the Xing/Info or VBRI frame count.
+
+    A sync word only counts when the frame after it starts with one as well
+    (or lies beyond ``data``), so stray ``0xFFE`` bits in other files are skipped.
+    """
+    window = min(len(data) - 3, _MPEG_SYNC_WINDOW)
+    for position in range(max(window, 0)):
+        if data[position] != 0xFF or data[position + 1] & 0xE0 != 0xE0:
+            continue
+        frame = _MpegFrame.parse(data[position : position + 4])
+        if frame is None:
+            continue
+        following = position + frame.length
+        if following + 4 <= len(data) and _MpegFrame.parse(data[following : following + 4]) is None:
+            continue
+        return _mpeg_header(data, position, frame)
+    return None
+
+
+@dataclass(frozen=True)
+class _MpegFrame:
+    is_mpeg1: bool
+    layer: int
+    sample_rate: int
+    channels: int
+    length: int
+
+    @classmethod
+    def parse(cls, header: bytes) -> _MpegFrame | None:
+        if header[0] != 0xFF or header[1] & 0xE0 != 0xE0:
+            return None
+        version = (header[1] >> 3) & 0x3
+        layer = 4 - ((header[1] >> 1) & 0x3)
+        bitrate_index = header[2] >> 4
+        rate_index = (header[2] >> 2) & 0x3
+        if version == 1 or layer not in (2, 3) or bitrate_index in (0, 15) or rate_index == 3:
+            return None
+        is_mpeg1 = version == 3
+        sample_rate = _MPEG_SAMPLE_RATES[rate_index] >> {3: 0, 2: 1, 0: 2}[version]
+        bitrate = _MPEG_BITRATES[(is_mpeg1, layer)][bitrate_index - 1] * 1000
+        slots = 144 if is_mpeg1 or layer == 2 else 72
+        padding = (header[2] >> 1) & 0x1
+        return cls(
+            is_mpeg1=is_mpeg1,
+            layer=layer,
+            sample_rate=sample_rate,
+            channels=1 if header[3] >> 6 == 3 else 2,
+            length=slots * bitrate // sample_rate + padding,
+        )
+
+
+def _mpeg_header(data: bytes, position: int, frame: _MpegFrame) -> AudioHeader:
+    if frame.is_mpeg1:
+        side_info = 32 if frame.channels == 2 else 17
+    else:
+        side_info = 17 if frame.channels == 2 else 9
+    xing = position + 4 + side_info
+    frames: int | None = None
+    if data[xing : xing + 4] in (b"Xing", b"Info") and len(data) >= xing + 12:
+        if int.from_bytes(data[xing + 4 : xing + 8], "big") & 0x1:
+            frames = int.from_bytes(data[xing + 8 : xing + 12], "big")
+    vbri = position + 36
+    if frames is None and data[vbri : vbri + 4] == b"VBRI" and len(data) >= vbri + 18:
+        frames = int.from_bytes(data[vbri + 14 : vbri + 18], "big")
+
+    samples_per_frame = 1152 if frame.is_mpeg1 or frame.layer == 2 else 576
+    return AudioHeader(
+        format_name="mp3",
+        codec_name="mp3" if frame.layer == 3 else "mp2",
+        sample_rate=frame.sample_rate,
+        channels=frame.channels,
+        duration_seconds=(frames * samples_per_frame / frame.sample_rate if frames else None),
+    )
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+from sounds_right_worker.audio.wav import pack_pcm16, read_pcm16, unpack_pcm16, write_pcm16
+from sounds_right_worker.logging import get_logger
+from sounds_right_worker.storage.minio_client import (
+    ObjectNotFoundError,
+    StorageClient,
+    StorageError,
+)
+
+logger = get_logger(__name__)
+
+
+class PcmCache:
+    """Engine-ready mono PCM16 audio cached in object storage.
+
+    Objects hold ``pack_pcm16`` data, so a hit is restored with NumPy alone,
+    without running ffmpeg. Reads and writes never raise; a failure is a miss.
+    """
+
+    def __init__(self, storage: StorageClient, bucket: str) -> None:
+        self._storage = storage
+        self._bucket = bucket
+
+    async def read(self, object_key: str, destination: Path) -> bool:
+        try:
+            data = await self._storage.download_bytes(self._bucket, object_key)
+        except ObjectNotFoundError:
+            return False
+        except StorageError:
+            logger.warning("could not read audio cache", extra={"object_key": object_key})
+            return False
+        try:
+            samples, sample_rate = unpack_pcm16(data)
+            await asyncio.to_thread(write_pcm16, destination, samples, sample_rate)
+        except (OSError, ValueError, KeyError):
+            logger.warning("ignoring corrupt audio cache entry", extra={"object_key": object_key})
+            return False
+        return True
+
+    async def write(self, object_key: str, wav: Path) -> None:
+        try:
+            samples, sample_rate = await asyncio.to_thread(read_pcm16, wav)
+            data = await asyncio.to_thread(pack_pcm16, samples, sample_rate)
+            await self._storage.upload_json(
+                self._bucket,
+                object_key,
+                data,
+                content_type="application/octet-stream",
+            )
+        except (OSError, ValueError, StorageError):
+            logger.warning("could not write audio cache", extra={"object_key": object_key})
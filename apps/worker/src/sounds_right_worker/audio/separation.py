@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import os
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import numpy.typing as npt
+
+from sounds_right_worker.audio.ffmpeg import convert_for_separation, normalize_to_wav
+from sounds_right_worker.audio.pcm_cache import PcmCache
+from sounds_right_worker.audio.wav import read_pcm16_frames, write_pcm16
+from sounds_right_worker.config import WorkerSettings
+from sounds_right_worker.errors import VOCAL_SEPARATION_FAILED, PipelineError
+from sounds_right_worker.logging import get_logger
+from sounds_right_worker.storage.minio_client import StorageClient
+from sounds_right_worker.storage.object_keys import vocal_stem_object_key
+
+logger = get_logger(__name__)
+
+_STAGE = "vocal_separation"
+
+
+@dataclass(frozen=True)
+class SeparationConfig:
+    binary: str = "demucs"
+    model: str = "htdemucs"
+    chunk_seconds: float = 60
+    overlap_seconds: float = 2
+    jobs: int = 1
+    threads_per_job: int = 1
+    timeout_seconds: int = 900
+    ffmpeg_path: str = "ffmpeg"
+
+    @classmethod
+    def from_settings(cls, settings: WorkerSettings) -> SeparationConfig:
+        cores = os.cpu_count() or 1
+        jobs = settings.worker_separation_jobs or max(cores // 2, 1)
+        return cls(
+            binary=settings.worker_separator_path,
+            model=settings.worker_separator_model,
+            chunk_seconds=settings.worker_separation_chunk_seconds,
+            overlap_seconds=settings.worker_separation_overlap_seconds,
+            jobs=jobs,
+            threads_per_job=max(cores // jobs, 1),
+            timeout_seconds=settings.worker_separation_timeout_seconds,
+            ffmpeg_path=settings.ffmpeg_path,
+        )
+
+
+@dataclass(frozen=True)
+class SeparatedVocals:
+    path: Path
+    model: str
+    cached: bool
+
+
+def plan_chunks(
+    total_samples: int,
+    sample_rate: int,
+    chunk_seconds: float,
+    overlap_seconds: float,
+) -> list[tuple[int, int]]:
+    """Split ``[0, total_samples)`` into chunks that overlap by ``overlap_seconds``."""
+    chunk = max(int(chunk_seconds * sample_rate), 1)
+    overlap = min(max(int(overlap_seconds * sample_rate), 0), chunk // 2)
+    spans: list[tuple[int, int]] = []
+    start = 0
+    while True:
+        end = min(start + chunk, total_samples)
+        spans.append((start, end))
+        if end >= total_samples:
+            return spans
+        start = end - overlap
+
+
+def _fade(length: int) -> npt.NDArray[np.float32]:
+    """Linear ramp from just above 0 to just below 1."""
+    return np.linspace(0.0, 1.0, length + 2, dtype=np.float32)[1:-1]
+
+
+def stitch_chunks(
+    chunks: list[npt.NDArray[np.float32]],
+    spans: list[tuple[int, int]],
+    total_samples: int,
+) -> npt.NDArray[np.float32]:
+    """Overlap-add separated chunks with linear crossfades over their overlaps.
+
+    Chunks are mono or ``(frames, channels)``; the output has the same layout.
+    """
+    channels = chunks[0].shape[1:] if chunks else ()
+    output = np.zeros((total_samples, *channels), dtype=np.float32)
+    weight = np.zeros(total_samples, dtype=np.float32)
+    # Broadcasts a per-frame ramp over the channels.
+    per_frame = (-1,) + (1,) * len(channels)
+    for index, (chunk, (start, end)) in enumerate(zip(chunks, spans, strict=True)):
+        length = end - start
+        samples = np.zeros((length, *channels), dtype=np.float32)
+        samples[: min(len(chunk), length)] = chunk[:length]
+        ramp = np.ones(length, dtype=np.float32)
+        fade_in = spans[index - 1][1] - start if index > 0 else 0
+        if fade_in > 0:
+            ramp[:fade_in] = _fade(fade_in)
+        fade_out = end - spans[index + 1][0] if index + 1 < len(spans) else 0
+        if fade_out > 0:
+            ramp[length - fade_out :] *= _fade(fade_out)[::-1]
+        output[start:end] += samples * ramp.reshape(per_frame)
+        weight[start:end] += ramp
+    divisor = np.maximum(weight, np.float32(1e-6)).reshape(per_frame)
+    return (output / divisor).astype(np.float32)
+
+
+class VocalSeparator:
+    """Isolates the vocal stem with Demucs on CPU.
+
+    The source audio is converted to 44.1 kHz stereo, the format Demucs models
+    are trained on, and cut into overlapping chunks so every separator process
+    holds at most one chunk in memory. Up to ``jobs`` processes run at once,
+    each limited to ``threads_per_job`` threads. The stitched stem is then
+    downmixed and resampled to the engine format. Stems are cached in the
+    artifacts bucket by source audio SHA-256 and separator model, so retries and
+    re-transcriptions with another whisper model skip separation.
+    """
+
+    def __init__(self, config: SeparationConfig, storage: StorageClient, cache_bucket: str) -> None:
+        self._config = config
+        self._cache = PcmCache(storage, cache_bucket)
+
+    def is_available(self) -> bool:
+        return shutil.which(self._config.binary) is not None
+
+    async def vocals(
+        self,
+        source_audio: Path,
+        work_dir: Path,
+        audio_sha256: str,
+    ) -> SeparatedVocals:
+        output_wav = work_dir / "vocals.wav"
+        cache_key = vocal_stem_object_key(audio_sha256, self._config.model)
+        if await self._cache.read(cache_key, output_wav):
+            logger.info("vocal stem cache hit", extra={"audio_sha256": audio_sha256})
+            return SeparatedVocals(path=output_wav, model=self._config.model, cached=True)
+
+        if not self.is_available():
+            raise PipelineError(
+                VOCAL_SEPARATION_FAILED,
+                "Vocal separation is not available",
+                stage=_STAGE,
+            )
+        chunk_dir = work_dir / "separation"
+        chunk_dir.mkdir(parents=True, exist_ok=True)
+        await self._separate(source_audio, chunk_dir, output_wav)
+        await self._cache.write(cache_key, output_wav)
+        return SeparatedVocals(path=output_wav, model=self._config.model, cached=False)
+
+    async def _separate(self, source_audio: Path, chunk_dir: Path, output_wav: Path) -> None:
+        ffmpeg = self._config.ffmpeg_path
+        input_wav = await convert_for_separation(ffmpeg, source_audio, chunk_dir / "input.wav")
+        pcm, sample_rate = await asyncio.to_thread(read_pcm16_frames, input_wav)
+        input_wav.unlink()
+        spans = plan_chunks(
+            len(pcm),
+            sample_rate,
+            self._config.chunk_seconds,
+            self._config.overlap_seconds,
+        )
+        slots = asyncio.Semaphore(self._config.jobs)
+
+        async def separate_chunk(index: int, start: int, end: int) -> npt.NDArray[np.float32]:
+            async with slots:
+                chunk_wav = chunk_dir / f"chunk_{index:04d}.wav"
+                await asyncio.to_thread(write_pcm16, chunk_wav, pcm[start:end], sample_rate)
+                stem = await self._run_separator(chunk_wav, chunk_dir / f"out_{index:04d}")
+                vocals_wav = chunk_dir / f"vocals_{index:04d}.wav"
+                await convert_for_separation(ffmpeg, stem, vocals_wav)
+                vocals, _ = await asyncio.to_thread(read_pcm16_frames, vocals_wav)
+                for leftover in (chunk_wav, stem, vocals_wav):
+                    leftover.unlink(missing_ok=True)
+                return vocals.astype(np.float32)
+
+        # A failed chunk cancels its siblings, which kill their separator processes.
+        try:
+            async with asyncio.TaskGroup() as group:
+                tasks = [
+                    group.create_task(separate_chunk(index, start, end))
+                    for index, (start, end) in enumerate(spans)
+                ]
+        except* PipelineError as failures:
+            raise failures.exceptions[0] from None
+        stitched = stitch_chunks([task.result() for task in tasks], spans, len(pcm))
+        stem_wav = chunk_dir / "vocals.wav"
+        await asyncio.to_thread(
+            write_pcm16,
+            stem_wav,
+            np.clip(np.rint(stitched), -32768, 32767).astype(np.int16),
+            sample_rate,
+        )
+        await normalize_to_wav(ffmpeg, stem_wav, output_wav)
+        stem_wav.unlink()
+
+    async def _run_separator(self, chunk_wav: Path, output_dir: Path) -> Path:
+        threads = str(self._config.threads_per_job)
+        args = [
+            self._config.binary,
+            "--two-stems=vocals",
+            "-n",
+            self._config.model,
+            "-d",
+            "cpu",
+            "-o",
+            str(output_dir),
+            "--filename",
+            "{stem}.{ext}",
+            str(chunk_wav),
+        ]
+        process = await asyncio.create_subprocess_exec(
+            *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env={**os.environ, "OMP_NUM_THREADS": threads, "MKL_NUM_THREADS": threads},
+        )
+        try:
+            _, stderr = await asyncio.wait_for(
+                process.communicate(),
+                timeout=self._config.timeout_seconds,
+            )
+        except TimeoutError as exc:
+            raise PipelineError(
+                VOCAL_SEPARATION_FAILED,
+                "Vocal separation timed out",
+                stage=_STAGE,
+            ) from exc
+        finally:
+            # Also reached on cancellation, so no separator outlives its chunk.
+            if process.returncode is None:
+                with contextlib.suppress(ProcessLookupError):
+                    process.kill()
+                await process.wait()
+        stem = output_dir / self._config.model / "vocals.wav"
+        if process.returncode != 0 or not stem.exists():
+            logger.error(
+                "vocal separation failed",
+                extra={"returncode": process.returncode, "stderr": stderr.decode(errors="replace")},
+            )
+            raise PipelineError(
+                VOCAL_SEPARATION_FAILED,
+                "Vocal separation failed",
+                stage=_STAGE,
+            )
+        return stem
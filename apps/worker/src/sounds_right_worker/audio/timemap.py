@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from functools import cached_property
+
+
+@dataclass(frozen=True)
+class TimeSpan:
+    start: float
+    end: float
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+@dataclass(frozen=True)
+class TimeMap:
+    """Maps timestamps of a trimmed signal back onto the original timeline.
+
+    ``spans`` are the kept regions of the original audio, in order. The trimmed
+    signal is those regions concatenated back to back.
+    """
+
+    spans: tuple[TimeSpan, ...]
+
+    @cached_property
+    def _trimmed_starts(self) -> list[float]:
+        starts: list[float] = []
+        cursor = 0.0
+        for span in self.spans:
+            starts.append(cursor)
+            cursor += span.duration
+        return starts
+
+    @property
+    def kept_seconds(self) -> float:
+        return sum(span.duration for span in self.spans)
+
+    def to_original(self, trimmed_seconds: float, *, end: bool = False) -> float:
+        """Translate a trimmed-timeline timestamp into original time.
+
+        A timestamp that falls exactly on a splice point belongs to the next
+        span when it starts something and to the previous span when ``end`` is
+        set, so segments never stretch across a removed region.
+        """
+        if not self.spans:
+            return trimmed_seconds
+        starts = self._trimmed_starts
+        if end:
+            index = bisect_left(starts, trimmed_seconds) - 1
+        else:
+            index = bisect_right(starts, trimmed_seconds) - 1
+        index = min(max(index, 0), len(self.spans) - 1)
+        span = self.spans[index]
+        original = span.start + max(trimmed_seconds - starts[index], 0.0)
+        if index < len(self.spans) - 1:
+            original = min(original, span.end)
+        return original
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import numpy.typing as npt
+
+from sounds_right_worker.audio.timemap import TimeMap, TimeSpan
+from sounds_right_worker.audio.wav import read_pcm16, to_float32, write_pcm16
+from sounds_right_worker.config import WorkerSettings
+
+# Band that carries most sung/spoken vocal energy.
+_VOICE_BAND_HZ = (250.0, 4000.0)
+# Frames are analysed in blocks so the FFT working set stays bounded on long tracks.
+_FFT_BLOCK_FRAMES = 4096
+_SILENCE_FLOOR_DB = -60.0
+
+
+@dataclass(frozen=True)
+class VadConfig:
+    frame_ms: int = 30
+    threshold_db: float = 35.0
+    min_voice_band_ratio: float = 0.2
+    min_silence_seconds: float = 2.0
+    padding_seconds: float = 0.3
+
+    @classmethod
+    def from_settings(cls, settings: WorkerSettings) -> VadConfig:
+        return cls(
+            frame_ms=settings.vad_frame_ms,
+            threshold_db=settings.vad_threshold_db,
+            min_voice_band_ratio=settings.vad_min_voice_band_ratio,
+            min_silence_seconds=settings.vad_min_silence_seconds,
+            padding_seconds=settings.vad_padding_seconds,
+        )
+
+
+def frame_features(
+    samples: npt.NDArray[np.float32],
+    sample_rate: int,
+    frame_length: int,
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Return per-frame RMS level (dBFS) and voice-band energy ratio."""
+    frame_count = len(samples) // frame_length
+    if frame_count == 0:
+        empty = np.zeros(0, dtype=np.float64)
+        return empty, empty
+    frames = samples[: frame_count * frame_length].reshape(frame_count, frame_length)
+
+    rms = np.sqrt(np.mean(np.square(frames, dtype=np.float64), axis=1))
+    rms_db = 20.0 * np.log10(np.maximum(rms, 1e-10))
+
+    window = np.hanning(frame_length).astype(np.float32)
+    freqs = np.fft.rfftfreq(frame_length, d=1.0 / sample_rate)
+    band = (freqs >= _VOICE_BAND_HZ[0]) & (freqs <= _VOICE_BAND_HZ[1])
+    voice_ratio = np.empty(frame_count, dtype=np.float64)
+    for offset in range(0, frame_count, _FFT_BLOCK_FRAMES):
+        block = frames[offset : offset + _FFT_BLOCK_FRAMES] * window
+        power = np.square(np.abs(np.fft.rfft(block, axis=1)))
+        total = power.sum(axis=1)
+        voice_ratio[offset : offset + len(block)] = power[:, band].sum(axis=1) / np.maximum(
+            total, 1e-12
+        )
+    return rms_db, voice_ratio
+
+
+def detect_voiced_spans(
+    samples: npt.NDArray[np.float32],
+    sample_rate: int,
+    config: VadConfig,
+) -> list[TimeSpan]:
+    """Find regions likely to contain vocals, padded and merged across short gaps.
+
+    Only silences/instrumental stretches longer than ``min_silence_seconds`` are
+    left out; everything else is kept so the engine still sees phrase context.
+    """
+    frame_length = max(int(sample_rate * config.frame_ms / 1000), 1)
+    rms_db, voice_ratio = frame_features(samples, sample_rate, frame_length)
+    if len(rms_db) == 0:
+        return []
+
+    reference_db = float(np.percentile(rms_db, 95))
+    active = (
+        (rms_db > reference_db - config.threshold_db)
+        & (rms_db > _SILENCE_FLOOR_DB)
+        & (voice_ratio >= config.min_voice_band_ratio)
+    )
+    if not active.any():
+        return []
+
+    frame_seconds = frame_length / sample_rate
+    pad_frames = int(round(config.padding_seconds / frame_seconds))
+    if pad_frames > 0:
+        kernel = np.ones(2 * pad_frames + 1, dtype=np.int32)
+        active = np.convolve(active.astype(np.int32), kernel, mode="same") > 0
+
+    edges = np.diff(np.concatenate(([0], active.astype(np.int8), [0])))
+    run_starts = np.flatnonzero(edges == 1)
+    run_ends = np.flatnonzero(edges == -1)
+
+    min_gap_frames = config.min_silence_seconds / frame_seconds
+    spans: list[list[int]] = []
+    for start, end in zip(run_starts.tolist(), run_ends.tolist(), strict=True):
+        if spans and start - spans[-1][1] < min_gap_frames:
+            spans[-1][1] = end
+        else:
+            spans.append([start, end])
+
+    total_seconds = len(samples) / sample_rate
+    return [
+        TimeSpan(
+            start=start * frame_seconds,
+            end=min(end * frame_seconds, total_seconds),
+        )
+        for start, end in spans
+    ]
+
+
+def trim_silence(input_wav: Path, output_wav: Path, config: VadConfig) -> TimeMap | None:
+    """Write ``output_wav`` with non-vocal stretches removed.
+
+    Returns the time map for the trimmed file, or ``None`` when trimming would
+    not remove anything worthwhile (or found no vocals at all) and the original
+    file should be transcribed as-is.
+    """
+    pcm, sample_rate = read_pcm16(input_wav)
+    spans = detect_voiced_spans(to_float32(pcm), sample_rate, config)
+    if not spans:
+        return None
+
+    time_map = TimeMap(tuple(spans))
+    total_seconds = len(pcm) / sample_rate
+    if total_seconds - time_map.kept_seconds < config.min_silence_seconds:
+        return None
+
+    pieces = [pcm[int(span.start * sample_rate) : int(span.end * sample_rate)] for span in spans]
+    write_pcm16(output_wav, np.concatenate(pieces), sample_rate)
+    return time_map
+
+
+def select_vocal_window(
+    samples: npt.NDArray[np.float32],
+    sample_rate: int,
+    window_seconds: float,
+    config: VadConfig,
+) -> TimeSpan:
+    """Pick the ``window_seconds`` stretch with the most vocal-like frames."""
+    total_seconds = len(samples) / sample_rate
+    if total_seconds <= window_seconds:
+        return TimeSpan(0.0, total_seconds)
+
+    frame_length = max(int(sample_rate * config.frame_ms / 1000), 1)
+    rms_db, voice_ratio = frame_features(samples, sample_rate, frame_length)
+    reference_db = float(np.percentile(rms_db, 95))
+    score = np.where(
+        (rms_db > reference_db - config.threshold_db) & (rms_db > _SILENCE_FLOOR_DB),
+        voice_ratio,
+        0.0,
+    )
+    frame_seconds = frame_length / sample_rate
+    # A window shorter than one frame still covers that frame.
+    window_frames = min(max(int(window_seconds / frame_seconds), 1), len(score))
+    totals = np.convolve(score, np.ones(window_frames), mode="valid")
+    start = int(np.argmax(totals)) * frame_seconds
+    return TimeSpan(start, min(start + window_seconds, total_seconds))
+
+
+def extract_vocal_window(
+    input_wav: Path,
+    output_wav: Path,
+    window_seconds: float,
+    config: VadConfig,
+) -> TimeSpan:
+    """Write the most vocal-rich ``window_seconds`` of ``input_wav`` to ``output_wav``."""
+    pcm, sample_rate = read_pcm16(input_wav)
+    window = select_vocal_window(to_float32(pcm), sample_rate, window_seconds, config)
+    write_pcm16(
+        output_wav,
+        pcm[int(window.start * sample_rate) : int(window.end * sample_rate)],
+        sample_rate,
+    )
+    return window
@@ -3,6 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 from sounds_right_worker.audio.ffprobe import AudioProbeResult
+from sounds_right_worker.audio.header import AudioHeader
 from sounds_right_worker.errors import (
     AUDIO_DURATION_TOO_LONG,
     AUDIO_TOO_LARGE,
@@ -21,19 +22,39 @@ class AudioLimits:
 
 def validate_audio(probe: AudioProbeResult, limits: AudioLimits) -> None:
     """Enforce configured audio limits. Raises PipelineError on violation."""
-    if probe.size_bytes <= 0:
+    _check_size(probe.size_bytes, limits)
+    _check_duration(probe.duration_seconds, limits)
+
+
+def prevalidate_audio(size_bytes: int, header: AudioHeader | None, limits: AudioLimits) -> None:
+    """Reject an upload from its object size and first bytes, before downloading it.
+
+    Only what the header settles is checked. An unrecognised header (AIFF,
+    WebM, ADTS AAC, ...) is not a rejection: ffprobe decides after the
+    download, and ``validate_audio`` on its result stays authoritative.
+    """
+    _check_size(size_bytes, limits)
+    if header is not None and header.duration_seconds is not None:
+        _check_duration(header.duration_seconds, limits)
+
+
+def _check_size(size_bytes: int, limits: AudioLimits) -> None:
+    if size_bytes <= 0:
         raise PipelineError(
             AUDIO_VALIDATION_FAILED,
             "Audio file size is invalid or zero",
             stage=_STAGE,
         )
-    if probe.size_bytes > limits.max_size_bytes:
+    if size_bytes > limits.max_size_bytes:
         raise PipelineError(
             AUDIO_TOO_LARGE,
             "Audio file exceeds the maximum allowed size",
             stage=_STAGE,
         )
-    if probe.duration_seconds > limits.max_duration_seconds:
+
+
+def _check_duration(duration_seconds: float, limits: AudioLimits) -> None:
+    if duration_seconds > limits.max_duration_seconds:
         raise PipelineError(
             AUDIO_DURATION_TOO_LONG,
             "Audio duration exceeds the maximum allowed length",
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import io
+import wave
+from pathlib import Path
+
+import numpy as np
+import numpy.typing as npt
+
+PCM16_SCALE = 32768.0
+
+
+def read_pcm16(path: Path) -> tuple[npt.NDArray[np.int16], int]:
+    """Read a mono 16-bit PCM WAV (as produced by ``normalize_to_wav``).
+
+    Returns the raw samples and the sample rate. Raises ``wave.Error`` or
+    ``ValueError`` when the file is not mono pcm_s16le.
+    """
+    with wave.open(str(path), "rb") as reader:
+        if reader.getnchannels() != 1 or reader.getsampwidth() != 2:
+            raise ValueError("expected mono 16-bit PCM audio")
+        sample_rate = reader.getframerate()
+        frames = reader.readframes(reader.getnframes())
+    return np.frombuffer(frames, dtype="<i2").astype(np.int16, copy=False), sample_rate
+
+
+def read_pcm16_frames(path: Path) -> tuple[npt.NDArray[np.int16], int]:
+    """Read a 16-bit PCM WAV with any channel count as ``(frames, channels)``."""
+    with wave.open(str(path), "rb") as reader:
+        if reader.getsampwidth() != 2:
+            raise ValueError("expected 16-bit PCM audio")
+        channels = reader.getnchannels()
+        sample_rate = reader.getframerate()
+        frames = reader.readframes(reader.getnframes())
+    samples = np.frombuffer(frames, dtype="<i2").astype(np.int16, copy=False)
+    return samples.reshape(-1, channels), sample_rate
+
+
+def write_pcm16(path: Path, samples: npt.NDArray[np.int16], sample_rate: int) -> None:
+    """Write 16-bit PCM samples to a WAV file: mono, or ``(frames, channels)``."""
+    with wave.open(str(path), "wb") as writer:
+        writer.setnchannels(1 if samples.ndim == 1 else samples.shape[1])
+        writer.setsampwidth(2)
+        writer.setframerate(sample_rate)
+        writer.writeframes(samples.astype("<i2", copy=False).tobytes())
+
+
+def to_float32(samples: npt.NDArray[np.int16]) -> npt.NDArray[np.float32]:
+    """Scale PCM16 samples into ``[-1.0, 1.0)`` floats."""
+    return samples.astype(np.float32) / np.float32(PCM16_SCALE)
+
+
+def pack_pcm16(samples: npt.NDArray[np.int16], sample_rate: int) -> bytes:
+    """Losslessly compress mono PCM16 for caching, decodable without ffmpeg.
+
+    Sample deltas (wrapping int16 arithmetic) are split into low/high byte
+    planes before deflate, which compresses audio far better than raw PCM.
+    """
+    deltas = np.diff(samples.astype(np.int16, copy=False), prepend=np.int16(0))
+    planes = deltas.astype("<i2").view(np.uint8).reshape(-1, 2).T
+    buffer = io.BytesIO()
+    np.savez_compressed(buffer, planes=planes, sample_rate=np.array(sample_rate))
+    return buffer.getvalue()
+
+
+def unpack_pcm16(data: bytes) -> tuple[npt.NDArray[np.int16], int]:
+    """Inverse of ``pack_pcm16``."""
+    with np.load(io.BytesIO(data)) as archive:
+        planes = archive["planes"]
+        sample_rate = int(archive["sample_rate"])
+    deltas = np.ascontiguousarray(planes.T).view("<i2").ravel()
+    return np.cumsum(deltas, dtype=np.int16), sample_rate
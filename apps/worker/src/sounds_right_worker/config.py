@@ -1,7 +1,8 @@
 from functools import lru_cache
 from pathlib import Path
+from typing import Literal
 
-from pydantic import Field, field_validator
+from pydantic import Field, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -15,10 +16,42 @@ class WorkerSettings(BaseSettings):
     kafka_bootstrap_servers: str = Field(alias="KAFKA_BOOTSTRAP_SERVERS")
     kafka_client_id: str = Field(default="sounds-right-worker-local", alias="KAFKA_CLIENT_ID")
     kafka_topic: str = Field(default="sounds-right.events", alias="KAFKA_TOPIC")
+    kafka_commands_topic: str = Field(
+        default="sounds-right.commands",
+        alias="KAFKA_COMMANDS_TOPIC",
+    )
+    # Encoding of published events. Switch to msgpack only once every consumer
+    # reads it; consumers follow each record's content-type header.
+    kafka_event_encoding: Literal["json", "msgpack"] = Field(
+        default="json",
+        alias="KAFKA_EVENT_ENCODING",
+    )
+    # "memory" keeps topics in this process instead of Kafka; it only connects
+    # producers and consumers running in the same process.
+    event_bus_backend: Literal["kafka", "memory"] = Field(
+        default="kafka",
+        alias="EVENT_BUS_BACKEND",
+    )
+    # Confirms that the API and the worker share this process, as "memory" needs.
+    event_bus_in_process: bool = Field(default=False, alias="EVENT_BUS_IN_PROCESS")
     kafka_worker_consumer_group: str = Field(
         default="sounds-right-workers",
         alias="KAFKA_WORKER_CONSUMER_GROUP",
     )
+    # Stable and unique per worker replica; empty disables transactions.
+    kafka_transactional_id: str = Field(default="", alias="KAFKA_TRANSACTIONAL_ID")
+
+    # On-disk spool for events published while the broker is unreachable.
+    # Empty disables it; the directory must be a persistent volume.
+    worker_event_spool_path: str = Field(
+        default="/var/lib/sounds-right/event-spool.sqlite3",
+        alias="WORKER_EVENT_SPOOL_PATH",
+    )
+    worker_event_spool_batch_size: int = Field(default=100, alias="WORKER_EVENT_SPOOL_BATCH_SIZE")
+    worker_event_spool_retry_seconds: float = Field(
+        default=5,
+        alias="WORKER_EVENT_SPOOL_RETRY_SECONDS",
+    )
 
     # Mock mode
     worker_mock_mode: bool = Field(default=False, alias="WORKER_MOCK_MODE")
@@ -27,6 +60,20 @@ class WorkerSettings(BaseSettings):
         default=1,
         alias="WORKER_MOCK_STEP_DELAY_SECONDS",
     )
+    # Job durations in seconds, one per line; jobs then last a randomly drawn
+    # sample instead of fixed steps.
+    worker_mock_latency_samples_path: str = Field(
+        default="",
+        alias="WORKER_MOCK_LATENCY_SAMPLES_PATH",
+    )
+    # Multiplies drawn durations, e.g. 0.01 runs jobs (and events) 100x faster.
+    worker_mock_time_scale: float = Field(default=1.0, alias="WORKER_MOCK_TIME_SCALE")
+    worker_mock_progress_events: int = Field(default=4, alias="WORKER_MOCK_PROGRESS_EVENTS")
+    # Comma-separated error_code=probability pairs, e.g.
+    # "audio_download_failed=0.02,whisper_cpp_failed=0.01".
+    worker_mock_failure_rates: str = Field(default="", alias="WORKER_MOCK_FAILURE_RATES")
+    worker_mock_concurrency: int = Field(default=1, alias="WORKER_MOCK_CONCURRENCY")
+    worker_mock_seed: int | None = Field(default=None, alias="WORKER_MOCK_SEED")
 
     # MinIO
     minio_endpoint: str = Field(alias="MINIO_ENDPOINT")
@@ -36,6 +83,34 @@ class WorkerSettings(BaseSettings):
     minio_transcripts_bucket: str = Field(alias="MINIO_TRANSCRIPTS_BUCKET")
     minio_artifacts_bucket: str = Field(alias="MINIO_ARTIFACTS_BUCKET")
     minio_secure: bool = Field(default=False, alias="MINIO_SECURE")
+    minio_region: str = Field(default="us-east-1", alias="MINIO_REGION")
+    # Compression of stored transcripts, previews and manifests. Readers detect
+    # it per object, so changing it only affects newly written artifacts.
+    artifact_encoding: Literal["identity", "gzip", "zstd"] = Field(
+        default="gzip",
+        alias="ARTIFACT_ENCODING",
+    )
+
+    # Object storage transfers
+    worker_storage_part_size_bytes: int = Field(
+        default=16777216,
+        alias="WORKER_STORAGE_PART_SIZE_BYTES",
+    )
+    worker_storage_max_connections: int = Field(
+        default=16,
+        alias="WORKER_STORAGE_MAX_CONNECTIONS",
+    )
+    # Parts transferred at once by a single large download or multipart upload
+    worker_storage_transfer_concurrency: int = Field(
+        default=4,
+        alias="WORKER_STORAGE_TRANSFER_CONCURRENCY",
+    )
+
+    # Dedupe of redelivered job requests (records kept in the artifacts bucket)
+    worker_job_dedupe: bool = Field(default=True, alias="WORKER_JOB_DEDUPE")
+    worker_job_state_cache_size: int = Field(default=1024, alias="WORKER_JOB_STATE_CACHE_SIZE")
+    # A claim not heartbeated for this long is treated as abandoned.
+    worker_job_lease_seconds: float = Field(default=60, alias="WORKER_JOB_LEASE_SECONDS")
 
     # Audio limits
     max_audio_size_bytes: int = Field(default=104857600, alias="MAX_AUDIO_SIZE_BYTES")
@@ -48,6 +123,53 @@ class WorkerSettings(BaseSettings):
     worker_temp_root: str = Field(default="/tmp/sounds-right", alias="WORKER_TEMP_ROOT")
     worker_keep_temp_files: bool = Field(default=False, alias="WORKER_KEEP_TEMP_FILES")
 
+    # Cache of normalized (16 kHz mono PCM) audio, keyed by source audio SHA-256
+    worker_normalized_audio_cache: bool = Field(
+        default=True,
+        alias="WORKER_NORMALIZED_AUDIO_CACHE",
+    )
+
+    # Silence / instrumental trimming before transcription
+    worker_trim_silence: bool = Field(default=True, alias="WORKER_TRIM_SILENCE")
+    vad_frame_ms: int = Field(default=30, alias="VAD_FRAME_MS")
+    vad_threshold_db: float = Field(default=35.0, alias="VAD_THRESHOLD_DB")
+    vad_min_voice_band_ratio: float = Field(default=0.2, alias="VAD_MIN_VOICE_BAND_RATIO")
+    vad_min_silence_seconds: float = Field(default=2.0, alias="VAD_MIN_SILENCE_SECONDS")
+    vad_padding_seconds: float = Field(default=0.3, alias="VAD_PADDING_SECONDS")
+
+    # Vocal separation (only when a job asks for ``separate_vocals``)
+    worker_separator_path: str = Field(default="demucs", alias="WORKER_SEPARATOR_PATH")
+    worker_separator_model: str = Field(default="htdemucs", alias="WORKER_SEPARATOR_MODEL")
+    worker_separation_chunk_seconds: float = Field(
+        default=60,
+        alias="WORKER_SEPARATION_CHUNK_SECONDS",
+    )
+    worker_separation_overlap_seconds: float = Field(
+        default=2,
+        alias="WORKER_SEPARATION_OVERLAP_SECONDS",
+    )
+    # 0 picks one job per two cores.
+    worker_separation_jobs: int = Field(default=0, alias="WORKER_SEPARATION_JOBS")
+    worker_separation_timeout_seconds: int = Field(
+        default=900,
+        alias="WORKER_SEPARATION_TIMEOUT_SECONDS",
+    )
+
+    # Near-duplicate detection via acoustic fingerprints
+    worker_fingerprint_dedupe: bool = Field(default=True, alias="WORKER_FINGERPRINT_DEDUPE")
+    worker_fingerprint_min_matches: int = Field(
+        default=20,
+        alias="WORKER_FINGERPRINT_MIN_MATCHES",
+    )
+    worker_fingerprint_min_score: float = Field(default=0.1, alias="WORKER_FINGERPRINT_MIN_SCORE")
+
+    # Re-alignment features. Lyrics-aligned jobs always keep theirs; this also
+    # keeps them for transcribed jobs, at an extra feature pass and upload each.
+    worker_store_alignment_features: bool = Field(
+        default=False,
+        alias="WORKER_STORE_ALIGNMENT_FEATURES",
+    )
+
     # whisper.cpp
     whisper_cpp_path: str = Field(
         default="/usr/local/bin/whisper-cli",
@@ -62,6 +184,31 @@ class WorkerSettings(BaseSettings):
     whisper_threads: int = Field(default=4, alias="WHISPER_CPP_THREADS")
     whisper_timeout_seconds: int = Field(default=1800, alias="WHISPER_CPP_TIMEOUT_SECONDS")
 
+    # Two-tier transcription: a tiny/quantized model publishes a preview first.
+    # Empty disables the preview pass.
+    whisper_preview_model_path: str = Field(default="", alias="WHISPER_PREVIEW_MODEL_PATH")
+
+    # Partial transcript events while whisper.cpp decodes
+    worker_partial_transcripts: bool = Field(default=True, alias="WORKER_PARTIAL_TRANSCRIPTS")
+    worker_partial_batch_segments: int = Field(default=8, alias="WORKER_PARTIAL_BATCH_SEGMENTS")
+    worker_partial_interval_seconds: float = Field(
+        default=10,
+        alias="WORKER_PARTIAL_INTERVAL_SECONDS",
+    )
+
+    # Language detection pre-pass (only when the language is "auto")
+    whisper_detect_language: bool = Field(default=True, alias="WHISPER_DETECT_LANGUAGE")
+    whisper_language_window_seconds: float = Field(
+        default=30,
+        alias="WHISPER_LANGUAGE_WINDOW_SECONDS",
+    )
+    # Comma-separated ``language=model_path`` pairs, e.g. ``en=/models/ggml-base.en.bin``.
+    whisper_language_models: str = Field(default="", alias="WHISPER_LANGUAGE_MODELS")
+    whisper_language_model_min_confidence: float = Field(
+        default=0.8,
+        alias="WHISPER_LANGUAGE_MODEL_MIN_CONFIDENCE",
+    )
+
     # ffmpeg / ffprobe
     ffmpeg_path: str = Field(default="ffmpeg", alias="FFMPEG_PATH")
     ffprobe_path: str = Field(default="ffprobe", alias="FFPROBE_PATH")
@@ -78,6 +225,15 @@ class WorkerSettings(BaseSettings):
     def expand_user_path(cls, value: str) -> str:
         return str(Path(value).expanduser())
 
+    @model_validator(mode="after")
+    def require_in_process_memory_bus(self) -> "WorkerSettings":
+        if self.event_bus_backend == "memory" and not self.event_bus_in_process:
+            raise ValueError(
+                "EVENT_BUS_BACKEND=memory only connects clients in one process; "
+                "set EVENT_BUS_IN_PROCESS=true if the API and the worker run in this one"
+            )
+        return self
+
     @property
     def whisper_cpp_binary(self) -> Path:
         return Path(self.whisper_cpp_path)
@@ -86,6 +242,21 @@ class WorkerSettings(BaseSettings):
     def whisper_model_file(self) -> Path:
         return Path(self.whisper_model_path)
 
+    @property
+    def whisper_preview_model_file(self) -> Path | None:
+        if not self.whisper_preview_model_path:
+            return None
+        return Path(self.whisper_preview_model_path).expanduser()
+
+    @property
+    def whisper_language_model_files(self) -> dict[str, Path]:
+        models: dict[str, Path] = {}
+        for entry in self.whisper_language_models.split(","):
+            language, separator, path = entry.partition("=")
+            if separator and language.strip() and path.strip():
+                models[language.strip().lower()] = Path(path.strip()).expanduser()
+        return models
+
 
 @lru_cache
 def get_settings() -> WorkerSettings:
@@ -11,9 +11,13 @@ AUDIO_DURATION_TOO_LONG = "audio_duration_too_long"
 UNSUPPORTED_AUDIO_FORMAT = "unsupported_audio_format"
 UNSUPPORTED_OPTION = "unsupported_option"
 NORMALIZATION_FAILED = "normalization_failed"
+VOCAL_SEPARATION_FAILED = "vocal_separation_failed"
 WHISPER_CPP_MISSING = "whisper_cpp_missing"
 WHISPER_CPP_FAILED = "whisper_cpp_failed"
 TRANSCRIPT_PARSE_FAILED = "transcript_parse_failed"
+LYRICS_NOT_FOUND = "lyrics_not_found"
+LYRICS_ALIGNMENT_FAILED = "lyrics_alignment_failed"
+REALIGNMENT_UNAVAILABLE = "realignment_unavailable"
 ARTIFACT_UPLOAD_FAILED = "artifact_upload_failed"
 TEMP_CLEANUP_FAILED = "temp_cleanup_failed"
 UNKNOWN_WORKER_ERROR = "unknown_worker_error"
@@ -1,18 +1,21 @@
 import logging
-from collections.abc import AsyncIterator
+import time
+from collections.abc import AsyncIterator, Sequence
 from dataclasses import dataclass
 
-from aiokafka import AIOKafkaConsumer  # type: ignore[import-untyped]
+from aiokafka import AIOKafkaConsumer, TopicPartition  # type: ignore[import-untyped]
+from sounds_right_contracts.bus import BusConsumer, get_memory_bus
+from sounds_right_contracts.events import COMMAND_EVENT_TYPES, EventEnvelope, decode_event
 
 from sounds_right_worker.config import WorkerSettings
-from sounds_right_worker.events.schemas import (
-    EventEnvelope,
-    TranscriptionRequestedPayload,
-    event_envelope_adapter,
-)
+from sounds_right_worker.events.producer import ConsumedOffset
 
 logger = logging.getLogger(__name__)
 
+# How often positions past skipped (non-request) messages are committed when
+# offsets are otherwise only committed inside producer transactions.
+_SKIPPED_COMMIT_INTERVAL_SECONDS = 5.0
+
 
 @dataclass(frozen=True)
 class ConsumerConfig:
@@ -20,41 +23,102 @@ class ConsumerConfig:
     client_id: str
     topic: str
     group_id: str
+    backend: str = "kafka"
+    transactional: bool = False
 
     @classmethod
     def from_settings(cls, settings: WorkerSettings) -> "ConsumerConfig":
         return cls(
             bootstrap_servers=settings.kafka_bootstrap_servers,
             client_id=settings.kafka_client_id,
-            topic=settings.kafka_topic,
+            topic=settings.kafka_commands_topic,
             group_id=settings.kafka_worker_consumer_group,
+            backend=settings.event_bus_backend,
+            transactional=bool(settings.kafka_transactional_id),
         )
 
 
-async def consume_requested_events(config: ConsumerConfig) -> AsyncIterator[EventEnvelope]:
-    consumer = AIOKafkaConsumer(
+@dataclass(frozen=True)
+class ConsumedEvent:
+    event: EventEnvelope
+    offset: ConsumedOffset
+
+
+async def consume_requested_events(config: ConsumerConfig) -> AsyncIterator[ConsumedEvent]:
+    """Yield job requests with the offset to commit once each is handled.
+
+    In transactional mode auto-commit is off: a request's offset is committed
+    in the transaction that publishes its terminal event, and positions past
+    skipped messages are committed here every few seconds. Requests are
+    handled one at a time, so a skipped position never passes a pending request.
+    """
+    consumer = _create_consumer(config)
+    await consumer.start()
+    skipped: dict[TopicPartition, int] = {}
+    last_skipped_commit = time.monotonic()
+    try:
+        async for message in consumer:
+            partition = TopicPartition(message.topic, message.partition)
+            event = _requested_event(message.value, message.headers)
+            if event is None:
+                if config.transactional:
+                    skipped[partition] = message.offset + 1
+                    if time.monotonic() - last_skipped_commit >= _SKIPPED_COMMIT_INTERVAL_SECONDS:
+                        await _commit_skipped(consumer, skipped)
+                        last_skipped_commit = time.monotonic()
+                continue
+            # The request's own commit covers anything skipped before it.
+            skipped.pop(partition, None)
+            yield ConsumedEvent(
+                event=event,
+                offset=ConsumedOffset(
+                    topic=message.topic,
+                    partition=message.partition,
+                    offset=message.offset + 1,
+                    group_id=config.group_id,
+                ),
+            )
+    finally:
+        if skipped:
+            await _commit_skipped(consumer, skipped)
+        await consumer.stop()
+
+
+def _create_consumer(config: ConsumerConfig) -> BusConsumer:
+    if config.backend == "memory":
+        return get_memory_bus().consumer(
+            config.topic,
+            group_id=config.group_id,
+            enable_auto_commit=not config.transactional,
+        )
+    consumer: BusConsumer = AIOKafkaConsumer(
         config.topic,
         bootstrap_servers=config.bootstrap_servers,
         client_id=config.client_id,
         group_id=config.group_id,
         auto_offset_reset="earliest",
+        enable_auto_commit=not config.transactional,
+        isolation_level="read_committed",
     )
-    await consumer.start()
+    return consumer
+
+
+def _requested_event(
+    raw: bytes,
+    headers: Sequence[tuple[str, bytes]],
+) -> EventEnvelope | None:
+    # Anything else is recognized from its headers and never decoded.
     try:
-        async for message in consumer:
-            try:
-                event = event_envelope_adapter.validate_json(message.value)
-            except Exception:
-                logger.exception("skipping malformed event")
-                continue
-            if event.event_type != "transcription.requested":
-                continue
-            if not isinstance(event.payload, TranscriptionRequestedPayload):
-                logger.error(
-                    "requested event has invalid payload",
-                    extra={"event_id": str(event.event_id)},
-                )
-                continue
-            yield event
-    finally:
-        await consumer.stop()
+        return decode_event(raw, event_types=COMMAND_EVENT_TYPES, headers=headers)
+    except Exception:
+        logger.exception("skipping malformed event")
+        return None
+
+
+async def _commit_skipped(consumer: BusConsumer, skipped: dict[TopicPartition, int]) -> None:
+    try:
+        await consumer.commit(dict(skipped))
+    except Exception:
+        logger.warning("could not commit skipped offsets", exc_info=True)
+        return
+    skipped.clear()
@@ -1,13 +1,26 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
+import sqlite3
 import uuid
 from dataclasses import dataclass
+from pathlib import Path
 
-from aiokafka import AIOKafkaProducer  # type: ignore[import-untyped]
+from aiokafka import AIOKafkaProducer, TopicPartition  # type: ignore[import-untyped]
+from aiokafka.errors import KafkaError, ProducerFenced  # type: ignore[import-untyped]
+from sounds_right_contracts.bus import BusProducer, get_memory_bus
+from sounds_right_contracts.codec import ENCODINGS
+from sounds_right_contracts.events import (
+    EventEnvelope,
+    decode_event_header,
+    encode_event,
+    event_headers,
+)
 
 from sounds_right_worker.config import WorkerSettings
-from sounds_right_worker.events.schemas import EventEnvelope
+from sounds_right_worker.events.spool import EventSpool, SpooledEvent, SpoolStats
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +30,13 @@ class EventProducerConfig:
     bootstrap_servers: str
     client_id: str
     topic: str
+    backend: str = "kafka"
+    transactional_id: str = ""
+    content_type: str = ENCODINGS["json"]
+    # Empty disables spooling: publishes then fail while the broker is down.
+    spool_path: str = ""
+    spool_batch_size: int = 100
+    spool_retry_seconds: float = 5
 
     @classmethod
     def from_settings(cls, settings: WorkerSettings) -> EventProducerConfig:
@@ -24,42 +44,272 @@ class EventProducerConfig:
             bootstrap_servers=settings.kafka_bootstrap_servers,
             client_id=settings.kafka_client_id,
             topic=settings.kafka_topic,
+            backend=settings.event_bus_backend,
+            transactional_id=settings.kafka_transactional_id,
+            content_type=ENCODINGS[settings.kafka_event_encoding],
+            spool_path=settings.worker_event_spool_path,
+            spool_batch_size=settings.worker_event_spool_batch_size,
+            spool_retry_seconds=settings.worker_event_spool_retry_seconds,
         )
 
 
+@dataclass(frozen=True)
+class ConsumedOffset:
+    """Consumer group position just past a consumed message."""
+
+    topic: str
+    partition: int
+    offset: int
+    group_id: str
+
+
 class EventProducer:
+    """Publishes worker events.
+
+    With a ``transactional_id`` every publish is its own Kafka transaction, so
+    read-committed consumers never see events of an aborted attempt, and a
+    publish given ``commit`` also commits that consumer offset atomically with
+    the event. A restarted worker with the same id fences off its old instance.
+
+    With a spool, events the broker does not accept are appended to it instead
+    of failing the job, and so is every later event until the spool has been
+    replayed, which keeps the topic order. A background task replays it in
+    batches. A spooled event's ``commit`` is dropped; the request is redelivered
+    and recognized as already handled.
+    """
+
     def __init__(self, config: EventProducerConfig) -> None:
         self.config = config
-        self._producer: AIOKafkaProducer | None = None
+        self._producer: BusProducer | None = None
+        self._spool: EventSpool | None = None
+        # Guards the spool's empty/non-empty transitions against concurrent publishes.
+        self._spool_lock = asyncio.Lock()
+        self._backlog = False
+        self._replay_task: asyncio.Task[None] | None = None
+
+    @property
+    def transactional(self) -> bool:
+        return bool(self.config.transactional_id)
 
     async def start(self) -> None:
-        self._producer = AIOKafkaProducer(
-            bootstrap_servers=self.config.bootstrap_servers,
-            client_id=self.config.client_id,
-        )
+        self._producer = _create_producer(self.config)
         await self._producer.start()
+        if self.config.spool_path:
+            self._spool = await asyncio.to_thread(EventSpool, Path(self.config.spool_path))
+            stats = await asyncio.to_thread(self._spool.stats)
+            self._backlog = stats.depth > 0
+            if self._backlog:
+                _log_spool("event spool has events from a previous run", stats)
+            self._replay_task = asyncio.create_task(self._replay_spool(self._producer, self._spool))
 
     async def stop(self) -> None:
+        if self._replay_task is not None:
+            self._replay_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._replay_task
+            self._replay_task = None
         if self._producer is not None:
             await self._producer.stop()
             self._producer = None
+        if self._spool is not None:
+            await asyncio.to_thread(self._spool.close)
+            self._spool = None
+
+    async def spool_stats(self) -> SpoolStats | None:
+        """Depth and age of the spool, or ``None`` when spooling is disabled."""
+        if self._spool is None:
+            return None
+        return await asyncio.to_thread(self._spool.stats)
+
+    async def commit(self, offset: ConsumedOffset | None) -> None:
+        """Commit a consumer offset without publishing (no-op unless transactional).
 
-    async def publish(self, event: EventEnvelope, key: uuid.UUID) -> None:
+        Best effort: an uncommitted offset only means another redelivery.
+        """
         if self._producer is None:
             raise RuntimeError("event producer is not started")
+        if offset is None or not self.transactional:
+            return
+        try:
+            async with self._producer.transaction():
+                await self._producer.send_offsets_to_transaction(
+                    {TopicPartition(offset.topic, offset.partition): offset.offset},
+                    offset.group_id,
+                )
+        except KafkaError:
+            logger.warning("could not commit consumer offset", exc_info=True)
 
-        await self._producer.send_and_wait(
-            self.config.topic,
-            key=str(key).encode("utf-8"),
-            value=event.model_dump_json().encode("utf-8"),
-        )
+    async def publish(
+        self,
+        event: EventEnvelope,
+        key: uuid.UUID,
+        *,
+        commit: ConsumedOffset | None = None,
+    ) -> None:
+        """Publish ``event``; with transactions, also commit ``commit`` with it."""
+        producer = self._producer
+        if producer is None:
+            raise RuntimeError("event producer is not started")
+
+        key_bytes = str(key).encode("utf-8")
+        content_type = self.config.content_type
+        value = encode_event(event, content_type)
+        log_context = {
+            "event_id": str(event.event_id),
+            "event_type": event.event_type,
+            "job_id": str(key),
+            "producer": event.producer,
+            "topic": self.config.topic,
+        }
+        spool = self._spool
+        if spool is not None:
+            stats = await self._spool_if_backlogged(spool, key_bytes, value, content_type)
+            if stats is not None:
+                logger.info(
+                    "spooled event behind earlier ones",
+                    extra={**log_context, **_spool_fields(stats)},
+                )
+                return
+        try:
+            await self._send(
+                producer,
+                key_bytes,
+                value,
+                event_headers(event.event_type, content_type),
+                commit,
+            )
+        except ProducerFenced:
+            raise
+        except KafkaError:
+            if spool is None:
+                raise
+            async with self._spool_lock:
+                stats = await asyncio.to_thread(_append, spool, key_bytes, value, content_type)
+                self._backlog = True
+            logger.warning(
+                "broker unavailable, spooled event",
+                extra={**log_context, **_spool_fields(stats)},
+                exc_info=True,
+            )
+            return
         logger.info(
             "published event",
             extra={
-                "event_id": str(event.event_id),
-                "event_type": event.event_type,
-                "job_id": str(key),
-                "producer": event.producer,
-                "topic": self.config.topic,
+                **log_context,
+                "committed_offset": commit.offset if commit and self.transactional else None,
             },
         )
+
+    async def _send(
+        self,
+        producer: BusProducer,
+        key: bytes,
+        value: bytes,
+        headers: list[tuple[str, bytes]],
+        commit: ConsumedOffset | None,
+    ) -> None:
+        topic = self.config.topic
+        if not self.transactional:
+            await producer.send_and_wait(topic, key=key, value=value, headers=headers)
+            return
+        async with producer.transaction():
+            await producer.send(topic, key=key, value=value, headers=headers)
+            if commit is not None:
+                await producer.send_offsets_to_transaction(
+                    {TopicPartition(commit.topic, commit.partition): commit.offset},
+                    commit.group_id,
+                )
+
+    async def _spool_if_backlogged(
+        self,
+        spool: EventSpool,
+        key: bytes,
+        value: bytes,
+        content_type: str,
+    ) -> SpoolStats | None:
+        """Append behind a backlog and return the new stats; ``None`` if there is none."""
+        async with self._spool_lock:
+            if not self._backlog:
+                return None
+            return await asyncio.to_thread(_append, spool, key, value, content_type)
+
+    async def _replay_spool(self, producer: BusProducer, spool: EventSpool) -> None:
+        while True:
+            await asyncio.sleep(self.config.spool_retry_seconds)
+            try:
+                while await self._replay_batch(producer, spool):
+                    pass
+            except Exception as exc:
+                # Never give up: while the backlog lasts, every later event is spooled.
+                try:
+                    fields = _spool_fields(await asyncio.to_thread(spool.stats))
+                except sqlite3.Error:
+                    fields = {}
+                logger.log(
+                    logging.INFO if isinstance(exc, KafkaError) else logging.ERROR,
+                    "event spool replay failed, will retry",
+                    extra=fields,
+                    exc_info=not isinstance(exc, KafkaError),
+                )
+
+    async def _replay_batch(self, producer: BusProducer, spool: EventSpool) -> bool:
+        """Send the oldest spooled events; return whether more may remain."""
+        async with self._spool_lock:
+            batch = await asyncio.to_thread(spool.peek, self.config.spool_batch_size)
+            if not batch:
+                self._backlog = False
+                return False
+
+        topic = self.config.topic
+        # The spool does not keep headers; the event type is read back from the value.
+        records = [(item.key, item.value, _spooled_headers(item)) for item in batch]
+        if self.transactional:
+            async with producer.transaction():
+                for key, value, headers in records:
+                    await producer.send(topic, key=key, value=value, headers=headers)
+        else:
+            # send() only enqueues; the producer batches the requests.
+            deliveries = [
+                await producer.send(topic, key=key, value=value, headers=headers)
+                for key, value, headers in records
+            ]
+            await asyncio.gather(*deliveries)
+        await asyncio.to_thread(spool.remove_through, batch[-1].seq)
+        _log_spool(
+            f"replayed {len(batch)} spooled events",
+            await asyncio.to_thread(spool.stats),
+        )
+        return True
+
+
+def _create_producer(config: EventProducerConfig) -> BusProducer:
+    if config.backend == "memory":
+        return get_memory_bus().producer()
+    producer: BusProducer = AIOKafkaProducer(
+        bootstrap_servers=config.bootstrap_servers,
+        client_id=config.client_id,
+        transactional_id=config.transactional_id or None,
+        enable_idempotence=bool(config.transactional_id),
+    )
+    return producer
+
+
+def _spooled_headers(item: SpooledEvent) -> list[tuple[str, bytes]]:
+    event_type = decode_event_header(item.value, item.content_type).event_type
+    return event_headers(event_type, item.content_type)
+
+
+def _append(spool: EventSpool, key: bytes, value: bytes, content_type: str) -> SpoolStats:
+    spool.append(key, value, content_type)
+    return spool.stats()
+
+
+def _spool_fields(stats: SpoolStats) -> dict[str, float]:
+    return {
+        "spool_depth": stats.depth,
+        "spool_oldest_age_seconds": round(stats.oldest_age_seconds, 1),
+    }
+
+
+def _log_spool(message: str, stats: SpoolStats) -> None:
+    logger.info(message, extra=_spool_fields(stats))
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    key BLOB NOT NULL,
+    value BLOB NOT NULL,
+    content_type TEXT NOT NULL,
+    spooled_at REAL NOT NULL
+)
+"""
+
+
+@dataclass(frozen=True)
+class SpooledEvent:
+    seq: int
+    key: bytes
+    value: bytes
+    content_type: str
+
+
+@dataclass(frozen=True)
+class SpoolStats:
+    depth: int
+    # Seconds the oldest spooled event has waited (0 when empty).
+    oldest_age_seconds: float
+
+
+class EventSpool:
+    """On-disk FIFO of serialized events the broker did not accept.
+
+    Backed by SQLite in WAL mode, so an appended event survives a crash of
+    the worker; events are removed only after the broker acknowledged them.
+    Calls block on disk I/O and are safe from any thread.
+    """
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=FULL")
+        self._connection.execute(_SCHEMA)
+
+    def append(self, key: bytes, value: bytes, content_type: str) -> None:
+        with self._lock:
+            self._connection.execute(
+                "INSERT INTO events (key, value, content_type, spooled_at) VALUES (?, ?, ?, ?)",
+                (key, value, content_type, time.time()),
+            )
+
+    def peek(self, limit: int) -> list[SpooledEvent]:
+        """The oldest ``limit`` events, in the order they were appended."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT seq, key, value, content_type FROM events ORDER BY seq LIMIT ?",
+                (limit,),
+            ).fetchall()
+        return [
+            SpooledEvent(seq=seq, key=key, value=value, content_type=content_type)
+            for seq, key, value, content_type in rows
+        ]
+
+    def remove_through(self, seq: int) -> None:
+        """Drop every event up to and including ``seq``."""
+        with self._lock:
+            self._connection.execute("DELETE FROM events WHERE seq <= ?", (seq,))
+
+    def stats(self) -> SpoolStats:
+        with self._lock:
+            depth, oldest = self._connection.execute(
+                "SELECT COUNT(*), MIN(spooled_at) FROM events"
+            ).fetchone()
+        age = max(time.time() - oldest, 0.0) if oldest is not None else 0.0
+        return SpoolStats(depth=depth, oldest_age_seconds=age)
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import asyncio
-
 from sounds_right_worker.logging import get_logger
 from sounds_right_worker.storage.minio_client import StorageClient
 
@@ -18,7 +16,7 @@ async def delete_temp_audio(
     Never raises: cleanup failures should not fail an otherwise successful job.
     """
     try:
-        await asyncio.to_thread(storage.delete_object, bucket, object_key)
+        await storage.delete_object(bucket, object_key)
     except Exception:
         logger.exception(
             "failed to delete temporary audio",
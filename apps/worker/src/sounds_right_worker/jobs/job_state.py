@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import uuid
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Literal
+
+from pydantic import BaseModel, ValidationError
+
+from sounds_right_worker.config import WorkerSettings
+from sounds_right_worker.logging import get_logger
+from sounds_right_worker.storage.minio_client import (
+    ObjectNotFoundError,
+    PreconditionFailedError,
+    StorageClient,
+    StorageError,
+)
+from sounds_right_worker.storage.object_keys import job_state_object_key
+
+logger = get_logger(__name__)
+
+JobState = Literal["claimed", "running", "done"]
+
+# Longest pause between re-reads while waiting on another worker's job.
+_MAX_POLL_SECONDS = 5.0
+
+
+class JobRecord(BaseModel):
+    """Processing state of one job, as last written by the worker owning it."""
+
+    job_id: uuid.UUID
+    event_id: uuid.UUID
+    state: JobState
+    owner: str
+    updated_at: datetime
+    # Terminal event type once ``done``.
+    outcome: str | None = None
+
+
+class JobRunningError(Exception):
+    """The job is running under a live claim, here or on another worker."""
+
+
+@dataclass(frozen=True)
+class JobStateConfig:
+    enabled: bool = True
+    cache_size: int = 1024
+    lease_seconds: float = 60
+
+    @classmethod
+    def from_settings(cls, settings: WorkerSettings) -> JobStateConfig:
+        return cls(
+            enabled=settings.worker_job_dedupe,
+            cache_size=settings.worker_job_state_cache_size,
+            lease_seconds=settings.worker_job_lease_seconds,
+        )
+
+
+@dataclass(frozen=True)
+class _Stored:
+    record: JobRecord
+    # ETag of the stored version; ``None`` when it is unknown (a failed write).
+    etag: str | None
+
+
+class JobStateStore:
+    """Dedupes job requests across redeliveries and worker replicas.
+
+    Records live in the artifacts bucket, one per job, behind an in-memory
+    LRU. A job is ``claimed`` before any work (or event) happens, ``running``
+    while its owner heartbeats the record, and ``done`` once its terminal
+    event is published. A claim whose heartbeat is older than the lease is
+    considered abandoned and may be taken over.
+
+    Every write is conditional on the ETag last seen (or on the record not
+    existing yet), so of two workers claiming a job at once only one wins,
+    and an owner whose claim was taken over stops writing.
+
+    Storage failures are logged and ignored: dedupe is an optimization, never
+    a reason to drop a job.
+    """
+
+    def __init__(
+        self,
+        storage: StorageClient,
+        bucket: str,
+        config: JobStateConfig,
+        worker_name: str,
+    ) -> None:
+        self._storage = storage
+        self._bucket = bucket
+        self._config = config
+        self._owner = f"{worker_name}:{uuid.uuid4().hex[:8]}"
+        self._cache: OrderedDict[uuid.UUID, _Stored] = OrderedDict()
+        # Jobs this process is running, so a waiting redelivery is woken at once.
+        self._local: dict[uuid.UUID, asyncio.Event] = {}
+
+    async def claim(self, event_id: uuid.UUID, job_id: uuid.UUID) -> JobRecord | None:
+        """Claim ``job_id`` for this worker, or return ``None`` if already handled.
+
+        Never waits: a job running here or under a live lease elsewhere raises
+        ``JobRunningError``, and the caller retries after ``wait``.
+        """
+        stored = await self._get(job_id)
+        record = stored.record if stored is not None else None
+        if record is not None and record.state != "done":
+            if job_id in self._local or not self._expired(record):
+                raise JobRunningError(f"job {job_id} is running on {record.owner}")
+            logger.warning(
+                "taking over abandoned job",
+                extra={"job_id": str(job_id), "owner": record.owner},
+            )
+
+        # A different request for a finished job (e.g. a retry) runs again.
+        if record is not None and record.state == "done" and record.event_id == event_id:
+            return None
+        claimed = JobRecord(
+            job_id=job_id,
+            event_id=event_id,
+            state="claimed",
+            owner=self._owner,
+            updated_at=datetime.now(UTC),
+        )
+        try:
+            await self._write(claimed, stored)
+        except PreconditionFailedError as exc:
+            self._cache.pop(job_id, None)
+            raise JobRunningError(f"job {job_id} was claimed concurrently") from exc
+        return claimed
+
+    async def wait(self, job_id: uuid.UUID) -> None:
+        """Return once ``job_id`` is no longer running under a live claim."""
+        while True:
+            local = self._local.get(job_id)
+            if local is not None:
+                await local.wait()
+                continue
+            stored = await self._get(job_id, refresh=True)
+            if stored is None or stored.record.state == "done" or self._expired(stored.record):
+                return
+            await asyncio.sleep(min(self._config.lease_seconds / 4, _MAX_POLL_SECONDS))
+
+    @contextlib.asynccontextmanager
+    async def hold(self, record: JobRecord) -> AsyncIterator[None]:
+        """Mark a claimed job ``running`` and heartbeat it until the block exits.
+
+        If the block raises, the claim is released so a redelivery can start
+        over at once rather than wait out the lease.
+        """
+        done = asyncio.Event()
+        self._local[record.job_id] = done
+        await self._update(
+            record.model_copy(update={"state": "running", "updated_at": datetime.now(UTC)})
+        )
+        heartbeat = asyncio.create_task(self._heartbeat(record.job_id))
+        try:
+            yield
+        except BaseException:
+            await self._release(record.job_id)
+            raise
+        finally:
+            heartbeat.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await heartbeat
+            del self._local[record.job_id]
+            done.set()
+
+    async def finish(self, record: JobRecord, outcome: str) -> None:
+        """Mark a job ``done`` with its terminal event type."""
+        await self._update(
+            record.model_copy(
+                update={"state": "done", "outcome": outcome, "updated_at": datetime.now(UTC)}
+            )
+        )
+
+    def _expired(self, record: JobRecord) -> bool:
+        age = (datetime.now(UTC) - record.updated_at).total_seconds()
+        return age > self._config.lease_seconds
+
+    async def _heartbeat(self, job_id: uuid.UUID) -> None:
+        while True:
+            await asyncio.sleep(self._config.lease_seconds / 3)
+            stored = self._cache.get(job_id)
+            if stored is None or stored.record.state != "running":
+                return
+            await self._update(stored.record.model_copy(update={"updated_at": datetime.now(UTC)}))
+
+    async def _get(self, job_id: uuid.UUID, *, refresh: bool = False) -> _Stored | None:
+        if not self._config.enabled:
+            return None
+        stored = None if refresh else self._cache.get(job_id)
+        if stored is not None:
+            self._cache.move_to_end(job_id)
+            return stored
+        stored = await self._read(job_id)
+        if stored is not None:
+            self._remember(stored)
+        return stored
+
+    def _remember(self, stored: _Stored) -> None:
+        job_id = stored.record.job_id
+        self._cache[job_id] = stored
+        self._cache.move_to_end(job_id)
+        while len(self._cache) > self._config.cache_size:
+            self._cache.popitem(last=False)
+
+    async def _read(self, job_id: uuid.UUID) -> _Stored | None:
+        object_key = job_state_object_key(job_id)
+        try:
+            raw, etag = await self._storage.download_with_etag(self._bucket, object_key)
+        except ObjectNotFoundError:
+            return None
+        except StorageError:
+            logger.warning("could not read job state", extra={"object_key": object_key})
+            return None
+        try:
+            return _Stored(JobRecord.model_validate_json(raw), etag or None)
+        except ValidationError:
+            return None
+
+    async def _update(self, record: JobRecord) -> None:
+        """Write this worker's own record, unless another worker took the job over."""
+        # A record evicted from the cache is overwritten unconditionally.
+        previous = self._cache.get(record.job_id) or _Stored(record, None)
+        try:
+            await self._write(record, previous)
+        except PreconditionFailedError:
+            self._cache.pop(record.job_id, None)
+            logger.warning(
+                "job claim was taken over, no longer recording state",
+                extra={"job_id": str(record.job_id)},
+            )
+
+    async def _write(self, record: JobRecord, previous: _Stored | None) -> None:
+        """Replace ``previous`` (or create the record when it is ``None``).
+
+        Raises ``PreconditionFailedError`` if the stored record changed since.
+        """
+        if not self._config.enabled:
+            return
+        object_key = job_state_object_key(record.job_id)
+        etag: str | None = None
+        try:
+            etag = await self._storage.upload_json(
+                self._bucket,
+                object_key,
+                record.model_dump_json().encode("utf-8"),
+                if_match=previous.etag if previous is not None else None,
+                if_none_match=previous is None,
+            )
+        except PreconditionFailedError:
+            raise
+        except StorageError:
+            logger.warning("could not write job state", extra={"object_key": object_key})
+        self._remember(_Stored(record, etag or None))
+
+    async def _release(self, job_id: uuid.UUID) -> None:
+        if not self._config.enabled:
+            return
+        self._cache.pop(job_id, None)
+        object_key = job_state_object_key(job_id)
+        try:
+            await self._storage.delete_object(self._bucket, object_key)
+        except StorageError:
+            logger.warning("could not release job state", extra={"object_key": object_key})
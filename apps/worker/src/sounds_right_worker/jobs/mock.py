@@ -0,0 +1,292 @@
+from __future__ import annotations
+
+import asyncio
+import random
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from sounds_right_contracts.events import (
+    EventEnvelope,
+    TranscriptionCompletedPayload,
+    TranscriptionFailedPayload,
+    TranscriptionProgressPayload,
+    TranscriptionStartedPayload,
+)
+
+from sounds_right_worker import errors
+from sounds_right_worker.config import WorkerSettings
+from sounds_right_worker.events.producer import ConsumedOffset, EventProducer
+from sounds_right_worker.logging import get_logger
+
+logger = get_logger(__name__)
+
+MOCK_FAILURE = "mock_failure"
+
+# Share of a job's progress events emitted before it fails with each code,
+# following the pipeline stage that raises it. These are the only codes a
+# failure mix may use.
+_FAILURE_PROGRESS_SHARE: dict[str, float] = {
+    MOCK_FAILURE: 0.0,
+    errors.AUDIO_NOT_FOUND: 0.0,
+    errors.AUDIO_DOWNLOAD_FAILED: 0.0,
+    errors.AUDIO_VALIDATION_FAILED: 0.0,
+    errors.AUDIO_TOO_LARGE: 0.0,
+    errors.AUDIO_DURATION_TOO_LONG: 0.0,
+    errors.UNSUPPORTED_AUDIO_FORMAT: 0.0,
+    errors.UNSUPPORTED_OPTION: 0.0,
+    errors.LYRICS_NOT_FOUND: 0.0,
+    errors.REALIGNMENT_UNAVAILABLE: 0.0,
+    errors.WHISPER_CPP_MISSING: 0.0,
+    errors.NORMALIZATION_FAILED: 0.25,
+    errors.VOCAL_SEPARATION_FAILED: 0.25,
+    errors.WHISPER_CPP_FAILED: 0.5,
+    errors.LYRICS_ALIGNMENT_FAILED: 0.5,
+    errors.TRANSCRIPT_PARSE_FAILED: 0.75,
+    errors.ARTIFACT_UPLOAD_FAILED: 1.0,
+    errors.TEMP_CLEANUP_FAILED: 1.0,
+    errors.UNKNOWN_WORKER_ERROR: 0.5,
+}
+
+
+@dataclass(frozen=True)
+class MockProfile:
+    """Shape of the jobs simulated in mock mode."""
+
+    step_delay_seconds: float = 1
+    # Real job durations to draw from; empty means fixed steps of ``step_delay_seconds``.
+    latency_samples: tuple[float, ...] = ()
+    time_scale: float = 1.0
+    progress_events: int = 4
+    # Probability of failing with each error code.
+    failure_rates: Mapping[str, float] = field(default_factory=dict)
+    concurrency: int = 1
+    seed: int | None = None
+
+    def __post_init__(self) -> None:
+        _check_failure_codes(self.failure_rates)
+        if any(rate < 0 for rate in self.failure_rates.values()):
+            raise ValueError("mock failure rates must not be negative")
+        if sum(self.failure_rates.values()) > 1:
+            raise ValueError("mock failure rates must add up to at most 1")
+
+    @classmethod
+    def from_settings(cls, settings: WorkerSettings) -> MockProfile:
+        samples: tuple[float, ...] = ()
+        if settings.worker_mock_latency_samples_path:
+            samples = load_latency_samples(Path(settings.worker_mock_latency_samples_path))
+        try:
+            failure_rates = parse_failure_rates(settings.worker_mock_failure_rates)
+        except ValueError as exc:
+            raise ValueError(f"invalid WORKER_MOCK_FAILURE_RATES: {exc}") from exc
+        if settings.worker_mock_should_fail:
+            failure_rates = {MOCK_FAILURE: 1.0}
+        return cls(
+            step_delay_seconds=settings.worker_mock_step_delay_seconds,
+            latency_samples=samples,
+            time_scale=settings.worker_mock_time_scale,
+            progress_events=max(settings.worker_mock_progress_events, 0),
+            failure_rates=failure_rates,
+            concurrency=max(settings.worker_mock_concurrency, 1),
+            seed=settings.worker_mock_seed,
+        )
+
+    def draw_duration(self, rng: random.Random) -> float:
+        if self.latency_samples:
+            duration = rng.choice(self.latency_samples)
+        else:
+            duration = self.step_delay_seconds * (self.progress_events + 1)
+        return duration * self.time_scale
+
+    def draw_failure(self, rng: random.Random) -> str | None:
+        draw = rng.random()
+        for error_code, rate in self.failure_rates.items():
+            if draw < rate:
+                return error_code
+            draw -= rate
+        return None
+
+
+def parse_failure_rates(value: str) -> dict[str, float]:
+    """Parse comma-separated ``error_code=probability`` pairs.
+
+    Raises ``ValueError`` for a malformed pair or a code the worker never emits.
+    """
+    rates: dict[str, float] = {}
+    for entry in value.split(","):
+        if not entry.strip():
+            continue
+        error_code, separator, rate = (part.strip() for part in entry.partition("="))
+        try:
+            if not separator or not error_code:
+                raise ValueError(entry)
+            rates[error_code] = float(rate)
+        except ValueError:
+            raise ValueError(f"expected error_code=probability, got {entry.strip()!r}") from None
+    _check_failure_codes(rates)
+    return rates
+
+
+def _check_failure_codes(codes: Iterable[str]) -> None:
+    unknown = sorted(set(codes) - _FAILURE_PROGRESS_SHARE.keys())
+    if unknown:
+        raise ValueError(f"unknown mock failure codes: {', '.join(unknown)}")
+
+
+def load_latency_samples(path: Path) -> tuple[float, ...]:
+    """Read job durations in seconds, one per line (blank and ``#`` lines skipped)."""
+    samples = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        sample = float(line)
+        if sample < 0:
+            raise ValueError(f"negative job duration in {path}: {line}")
+        samples.append(sample)
+    if not samples:
+        raise ValueError(f"no job durations in {path}")
+    return tuple(samples)
+
+
+class MockWorker:
+    """Runs mock jobs for consumed requests, up to ``profile.concurrency`` at once.
+
+    With more than one job in flight, a transactional offset commit can pass a
+    request that is still running; a crash then drops that request. Mock mode
+    accepts this to generate load.
+    """
+
+    def __init__(self, producer: EventProducer, worker_name: str, profile: MockProfile) -> None:
+        self._producer = producer
+        self._worker_name = worker_name
+        self._profile = profile
+        self._rng = random.Random(profile.seed)
+        self._slots = asyncio.Semaphore(profile.concurrency)
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def submit(self, event: EventEnvelope, offset: ConsumedOffset | None = None) -> None:
+        """Start a job for ``event`` once a slot is free."""
+        await self._slots.acquire()
+        task = asyncio.create_task(self._run(event, offset))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def drain(self) -> None:
+        """Wait for the jobs in flight."""
+        if self._tasks:
+            await asyncio.wait(self._tasks)
+
+    async def _run(self, event: EventEnvelope, offset: ConsumedOffset | None) -> None:
+        try:
+            await process_requested_event(
+                event,
+                self._producer,
+                self._worker_name,
+                self._profile,
+                offset,
+                self._rng,
+            )
+        except Exception:
+            logger.exception("mock job failed", extra={"event_id": str(event.event_id)})
+        finally:
+            self._slots.release()
+
+
+async def process_requested_event(
+    event: EventEnvelope,
+    producer: EventProducer,
+    worker_name: str,
+    profile: MockProfile,
+    offset: ConsumedOffset | None = None,
+    rng: random.Random | None = None,
+) -> None:
+    requested = event.payload
+    if not hasattr(requested, "job_id") or not hasattr(requested, "track_version_id"):
+        return
+    rng = rng if rng is not None else random.Random()
+    steps = profile.progress_events
+    step_delay = profile.draw_duration(rng) / (steps + 1)
+    error_code = profile.draw_failure(rng)
+    fail_after = 0
+    if error_code is not None and steps:
+        share = _FAILURE_PROGRESS_SHARE[error_code]
+        fail_after = max(1, round(steps * share))
+
+    await producer.publish(
+        EventEnvelope(
+            event_type="transcription.started",
+            correlation_id=event.correlation_id,
+            causation_id=event.event_id,
+            producer=worker_name,
+            payload=TranscriptionStartedPayload(
+                job_id=requested.job_id,
+                track_version_id=requested.track_version_id,
+                worker_id=worker_name,
+                engine="mock",
+                message="Mock transcription started",
+            ),
+        ),
+        requested.job_id,
+    )
+
+    for step in range(1, steps + 1):
+        progress = round(100 * step / (steps + 1))
+        await asyncio.sleep(step_delay)
+        await producer.publish(
+            EventEnvelope(
+                event_type="transcription.progress",
+                correlation_id=event.correlation_id,
+                causation_id=event.event_id,
+                producer=worker_name,
+                payload=TranscriptionProgressPayload(
+                    job_id=requested.job_id,
+                    track_version_id=requested.track_version_id,
+                    progress=progress,
+                    stage="mock_processing",
+                    message=f"Mock processing {progress}% complete",
+                ),
+            ),
+            requested.job_id,
+        )
+        if step == fail_after:
+            break
+    else:
+        await asyncio.sleep(step_delay)
+
+    if error_code is not None:
+        await producer.publish(
+            EventEnvelope(
+                event_type="transcription.failed",
+                correlation_id=event.correlation_id,
+                causation_id=event.event_id,
+                producer=worker_name,
+                payload=TranscriptionFailedPayload(
+                    job_id=requested.job_id,
+                    track_version_id=requested.track_version_id,
+                    error_code=error_code,
+                    error_message="Mock worker failed intentionally",
+                    retryable=error_code == MOCK_FAILURE
+                    or error_code in errors.RETRYABLE_ERROR_CODES,
+                ),
+            ),
+            requested.job_id,
+            commit=offset,
+        )
+        return
+
+    await producer.publish(
+        EventEnvelope(
+            event_type="transcription.completed",
+            correlation_id=event.correlation_id,
+            causation_id=event.event_id,
+            producer=worker_name,
+            payload=TranscriptionCompletedPayload(
+                job_id=requested.job_id,
+                track_version_id=requested.track_version_id,
+                message="Mock transcription completed",
+            ),
+        ),
+        requested.job_id,
+        commit=offset,
+    )
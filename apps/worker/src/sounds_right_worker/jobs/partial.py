@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+
+from sounds_right_contracts.events import (
+    EventEnvelope,
+    PartialSegmentPayload,
+    TranscriptionRequestedPayload,
+)
+
+from sounds_right_worker.audio.timemap import TimeMap
+from sounds_right_worker.config import WorkerSettings
+from sounds_right_worker.jobs.pipeline_events import PipelineEventPublisher
+from sounds_right_worker.logging import get_logger
+from sounds_right_worker.transcription.schemas import WhisperSegment
+
+logger = get_logger(__name__)
+
+# Partial progress is reported inside the transcription stage (40 -> 80).
+_PROGRESS_START = 40
+_PROGRESS_END = 79
+
+
+@dataclass(frozen=True)
+class PartialBatchConfig:
+    max_segments: int = 8
+    interval_seconds: float = 10.0
+
+    @classmethod
+    def from_settings(cls, settings: WorkerSettings) -> PartialBatchConfig:
+        return cls(
+            max_segments=max(settings.worker_partial_batch_segments, 1),
+            interval_seconds=settings.worker_partial_interval_seconds,
+        )
+
+
+class PartialTranscriptPublisher:
+    """Batches segments decoded by whisper.cpp into ``transcription.partial`` events.
+
+    A batch is flushed once it holds ``max_segments`` segments or
+    ``interval_seconds`` have passed since the last flush. Publishing is best
+    effort: a failed publish is logged and never interrupts transcription.
+    """
+
+    def __init__(
+        self,
+        events: PipelineEventPublisher,
+        event: EventEnvelope,
+        payload: TranscriptionRequestedPayload,
+        config: PartialBatchConfig,
+        *,
+        duration_seconds: float,
+        time_map: TimeMap | None = None,
+    ) -> None:
+        self._events = events
+        self._event = event
+        self._payload = payload
+        self._config = config
+        self._duration_seconds = duration_seconds
+        self._time_map = time_map
+        self._pending: list[PartialSegmentPayload] = []
+        self._sequence = 0
+        self._decoded_seconds = 0.0
+        self._last_flush = time.monotonic()
+
+    @property
+    def published_batches(self) -> int:
+        return self._sequence
+
+    async def add(self, segment: WhisperSegment) -> None:
+        start, end = segment.start, segment.end
+        if self._time_map is not None:
+            start = self._time_map.to_original(start)
+            end = max(self._time_map.to_original(end, end=True), start)
+        self._pending.append(PartialSegmentPayload(start=start, end=end, text=segment.text))
+        self._decoded_seconds = max(self._decoded_seconds, end)
+        if (
+            len(self._pending) >= self._config.max_segments
+            or time.monotonic() - self._last_flush >= self._config.interval_seconds
+        ):
+            await self.flush()
+
+    async def flush(self) -> None:
+        if not self._pending:
+            return
+        segments, self._pending = self._pending, []
+        self._last_flush = time.monotonic()
+        try:
+            await self._events.partial(
+                self._event,
+                self._payload,
+                sequence=self._sequence,
+                segments=segments,
+                decoded_seconds=self._decoded_seconds,
+                progress=self._progress(),
+            )
+        except Exception:
+            logger.exception(
+                "could not publish partial transcript",
+                extra={"job_id": str(self._payload.job_id), "sequence": self._sequence},
+            )
+            return
+        self._sequence += 1
+
+    def _progress(self) -> int:
+        if self._duration_seconds <= 0:
+            return _PROGRESS_START
+        fraction = min(self._decoded_seconds / self._duration_seconds, 1.0)
+        return min(
+            _PROGRESS_START + int(fraction * (_PROGRESS_END - _PROGRESS_START)),
+            _PROGRESS_END,
+        )
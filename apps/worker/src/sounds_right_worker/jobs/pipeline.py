@@ -1,22 +1,44 @@
 from __future__ import annotations
 
 import asyncio
+import json
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
 
-from sounds_right_worker.audio.ffmpeg import normalize_to_wav
-from sounds_right_worker.audio.ffprobe import probe_audio
-from sounds_right_worker.audio.validation import AudioLimits, validate_audio
+from sounds_right_contracts.artifacts import content_encoding_header, decode_artifact
+from sounds_right_contracts.events import (
+    EventEnvelope,
+    TranscriptionRealignRequestedPayload,
+    TranscriptionRequestedPayload,
+)
+from sounds_right_contracts.seek_index import SeekIndex
+from sounds_right_contracts.word_timings import WORD_TIMINGS_BINARY_CONTENT_TYPE, WordTimings
+
+from sounds_right_worker.audio.ffmpeg import NORMALIZED_FORMAT, is_normalized, normalize_to_wav
+from sounds_right_worker.audio.ffprobe import AudioProbeResult, probe_audio
+from sounds_right_worker.audio.fingerprint import Fingerprint, fingerprint_wav
+from sounds_right_worker.audio.header import HEADER_BYTES, id3v2_size, sniff_audio_header
+from sounds_right_worker.audio.pcm_cache import PcmCache
+from sounds_right_worker.audio.separation import SeparatedVocals, SeparationConfig, VocalSeparator
+from sounds_right_worker.audio.timemap import TimeMap
+from sounds_right_worker.audio.vad import VadConfig, trim_silence
+from sounds_right_worker.audio.validation import AudioLimits, prevalidate_audio, validate_audio
 from sounds_right_worker.config import WorkerSettings
 from sounds_right_worker.errors import (
     ARTIFACT_UPLOAD_FAILED,
     AUDIO_DOWNLOAD_FAILED,
     AUDIO_NOT_FOUND,
+    LYRICS_ALIGNMENT_FAILED,
+    LYRICS_NOT_FOUND,
+    REALIGNMENT_UNAVAILABLE,
     UNKNOWN_WORKER_ERROR,
-    UNSUPPORTED_OPTION,
     PipelineError,
 )
-from sounds_right_worker.events.producer import EventProducer
-from sounds_right_worker.events.schemas import EventEnvelope, TranscriptionRequestedPayload
+from sounds_right_worker.events.producer import ConsumedOffset, EventProducer
 from sounds_right_worker.jobs.cleanup import delete_temp_audio
+from sounds_right_worker.jobs.job_state import JobRunningError, JobStateConfig, JobStateStore
+from sounds_right_worker.jobs.partial import PartialBatchConfig, PartialTranscriptPublisher
 from sounds_right_worker.jobs.pipeline_events import PipelineEventPublisher
 from sounds_right_worker.jobs.tempdir import JobTempDir
 from sounds_right_worker.logging import get_logger
@@ -26,18 +48,120 @@ from sounds_right_worker.storage.minio_client import (
     StorageError,
 )
 from sounds_right_worker.storage.object_keys import (
+    alignment_features_object_key,
     input_extension,
     manifest_object_key,
+    normalized_audio_object_key,
+    preview_object_key,
+    seek_index_object_key,
     transcript_object_key,
+    word_timings_object_key,
+)
+from sounds_right_worker.transcription.alignment import (
+    ALIGNMENT_ENGINE_NAME,
+    ALIGNMENT_MODEL_NAME,
+    AlignmentError,
+    AlignmentFeatures,
+    align_lyrics_text,
+)
+from sounds_right_worker.transcription.duplicates import (
+    DuplicateConfig,
+    DuplicateMatch,
+    FingerprintEntry,
+    FingerprintIndex,
+)
+from sounds_right_worker.transcription.language import (
+    LanguageDetector,
+    LanguageModelChoice,
+    choose_language_model,
+    model_name_from_path,
+)
+from sounds_right_worker.transcription.manifest import (
+    Manifest,
+    ManifestArtifact,
+    ManifestArtifacts,
+    ManifestRealignment,
+    ManifestReuse,
+    ManifestSeparation,
+    build_manifest,
+    compute_file_sha256,
+    compute_sha256,
+    manifest_artifact,
+)
+from sounds_right_worker.transcription.parser import (
+    build_transcript,
+    remap_result,
+    shift_transcript,
+)
+from sounds_right_worker.transcription.realign import realign_transcript
+from sounds_right_worker.transcription.schemas import (
+    LanguageDetection,
+    Transcript,
+    TranscriptionOptions,
+    WhisperCppResult,
 )
-from sounds_right_worker.transcription.manifest import build_manifest, compute_sha256
-from sounds_right_worker.transcription.parser import build_transcript
-from sounds_right_worker.transcription.schemas import TranscriptionOptions
 from sounds_right_worker.transcription.whisper_cpp import WhisperCppEngine
 
 logger = get_logger(__name__)
 
 
+@dataclass(frozen=True)
+class _EngineOutput:
+    result: WhisperCppResult
+    model_name: str
+    engine_name: str | None = None
+    detection: LanguageDetection | None = None
+    preview_published: bool = False
+
+
+@dataclass(frozen=True)
+class _ReusedTranscript:
+    match: DuplicateMatch
+    transcript: Transcript
+
+
+@dataclass(frozen=True)
+class _PlayerArtifacts:
+    """Artifacts derived from transcript.json and stored beside it."""
+
+    word_timings_key: str
+    word_timings: bytes
+    seek_index_key: str
+    seek_index: bytes
+
+    @classmethod
+    def build(
+        cls,
+        prefix: str,
+        track_version_id: uuid.UUID,
+        transcript: Transcript,
+        transcript_bytes: bytes,
+    ) -> _PlayerArtifacts:
+        index = SeekIndex.from_transcript_json(transcript_bytes)
+        return cls(
+            word_timings_key=word_timings_object_key(prefix, track_version_id),
+            word_timings=WordTimings.from_segments(transcript.segments).to_bytes(),
+            seek_index_key=seek_index_object_key(prefix, track_version_id),
+            seek_index=json.dumps(index.to_json(), separators=(",", ":")).encode("utf-8"),
+        )
+
+    def word_timings_artifact(self, content_encoding: str | None) -> ManifestArtifact:
+        return manifest_artifact(
+            self.word_timings_key,
+            self.word_timings,
+            WORD_TIMINGS_BINARY_CONTENT_TYPE,
+            content_encoding,
+        )
+
+    def seek_index_artifact(self, content_encoding: str | None) -> ManifestArtifact:
+        return manifest_artifact(
+            self.seek_index_key,
+            self.seek_index,
+            "application/json",
+            content_encoding,
+        )
+
+
 class TranscriptionPipeline:
     def __init__(
         self,
@@ -51,10 +175,60 @@ class TranscriptionPipeline:
         self._engine = engine
         self._producer = producer
         self._events = PipelineEventPublisher(settings, producer)
+        self._vad_config = VadConfig.from_settings(settings)
+        self._audio_limits = AudioLimits(
+            max_size_bytes=settings.max_audio_size_bytes,
+            max_duration_seconds=settings.max_audio_duration_seconds,
+        )
+        self._partial_config = PartialBatchConfig.from_settings(settings)
+        self._language_detector = LanguageDetector(
+            engine,
+            storage,
+            settings.minio_artifacts_bucket,
+            settings.whisper_language_window_seconds,
+            self._vad_config,
+        )
+        self._audio_cache = PcmCache(storage, settings.minio_artifacts_bucket)
+        self._separator = VocalSeparator(
+            SeparationConfig.from_settings(settings),
+            storage,
+            settings.minio_artifacts_bucket,
+        )
+        self._fingerprints = FingerprintIndex(
+            storage,
+            settings.minio_artifacts_bucket,
+            DuplicateConfig.from_settings(settings),
+        )
+        self._jobs = JobStateStore(
+            storage,
+            settings.minio_artifacts_bucket,
+            JobStateConfig.from_settings(settings),
+            settings.worker_name,
+        )
+        # Requests for jobs that were already running, waiting for that run to end.
+        self._handoffs: set[asyncio.Task[None]] = set()
+
+    async def aclose(self) -> None:
+        """Drop handed-off requests; the runs they wait on publish the outcome."""
+        for task in self._handoffs:
+            task.cancel()
+        await asyncio.gather(*self._handoffs, return_exceptions=True)
+
+    async def handle_requested(
+        self,
+        event: EventEnvelope,
+        offset: ConsumedOffset | None = None,
+    ) -> None:
+        """Run one job request and publish its terminal event.
 
-    async def handle_requested(self, event: EventEnvelope) -> None:
+        ``offset`` is the consumer position past ``event``; with transactions it
+        is committed atomically with ``completed`` or ``failed``.
+        """
         payload = event.payload
-        if not isinstance(payload, TranscriptionRequestedPayload):
+        if not isinstance(
+            payload,
+            (TranscriptionRequestedPayload, TranscriptionRealignRequestedPayload),
+        ):
             logger.error("pipeline received non-requested event")
             return
 
@@ -64,20 +238,72 @@ class TranscriptionPipeline:
             "correlation_id": str(event.correlation_id),
             "event_id": str(event.event_id),
         }
-        logger.info("received transcription.requested", extra=log_context)
+        logger.info(
+            "received job request",
+            extra={**log_context, "event_type": event.event_type},
+        )
+
+        # Redeliveries of handled requests stop here, before `started` is sent.
+        try:
+            job = await self._jobs.claim(event.event_id, payload.job_id)
+        except JobRunningError:
+            logger.info("job is running, handing the request off", extra=log_context)
+            self._hand_off(event, payload.job_id)
+            return
+        if job is None:
+            logger.info("job request already handled, skipping", extra=log_context)
+            await self._producer.commit(offset)
+            return
+
+        async with self._jobs.hold(job):
+            outcome = await self._process(event, payload, log_context, offset)
+            await self._jobs.finish(job, outcome)
+
+    def _hand_off(self, event: EventEnvelope, job_id: uuid.UUID) -> None:
+        """Retry a request once the run it collided with ends, off the consume loop.
 
+        The retry is skipped if that run finished the request, and takes the job
+        over if it was abandoned. Its offset is left to later commits: committing
+        it after newer ones would move the consumer position back.
+        """
+
+        async def retry() -> None:
+            await self._jobs.wait(job_id)
+            try:
+                await self.handle_requested(event)
+            except Exception:
+                logger.exception("handed-off job request failed", extra={"job_id": str(job_id)})
+
+        task = asyncio.create_task(retry())
+        self._handoffs.add(task)
+        task.add_done_callback(self._handoffs.discard)
+
+    async def _process(
+        self,
+        event: EventEnvelope,
+        payload: TranscriptionRequestedPayload | TranscriptionRealignRequestedPayload,
+        log_context: dict[str, str],
+        offset: ConsumedOffset | None,
+    ) -> str:
+        """Run a claimed job; return the type of the terminal event published."""
         await self._events.started(event, payload)
 
         try:
-            await self._run(event, payload, log_context)
+            if isinstance(payload, TranscriptionRealignRequestedPayload):
+                await self._realign(event, payload, log_context, offset)
+            else:
+                await self._run(event, payload, log_context, offset)
         except PipelineError as exc:
             logger.warning(
                 "transcription failed",
                 extra={**log_context, "stage": exc.stage, "error_code": exc.error_code},
             )
-            await self._events.failed(event, payload, exc)
+            await self._discard_preview(payload)
+            await self._events.failed(event, payload, exc, commit=offset)
+            return "transcription.failed"
         except Exception:
             logger.exception("unexpected worker error", extra=log_context)
+            await self._discard_preview(payload)
             await self._events.failed(
                 event,
                 payload,
@@ -86,21 +312,18 @@ class TranscriptionPipeline:
                     "An unexpected error occurred during transcription",
                     stage="unknown",
                 ),
+                commit=offset,
             )
+            return "transcription.failed"
+        return "transcription.completed"
 
     async def _run(
         self,
         event: EventEnvelope,
         payload: TranscriptionRequestedPayload,
         log_context: dict[str, str],
+        offset: ConsumedOffset | None,
     ) -> None:
-        if payload.options.separate_vocals:
-            raise PipelineError(
-                UNSUPPORTED_OPTION,
-                "Vocal separation is not supported yet",
-                stage="options",
-            )
-
         settings = self._settings
         transcript_key = transcript_object_key(
             settings.transcript_object_prefix,
@@ -110,11 +333,17 @@ class TranscriptionPipeline:
             settings.transcript_object_prefix,
             payload.track_version_id,
         )
+        preview_key = preview_object_key(
+            settings.transcript_object_prefix,
+            payload.track_version_id,
+        )
 
         # Idempotency: if a transcript already exists, re-emit completion.
         if await self._transcript_exists(transcript_key):
             logger.info("transcript already exists, skipping", extra=log_context)
-            await self._events.completed_from_existing(event, payload, transcript_key, manifest_key)
+            await self._events.completed_from_existing(
+                event, payload, transcript_key, manifest_key, commit=offset
+            )
             await delete_temp_audio(
                 self._storage,
                 settings.minio_temp_audio_bucket,
@@ -131,10 +360,12 @@ class TranscriptionPipeline:
             input_original = temp.file(f"input_original.{extension}")
             input_wav = temp.file("input.wav")
 
+            # Reject oversized or non-audio uploads before pulling them onto the node
+            await self._prevalidate_upload(payload.audio_object_key)
+
             # Download audio
             try:
-                await asyncio.to_thread(
-                    self._storage.download_to_path,
+                await self._storage.download_to_path(
                     settings.minio_temp_audio_bucket,
                     payload.audio_object_key,
                     input_original,
@@ -153,35 +384,80 @@ class TranscriptionPipeline:
                 ) from exc
             logger.info("downloaded audio", extra=log_context)
             await self._events.progress(event, payload, 10, "audio_downloaded")
+            audio_sha256 = await asyncio.to_thread(compute_file_sha256, input_original)
 
             # Validate audio
             probe = await probe_audio(settings.ffprobe_path, input_original)
-            validate_audio(
-                probe,
-                AudioLimits(
-                    max_size_bytes=settings.max_audio_size_bytes,
-                    max_duration_seconds=settings.max_audio_duration_seconds,
-                ),
-            )
+            validate_audio(probe, self._audio_limits)
             logger.info("validated audio", extra=log_context)
             await self._events.progress(event, payload, 20, "audio_validated")
 
             # Normalize audio
-            await normalize_to_wav(settings.ffmpeg_path, input_original, input_wav)
-            logger.info("normalized audio", extra=log_context)
+            source = await self._normalize(input_original, input_wav, probe, audio_sha256)
+            logger.info("normalized audio", extra={**log_context, "source": source})
             await self._events.progress(event, payload, 30, "audio_normalized")
 
-            # Transcribe
-            options = TranscriptionOptions(
-                language=payload.options.language,
-                model=payload.options.model,
-                separate_vocals=payload.options.separate_vocals,
-            )
-            await self._events.progress(event, payload, 40, "transcription_started")
-            logger.info("started whisper.cpp", extra=log_context)
-            result = await self._engine.transcribe(input_wav, temp.path, options)
-            logger.info("finished whisper.cpp", extra=log_context)
-            await self._events.progress(event, payload, 80, "transcription_finished")
+            # Reuse the transcript of an acoustically matching earlier upload
+            fingerprint: Fingerprint | None = None
+            reused: _ReusedTranscript | None = None
+            lyrics_key = payload.options.lyrics_object_key
+            if settings.worker_fingerprint_dedupe:
+                fingerprint = await self._fingerprint(input_wav)
+                if fingerprint is not None and lyrics_key is None:
+                    reused = await self._reuse_duplicate(fingerprint, payload)
+
+            # Isolate the vocal stem for dense mixes (best effort)
+            engine_wav = input_wav
+            separation: SeparatedVocals | None = None
+            if payload.options.separate_vocals and reused is None:
+                separation = await self._separate_vocals(input_original, temp.path, audio_sha256)
+                if separation is not None:
+                    engine_wav = separation.path
+                    logger.info(
+                        "separated vocals",
+                        extra={**log_context, "cached": separation.cached},
+                    )
+                    await self._events.progress(event, payload, 33, "vocals_separated")
+            # Only lyrics alignment, or a later re-alignment, uses the features
+            features: AlignmentFeatures | None = None
+            if lyrics_key is not None or settings.worker_store_alignment_features:
+                features = await self._alignment_features(engine_wav)
+
+            if lyrics_key is not None:
+                output = await self._align_lyrics(event, payload, features, lyrics_key)
+                logger.info("aligned lyrics", extra=log_context)
+            elif reused is not None:
+                logger.info(
+                    "reusing transcript of duplicate audio",
+                    extra={
+                        **log_context,
+                        "duplicate_of": str(reused.match.entry.track_version_id),
+                        "offset_seconds": round(reused.match.offset_seconds, 3),
+                        "score": round(reused.match.score, 3),
+                    },
+                )
+                output = _EngineOutput(
+                    result=shift_transcript(
+                        reused.transcript,
+                        reused.match.offset_seconds,
+                        probe.duration_seconds,
+                    ),
+                    model_name=reused.transcript.engine.model,
+                )
+                await self._events.progress(event, payload, 80, "transcript_reused")
+            else:
+                output = await self._transcribe(
+                    event,
+                    payload,
+                    log_context,
+                    temp,
+                    engine_wav,
+                    probe.duration_seconds,
+                    audio_sha256,
+                    preview_key,
+                )
+            result = output.result
+            model_name = output.model_name
 
             # Build artifacts
             transcript = build_transcript(
@@ -189,12 +465,19 @@ class TranscriptionPipeline:
                 schema_version=settings.transcript_schema_version,
                 track_version_id=payload.track_version_id,
                 job_id=payload.job_id,
-                engine_name=payload.engine,
-                model=settings.whisper_model_name,
+                engine_name=output.engine_name or payload.engine,
+                model=model_name,
                 duration_seconds=probe.duration_seconds,
             )
-            transcript_bytes = transcript.model_dump_json(indent=2).encode("utf-8")
+            transcript_bytes = transcript.model_dump_json().encode("utf-8")
             transcript_sha256 = compute_sha256(transcript_bytes)
+            encoding = content_encoding_header(settings.artifact_encoding)
+            player = _PlayerArtifacts.build(
+                settings.transcript_object_prefix,
+                payload.track_version_id,
+                transcript,
+                transcript_bytes,
+            )
 
             manifest = build_manifest(
                 schema_version=settings.transcript_schema_version,
@@ -202,33 +485,58 @@ class TranscriptionPipeline:
                 transcript_object_key=transcript_key,
                 transcript_sha256=transcript_sha256,
                 probe=probe,
+                transcript_content_encoding=encoding,
+                word_timings=player.word_timings_artifact(encoding),
+                seek_index=player.seek_index_artifact(encoding),
+                language_detection=output.detection,
+                reused_from=(
+                    ManifestReuse(
+                        track_version_id=reused.match.entry.track_version_id,
+                        offset_seconds=reused.match.offset_seconds,
+                        score=reused.match.score,
+                    )
+                    if reused is not None
+                    else None
+                ),
+                vocal_separation=(
+                    ManifestSeparation(model=separation.model, cached=separation.cached)
+                    if separation is not None
+                    else None
+                ),
             )
-            manifest_bytes = manifest.model_dump_json(indent=2).encode("utf-8")
+            manifest_bytes = manifest.model_dump_json().encode("utf-8")
 
             # Upload artifacts
-            try:
-                await asyncio.to_thread(
-                    self._storage.upload_json,
-                    settings.minio_transcripts_bucket,
-                    transcript_key,
-                    transcript_bytes,
-                )
-                logger.info("uploaded transcript", extra=log_context)
-                await asyncio.to_thread(
-                    self._storage.upload_json,
-                    settings.minio_transcripts_bucket,
-                    manifest_key,
-                    manifest_bytes,
-                )
-                logger.info("uploaded manifest", extra=log_context)
-            except StorageError as exc:
-                raise PipelineError(
-                    ARTIFACT_UPLOAD_FAILED,
-                    "Could not upload transcript artifacts",
-                    stage="artifact_upload",
-                ) from exc
+            await self._upload_artifacts(
+                transcript_key,
+                transcript_bytes,
+                manifest_key,
+                manifest_bytes,
+                player,
+            )
+            logger.info("uploaded transcript and manifest", extra=log_context)
             await self._events.progress(event, payload, 90, "artifacts_uploaded")
 
+            # The full transcript replaces the preview
+            if output.preview_published:
+                await self._delete_object(settings.minio_transcripts_bucket, preview_key)
+
+            # Remember this recording so later duplicates can reuse the transcript
+            if fingerprint is not None and reused is None:
+                await self._index_fingerprint(
+                    fingerprint,
+                    FingerprintEntry(
+                        track_version_id=payload.track_version_id,
+                        transcript_object_key=transcript_key,
+                        duration_seconds=probe.duration_seconds,
+                        audio_sha256=audio_sha256,
+                    ),
+                )
+
+            # Keep what re-alignment needs once the source audio is gone
+            if features is not None:
+                await self._store_alignment_features(payload.track_version_id, features)
+
             # Cleanup temp audio from MinIO (best effort)
             deleted = await delete_temp_audio(
                 self._storage,
@@ -247,14 +555,594 @@ class TranscriptionPipeline:
                 word_count=transcript.metadata.word_count,
                 segment_count=transcript.metadata.segment_count,
                 language=transcript.engine.language,
+                model=model_name,
                 sha256=transcript_sha256,
+                commit=offset,
             )
             logger.info("emitted completed", extra=log_context)
 
-    async def _transcript_exists(self, transcript_key: str) -> bool:
+    async def _align_lyrics(
+        self,
+        event: EventEnvelope,
+        payload: TranscriptionRequestedPayload,
+        features: AlignmentFeatures | None,
+        lyrics_key: str,
+    ) -> _EngineOutput:
+        """Force-align the attached lyrics instead of running whisper.cpp."""
+        lyrics = await self._download_lyrics(lyrics_key)
+        if features is None:
+            raise PipelineError(
+                LYRICS_ALIGNMENT_FAILED,
+                "Audio features for alignment could not be computed",
+                stage="alignment",
+            )
+
+        language = payload.options.language
+        if language == "auto":
+            language = self._settings.whisper_language
+        await self._events.progress(event, payload, 40, "alignment_started")
+        try:
+            result = await asyncio.to_thread(
+                align_lyrics_text,
+                features,
+                lyrics,
+                "unknown" if language == "auto" else language,
+            )
+        except AlignmentError as exc:
+            raise PipelineError(
+                LYRICS_ALIGNMENT_FAILED,
+                "Lyrics could not be aligned to the audio",
+                stage="alignment",
+            ) from exc
+        await self._events.progress(event, payload, 80, "alignment_finished")
+        return _EngineOutput(
+            result=result,
+            model_name=ALIGNMENT_MODEL_NAME,
+            engine_name=ALIGNMENT_ENGINE_NAME,
+        )
+
+    async def _realign(
+        self,
+        event: EventEnvelope,
+        payload: TranscriptionRealignRequestedPayload,
+        log_context: dict[str, str],
+        offset: ConsumedOffset | None,
+    ) -> None:
+        """Re-align edited lines onto the current transcript and replace it."""
+        settings = self._settings
+        bucket = settings.minio_transcripts_bucket
+        manifest_key = manifest_object_key(
+            settings.transcript_object_prefix,
+            payload.track_version_id,
+        )
+        try:
+            transcript_raw, manifest_raw, features_raw = await asyncio.gather(
+                self._storage.download_bytes(bucket, payload.transcript_object_key),
+                self._storage.download_bytes(bucket, manifest_key),
+                self._storage.download_bytes(
+                    settings.minio_artifacts_bucket,
+                    alignment_features_object_key(payload.track_version_id),
+                ),
+            )
+        except (ObjectNotFoundError, StorageError) as exc:
+            raise PipelineError(
+                REALIGNMENT_UNAVAILABLE,
+                "This version has no stored transcript or audio features to re-align; "
+                "run a full transcription instead",
+                stage="realign_download",
+            ) from exc
+        lyrics = await self._download_lyrics(payload.lyrics_object_key)
+        previous = Transcript.model_validate_json(decode_artifact(transcript_raw))
+        previous_manifest = Manifest.model_validate_json(decode_artifact(manifest_raw))
+        features = AlignmentFeatures.from_bytes(features_raw)
+        await self._events.progress(event, payload, 40, "alignment_started")
+
+        try:
+            outcome = await asyncio.to_thread(realign_transcript, previous, lyrics, features)
+        except AlignmentError as exc:
+            raise PipelineError(
+                LYRICS_ALIGNMENT_FAILED,
+                "Edited lines could not be aligned to the audio",
+                stage="alignment",
+            ) from exc
+        logger.info(
+            "re-aligned edited lines",
+            extra={
+                **log_context,
+                "realigned_segments": outcome.realigned_segments,
+                "reused_segments": outcome.reused_segments,
+            },
+        )
+        await self._events.progress(event, payload, 80, "alignment_finished")
+
+        transcript = build_transcript(
+            outcome.result,
+            schema_version=settings.transcript_schema_version,
+            track_version_id=payload.track_version_id,
+            job_id=payload.job_id,
+            engine_name=previous.engine.name,
+            model=previous.engine.model,
+            duration_seconds=previous.metadata.duration_seconds,
+        )
+        transcript_bytes = transcript.model_dump_json().encode("utf-8")
+        transcript_sha256 = compute_sha256(transcript_bytes)
+        encoding = content_encoding_header(settings.artifact_encoding)
+        player = _PlayerArtifacts.build(
+            settings.transcript_object_prefix,
+            payload.track_version_id,
+            transcript,
+            transcript_bytes,
+        )
+        manifest = previous_manifest.model_copy(
+            update={
+                "job_id": payload.job_id,
+                "artifacts": ManifestArtifacts(
+                    transcript=ManifestArtifact(
+                        object_key=payload.transcript_object_key,
+                        content_type="application/json",
+                        content_encoding=encoding,
+                        sha256=transcript_sha256,
+                    ),
+                    word_timings=player.word_timings_artifact(encoding),
+                    seek_index=player.seek_index_artifact(encoding),
+                ),
+                "realignment": ManifestRealignment(
+                    source_job_id=previous.job_id,
+                    realigned_segments=outcome.realigned_segments,
+                    reused_segments=outcome.reused_segments,
+                ),
+                "created_at": transcript.metadata.created_at,
+            },
+        )
+
+        await self._upload_artifacts(
+            payload.transcript_object_key,
+            transcript_bytes,
+            manifest_key,
+            manifest.model_dump_json().encode("utf-8"),
+            player,
+        )
+        await self._events.progress(event, payload, 90, "artifacts_uploaded")
+
+        await self._events.completed(
+            event,
+            payload,
+            transcript_object_key=payload.transcript_object_key,
+            manifest_object_key=manifest_key,
+            duration_seconds=transcript.metadata.duration_seconds,
+            word_count=transcript.metadata.word_count,
+            segment_count=transcript.metadata.segment_count,
+            language=transcript.engine.language,
+            model=transcript.engine.model,
+            sha256=transcript_sha256,
+            message=f"Re-aligned {outcome.realigned_segments} edited lines",
+            commit=offset,
+        )
+        logger.info("emitted completed", extra=log_context)
+
+    async def _upload_artifacts(
+        self,
+        transcript_key: str,
+        transcript_bytes: bytes,
+        manifest_key: str,
+        manifest_bytes: bytes,
+        player: _PlayerArtifacts,
+    ) -> None:
+        """Upload transcript.json, manifest.json and the player artifacts side by side."""
+        bucket = self._settings.minio_transcripts_bucket
+        encoding = self._settings.artifact_encoding
+        try:
+            await asyncio.gather(
+                self._storage.upload_json_artifact(
+                    bucket, transcript_key, transcript_bytes, encoding
+                ),
+                self._storage.upload_json_artifact(bucket, manifest_key, manifest_bytes, encoding),
+                self._storage.upload_json_artifact(
+                    bucket,
+                    player.word_timings_key,
+                    player.word_timings,
+                    encoding,
+                    content_type=WORD_TIMINGS_BINARY_CONTENT_TYPE,
+                ),
+                self._storage.upload_json_artifact(
+                    bucket, player.seek_index_key, player.seek_index, encoding
+                ),
+            )
+        except StorageError as exc:
+            raise PipelineError(
+                ARTIFACT_UPLOAD_FAILED,
+                "Could not upload transcript artifacts",
+                stage="artifact_upload",
+            ) from exc
+
+    async def _download_lyrics(self, lyrics_key: str) -> str:
+        try:
+            raw = await self._storage.download_bytes(
+                self._settings.minio_transcripts_bucket,
+                lyrics_key,
+            )
+        except ObjectNotFoundError as exc:
+            raise PipelineError(
+                LYRICS_NOT_FOUND,
+                "Attached lyrics could not be found",
+                stage="lyrics_download",
+            ) from exc
+        except StorageError as exc:
+            raise PipelineError(
+                LYRICS_NOT_FOUND,
+                "Could not download attached lyrics",
+                stage="lyrics_download",
+            ) from exc
+        return raw.decode("utf-8", errors="replace")
+
+    async def _transcribe(
+        self,
+        event: EventEnvelope,
+        payload: TranscriptionRequestedPayload,
+        log_context: dict[str, str],
+        temp: JobTempDir,
+        input_wav: Path,
+        duration_seconds: float,
+        audio_sha256: str,
+        preview_key: str,
+    ) -> _EngineOutput:
+        """Trim, detect the language, publish a preview and run the full model."""
+        settings = self._settings
+        input_trimmed = temp.file("input_trimmed.wav")
+
+        # Drop silent / instrumental stretches (best effort)
+        engine_input = input_wav
+        time_map: TimeMap | None = None
+        if settings.worker_trim_silence:
+            time_map = await self._trim_silence(input_wav, input_trimmed)
+            if time_map is not None:
+                engine_input = input_trimmed
+                logger.info(
+                    "trimmed non-vocal audio",
+                    extra={
+                        **log_context,
+                        "kept_seconds": round(time_map.kept_seconds, 2),
+                        "duration_seconds": duration_seconds,
+                    },
+                )
+
+        # Detect language on a short vocal-rich window
+        language = payload.options.language or settings.whisper_language
+        detection: LanguageDetection | None = None
+        model_choice: LanguageModelChoice | None = None
+        if language == "auto" and settings.whisper_detect_language:
+            detection = await self._detect_language(input_wav, temp.path, audio_sha256)
+            if detection is not None:
+                language = detection.language
+                model_choice = choose_language_model(
+                    detection,
+                    settings.whisper_language_model_files,
+                    settings.whisper_language_model_min_confidence,
+                )
+                logger.info(
+                    "detected language",
+                    extra={
+                        **log_context,
+                        "language": detection.language,
+                        "confidence": detection.confidence,
+                        "model": model_choice.name if model_choice else None,
+                    },
+                )
+                await self._events.progress(event, payload, 35, "language_detected")
+        model_name = model_choice.name if model_choice else settings.whisper_model_name
+
+        options = TranscriptionOptions(
+            language=language,
+            model=payload.options.model,
+            separate_vocals=payload.options.separate_vocals,
+        )
+
+        # Fast preview with the tiny model (best effort)
+        preview_published = False
+        preview_model = settings.whisper_preview_model_file
+        if preview_model is not None:
+            preview_published = await self._publish_preview(
+                event,
+                payload,
+                preview_model,
+                engine_input,
+                temp.file("preview"),
+                options,
+                time_map,
+                duration_seconds,
+                preview_key,
+            )
+
+        # Transcribe
+        await self._events.progress(event, payload, 40, "transcription_started")
+        logger.info("started whisper.cpp", extra=log_context)
+        partials: PartialTranscriptPublisher | None = None
+        if settings.worker_partial_transcripts:
+            partials = PartialTranscriptPublisher(
+                self._events,
+                event,
+                payload,
+                self._partial_config,
+                duration_seconds=duration_seconds,
+                time_map=time_map,
+            )
+        result = await self._engine.transcribe(
+            engine_input,
+            temp.path,
+            options,
+            model=model_choice.path if model_choice else None,
+            on_segment=partials.add if partials is not None else None,
+        )
+        if partials is not None:
+            await partials.flush()
+        if time_map is not None:
+            result = remap_result(result, time_map)
+        logger.info("finished whisper.cpp", extra=log_context)
+        await self._events.progress(event, payload, 80, "transcription_finished")
+
+        return _EngineOutput(
+            result=result,
+            model_name=model_name,
+            detection=detection,
+            preview_published=preview_published,
+        )
+
+    async def _prevalidate_upload(self, audio_object_key: str) -> None:
+        """Validate an upload from its size and header bytes, read remotely.
+
+        Costs a HEAD and one or two small ranged GETs (a second one skips a
+        leading ID3 tag), so bad uploads fail before the full download.
+        """
+        bucket = self._settings.minio_temp_audio_bucket
+        try:
+            stat = await self._storage.stat_object(bucket, audio_object_key)
+            head = b""
+            if 0 < stat.size <= self._audio_limits.max_size_bytes:
+                head = await self._storage.download_range(bucket, audio_object_key, 0, HEADER_BYTES)
+                tag_size = id3v2_size(head)
+                if 0 < tag_size < stat.size:
+                    head = await self._storage.download_range(
+                        bucket, audio_object_key, tag_size, HEADER_BYTES
+                    )
+        except ObjectNotFoundError as exc:
+            raise PipelineError(
+                AUDIO_NOT_FOUND,
+                "Uploaded audio could not be found",
+                stage="audio_download",
+            ) from exc
+        except StorageError as exc:
+            raise PipelineError(
+                AUDIO_DOWNLOAD_FAILED,
+                "Could not download uploaded audio",
+                stage="audio_download",
+            ) from exc
+        header = sniff_audio_header(head)
+        prevalidate_audio(stat.size, header, self._audio_limits)
+        logger.info(
+            "prevalidated audio",
+            extra={
+                "object_key": audio_object_key,
+                "size_bytes": stat.size,
+                "format": header.format_name if header is not None else None,
+                "codec": header.codec_name if header is not None else None,
+            },
+        )
+
+    async def _normalize(
+        self,
+        input_original: Path,
+        input_wav: Path,
+        probe: AudioProbeResult,
+        audio_sha256: str,
+    ) -> str:
+        """Produce the engine-ready WAV, running ffmpeg only when nothing else will do.
+
+        Returns where the audio came from: ``input``, ``cache`` or ``ffmpeg``.
+        """
+        if is_normalized(probe):
+            await asyncio.to_thread(input_original.replace, input_wav)
+            return "input"
+        use_cache = self._settings.worker_normalized_audio_cache
+        cache_key = normalized_audio_object_key(audio_sha256, NORMALIZED_FORMAT)
+        if use_cache and await self._audio_cache.read(cache_key, input_wav):
+            return "cache"
+        await normalize_to_wav(self._settings.ffmpeg_path, input_original, input_wav)
+        if use_cache:
+            await self._audio_cache.write(cache_key, input_wav)
+        return "ffmpeg"
+
+    async def _trim_silence(self, input_wav: Path, output_wav: Path) -> TimeMap | None:
+        """Run the VAD pass off the event loop.
+
+        Never raises: if trimming fails the untrimmed audio is transcribed instead.
+        """
         try:
             return await asyncio.to_thread(
-                self._storage.object_exists,
+                trim_silence,
+                input_wav,
+                output_wav,
+                self._vad_config,
+            )
+        except Exception:
+            logger.exception("silence trimming failed, using full audio")
+            return None
+
+    async def _detect_language(
+        self,
+        input_wav: Path,
+        work_dir: Path,
+        audio_sha256: str,
+    ) -> LanguageDetection | None:
+        """Best-effort language pre-pass; ``None`` falls back to ``auto``."""
+        try:
+            return await self._language_detector.detect(input_wav, work_dir, audio_sha256)
+        except Exception:
+            logger.exception("language detection failed, using auto")
+            return None
+
+    async def _alignment_features(self, input_wav: Path) -> AlignmentFeatures | None:
+        try:
+            return await asyncio.to_thread(AlignmentFeatures.from_wav, input_wav)
+        except Exception:
+            logger.exception("computing alignment features failed")
+            return None
+
+    async def _store_alignment_features(
+        self,
+        track_version_id: uuid.UUID,
+        features: AlignmentFeatures,
+    ) -> None:
+        try:
+            await self._storage.upload_json(
+                self._settings.minio_artifacts_bucket,
+                alignment_features_object_key(track_version_id),
+                features.to_bytes(),
+                content_type="application/octet-stream",
+            )
+        except StorageError:
+            logger.warning(
+                "could not store alignment features",
+                extra={"track_version_id": str(track_version_id)},
+            )
+
+    async def _separate_vocals(
+        self,
+        source_audio: Path,
+        work_dir: Path,
+        audio_sha256: str,
+    ) -> SeparatedVocals | None:
+        """Best-effort vocal separation; ``None`` transcribes the full mix instead."""
+        try:
+            return await self._separator.vocals(source_audio, work_dir, audio_sha256)
+        except Exception:
+            logger.exception("vocal separation failed, using the full mix")
+            return None
+
+    async def _fingerprint(self, input_wav: Path) -> Fingerprint | None:
+        try:
+            return await asyncio.to_thread(fingerprint_wav, input_wav)
+        except Exception:
+            logger.exception("audio fingerprinting failed, skipping duplicate check")
+            return None
+
+    async def _reuse_duplicate(
+        self,
+        fingerprint: Fingerprint,
+        payload: TranscriptionRequestedPayload,
+    ) -> _ReusedTranscript | None:
+        """Find an earlier recording of the same audio and load its transcript.
+
+        Never raises: any miss or failure means the audio is transcribed as usual.
+        """
+        try:
+            match = await self._fingerprints.find(fingerprint)
+            if match is None or match.entry.track_version_id == payload.track_version_id:
+                return None
+            raw = await self._storage.download_bytes(
+                self._settings.minio_transcripts_bucket,
+                match.entry.transcript_object_key,
+            )
+            transcript = Transcript.model_validate_json(decode_artifact(raw))
+            return _ReusedTranscript(match=match, transcript=transcript)
+        except Exception:
+            logger.exception(
+                "duplicate lookup failed, transcribing",
+                extra={
+                    "job_id": str(payload.job_id),
+                },
+            )
+            return None
+
+    async def _index_fingerprint(self, fingerprint: Fingerprint, entry: FingerprintEntry) -> None:
+        try:
+            await self._fingerprints.add(fingerprint, entry)
+        except Exception:
+            logger.exception(
+                "could not index audio fingerprint",
+                extra={"track_version_id": str(entry.track_version_id)},
+            )
+
+    async def _publish_preview(
+        self,
+        event: EventEnvelope,
+        payload: TranscriptionRequestedPayload,
+        model: Path,
+        engine_input: Path,
+        output_dir: Path,
+        options: TranscriptionOptions,
+        time_map: TimeMap | None,
+        duration_seconds: float,
+        preview_key: str,
+    ) -> bool:
+        """Transcribe with the preview model and publish ``transcription.preview``.
+
+        Never raises: a failed preview only means reviewers wait for the full run.
+        """
+        settings = self._settings
+        model_name = model_name_from_path(model)
+        try:
+            output_dir.mkdir(parents=True, exist_ok=True)
+            result = await self._engine.transcribe(engine_input, output_dir, options, model=model)
+            if time_map is not None:
+                result = remap_result(result, time_map)
+            preview = build_transcript(
+                result,
+                schema_version=settings.transcript_schema_version,
+                track_version_id=payload.track_version_id,
+                job_id=payload.job_id,
+                engine_name=payload.engine,
+                model=model_name,
+                duration_seconds=duration_seconds,
+            )
+            await self._storage.upload_json_artifact(
+                settings.minio_transcripts_bucket,
+                preview_key,
+                preview.model_dump_json().encode("utf-8"),
+                settings.artifact_encoding,
+            )
+            await self._events.preview(
+                event,
+                payload,
+                preview_object_key=preview_key,
+                model=model_name,
+                language=preview.engine.language,
+                word_count=preview.metadata.word_count,
+                segment_count=preview.metadata.segment_count,
+            )
+        except Exception:
+            logger.exception("preview transcription failed", extra={"job_id": str(payload.job_id)})
+            return False
+        logger.info("published preview transcript", extra={"job_id": str(payload.job_id)})
+        return True
+
+    async def _discard_preview(
+        self,
+        payload: TranscriptionRequestedPayload | TranscriptionRealignRequestedPayload,
+    ) -> None:
+        """Delete a preview a failed run may have published; no full transcript replaces it."""
+        settings = self._settings
+        if (
+            isinstance(payload, TranscriptionRealignRequestedPayload)
+            or settings.whisper_preview_model_file is None
+        ):
+            return
+        await self._delete_object(
+            settings.minio_transcripts_bucket,
+            preview_object_key(settings.transcript_object_prefix, payload.track_version_id),
+        )
+
+    async def _delete_object(self, bucket: str, object_key: str) -> None:
+        try:
+            await self._storage.delete_object(bucket, object_key)
+        except StorageError:
+            logger.warning(
+                "could not delete object",
+                extra={"bucket": bucket, "object_key": object_key},
+            )
+
+    async def _transcript_exists(self, transcript_key: str) -> bool:
+        try:
+            return await self._storage.object_exists(
                 self._settings.minio_transcripts_bucket,
                 transcript_key,
             )
@@ -1,15 +1,23 @@
-from sounds_right_worker.config import WorkerSettings
-from sounds_right_worker.errors import PipelineError
-from sounds_right_worker.events.producer import EventProducer
-from sounds_right_worker.events.schemas import (
+from sounds_right_contracts.events import (
     EventEnvelope,
+    PartialSegmentPayload,
     TranscriptionCompletedPayload,
     TranscriptionFailedPayload,
+    TranscriptionPartialPayload,
+    TranscriptionPreviewPayload,
     TranscriptionProgressPayload,
+    TranscriptionRealignRequestedPayload,
     TranscriptionRequestedPayload,
     TranscriptionStartedPayload,
 )
 
+from sounds_right_worker.config import WorkerSettings
+from sounds_right_worker.errors import PipelineError
+from sounds_right_worker.events.producer import ConsumedOffset, EventProducer
+
+# Every job request the worker acts on; lifecycle events only need the ids and engine.
+JobRequestPayload = TranscriptionRequestedPayload | TranscriptionRealignRequestedPayload
+
 
 class PipelineEventPublisher:
     def __init__(self, settings: WorkerSettings, producer: EventProducer) -> None:
@@ -19,7 +27,7 @@ class PipelineEventPublisher:
     async def started(
         self,
         event: EventEnvelope,
-        payload: TranscriptionRequestedPayload,
+        payload: JobRequestPayload,
     ) -> None:
         await self._producer.publish(
             self._envelope(
@@ -39,7 +47,7 @@ class PipelineEventPublisher:
     async def progress(
         self,
         event: EventEnvelope,
-        payload: TranscriptionRequestedPayload,
+        payload: JobRequestPayload,
         progress: int,
         stage: str,
     ) -> None:
@@ -58,11 +66,67 @@ class PipelineEventPublisher:
             payload.job_id,
         )
 
-    async def completed(
+    async def preview(
         self,
         event: EventEnvelope,
         payload: TranscriptionRequestedPayload,
         *,
+        preview_object_key: str,
+        model: str,
+        language: str | None,
+        word_count: int | None,
+        segment_count: int | None,
+    ) -> None:
+        await self._producer.publish(
+            self._envelope(
+                event,
+                "transcription.preview",
+                TranscriptionPreviewPayload(
+                    job_id=payload.job_id,
+                    track_version_id=payload.track_version_id,
+                    preview_object_key=preview_object_key,
+                    model=model,
+                    language=language,
+                    word_count=word_count,
+                    segment_count=segment_count,
+                    message="Preview transcript available",
+                ),
+            ),
+            payload.job_id,
+        )
+
+    async def partial(
+        self,
+        event: EventEnvelope,
+        payload: TranscriptionRequestedPayload,
+        *,
+        sequence: int,
+        segments: list[PartialSegmentPayload],
+        decoded_seconds: float,
+        progress: int,
+    ) -> None:
+        await self._producer.publish(
+            self._envelope(
+                event,
+                "transcription.partial",
+                TranscriptionPartialPayload(
+                    job_id=payload.job_id,
+                    track_version_id=payload.track_version_id,
+                    sequence=sequence,
+                    segments=segments,
+                    decoded_seconds=decoded_seconds,
+                    progress=progress,
+                    message=f"{len(segments)} segments decoded ({decoded_seconds:.0f}s)",
+                ),
+            ),
+            payload.job_id,
+        )
+
+    async def completed(
+        self,
+        event: EventEnvelope,
+        payload: JobRequestPayload,
+        *,
         transcript_object_key: str,
         manifest_object_key: str,
         duration_seconds: float | None,
@@ -70,7 +134,9 @@ class PipelineEventPublisher:
         segment_count: int | None,
         language: str | None,
         sha256: str | None,
+        model: str | None = None,
         message: str = "Transcription completed",
+        commit: ConsumedOffset | None = None,
     ) -> None:
         await self._producer.publish(
             self._envelope(
@@ -85,21 +151,24 @@ class PipelineEventPublisher:
                     word_count=word_count,
                     segment_count=segment_count,
                     engine=payload.engine,
-                    model=self._settings.whisper_model_name,
+                    model=model or self._settings.whisper_model_name,
                     language=language,
                     sha256=sha256,
                     message=message,
                 ),
             ),
             payload.job_id,
+            commit=commit,
         )
 
     async def completed_from_existing(
         self,
         event: EventEnvelope,
-        payload: TranscriptionRequestedPayload,
+        payload: JobRequestPayload,
         transcript_key: str,
         manifest_key: str,
+        *,
+        commit: ConsumedOffset | None = None,
     ) -> None:
         await self.completed(
             event,
@@ -112,13 +181,16 @@ class PipelineEventPublisher:
             language=None,
             sha256=None,
             message="Transcript already existed; re-emitted completion",
+            commit=commit,
         )
 
     async def failed(
         self,
         event: EventEnvelope,
-        payload: TranscriptionRequestedPayload,
+        payload: JobRequestPayload,
         error: PipelineError,
+        *,
+        commit: ConsumedOffset | None = None,
     ) -> None:
         await self._producer.publish(
             self._envelope(
@@ -133,6 +205,7 @@ class PipelineEventPublisher:
                 ),
             ),
             payload.job_id,
+            commit=commit,
         )
 
     def _envelope(
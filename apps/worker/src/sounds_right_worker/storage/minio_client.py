@@ -1,18 +1,44 @@
 from __future__ import annotations
 
-import io
+import asyncio
+import hashlib
 import json
+import os
+import xml.etree.ElementTree as ElementTree
+from collections.abc import Awaitable, Iterable
 from dataclasses import dataclass
+from datetime import UTC, datetime
 from pathlib import Path
+from typing import TypeVar
 
-from minio import Minio
-from minio.error import S3Error
+import httpx
+from sounds_right_contracts.artifacts import (
+    IDENTITY_ENCODING,
+    content_encoding_header,
+    encode_artifact,
+)
 
 from sounds_right_worker.config import WorkerSettings
 from sounds_right_worker.logging import get_logger
+from sounds_right_worker.storage.sigv4 import (
+    EMPTY_SHA256,
+    Credentials,
+    canonical_query,
+    object_path,
+    sign_request,
+)
 
 logger = get_logger(__name__)
 
+# S3 rejects multipart parts below 5 MiB (except the last one).
+MIN_PART_SIZE = 5 * 1024 * 1024
+_STREAM_CHUNK_SIZE = 1024 * 1024
+_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+_NOT_FOUND_CODES = {"NoSuchKey", "NoSuchObject"}
+_PRECONDITION_CODES = {"PreconditionFailed", "ConditionalRequestConflict"}
+
+_T = TypeVar("_T")
+
 
 class ObjectNotFoundError(Exception):
     pass
@@ -22,6 +48,16 @@ class StorageError(Exception):
     pass
 
 
+class PreconditionFailedError(StorageError):
+    """A conditional write found the object changed (or present) and was refused."""
+
+
+@dataclass(frozen=True)
+class ObjectStat:
+    size: int
+    etag: str
+
+
 @dataclass(frozen=True)
 class StorageConfig:
     endpoint: str
@@ -31,6 +67,10 @@ class StorageConfig:
     temp_audio_bucket: str
     transcripts_bucket: str
     artifacts_bucket: str
+    region: str = "us-east-1"
+    part_size: int = 16 * 1024 * 1024
+    max_connections: int = 16
+    transfer_concurrency: int = 4
 
     @classmethod
     def from_settings(cls, settings: WorkerSettings) -> StorageConfig:
@@ -42,76 +82,393 @@ class StorageConfig:
             temp_audio_bucket=settings.minio_temp_audio_bucket,
             transcripts_bucket=settings.minio_transcripts_bucket,
             artifacts_bucket=settings.minio_artifacts_bucket,
+            region=settings.minio_region,
+            part_size=max(settings.worker_storage_part_size_bytes, MIN_PART_SIZE),
+            max_connections=max(settings.worker_storage_max_connections, 1),
+            transfer_concurrency=max(settings.worker_storage_transfer_concurrency, 1),
         )
 
 
+def _xml_field(body: bytes, name: str) -> str | None:
+    """Text of the first ``name`` element in an S3 XML document, ignoring namespaces."""
+    try:
+        root = ElementTree.fromstring(body)
+    except ElementTree.ParseError:
+        return None
+    for element in root.iter():
+        if element.tag == name or element.tag.endswith("}" + name):
+            return element.text or ""
+    return None
+
+
+def part_spans(size: int, part_size: int) -> list[tuple[int, int]]:
+    """Split ``[0, size)`` into consecutive ``[start, end)`` parts of ``part_size``."""
+    if size <= part_size:
+        return [(0, size)]
+    return [(start, min(start + part_size, size)) for start in range(0, size, part_size)]
+
+
+def _complete_multipart_body(etags: list[str]) -> bytes:
+    parts = "".join(
+        f"<Part><PartNumber>{number}</PartNumber><ETag>{etag}</ETag></Part>"
+        for number, etag in enumerate(etags, start=1)
+    )
+    return f"<CompleteMultipartUpload>{parts}</CompleteMultipartUpload>".encode()
+
+
 class StorageClient:
-    """Thin synchronous wrapper around the MinIO client.
+    """Async client for the S3-compatible object store (MinIO).
 
-    The MinIO SDK is blocking; call these helpers via ``asyncio.to_thread`` from
-    async code so the event loop is not blocked.
+    Requests are signed with SigV4 and sent over one pooled, keep-alive
+    ``httpx.AsyncClient``, so transfers from concurrent jobs overlap without
+    occupying executor threads. Transfers larger than ``part_size`` are split
+    into parts, of which up to ``transfer_concurrency`` are in flight at once:
+    ranged GETs written in place on download, multipart uploads on upload.
     """
 
-    def __init__(self, config: StorageConfig) -> None:
+    def __init__(
+        self,
+        config: StorageConfig,
+        *,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
         self._config = config
-        self._client = Minio(
-            config.endpoint,
+        self._credentials = Credentials(
             access_key=config.access_key,
             secret_key=config.secret_key,
-            secure=config.secure,
+            region=config.region,
         )
+        scheme = "https" if config.secure else "http"
+        self._base_url = f"{scheme}://{config.endpoint}"
+        self._host = httpx.URL(self._base_url).netloc.decode("ascii")
+        self._client = httpx.AsyncClient(
+            transport=transport,
+            limits=httpx.Limits(
+                max_connections=config.max_connections,
+                max_keepalive_connections=config.max_connections,
+            ),
+            timeout=_TIMEOUT,
+        )
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def download_to_path(self, bucket: str, object_key: str, destination: Path) -> None:
+        """Download an object to ``destination``.
 
-    def download_to_path(self, bucket: str, object_key: str, destination: Path) -> None:
+        Objects larger than ``part_size`` are fetched as parallel ranged GETs,
+        each written in place into a file preallocated to the object's size.
+        """
+        stat = await self.stat_object(bucket, object_key)
+        spans = part_spans(stat.size, self._config.part_size)
         try:
-            self._client.fget_object(bucket, object_key, str(destination))
-        except S3Error as exc:
-            if exc.code in {"NoSuchKey", "NoSuchObject"}:
-                raise ObjectNotFoundError(object_key) from exc
-            raise StorageError(str(exc)) from exc
+            with destination.open("wb") as output:
+                output.truncate(stat.size)
+                fd = output.fileno()
+                if len(spans) == 1:
+                    await self._download_part(bucket, object_key, fd, 0, {})
+                    return
+                await self._run_all(
+                    self._download_part(
+                        bucket,
+                        object_key,
+                        fd,
+                        start,
+                        # Pin every range to one version of the object.
+                        {"range": f"bytes={start}-{end - 1}", "if-match": f'"{stat.etag}"'},
+                    )
+                    for start, end in spans
+                )
+        except BaseException:
+            destination.unlink(missing_ok=True)
+            raise
+
+    async def download_bytes(self, bucket: str, object_key: str) -> bytes:
+        response = await self._send("GET", bucket, object_key)
+        return response.content
+
+    async def download_with_etag(self, bucket: str, object_key: str) -> tuple[bytes, str]:
+        """Return the object's content and the ETag of the version that was read."""
+        response = await self._send("GET", bucket, object_key)
+        etag: str = response.headers.get("etag", "")
+        return response.content, etag.strip('"')
 
-    def object_exists(self, bucket: str, object_key: str) -> bool:
+    async def download_range(self, bucket: str, object_key: str, start: int, length: int) -> bytes:
+        """Return up to ``length`` bytes of the object from offset ``start``."""
+        response = await self._send(
+            "GET",
+            bucket,
+            object_key,
+            headers={"range": f"bytes={start}-{start + length - 1}"},
+        )
+        # Servers may answer a range covering the whole object with all of it.
+        if response.status_code == 200:
+            return response.content[start : start + length]
+        return response.content
+
+    async def stat_object(self, bucket: str, object_key: str) -> ObjectStat:
+        response = await self._send("HEAD", bucket, object_key)
+        etag: str = response.headers.get("etag", "")
+        return ObjectStat(
+            size=int(response.headers.get("content-length", "0")),
+            etag=etag.strip('"'),
+        )
+
+    async def object_exists(self, bucket: str, object_key: str) -> bool:
+        return await self.object_etag(bucket, object_key) is not None
+
+    async def object_etag(self, bucket: str, object_key: str) -> str | None:
+        """Return the object's ETag, or ``None`` when it does not exist."""
         try:
-            self._client.stat_object(bucket, object_key)
-        except S3Error as exc:
-            if exc.code in {"NoSuchKey", "NoSuchObject"}:
-                return False
-            raise StorageError(str(exc)) from exc
-        return True
-
-    def upload_json(
+            return (await self.stat_object(bucket, object_key)).etag
+        except ObjectNotFoundError:
+            return None
+
+    async def upload_json(
         self,
         bucket: str,
         object_key: str,
         data: bytes,
         *,
         content_type: str = "application/json",
+        content_encoding: str | None = None,
+        if_match: str | None = None,
+        if_none_match: bool = False,
+    ) -> str:
+        """Upload ``data`` in one PUT and return the new object's ETag.
+
+        ``if_match`` only replaces the object while it still has that ETag;
+        ``if_none_match`` only creates it when it does not exist yet. A write
+        refused by either condition raises ``PreconditionFailedError``.
+        """
+        headers = {"content-type": content_type}
+        if content_encoding is not None:
+            headers["content-encoding"] = content_encoding
+        if if_match is not None:
+            headers["if-match"] = f'"{if_match}"'
+        if if_none_match:
+            headers["if-none-match"] = "*"
+        response = await self._send("PUT", bucket, object_key, headers=headers, content=data)
+        etag: str = response.headers.get("etag", "")
+        return etag.strip('"')
+
+    async def upload_json_artifact(
+        self,
+        bucket: str,
+        object_key: str,
+        data: bytes,
+        encoding: str = IDENTITY_ENCODING,
+        *,
+        content_type: str = "application/json",
+    ) -> None:
+        """Upload an artifact compressed with ``encoding``, labelled with Content-Encoding."""
+        body = await asyncio.to_thread(encode_artifact, data, encoding)
+        await self.upload_json(
+            bucket,
+            object_key,
+            body,
+            content_type=content_type,
+            content_encoding=content_encoding_header(encoding),
+        )
+
+    async def upload_file(
+        self,
+        bucket: str,
+        object_key: str,
+        source: Path,
+        *,
+        content_type: str = "application/octet-stream",
     ) -> None:
+        size = source.stat().st_size
+        if size <= self._config.part_size:
+            data = await asyncio.to_thread(source.read_bytes)
+            await self.upload_json(bucket, object_key, data, content_type=content_type)
+            return
+        await self._upload_multipart(bucket, object_key, source, content_type)
+
+    async def upload_json_document(
+        self,
+        bucket: str,
+        object_key: str,
+        document: dict[str, object],
+    ) -> bytes:
+        data = json.dumps(document, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        await self.upload_json(bucket, object_key, data)
+        return data
+
+    async def delete_object(self, bucket: str, object_key: str) -> None:
+        await self._send("DELETE", bucket, object_key)
+
+    async def _upload_multipart(
+        self,
+        bucket: str,
+        object_key: str,
+        source: Path,
+        content_type: str,
+    ) -> None:
+        """Upload ``source`` in parts, up to ``transfer_concurrency`` at once."""
+        response = await self._send(
+            "POST",
+            bucket,
+            object_key,
+            query={"uploads": ""},
+            headers={"content-type": content_type},
+        )
+        upload_id = _xml_field(response.content, "UploadId")
+        if not upload_id:
+            raise StorageError(f"multipart upload of {object_key} was not started")
+
+        async def upload_part(number: int, fd: int, start: int, end: int) -> str:
+            data = await asyncio.to_thread(os.pread, fd, end - start, start)
+            part = await self._send(
+                "PUT",
+                bucket,
+                object_key,
+                query={"partNumber": str(number), "uploadId": upload_id},
+                content=data,
+            )
+            etag: str = part.headers.get("etag", "")
+            return etag
+
         try:
-            self._client.put_object(
+            with source.open("rb") as file:
+                spans = part_spans(os.fstat(file.fileno()).st_size, self._config.part_size)
+                etags = await self._run_all(
+                    upload_part(number, file.fileno(), start, end)
+                    for number, (start, end) in enumerate(spans, start=1)
+                )
+            completed = await self._send(
+                "POST",
                 bucket,
                 object_key,
-                io.BytesIO(data),
-                length=len(data),
-                content_type=content_type,
+                query={"uploadId": upload_id},
+                headers={"content-type": "application/xml"},
+                content=_complete_multipart_body(etags),
             )
-        except S3Error as exc:
-            raise StorageError(str(exc)) from exc
+            # Completion can fail after the 200 status line has been sent.
+            if _xml_field(completed.content, "Code") is not None:
+                _raise_for_status(completed, object_key, force=True)
+        except Exception:
+            try:
+                await self._send("DELETE", bucket, object_key, query={"uploadId": upload_id})
+            except StorageError:
+                logger.warning(
+                    "could not abort multipart upload",
+                    extra={"bucket": bucket, "object_key": object_key},
+                )
+            raise
 
-    def upload_json_document(
+    async def _download_part(
         self,
         bucket: str,
         object_key: str,
-        document: dict[str, object],
-    ) -> bytes:
-        data = json.dumps(document, ensure_ascii=False, indent=2).encode("utf-8")
-        self.upload_json(bucket, object_key, data)
-        return data
+        fd: int,
+        offset: int,
+        headers: dict[str, str],
+    ) -> None:
+        request = self._build("GET", bucket, object_key, headers=headers)
+        try:
+            response = await self._client.send(request, stream=True)
+            try:
+                if response.is_error:
+                    await response.aread()
+                    _raise_for_status(response, object_key)
+                if "range" in headers and response.status_code != 206:
+                    raise StorageError(f"ranged GET of {object_key} returned the whole object")
+                async for chunk in response.aiter_bytes(_STREAM_CHUNK_SIZE):
+                    os.pwrite(fd, chunk, offset)
+                    offset += len(chunk)
+            finally:
+                await response.aclose()
+        except httpx.HTTPError as exc:
+            raise StorageError(f"GET {object_key} failed: {exc}") from exc
+
+    async def _run_all(self, transfers: Iterable[Awaitable[_T]]) -> list[_T]:
+        """Await ``transfers`` with at most ``transfer_concurrency`` in flight.
+
+        The first failure cancels the others before it is re-raised, so no part
+        is still writing to a file the caller is about to close.
+        """
+        slots = asyncio.Semaphore(self._config.transfer_concurrency)
+
+        async def limited(transfer: Awaitable[_T]) -> _T:
+            async with slots:
+                return await transfer
 
-    def delete_object(self, bucket: str, object_key: str) -> None:
+        tasks = [asyncio.ensure_future(limited(transfer)) for transfer in transfers]
         try:
-            self._client.remove_object(bucket, object_key)
-        except S3Error as exc:
-            raise StorageError(str(exc)) from exc
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    def _build(
+        self,
+        method: str,
+        bucket: str,
+        object_key: str,
+        *,
+        query: dict[str, str] | None = None,
+        headers: dict[str, str] | None = None,
+        content: bytes = b"",
+    ) -> httpx.Request:
+        query = query or {}
+        path = object_path(bucket, object_key)
+        signed = sign_request(
+            self._credentials,
+            method,
+            path,
+            query,
+            {"host": self._host, **(headers or {})},
+            hashlib.sha256(content).hexdigest() if content else EMPTY_SHA256,
+            datetime.now(UTC),
+        )
+        url = f"{self._base_url}{path}"
+        if query:
+            url += "?" + canonical_query(query)
+        return self._client.build_request(method, url, headers=signed, content=content)
+
+    async def _send(
+        self,
+        method: str,
+        bucket: str,
+        object_key: str,
+        *,
+        query: dict[str, str] | None = None,
+        headers: dict[str, str] | None = None,
+        content: bytes = b"",
+    ) -> httpx.Response:
+        request = self._build(
+            method,
+            bucket,
+            object_key,
+            query=query,
+            headers=headers,
+            content=content,
+        )
+        try:
+            response = await self._client.send(request)
+        except httpx.HTTPError as exc:
+            raise StorageError(f"{method} {object_key} failed: {exc}") from exc
+        _raise_for_status(response, object_key)
+        return response
+
+
+def _raise_for_status(response: httpx.Response, object_key: str, *, force: bool = False) -> None:
+    if not response.is_error and not force:
+        return
+    code = _xml_field(response.content, "Code")
+    # HEAD responses carry no error document.
+    if code in _NOT_FOUND_CODES or (
+        code is None and response.status_code == 404 and response.request.method == "HEAD"
+    ):
+        raise ObjectNotFoundError(object_key)
+    if code in _PRECONDITION_CODES or (code is None and response.status_code == 412):
+        raise PreconditionFailedError(object_key)
+    message = _xml_field(response.content, "Message") or response.reason_phrase
+    raise StorageError(f"{code or response.status_code}: {message} ({object_key})")
 
 
 def create_storage_client(settings: WorkerSettings) -> StorageClient:
@@ -8,11 +8,61 @@ def transcript_object_key(prefix: str, track_version_id: uuid.UUID) -> str:
     return f"{prefix}/{track_version_id}/transcript.json"
 
 
+def preview_object_key(prefix: str, track_version_id: uuid.UUID) -> str:
+    """Deterministic key for the fast preview transcript (replaced by the full one)."""
+    return f"{prefix}/{track_version_id}/preview.json"
+
+
+def word_timings_object_key(prefix: str, track_version_id: uuid.UUID) -> str:
+    """Deterministic key for the columnar word timings beside the transcript."""
+    return f"{prefix}/{track_version_id}/word-timings.bin"
+
+
+def seek_index_object_key(prefix: str, track_version_id: uuid.UUID) -> str:
+    """Deterministic key for the transcript's seek index, beside the transcript."""
+    return f"{prefix}/{track_version_id}/seek-index.json"
+
+
 def manifest_object_key(prefix: str, track_version_id: uuid.UUID) -> str:
     """Deterministic key for the manifest document."""
     return f"{prefix}/{track_version_id}/manifest.json"
 
 
+def language_detection_object_key(audio_sha256: str) -> str:
+    """Cache key for language detection results of a given source audio."""
+    return f"cache/language/{audio_sha256}.json"
+
+
+def normalized_audio_object_key(audio_sha256: str, audio_format: str) -> str:
+    """Cache key for the engine-ready conversion of a given source audio."""
+    return f"cache/normalized/{audio_sha256}/{audio_format}.npz"
+
+
+def vocal_stem_object_key(audio_sha256: str, separator_model: str) -> str:
+    """Cache key for the separated vocal stem of a given source audio."""
+    return f"cache/stems/{audio_sha256}/{separator_model}/vocals.npz"
+
+
+def fingerprint_shard_object_key(shard: int) -> str:
+    """Key of one shard of the audio fingerprint index."""
+    return f"cache/fingerprints/shards/{shard:02x}.npz"
+
+
+def fingerprint_entry_object_key(track_version_id: uuid.UUID) -> str:
+    """Key of the metadata for a fingerprinted track version."""
+    return f"cache/fingerprints/entries/{track_version_id}.json"
+
+
+def alignment_features_object_key(track_version_id: uuid.UUID) -> str:
+    """Key of the per-frame alignment features kept for later re-alignment."""
+    return f"cache/alignment/{track_version_id}.npz"
+
+
+def job_state_object_key(job_id: uuid.UUID) -> str:
+    """Key of the dedupe record for a transcription job."""
+    return f"jobs/{job_id}/state.json"
+
+
 def input_extension(audio_object_key: str, fallback: str = "audio") -> str:
     """Extract a safe file extension from a temp audio object key."""
     tail = audio_object_key.rsplit("/", maxsplit=1)[-1]
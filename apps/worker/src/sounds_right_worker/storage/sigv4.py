@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import hashlib
+import hmac
+from dataclasses import dataclass
+from datetime import datetime
+from urllib.parse import quote
+
+EMPTY_SHA256 = hashlib.sha256(b"").hexdigest()
+
+_ALGORITHM = "AWS4-HMAC-SHA256"
+_SERVICE = "s3"
+
+
+@dataclass(frozen=True)
+class Credentials:
+    access_key: str
+    secret_key: str
+    region: str = "us-east-1"
+
+
+def _hmac(key: bytes, message: str) -> bytes:
+    return hmac.new(key, message.encode("utf-8"), hashlib.sha256).digest()
+
+
+def _encode(value: str) -> str:
+    return quote(value, safe="-_.~")
+
+
+def canonical_query(query: dict[str, str]) -> str:
+    """Query string in SigV4 canonical form; also used as the request's query."""
+    return "&".join(f"{_encode(key)}={_encode(value)}" for key, value in sorted(query.items()))
+
+
+def object_path(bucket: str, object_key: str) -> str:
+    """Path-style, URI-encoded request path for an object."""
+    return f"/{_encode(bucket)}/{quote(object_key, safe='/~')}"
+
+
+def sign_request(
+    credentials: Credentials,
+    method: str,
+    path: str,
+    query: dict[str, str],
+    headers: dict[str, str],
+    payload_sha256: str,
+    now: datetime,
+) -> dict[str, str]:
+    """Return ``headers`` plus the ``x-amz-*`` and ``Authorization`` headers.
+
+    ``path`` must already be URI-encoded (see ``object_path``). Every given
+    header is signed, so it must include ``host``. ``now`` must be in UTC.
+    """
+    amz_date = now.strftime("%Y%m%dT%H%M%SZ")
+    day = amz_date[:8]
+    signed = {name.lower(): " ".join(value.split()) for name, value in headers.items()}
+    signed["x-amz-content-sha256"] = payload_sha256
+    signed["x-amz-date"] = amz_date
+    names = sorted(signed)
+    signed_headers = ";".join(names)
+    canonical_request = "\n".join(
+        [
+            method,
+            path,
+            canonical_query(query),
+            "".join(f"{name}:{signed[name]}\n" for name in names),
+            signed_headers,
+            payload_sha256,
+        ]
+    )
+    scope = f"{day}/{credentials.region}/{_SERVICE}/aws4_request"
+    string_to_sign = "\n".join(
+        [
+            _ALGORITHM,
+            amz_date,
+            scope,
+            hashlib.sha256(canonical_request.encode("utf-8")).hexdigest(),
+        ]
+    )
+    key = _hmac(f"AWS4{credentials.secret_key}".encode(), day)
+    key = _hmac(key, credentials.region)
+    key = _hmac(key, _SERVICE)
+    key = _hmac(key, "aws4_request")
+    signature = hmac.new(key, string_to_sign.encode("utf-8"), hashlib.sha256).hexdigest()
+    return {
+        **signed,
+        "authorization": (
+            f"{_ALGORITHM} Credential={credentials.access_key}/{scope}, "
+            f"SignedHeaders={signed_headers}, Signature={signature}"
+        ),
+    }
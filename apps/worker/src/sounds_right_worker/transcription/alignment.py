@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import io
+import re
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import numpy.typing as npt
+
+from sounds_right_worker.audio.vad import frame_features
+from sounds_right_worker.audio.wav import read_pcm16, to_float32
+from sounds_right_worker.transcription.schemas import WhisperCppResult, WhisperSegment, WhisperWord
+
+ALIGNMENT_ENGINE_NAME = "lyrics-dtw"
+ALIGNMENT_MODEL_NAME = "dtw-v1"
+
+_HOP_MS = 20
+HOP_SECONDS = _HOP_MS / 1000
+_VOWEL_GROUPS = re.compile(r"[aeiouyàáâãäåæèéêëìíîïòóôõöøùúûüýÿœ]+", re.IGNORECASE)
+_WORD = re.compile(r"[^\W_]+(?:['’-][^\W_]+)*")
+# Voicing is a soft step centred this many dB below the loud reference level.
+_VOICING_KNEE_DB = 25.0
+_VOICING_SLOPE_DB = 4.0
+# Cost of starting a syllable away from an onset, relative to per-frame costs.
+_ONSET_WEIGHT = 2.0
+_INF = np.float32(np.inf)
+
+
+@dataclass(frozen=True)
+class _Unit:
+    """One step of the expected lyric sequence: a syllable or an optional pause."""
+
+    word_index: int  # -1 for pauses
+    is_pause: bool
+
+
+@dataclass(frozen=True)
+class LyricLine:
+    text: str
+    words: tuple[str, ...]
+
+
+class AlignmentError(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class AlignmentFeatures:
+    """Per-frame voicing and onset strength, one frame every ``_HOP_MS``.
+
+    Small enough to keep per track version, so lyric lines can be re-aligned
+    later without the (deleted) source audio.
+    """
+
+    voicing: npt.NDArray[np.float32]
+    onset: npt.NDArray[np.float32]
+
+    @classmethod
+    def from_samples(cls, samples: npt.NDArray[np.float32], sample_rate: int) -> AlignmentFeatures:
+        voicing, onset = alignment_features(samples, sample_rate)
+        return cls(voicing=voicing, onset=onset)
+
+    @classmethod
+    def from_wav(cls, path: Path) -> AlignmentFeatures:
+        pcm, sample_rate = read_pcm16(path)
+        return cls.from_samples(to_float32(pcm), sample_rate)
+
+    def __len__(self) -> int:
+        return len(self.voicing)
+
+    @property
+    def duration_seconds(self) -> float:
+        return len(self) * HOP_SECONDS
+
+    def to_bytes(self) -> bytes:
+        buffer = io.BytesIO()
+        np.savez_compressed(
+            buffer,
+            voicing=self.voicing.astype(np.float16),
+            onset=self.onset.astype(np.float16),
+        )
+        return buffer.getvalue()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> AlignmentFeatures:
+        with np.load(io.BytesIO(data)) as archive:
+            return cls(
+                voicing=archive["voicing"].astype(np.float32),
+                onset=archive["onset"].astype(np.float32),
+            )
+
+
+def parse_lyrics(text: str) -> list[LyricLine]:
+    """Split lyrics into lines that contain at least one word."""
+    lines: list[LyricLine] = []
+    for raw_line in text.splitlines():
+        words = tuple(_WORD.findall(raw_line))
+        if words:
+            lines.append(LyricLine(text=" ".join(raw_line.split()), words=words))
+    return lines
+
+
+def count_syllables(word: str) -> int:
+    """Rough syllable count from vowel groups, ignoring a silent final ``e``."""
+    groups = len(_VOWEL_GROUPS.findall(word))
+    lowered = word.lower()
+    if groups > 1 and lowered.endswith("e") and not lowered.endswith(("le", "ee", "ie", "ye")):
+        groups -= 1
+    return max(groups, 1)
+
+
+def alignment_features(
+    samples: npt.NDArray[np.float32],
+    sample_rate: int,
+) -> tuple[npt.NDArray[np.float32], npt.NDArray[np.float32]]:
+    """Per-frame voicing probability and onset strength, both in ``[0, 1]``."""
+    frame_length = max(int(sample_rate * _HOP_MS / 1000), 1)
+    rms_db, voice_ratio = frame_features(samples, sample_rate, frame_length)
+    if len(rms_db) == 0:
+        empty = np.zeros(0, dtype=np.float32)
+        return empty, empty
+
+    reference_db = float(np.percentile(rms_db, 95))
+    level = 1.0 / (1.0 + np.exp(-(rms_db - (reference_db - _VOICING_KNEE_DB)) / _VOICING_SLOPE_DB))
+    voicing = (level * np.clip(voice_ratio / 0.5, 0.0, 1.0)).astype(np.float32)
+
+    flux = np.maximum(np.diff(rms_db, prepend=rms_db[0]), 0.0)
+    peak = float(np.percentile(flux, 99)) or 1.0
+    onset = np.clip(flux / peak, 0.0, 1.0).astype(np.float32)
+    return voicing, onset
+
+
+def _units(lines: list[LyricLine]) -> tuple[list[_Unit], int]:
+    """Expand lines to units; pauses sit between lines and at both ends.
+
+    Returns the units and the total number of words.
+    """
+    units = [_Unit(word_index=-1, is_pause=True)]
+    word_count = 0
+    for line in lines:
+        for word in line.words:
+            units.extend(
+                _Unit(word_index=word_count, is_pause=False) for _ in range(count_syllables(word))
+            )
+            word_count += 1
+        units.append(_Unit(word_index=-1, is_pause=True))
+    return units, word_count
+
+
+def _dtw_path(
+    costs: npt.NDArray[np.float32],
+    entry_costs: npt.NDArray[np.float32],
+    skippable: npt.NDArray[np.bool_],
+) -> npt.NDArray[np.int64]:
+    """Monotonic alignment of units (rows) to frames (columns).
+
+    Each frame is assigned exactly one unit. From one frame to the next the
+    unit stays, advances by one, or advances by two over a skippable pause.
+    Entering a non-pause unit adds that frame's ``entry_costs``. The recursion
+    runs over frames and is vectorized across units. Returns each frame's unit.
+    """
+    unit_count, frame_count = costs.shape
+    enters = (~skippable).astype(np.float32)
+    steps = np.zeros((frame_count, unit_count), dtype=np.int8)
+    total = np.full(unit_count, _INF, dtype=np.float32)
+    total[0] = costs[0, 0]
+    if skippable[0] and unit_count > 1:
+        total[1] = costs[1, 0] + entry_costs[0] * enters[1]
+    skip_allowed = np.zeros(unit_count, dtype=np.bool_)
+    skip_allowed[2:] = skippable[1:-1]
+
+    for frame in range(1, frame_count):
+        entry = entry_costs[frame] * enters
+        stay = total
+        advance = np.concatenate(([_INF], total[:-1])) + entry
+        skip = np.concatenate(([_INF, _INF], total[:-2])) + entry
+        skip = np.where(skip_allowed, skip, _INF)
+        choices = np.stack([stay, advance, skip])
+        best = np.argmin(choices, axis=0)
+        steps[frame] = best
+        total = choices[best, np.arange(unit_count)] + costs[:, frame]
+
+    last = unit_count - 1
+    if skippable[last] and unit_count > 1 and total[last - 1] < total[last]:
+        last -= 1
+    if not np.isfinite(total[last]):
+        raise AlignmentError("lyrics could not be aligned to the audio")
+
+    path = np.empty(frame_count, dtype=np.int64)
+    unit = last
+    for frame in range(frame_count - 1, -1, -1):
+        path[frame] = unit
+        unit -= int(steps[frame, unit])
+    return path
+
+
+def align_lines(
+    features: AlignmentFeatures,
+    lines: list[LyricLine],
+    *,
+    start_seconds: float = 0.0,
+    end_seconds: float | None = None,
+) -> list[WhisperSegment]:
+    """Force-align lyric lines within ``[start_seconds, end_seconds)`` of the audio.
+
+    Every syllable expects voiced frames and prefers to start on an onset; pauses
+    between lines expect unvoiced frames and may be skipped entirely. Returns one
+    segment per line, timed on the full audio.
+    """
+    if not lines:
+        raise AlignmentError("lyrics are empty")
+    first_frame = max(int(round(start_seconds / HOP_SECONDS)), 0)
+    last_frame = len(features) if end_seconds is None else int(round(end_seconds / HOP_SECONDS))
+    voicing = features.voicing[first_frame:last_frame]
+    onset = features.onset[first_frame:last_frame]
+    units, word_count = _units(lines)
+    if len(voicing) < len(units):
+        raise AlignmentError("audio is too short for the lyrics")
+
+    is_pause = np.array([unit.is_pause for unit in units], dtype=np.bool_)
+    costs = np.where(is_pause[:, None], voicing[None, :], 1.0 - voicing[None, :]).astype(np.float32)
+    entry_costs = (_ONSET_WEIGHT * (1.0 - onset)).astype(np.float32)
+    path = _dtw_path(costs, entry_costs, is_pause)
+
+    word_index = np.array([unit.word_index for unit in units], dtype=np.int64)[path]
+    frame_cost = costs[path, np.arange(len(path))]
+
+    word_spans: list[tuple[float, float, float]] = []
+    for index in range(word_count):
+        frames = np.flatnonzero(word_index == index)
+        start = float(frames[0] + first_frame) * HOP_SECONDS
+        end = float(frames[-1] + first_frame + 1) * HOP_SECONDS
+        confidence = float(np.clip(1.0 - frame_cost[frames].mean(), 0.0, 1.0))
+        word_spans.append((round(start, 3), round(end, 3), confidence))
+
+    segments: list[WhisperSegment] = []
+    cursor = 0
+    for line in lines:
+        line_words = [
+            WhisperWord(word=word, start=start, end=end, confidence=round(confidence, 3))
+            for word, (start, end, confidence) in zip(
+                line.words, word_spans[cursor : cursor + len(line.words)], strict=True
+            )
+        ]
+        cursor += len(line.words)
+        segments.append(
+            WhisperSegment(
+                start=line_words[0].start,
+                end=line_words[-1].end,
+                text=line.text,
+                words=line_words,
+            )
+        )
+    return segments
+
+
+def align_lyrics_text(features: AlignmentFeatures, lyrics: str, language: str) -> WhisperCppResult:
+    return WhisperCppResult(language=language, segments=align_lines(features, parse_lyrics(lyrics)))
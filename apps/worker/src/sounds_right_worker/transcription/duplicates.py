@@ -0,0 +1,293 @@
+from __future__ import annotations
+
+import io
+import uuid
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+from pydantic import BaseModel, ValidationError
+
+from sounds_right_worker.audio.fingerprint import FRAME_SECONDS, Fingerprint
+from sounds_right_worker.config import WorkerSettings
+from sounds_right_worker.logging import get_logger
+from sounds_right_worker.storage.minio_client import (
+    ObjectNotFoundError,
+    PreconditionFailedError,
+    StorageClient,
+    StorageError,
+)
+from sounds_right_worker.storage.object_keys import (
+    fingerprint_entry_object_key,
+    fingerprint_shard_object_key,
+)
+
+logger = get_logger(__name__)
+
+_SHARD_COUNT = 16
+# Only every n-th hash (by a mixed hash value) is indexed; voting on the sample
+# is as decisive as on the full set at a fraction of the index size.
+_INDEX_SAMPLE = 4
+_MIX = np.uint32(0x9E3779B1)
+# A shard write that loses to a concurrent one is retried on the new version.
+_SHARD_WRITE_ATTEMPTS = 5
+
+
+class FingerprintEntry(BaseModel):
+    """What the index knows about an earlier, transcribed recording."""
+
+    track_version_id: uuid.UUID
+    transcript_object_key: str
+    duration_seconds: float
+    audio_sha256: str
+
+
+@dataclass(frozen=True)
+class DuplicateConfig:
+    min_matches: int = 20
+    min_score: float = 0.1
+
+    @classmethod
+    def from_settings(cls, settings: WorkerSettings) -> DuplicateConfig:
+        return cls(
+            min_matches=settings.worker_fingerprint_min_matches,
+            min_score=settings.worker_fingerprint_min_score,
+        )
+
+
+@dataclass(frozen=True)
+class DuplicateMatch:
+    entry: FingerprintEntry
+    matched_hashes: int
+    score: float
+    offset_seconds: float
+
+
+@dataclass(frozen=True)
+class _Shard:
+    etag: str
+    hashes: npt.NDArray[np.uint32]
+    offsets: npt.NDArray[np.uint32]
+    entries: npt.NDArray[np.uint32]
+    entry_ids: npt.NDArray[np.str_]
+
+    @classmethod
+    def empty(cls) -> _Shard:
+        return cls(
+            etag="",
+            hashes=np.zeros(0, dtype=np.uint32),
+            offsets=np.zeros(0, dtype=np.uint32),
+            entries=np.zeros(0, dtype=np.uint32),
+            entry_ids=np.zeros(0, dtype="<U36"),
+        )
+
+    def to_bytes(self) -> bytes:
+        buffer = io.BytesIO()
+        np.savez_compressed(
+            buffer,
+            hashes=self.hashes,
+            offsets=self.offsets,
+            entries=self.entries,
+            entry_ids=self.entry_ids,
+        )
+        return buffer.getvalue()
+
+    @classmethod
+    def from_bytes(cls, data: bytes, etag: str) -> _Shard:
+        with np.load(io.BytesIO(data)) as archive:
+            return cls(
+                etag=etag,
+                hashes=archive["hashes"],
+                offsets=archive["offsets"],
+                entries=archive["entries"],
+                entry_ids=archive["entry_ids"],
+            )
+
+    def with_entry(
+        self,
+        entry_id: str,
+        hashes: npt.NDArray[np.uint32],
+        offsets: npt.NDArray[np.uint32],
+    ) -> _Shard:
+        """Return a copy with ``entry_id``'s hashes replaced by the given ones."""
+        entry_ids = self.entry_ids
+        existing = np.flatnonzero(entry_ids == entry_id)
+        if len(existing):
+            index = int(existing[0])
+            keep = self.entries != index
+            base_hashes, base_offsets, base_entries = (
+                self.hashes[keep],
+                self.offsets[keep],
+                self.entries[keep],
+            )
+        else:
+            index = len(entry_ids)
+            entry_ids = np.append(entry_ids, np.array([entry_id], dtype="<U36"))
+            base_hashes, base_offsets, base_entries = self.hashes, self.offsets, self.entries
+        merged_hashes = np.concatenate([base_hashes, hashes])
+        merged_offsets = np.concatenate([base_offsets, offsets])
+        merged_entries = np.concatenate(
+            [base_entries, np.full(len(hashes), index, dtype=np.uint32)],
+        )
+        order = np.argsort(merged_hashes, kind="stable")
+        return _Shard(
+            etag=self.etag,
+            hashes=merged_hashes[order],
+            offsets=merged_offsets[order],
+            entries=merged_entries[order],
+            entry_ids=entry_ids,
+        )
+
+    def votes(
+        self,
+        hashes: npt.NDArray[np.uint32],
+        offsets: npt.NDArray[np.uint32],
+    ) -> tuple[npt.NDArray[np.str_], npt.NDArray[np.int64]]:
+        """Return (entry id, reference frame - query frame) for every hash hit."""
+        left = np.searchsorted(self.hashes, hashes, side="left")
+        right = np.searchsorted(self.hashes, hashes, side="right")
+        counts = right - left
+        if not counts.any():
+            return np.zeros(0, dtype="<U36"), np.zeros(0, dtype=np.int64)
+        query_index = np.repeat(np.arange(len(hashes)), counts)
+        within = np.arange(len(query_index)) - np.repeat(np.cumsum(counts) - counts, counts)
+        hits = np.repeat(left, counts) + within
+        deltas = self.offsets[hits].astype(np.int64) - offsets[query_index].astype(np.int64)
+        return self.entry_ids[self.entries[hits]], deltas
+
+
+def _sampled_shards(
+    fingerprint: Fingerprint,
+) -> dict[int, tuple[npt.NDArray[np.uint32], npt.NDArray[np.uint32]]]:
+    mixed = fingerprint.hashes * _MIX
+    sampled = (mixed >> np.uint32(8)) % np.uint32(_INDEX_SAMPLE) == 0
+    shard_of = (mixed >> np.uint32(28)) % np.uint32(_SHARD_COUNT)
+    shards: dict[int, tuple[npt.NDArray[np.uint32], npt.NDArray[np.uint32]]] = {}
+    for shard in range(_SHARD_COUNT):
+        selected = sampled & (shard_of == shard)
+        if selected.any():
+            shards[shard] = (fingerprint.hashes[selected], fingerprint.offsets[selected])
+    return shards
+
+
+class FingerprintIndex:
+    """Near-duplicate lookup over acoustic fingerprints of transcribed audio.
+
+    The index is an inverted list of sampled landmark hashes, split into shards
+    stored in the artifacts bucket and cached in memory by ETag. A lookup votes
+    for (entry, time offset) pairs, so re-encoded or differently trimmed copies
+    of a recording still match. Shard updates are conditional on the ETag that
+    was read, so concurrent writers retry on each other's result instead of
+    overwriting it.
+    """
+
+    def __init__(self, storage: StorageClient, bucket: str, config: DuplicateConfig) -> None:
+        self._storage = storage
+        self._bucket = bucket
+        self._config = config
+        self._shards: dict[int, _Shard] = {}
+
+    async def find(self, fingerprint: Fingerprint) -> DuplicateMatch | None:
+        sampled = _sampled_shards(fingerprint)
+        query_size = sum(len(hashes) for hashes, _ in sampled.values())
+        if query_size == 0:
+            return None
+
+        entry_parts: list[npt.NDArray[np.str_]] = []
+        delta_parts: list[npt.NDArray[np.int64]] = []
+        for shard_number, (hashes, offsets) in sampled.items():
+            shard = await self._load_shard(shard_number)
+            entries, deltas = shard.votes(hashes, offsets)
+            entry_parts.append(entries)
+            delta_parts.append(deltas)
+        entries = np.concatenate(entry_parts)
+        if len(entries) == 0:
+            return None
+
+        pairs, votes = np.unique(
+            np.rec.fromarrays([entries, np.concatenate(delta_parts)], names="entry,delta"),
+            return_counts=True,
+        )
+        best = int(np.argmax(votes))
+        matched = int(votes[best])
+        score = matched / query_size
+        if matched < self._config.min_matches or score < self._config.min_score:
+            return None
+
+        entry = await self._read_entry(str(pairs[best]["entry"]))
+        if entry is None:
+            return None
+        return DuplicateMatch(
+            entry=entry,
+            matched_hashes=matched,
+            score=score,
+            offset_seconds=int(pairs[best]["delta"]) * FRAME_SECONDS,
+        )
+
+    async def add(self, fingerprint: Fingerprint, entry: FingerprintEntry) -> None:
+        await self._storage.upload_json(
+            self._bucket,
+            fingerprint_entry_object_key(entry.track_version_id),
+            entry.model_dump_json().encode("utf-8"),
+        )
+        entry_id = str(entry.track_version_id)
+        for shard_number, (hashes, offsets) in _sampled_shards(fingerprint).items():
+            await self._add_to_shard(shard_number, entry_id, hashes, offsets)
+
+    async def _add_to_shard(
+        self,
+        shard_number: int,
+        entry_id: str,
+        hashes: npt.NDArray[np.uint32],
+        offsets: npt.NDArray[np.uint32],
+    ) -> None:
+        key = fingerprint_shard_object_key(shard_number)
+        for _attempt in range(_SHARD_WRITE_ATTEMPTS):
+            shard = await self._load_shard(shard_number)
+            updated = shard.with_entry(entry_id, hashes, offsets)
+            # Force a reload next time so the cached copy picks up the new ETag.
+            self._shards.pop(shard_number, None)
+            try:
+                await self._storage.upload_json(
+                    self._bucket,
+                    key,
+                    updated.to_bytes(),
+                    content_type="application/octet-stream",
+                    if_match=shard.etag or None,
+                    if_none_match=not shard.etag,
+                )
+            except PreconditionFailedError:
+                continue
+            return
+        # Giving up only drops the entry from this shard: a later cache miss.
+        logger.warning(
+            "fingerprint shard kept changing; entry not indexed",
+            extra={"shard": shard_number, "entry_id": entry_id},
+        )
+
+    async def _load_shard(self, shard_number: int) -> _Shard:
+        key = fingerprint_shard_object_key(shard_number)
+        etag = await self._storage.object_etag(self._bucket, key)
+        if etag is None:
+            return _Shard.empty()
+        cached = self._shards.get(shard_number)
+        if cached is not None and cached.etag == etag:
+            return cached
+        try:
+            data = await self._storage.download_bytes(self._bucket, key)
+        except ObjectNotFoundError:
+            return _Shard.empty()
+        shard = _Shard.from_bytes(data, etag)
+        self._shards[shard_number] = shard
+        return shard
+
+    async def _read_entry(self, entry_id: str) -> FingerprintEntry | None:
+        key = fingerprint_entry_object_key(uuid.UUID(entry_id))
+        try:
+            raw = await self._storage.download_bytes(self._bucket, key)
+        except (ObjectNotFoundError, StorageError):
+            return None
+        try:
+            return FingerprintEntry.model_validate_json(raw)
+        except ValidationError:
+            return None
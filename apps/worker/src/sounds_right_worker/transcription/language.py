@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from sounds_right_worker.audio.vad import VadConfig, extract_vocal_window
+from sounds_right_worker.logging import get_logger
+from sounds_right_worker.storage.minio_client import (
+    ObjectNotFoundError,
+    StorageClient,
+    StorageError,
+)
+from sounds_right_worker.storage.object_keys import language_detection_object_key
+from sounds_right_worker.transcription.schemas import LanguageDetection
+from sounds_right_worker.transcription.whisper_cpp import WhisperCppEngine
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class LanguageModelChoice:
+    name: str
+    path: Path
+
+
+def model_name_from_path(path: Path) -> str:
+    """``/models/ggml-base.en.bin`` -> ``base.en``."""
+    name = path.name.removesuffix(".bin")
+    return name.removeprefix("ggml-")
+
+
+def choose_language_model(
+    detection: LanguageDetection,
+    language_models: dict[str, Path],
+    min_confidence: float,
+) -> LanguageModelChoice | None:
+    """Return a language-specific model when detection is confident enough."""
+    if detection.confidence < min_confidence:
+        return None
+    path = language_models.get(detection.language)
+    if path is None or not path.exists():
+        return None
+    return LanguageModelChoice(name=model_name_from_path(path), path=path)
+
+
+class LanguageDetector:
+    """Detects the sung language from a short vocal-rich window.
+
+    Results are cached in the artifacts bucket keyed by the source audio
+    SHA-256, so retries and re-transcriptions of the same audio skip the engine.
+    """
+
+    def __init__(
+        self,
+        engine: WhisperCppEngine,
+        storage: StorageClient,
+        cache_bucket: str,
+        window_seconds: float,
+        vad_config: VadConfig,
+    ) -> None:
+        self._engine = engine
+        self._storage = storage
+        self._cache_bucket = cache_bucket
+        self._window_seconds = window_seconds
+        self._vad_config = vad_config
+
+    async def detect(
+        self,
+        input_wav: Path,
+        work_dir: Path,
+        audio_sha256: str,
+    ) -> LanguageDetection | None:
+        cache_key = language_detection_object_key(audio_sha256)
+        cached = await self._read_cache(cache_key)
+        if cached is not None:
+            logger.info("language detection cache hit", extra={"audio_sha256": audio_sha256})
+            return cached
+
+        window_wav = work_dir / "language_window.wav"
+        await asyncio.to_thread(
+            extract_vocal_window,
+            input_wav,
+            window_wav,
+            self._window_seconds,
+            self._vad_config,
+        )
+        detection = await self._engine.detect_language(window_wav)
+        if detection is not None:
+            await self._write_cache(cache_key, detection)
+        return detection
+
+    async def _read_cache(self, cache_key: str) -> LanguageDetection | None:
+        try:
+            raw = await self._storage.download_bytes(
+                self._cache_bucket,
+                cache_key,
+            )
+        except ObjectNotFoundError:
+            return None
+        except StorageError:
+            logger.warning("could not read language cache", extra={"object_key": cache_key})
+            return None
+        try:
+            return LanguageDetection.model_validate_json(raw)
+        except ValidationError:
+            return None
+
+    async def _write_cache(self, cache_key: str, detection: LanguageDetection) -> None:
+        try:
+            await self._storage.upload_json(
+                self._cache_bucket,
+                cache_key,
+                detection.model_dump_json().encode("utf-8"),
+            )
+        except StorageError:
+            logger.warning("could not write language cache", extra={"object_key": cache_key})
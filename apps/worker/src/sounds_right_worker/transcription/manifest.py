@@ -3,21 +3,29 @@ from __future__ import annotations
 import hashlib
 import uuid
 from datetime import UTC, datetime
+from pathlib import Path
 
 from pydantic import BaseModel
 
 from sounds_right_worker.audio.ffprobe import AudioProbeResult
-from sounds_right_worker.transcription.schemas import Transcript
+from sounds_right_worker.transcription.schemas import LanguageDetection, Transcript
+
+_HASH_CHUNK_BYTES = 1024 * 1024
 
 
 class ManifestArtifact(BaseModel):
     object_key: str
     content_type: str
+    # Compression of the stored object; the SHA-256 is of the decoded JSON.
+    content_encoding: str | None = None
     sha256: str
 
 
 class ManifestArtifacts(BaseModel):
     transcript: ManifestArtifact
+    # Player artifacts derived from the transcript; absent from older manifests.
+    word_timings: ManifestArtifact | None = None
+    seek_index: ManifestArtifact | None = None
 
 
 class ManifestEngine(BaseModel):
@@ -32,6 +40,29 @@ class ManifestAudio(BaseModel):
     channels: int | None
 
 
+class ManifestReuse(BaseModel):
+    """Set when the transcript was re-timed from an acoustically matching upload."""
+
+    track_version_id: uuid.UUID
+    offset_seconds: float
+    score: float
+
+
+class ManifestSeparation(BaseModel):
+    """Set when the engine ran on a separated vocal stem instead of the mix."""
+
+    model: str
+    cached: bool
+
+
+class ManifestRealignment(BaseModel):
+    """Set when edited lines were re-aligned onto an earlier transcript."""
+
+    source_job_id: uuid.UUID
+    realigned_segments: int
+    reused_segments: int
+
+
 class Manifest(BaseModel):
     schema_version: str
     track_version_id: uuid.UUID
@@ -40,6 +71,10 @@ class Manifest(BaseModel):
     artifacts: ManifestArtifacts
     engine: ManifestEngine
     audio: ManifestAudio
+    language_detection: LanguageDetection | None = None
+    reused_from: ManifestReuse | None = None
+    vocal_separation: ManifestSeparation | None = None
+    realignment: ManifestRealignment | None = None
     created_at: datetime
 
 
@@ -47,6 +82,28 @@ def compute_sha256(data: bytes) -> str:
     return hashlib.sha256(data).hexdigest()
 
 
+def compute_file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        while chunk := handle.read(_HASH_CHUNK_BYTES):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def manifest_artifact(
+    object_key: str,
+    data: bytes,
+    content_type: str,
+    content_encoding: str | None = None,
+) -> ManifestArtifact:
+    return ManifestArtifact(
+        object_key=object_key,
+        content_type=content_type,
+        content_encoding=content_encoding,
+        sha256=compute_sha256(data),
+    )
+
+
 def build_manifest(
     *,
     schema_version: str,
@@ -54,6 +111,12 @@ def build_manifest(
     transcript_object_key: str,
     transcript_sha256: str,
     probe: AudioProbeResult,
+    transcript_content_encoding: str | None = None,
+    word_timings: ManifestArtifact | None = None,
+    seek_index: ManifestArtifact | None = None,
+    language_detection: LanguageDetection | None = None,
+    reused_from: ManifestReuse | None = None,
+    vocal_separation: ManifestSeparation | None = None,
     created_at: datetime | None = None,
 ) -> Manifest:
     return Manifest(
@@ -65,8 +128,11 @@ def build_manifest(
             transcript=ManifestArtifact(
                 object_key=transcript_object_key,
                 content_type="application/json",
+                content_encoding=transcript_content_encoding,
                 sha256=transcript_sha256,
             ),
+            word_timings=word_timings,
+            seek_index=seek_index,
         ),
         engine=ManifestEngine(
             name=transcript.engine.name,
@@ -78,5 +144,8 @@ def build_manifest(
             sample_rate=probe.sample_rate,
             channels=probe.channels,
         ),
+        language_detection=language_detection,
+        reused_from=reused_from,
+        vocal_separation=vocal_separation,
         created_at=created_at or datetime.now(UTC),
     )
@@ -3,6 +3,7 @@ from __future__ import annotations
 import uuid
 from datetime import UTC, datetime
 
+from sounds_right_worker.audio.timemap import TimeMap
 from sounds_right_worker.transcription.schemas import (
     Transcript,
     TranscriptEngine,
@@ -10,6 +11,8 @@ from sounds_right_worker.transcription.schemas import (
     TranscriptSegment,
     TranscriptWord,
     WhisperCppResult,
+    WhisperSegment,
+    WhisperWord,
 )
 
 
@@ -17,6 +20,67 @@ def _count_words(text: str) -> int:
     return len(text.split())
 
 
+def remap_result(result: WhisperCppResult, time_map: TimeMap) -> WhisperCppResult:
+    """Move segment and word timestamps from a trimmed input back to original time."""
+    segments: list[WhisperSegment] = []
+    for segment in result.segments:
+        start = time_map.to_original(segment.start)
+        words: list[WhisperWord] = []
+        for word in segment.words:
+            word_start = time_map.to_original(word.start)
+            word_end = max(time_map.to_original(word.end, end=True), word_start)
+            words.append(word.model_copy(update={"start": word_start, "end": word_end}))
+        segments.append(
+            segment.model_copy(
+                update={
+                    "start": start,
+                    "end": max(time_map.to_original(segment.end, end=True), start),
+                    "words": words,
+                }
+            )
+        )
+    return WhisperCppResult(language=result.language, segments=segments)
+
+
+def shift_transcript(
+    transcript: Transcript,
+    offset_seconds: float,
+    duration_seconds: float,
+) -> WhisperCppResult:
+    """Re-time an existing transcript onto audio that starts ``offset_seconds`` later.
+
+    Segments that fall outside ``[0, duration_seconds]`` are dropped and the
+    rest are clamped, so a trimmed duplicate only keeps the lyrics it contains.
+    """
+
+    def move(seconds: float) -> float:
+        return min(max(seconds - offset_seconds, 0.0), duration_seconds)
+
+    segments: list[WhisperSegment] = []
+    for segment in transcript.segments:
+        if segment.end - offset_seconds <= 0 or segment.start - offset_seconds >= duration_seconds:
+            continue
+        segments.append(
+            WhisperSegment(
+                start=move(segment.start),
+                end=move(segment.end),
+                text=segment.text,
+                words=[
+                    WhisperWord(
+                        word=word.word,
+                        start=move(word.start),
+                        end=move(word.end),
+                        confidence=word.confidence,
+                    )
+                    for word in segment.words
+                    if word.end - offset_seconds > 0
+                    and word.start - offset_seconds < duration_seconds
+                ],
+            )
+        )
+    return WhisperCppResult(language=transcript.engine.language, segments=segments)
+
+
 def build_transcript(
     result: WhisperCppResult,
     *,
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+
+from sounds_right_worker.transcription.alignment import (
+    AlignmentError,
+    AlignmentFeatures,
+    LyricLine,
+    align_lines,
+    parse_lyrics,
+)
+from sounds_right_worker.transcription.schemas import (
+    Transcript,
+    TranscriptSegment,
+    WhisperCppResult,
+    WhisperSegment,
+    WhisperWord,
+)
+
+
+@dataclass(frozen=True)
+class RealignOutcome:
+    result: WhisperCppResult
+    realigned_segments: int
+    reused_segments: int
+
+
+def _line_key(text: str) -> tuple[str, ...]:
+    """Compare lines by their words only, so punctuation and case edits keep timings."""
+    return tuple(word.lower() for line in parse_lyrics(text) for word in line.words)
+
+
+def _reused(segment: TranscriptSegment, line: LyricLine) -> WhisperSegment:
+    return WhisperSegment(
+        start=segment.start,
+        end=segment.end,
+        text=line.text,
+        words=[
+            WhisperWord(word=word.word, start=word.start, end=word.end, confidence=word.confidence)
+            for word in segment.words
+        ],
+    )
+
+
+def realign_transcript(
+    transcript: Transcript,
+    lyrics: str,
+    features: AlignmentFeatures,
+) -> RealignOutcome:
+    """Re-align only the lines that changed between ``transcript`` and ``lyrics``.
+
+    ``lyrics`` holds one line per segment. Lines whose words are unchanged keep
+    their segment timings; each run of inserted or replaced lines is aligned
+    inside the gap between the unchanged segments around it. Deleted lines are
+    dropped.
+    """
+    lines = parse_lyrics(lyrics)
+    if not lines:
+        raise AlignmentError("lyrics are empty")
+    old = transcript.segments
+    duration = min(transcript.metadata.duration_seconds, features.duration_seconds)
+    matcher = SequenceMatcher(
+        a=[_line_key(segment.text) for segment in old],
+        b=[_line_key(line.text) for line in lines],
+        autojunk=False,
+    )
+
+    segments: list[WhisperSegment] = []
+    realigned = 0
+    for tag, old_start, old_end, new_start, new_end in matcher.get_opcodes():
+        if tag == "equal":
+            segments.extend(
+                _reused(segment, line)
+                for segment, line in zip(
+                    old[old_start:old_end], lines[new_start:new_end], strict=True
+                )
+            )
+            continue
+        if new_start == new_end:
+            continue
+        window_start = segments[-1].end if segments else 0.0
+        window_end = old[old_end].start if old_end < len(old) else duration
+        segments.extend(
+            align_lines(
+                features,
+                lines[new_start:new_end],
+                start_seconds=window_start,
+                end_seconds=window_end,
+            )
+        )
+        realigned += new_end - new_start
+
+    return RealignOutcome(
+        result=WhisperCppResult(language=transcript.engine.language, segments=segments),
+        realigned_segments=realigned,
+        reused_segments=len(lines) - realigned,
+    )
@@ -12,6 +12,13 @@ class TranscriptionOptions(BaseModel):
     separate_vocals: bool = False
 
 
+class LanguageDetection(BaseModel):
+    """Outcome of the short-window language detection pre-pass."""
+
+    language: str
+    confidence: float = Field(ge=0, le=1)
+
+
 class WhisperCppResult(BaseModel):
     """Raw-ish parsed output returned by the whisper.cpp wrapper."""
 
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import asyncio
 import json
+import re
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -13,6 +15,7 @@ from sounds_right_worker.errors import (
 )
 from sounds_right_worker.logging import get_logger
 from sounds_right_worker.transcription.schemas import (
+    LanguageDetection,
     TranscriptionOptions,
     WhisperCppResult,
     WhisperSegment,
@@ -22,6 +25,13 @@ logger = get_logger(__name__)
 
 _STAGE = "transcription"
 _OUTPUT_PREFIX = "whisper_output"
+_DETECTED_LANGUAGE = re.compile(r"auto-detected language:\s*([a-z]{2,3})\s*\(p\s*=\s*([0-9.]+)\)")
+# Segments printed to stdout while decoding: ``[00:00:01.230 --> 00:00:04.560]   text``
+_SEGMENT_LINE = re.compile(
+    r"^\[(\d+):(\d{2}):(\d{2}(?:\.\d+)?)\s*-->\s*(\d+):(\d{2}):(\d{2}(?:\.\d+)?)\]\s*(.*)$"
+)
+
+SegmentCallback = Callable[[WhisperSegment], Awaitable[None]]
 
 
 @dataclass(frozen=True)
@@ -56,8 +66,23 @@ class WhisperCppEngine:
         input_wav: Path,
         output_dir: Path,
         options: TranscriptionOptions,
+        *,
+        model: Path | None = None,
+        on_segment: SegmentCallback | None = None,
     ) -> WhisperCppResult:
+        """Run a full transcription. ``model`` overrides the configured model file.
+
+        When ``on_segment`` is given, it is awaited for each segment as whisper.cpp
+        prints it, before the final JSON output is available.
+        """
         self.ensure_available()
+        model_file = model or self._config.model
+        if not model_file.exists():
+            raise PipelineError(
+                WHISPER_CPP_MISSING,
+                "Transcription model is not available",
+                stage=_STAGE,
+            )
 
         output_prefix = output_dir / _OUTPUT_PREFIX
         language = options.language or self._config.default_language
@@ -65,7 +90,7 @@ class WhisperCppEngine:
         args = [
             str(self._config.binary),
             "-m",
-            str(self._config.model),
+            str(model_file),
             "-f",
             str(input_wav),
             "-l",
@@ -77,30 +102,13 @@ class WhisperCppEngine:
             str(output_prefix),
         ]
 
-        process = await asyncio.create_subprocess_exec(
-            *args,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        try:
-            _, stderr = await asyncio.wait_for(
-                process.communicate(),
-                timeout=self._config.timeout_seconds,
-            )
-        except TimeoutError as exc:
-            process.kill()
-            await process.wait()
-            raise PipelineError(
-                WHISPER_CPP_FAILED,
-                "Transcription timed out",
-                stage=_STAGE,
-            ) from exc
-
-        if process.returncode != 0:
+        on_line = _segment_line_handler(on_segment) if on_segment is not None else None
+        returncode, _, stderr = await self._run(args, on_line=on_line)
+        if returncode != 0:
             logger.error(
                 "whisper.cpp failed",
                 extra={
-                    "returncode": process.returncode,
+                    "returncode": returncode,
                     "stderr": stderr.decode(errors="replace"),
                 },
             )
@@ -120,6 +128,118 @@ class WhisperCppEngine:
 
         return parse_whisper_output(output_file.read_text(encoding="utf-8"))
 
+    async def detect_language(self, input_wav: Path) -> LanguageDetection | None:
+        """Run whisper.cpp language detection only (``-dl``) on a short clip.
+
+        Returns ``None`` when the engine did not report a language.
+        """
+        self.ensure_available()
+        args = [
+            str(self._config.binary),
+            "-m",
+            str(self._config.model),
+            "-f",
+            str(input_wav),
+            "-l",
+            "auto",
+            "-dl",
+            "-t",
+            str(self._config.threads),
+        ]
+        returncode, stdout, stderr = await self._run(args)
+        if returncode != 0:
+            logger.error(
+                "whisper.cpp language detection failed",
+                extra={"returncode": returncode, "stderr": stderr.decode(errors="replace")},
+            )
+            raise PipelineError(
+                WHISPER_CPP_FAILED,
+                "Language detection failed",
+                stage=_STAGE,
+            )
+        return parse_language_detection(
+            stderr.decode(errors="replace") + stdout.decode(errors="replace")
+        )
+
+    async def _run(
+        self,
+        args: list[str],
+        *,
+        on_line: Callable[[str], Awaitable[None]] | None = None,
+    ) -> tuple[int | None, bytes, bytes]:
+        process = await asyncio.create_subprocess_exec(
+            *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                process.communicate() if on_line is None else _stream(process, on_line),
+                timeout=self._config.timeout_seconds,
+            )
+        except TimeoutError as exc:
+            process.kill()
+            await process.wait()
+            raise PipelineError(
+                WHISPER_CPP_FAILED,
+                "Transcription timed out",
+                stage=_STAGE,
+            ) from exc
+        return process.returncode, stdout, stderr
+
+
+async def _stream(
+    process: asyncio.subprocess.Process,
+    on_line: Callable[[str], Awaitable[None]],
+) -> tuple[bytes, bytes]:
+    """Read stdout line by line while draining stderr so neither pipe fills up."""
+    assert process.stdout is not None and process.stderr is not None
+    stderr_task = asyncio.ensure_future(process.stderr.read())
+    lines: list[bytes] = []
+    try:
+        async for raw in process.stdout:
+            lines.append(raw)
+            await on_line(raw.decode(errors="replace"))
+        stderr = await stderr_task
+    finally:
+        stderr_task.cancel()
+    await process.wait()
+    return b"".join(lines), stderr
+
+
+def _segment_line_handler(on_segment: SegmentCallback) -> Callable[[str], Awaitable[None]]:
+    async def handle(line: str) -> None:
+        segment = parse_segment_line(line)
+        if segment is not None:
+            await on_segment(segment)
+
+    return handle
+
+
+def parse_segment_line(line: str) -> WhisperSegment | None:
+    """Parse one realtime segment line printed by whisper.cpp, if it is one."""
+    match = _SEGMENT_LINE.match(line.strip())
+    if match is None:
+        return None
+    hours, minutes, seconds, end_hours, end_minutes, end_seconds, text = match.groups()
+    return WhisperSegment(
+        start=int(hours) * 3600 + int(minutes) * 60 + float(seconds),
+        end=int(end_hours) * 3600 + int(end_minutes) * 60 + float(end_seconds),
+        text=text.strip(),
+    )
+
+
+def parse_language_detection(output: str) -> LanguageDetection | None:
+    """Extract ``auto-detected language: xx (p = 0.97)`` from whisper.cpp logs."""
+    match = _DETECTED_LANGUAGE.search(output)
+    if match is None:
+        return None
+    try:
+        confidence = min(max(float(match.group(2)), 0.0), 1.0)
+    except ValueError:
+        return None
+    return LanguageDetection(language=match.group(1), confidence=confidence)
+
 
 def parse_whisper_output(raw: str) -> WhisperCppResult:
     """Parse whisper.cpp ``-oj`` JSON output into a normalized result.
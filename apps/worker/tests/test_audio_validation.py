@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+from pathlib import Path
+
+import numpy as np
 import pytest
 
+from sounds_right_worker.audio.ffmpeg import is_normalized
 from sounds_right_worker.audio.ffprobe import AudioProbeResult, parse_ffprobe_output
-from sounds_right_worker.audio.validation import AudioLimits, validate_audio
+from sounds_right_worker.audio.header import id3v2_size, sniff_audio_header
+from sounds_right_worker.audio.validation import AudioLimits, prevalidate_audio, validate_audio
+from sounds_right_worker.audio.wav import pack_pcm16, unpack_pcm16, write_pcm16
 from sounds_right_worker.errors import (
     AUDIO_DURATION_TOO_LONG,
     AUDIO_TOO_LARGE,
@@ -74,3 +80,104 @@ def test_validate_audio_rejects_long_duration() -> None:
     with pytest.raises(PipelineError) as exc:
         validate_audio(probe, AudioLimits(max_size_bytes=104857600, max_duration_seconds=900))
     assert exc.value.error_code == AUDIO_DURATION_TOO_LONG
+
+
+def _probe(format_name: str, codec_name: str, sample_rate: int, channels: int) -> AudioProbeResult:
+    return AudioProbeResult(
+        duration_seconds=10.0,
+        size_bytes=320044,
+        format_name=format_name,
+        codec_name=codec_name,
+        sample_rate=sample_rate,
+        channels=channels,
+    )
+
+
+def test_is_normalized_only_for_16khz_mono_pcm_wav() -> None:
+    assert is_normalized(_probe("wav", "pcm_s16le", 16000, 1))
+    assert not is_normalized(_probe("wav", "pcm_s16le", 44100, 1))
+    assert not is_normalized(_probe("wav", "pcm_s16le", 16000, 2))
+    assert not is_normalized(_probe("wav", "pcm_f32le", 16000, 1))
+    assert not is_normalized(_probe("flac", "flac", 16000, 1))
+
+
+def test_pack_pcm16_round_trips_losslessly() -> None:
+    rng = np.random.default_rng(1)
+    samples = rng.integers(-32768, 32767, size=4000, dtype=np.int16)
+    samples[:4] = [32767, -32768, 32767, -32768]
+
+    restored, sample_rate = unpack_pcm16(pack_pcm16(samples, 16000))
+
+    assert sample_rate == 16000
+    assert np.array_equal(restored, samples)
+
+
+_LIMITS = AudioLimits(max_size_bytes=104857600, max_duration_seconds=900)
+
+
+def _mp3_with_xing(frames: int) -> bytes:
+    """ID3 tag, then an MPEG-1 layer III 128 kbit/s 44.1 kHz Xing frame and one more frame."""
+    tag = b"ID3\x04\x00\x00\x00\x00\x00\x0a" + bytes(10)
+    header = b"\xff\xfb\x90\x64"
+    xing = b"Xing" + (1).to_bytes(4, "big") + frames.to_bytes(4, "big")
+    frame = (header + bytes(32) + xing).ljust(417, b"\x00")
+    return tag + frame + header + bytes(100)
+
+
+def test_sniff_audio_header_reads_wav_and_flac(tmp_path: Path) -> None:
+    wav = tmp_path / "input.wav"
+    write_pcm16(wav, np.zeros(16000 * 3, dtype=np.int16), 16000)
+    # Block/frame size bounds, then rate, channels - 1, bits - 1 and total samples.
+    streaminfo = bytes(10) + (44100 << 44 | 1 << 41 | 15 << 36 | 44100 * 1200).to_bytes(8, "big")
+    flac = b"fLaC" + b"\x80\x00\x00\x22" + streaminfo + bytes(16)
+
+    wav_header = sniff_audio_header(wav.read_bytes()[:4096])
+    flac_header = sniff_audio_header(flac)
+
+    assert wav_header is not None
+    assert (wav_header.format_name, wav_header.codec_name) == ("wav", "pcm_s16le")
+    assert wav_header.duration_seconds == pytest.approx(3.0)
+    assert flac_header is not None
+    assert (flac_header.sample_rate, flac_header.channels) == (44100, 2)
+    assert flac_header.duration_seconds == pytest.approx(1200.0)
+
+
+def test_sniff_audio_header_reads_mp3_xing_frame_count() -> None:
+    data = _mp3_with_xing(frames=10000)
+    tag_size = id3v2_size(data)
+
+    header = sniff_audio_header(data[tag_size:])
+
+    assert tag_size == 20
+    assert header is not None
+    assert (header.codec_name, header.sample_rate) == ("mp3", 44100)
+    assert header.duration_seconds == pytest.approx(10000 * 1152 / 44100)
+
+
+def test_prevalidate_audio_rejects_before_download() -> None:
+    long_mp3 = sniff_audio_header(_mp3_with_xing(frames=40000)[20:])
+
+    with pytest.raises(PipelineError) as too_large:
+        prevalidate_audio(200_000_000, None, _LIMITS)
+    with pytest.raises(PipelineError) as too_long:
+        prevalidate_audio(5000, long_mp3, _LIMITS)
+    prevalidate_audio(5000, sniff_audio_header(_mp3_with_xing(frames=100)[20:]), _LIMITS)
+
+    assert too_large.value.error_code == AUDIO_TOO_LARGE
+    assert too_long.value.error_code == AUDIO_DURATION_TOO_LONG
+
+
+@pytest.mark.parametrize(
+    "head",
+    [
+        b"FORM\x00\x01\x00\x00AIFFCOMM" + bytes(64),
+        b"\x1aE\xdf\xa3\x9fB\x86\x81\x01B\xf7\x81\x01B\x82\x84webm" + bytes(64),
+        b"\xff\xf1\x50\x80\x02\x1f\xfc" + bytes(64),
+    ],
+    ids=["aiff", "webm", "adts-aac"],
+)
+def test_prevalidate_audio_leaves_unrecognised_formats_to_ffprobe(head: bytes) -> None:
+    header = sniff_audio_header(head)
+
+    assert header is None
+    prevalidate_audio(5000, header, _LIMITS)
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import sqlite3
+import uuid
+from pathlib import Path
+
+import pytest
+from aiokafka.errors import KafkaConnectionError
+from sounds_right_contracts.events import EventEnvelope, TranscriptionProgressPayload
+
+from sounds_right_worker.events.producer import EventProducer, EventProducerConfig
+from sounds_right_worker.events.spool import EventSpool, SpooledEvent
+
+
+class FakeKafkaProducer:
+    def __init__(self) -> None:
+        self.available = False
+        self.sent: list[bytes] = []
+
+    async def send_and_wait(
+        self,
+        topic: str,
+        *,
+        key: bytes,
+        value: bytes,
+        headers: list[tuple[str, bytes]],
+    ) -> None:
+        if not self.available:
+            raise KafkaConnectionError("broker unreachable")
+        self.sent.append(value)
+
+    async def send(
+        self,
+        topic: str,
+        *,
+        key: bytes,
+        value: bytes,
+        headers: list[tuple[str, bytes]],
+    ) -> asyncio.Future[None]:
+        delivery: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        if self.available:
+            self.sent.append(value)
+            delivery.set_result(None)
+        else:
+            delivery.set_exception(KafkaConnectionError("broker unreachable"))
+        return delivery
+
+
+class FlakySpool(EventSpool):
+    """Fails its first read, as a locked or briefly unavailable database would."""
+
+    failures = 1
+
+    def peek(self, limit: int) -> list[SpooledEvent]:
+        if self.failures:
+            self.failures -= 1
+            raise sqlite3.OperationalError("database is locked")
+        return super().peek(limit)
+
+
+def _producer(tmp_path: Path, kafka: FakeKafkaProducer, spool: EventSpool) -> EventProducer:
+    producer = EventProducer(
+        EventProducerConfig(
+            bootstrap_servers="redpanda:9092",
+            client_id="worker",
+            topic="sounds-right.events",
+            spool_path=str(tmp_path / "spool.sqlite3"),
+            spool_retry_seconds=0.01,
+        )
+    )
+    producer._producer = kafka
+    producer._spool = spool
+    return producer
+
+
+def _progress(job_id: uuid.UUID, progress: int) -> EventEnvelope:
+    return EventEnvelope(
+        event_type="transcription.progress",
+        correlation_id=uuid.uuid4(),
+        producer="worker-1",
+        payload=TranscriptionProgressPayload(
+            job_id=job_id,
+            track_version_id=uuid.uuid4(),
+            progress=progress,
+            stage="stage",
+            message="progress",
+        ),
+    )
+
+
+def test_spool_is_fifo_and_reports_depth(tmp_path: Path) -> None:
+    spool = EventSpool(tmp_path / "spool.sqlite3")
+    for index in range(3):
+        spool.append(b"key", f"event-{index}".encode(), "application/json")
+
+    assert [item.value for item in spool.peek(2)] == [b"event-0", b"event-1"]
+    assert spool.stats().depth == 3
+    spool.remove_through(spool.peek(2)[-1].seq)
+    spool.close()
+
+    reopened = EventSpool(tmp_path / "spool.sqlite3")
+    assert [item.value for item in reopened.peek(10)] == [b"event-2"]
+    reopened.remove_through(reopened.peek(10)[-1].seq)
+    assert reopened.stats().depth == 0
+    assert reopened.stats().oldest_age_seconds == 0
+
+
+def test_producer_spools_during_outage_and_replays_in_order(tmp_path: Path) -> None:
+    asyncio.run(run_outage(tmp_path))
+
+
+async def run_outage(tmp_path: Path) -> None:
+    kafka = FakeKafkaProducer()
+    producer = _producer(tmp_path, kafka, EventSpool(tmp_path / "spool.sqlite3"))
+    job_id = uuid.uuid4()
+    events = [_progress(job_id, progress) for progress in (10, 20, 30)]
+
+    await producer.publish(events[0], job_id)
+    await producer.publish(events[1], job_id)
+    kafka.available = True
+    # Still queued behind the spooled events to keep their order.
+    await producer.publish(events[2], job_id)
+    stats = await producer.spool_stats()
+    assert kafka.sent == []
+    assert stats is not None and stats.depth == 3
+
+    while await producer._replay_batch(kafka, producer._spool):
+        pass
+    await producer.publish(_progress(job_id, 40), job_id)
+
+    sent = [EventEnvelope.model_validate_json(value) for value in kafka.sent]
+    assert [event.event_id for event in sent[:3]] == [event.event_id for event in events]
+    assert len(sent) == 4
+    stats = await producer.spool_stats()
+    assert stats is not None and stats.depth == 0
+
+
+def test_spooling_logs_depth_and_age(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    caplog.set_level(logging.INFO, logger="sounds_right_worker.events.producer")
+    asyncio.run(run_spool_twice(tmp_path))
+
+    spooled = [record for record in caplog.records if "spooled event" in record.getMessage()]
+    assert [record.__dict__["spool_depth"] for record in spooled] == [1, 2]
+    assert all(record.__dict__["spool_oldest_age_seconds"] >= 0 for record in spooled)
+
+
+async def run_spool_twice(tmp_path: Path) -> None:
+    kafka = FakeKafkaProducer()
+    producer = _producer(tmp_path, kafka, EventSpool(tmp_path / "spool.sqlite3"))
+    job_id = uuid.uuid4()
+    await producer.publish(_progress(job_id, 10), job_id)
+    await producer.publish(_progress(job_id, 20), job_id)
+
+
+def test_replay_keeps_retrying_after_a_spool_error(
+    tmp_path: Path,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    caplog.set_level(logging.INFO, logger="sounds_right_worker.events.producer")
+    asyncio.run(run_flaky_replay(tmp_path))
+
+    assert any(
+        record.getMessage() == "event spool replay failed, will retry" and record.exc_info
+        for record in caplog.records
+    )
+
+
+async def run_flaky_replay(tmp_path: Path) -> None:
+    kafka = FakeKafkaProducer()
+    spool = FlakySpool(tmp_path / "spool.sqlite3")
+    producer = _producer(tmp_path, kafka, spool)
+    job_id = uuid.uuid4()
+    await producer.publish(_progress(job_id, 10), job_id)
+    kafka.available = True
+
+    replay = asyncio.create_task(producer._replay_spool(kafka, spool))
+    try:
+        async with asyncio.timeout(5):
+            while producer._backlog:
+                await asyncio.sleep(0.01)
+    finally:
+        replay.cancel()
+
+    assert len(kafka.sent) == 1
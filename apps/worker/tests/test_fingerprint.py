@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import asyncio
+import uuid
+from datetime import UTC, datetime
+from typing import cast
+
+import numpy as np
+import pytest
+
+from sounds_right_worker.audio.fingerprint import compute_fingerprint, match_fingerprints
+from sounds_right_worker.storage.minio_client import (
+    ObjectNotFoundError,
+    PreconditionFailedError,
+    StorageClient,
+)
+from sounds_right_worker.transcription.duplicates import (
+    DuplicateConfig,
+    FingerprintEntry,
+    FingerprintIndex,
+)
+from sounds_right_worker.transcription.parser import shift_transcript
+from sounds_right_worker.transcription.schemas import (
+    Transcript,
+    TranscriptEngine,
+    TranscriptMetadata,
+    TranscriptSegment,
+)
+
+_SAMPLE_RATE = 16000
+
+
+def _melody(seed: int, seconds: float = 40.0) -> np.ndarray:
+    """Random sequence of decaying harmonic notes over a little noise."""
+    rng = np.random.default_rng(seed)
+    notes: list[np.ndarray] = []
+    total = int(seconds * _SAMPLE_RATE)
+    while sum(len(note) for note in notes) < total:
+        frequency = rng.uniform(110, 880)
+        t = np.arange(int(rng.uniform(0.15, 0.6) * _SAMPLE_RATE)) / _SAMPLE_RATE
+        tone = sum(np.sin(2 * np.pi * frequency * h * t) / h for h in (1, 2, 3))
+        notes.append(tone * np.exp(-3 * t))
+    samples = np.concatenate(notes)[:total] + 0.05 * rng.standard_normal(total)
+    return (0.3 * samples).astype(np.float32)
+
+
+def _reencoded(samples: np.ndarray, start_seconds: float) -> np.ndarray:
+    """Trim the start, drop the level and smear the highs like a lossy re-encode."""
+    trimmed = samples[int(start_seconds * _SAMPLE_RATE) :] * 0.6
+    return np.convolve(trimmed, np.ones(4) / 4, mode="same").astype(np.float32)
+
+
+class FakeStorage:
+    def __init__(self) -> None:
+        self.objects: dict[str, bytes] = {}
+
+    async def object_etag(self, bucket: str, object_key: str) -> str | None:
+        # Yield like a real request would, so concurrent writers interleave.
+        await asyncio.sleep(0)
+        data = self.objects.get(object_key)
+        return None if data is None else str(hash(data))
+
+    async def download_bytes(self, bucket: str, object_key: str) -> bytes:
+        if object_key not in self.objects:
+            raise ObjectNotFoundError(object_key)
+        return self.objects[object_key]
+
+    async def upload_json(
+        self,
+        bucket: str,
+        object_key: str,
+        data: bytes,
+        *,
+        content_type: str = "application/json",
+        if_match: str | None = None,
+        if_none_match: bool = False,
+    ) -> None:
+        current = await self.object_etag(bucket, object_key)
+        if (if_none_match and current is not None) or (
+            if_match is not None and if_match != current
+        ):
+            raise PreconditionFailedError(object_key)
+        self.objects[object_key] = data
+
+
+def test_fingerprint_matches_trimmed_reencode_with_offset() -> None:
+    original = _melody(1)
+    reference = compute_fingerprint(original, _SAMPLE_RATE)
+
+    duplicate = match_fingerprints(
+        compute_fingerprint(_reencoded(original, 7.3), _SAMPLE_RATE), reference
+    )
+    unrelated = match_fingerprints(compute_fingerprint(_melody(2), _SAMPLE_RATE), reference)
+
+    assert duplicate.score > 0.1
+    assert duplicate.offset_seconds == pytest.approx(7.3, abs=0.05)
+    assert unrelated.score < 0.02
+
+
+def test_fingerprint_index_finds_near_duplicate() -> None:
+    asyncio.run(run_fingerprint_index())
+
+
+async def run_fingerprint_index() -> None:
+    index = FingerprintIndex(cast(StorageClient, FakeStorage()), "artifacts", DuplicateConfig())
+    original = _melody(1)
+    entries = [
+        FingerprintEntry(
+            track_version_id=uuid.uuid4(),
+            transcript_object_key=f"transcripts/{seed}/transcript.json",
+            duration_seconds=40.0,
+            audio_sha256=str(seed),
+        )
+        for seed in (1, 2)
+    ]
+    await index.add(compute_fingerprint(original, _SAMPLE_RATE), entries[0])
+    await index.add(compute_fingerprint(_melody(2), _SAMPLE_RATE), entries[1])
+
+    match = await index.find(compute_fingerprint(_reencoded(original, 5.0), _SAMPLE_RATE))
+    miss = await index.find(compute_fingerprint(_melody(3), _SAMPLE_RATE))
+
+    assert match is not None
+    assert match.entry == entries[0]
+    assert match.offset_seconds == pytest.approx(5.0, abs=0.05)
+    assert miss is None
+
+
+def test_fingerprint_index_keeps_concurrent_additions() -> None:
+    asyncio.run(run_concurrent_additions())
+
+
+async def run_concurrent_additions() -> None:
+    storage = FakeStorage()
+    # Two workers, each with its own shard cache, indexing at the same moment.
+    indexes = [
+        FingerprintIndex(cast(StorageClient, storage), "artifacts", DuplicateConfig())
+        for _ in range(2)
+    ]
+    entries = [
+        FingerprintEntry(
+            track_version_id=uuid.uuid4(),
+            transcript_object_key=f"transcripts/{seed}/transcript.json",
+            duration_seconds=40.0,
+            audio_sha256=str(seed),
+        )
+        for seed in (1, 2)
+    ]
+    melodies = [_melody(1), _melody(2)]
+
+    await asyncio.gather(
+        *(
+            index.add(compute_fingerprint(melody, _SAMPLE_RATE), entry)
+            for index, melody, entry in zip(indexes, melodies, entries, strict=True)
+        )
+    )
+
+    for melody, entry in zip(melodies, entries, strict=True):
+        match = await indexes[0].find(compute_fingerprint(_reencoded(melody, 3.0), _SAMPLE_RATE))
+        assert match is not None
+        assert match.entry == entry
+
+
+def test_shift_transcript_drops_lines_outside_the_duplicate() -> None:
+    transcript = Transcript(
+        schema_version="1.0",
+        track_version_id=uuid.uuid4(),
+        job_id=uuid.uuid4(),
+        engine=TranscriptEngine(name="whisper.cpp", model="base", language="en"),
+        metadata=TranscriptMetadata(
+            duration_seconds=30.0,
+            created_at=datetime.now(UTC),
+            word_count=6,
+            segment_count=3,
+        ),
+        text="intro line verse line outro line",
+        segments=[
+            TranscriptSegment(id=0, start=1.0, end=4.0, text="intro line"),
+            TranscriptSegment(id=1, start=6.0, end=9.0, text="verse line"),
+            TranscriptSegment(id=2, start=25.0, end=28.0, text="outro line"),
+        ],
+    )
+
+    result = shift_transcript(transcript, offset_seconds=5.0, duration_seconds=15.0)
+
+    assert [segment.text for segment in result.segments] == ["verse line"]
+    assert result.segments[0].start == pytest.approx(1.0)
+    assert result.language == "en"
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import asyncio
+import uuid
+from datetime import UTC, datetime, timedelta
+from typing import cast
+
+import pytest
+
+from sounds_right_worker.jobs.job_state import (
+    JobRecord,
+    JobRunningError,
+    JobStateConfig,
+    JobStateStore,
+)
+from sounds_right_worker.storage.minio_client import (
+    ObjectNotFoundError,
+    PreconditionFailedError,
+    StorageClient,
+)
+from sounds_right_worker.storage.object_keys import job_state_object_key
+
+
+class FakeStorage:
+    def __init__(self) -> None:
+        self.objects: dict[str, bytes] = {}
+
+    async def download_with_etag(self, bucket: str, object_key: str) -> tuple[bytes, str]:
+        data = self.objects.get(object_key)
+        # Answer after yielding, like a real request, so concurrent claims interleave.
+        await asyncio.sleep(0)
+        if data is None:
+            raise ObjectNotFoundError(object_key)
+        return data, str(hash(data))
+
+    async def upload_json(
+        self,
+        bucket: str,
+        object_key: str,
+        data: bytes,
+        *,
+        if_match: str | None = None,
+        if_none_match: bool = False,
+    ) -> str:
+        current = self.objects.get(object_key)
+        if (if_none_match and current is not None) or (
+            if_match is not None and (current is None or if_match != str(hash(current)))
+        ):
+            raise PreconditionFailedError(object_key)
+        self.objects[object_key] = data
+        return str(hash(data))
+
+    async def delete_object(self, bucket: str, object_key: str) -> None:
+        self.objects.pop(object_key, None)
+
+
+def _store(storage: FakeStorage, lease_seconds: float = 60) -> JobStateStore:
+    return JobStateStore(
+        cast(StorageClient, storage),
+        "artifacts",
+        JobStateConfig(cache_size=2, lease_seconds=lease_seconds),
+        "worker",
+    )
+
+
+def _stored(storage: FakeStorage, job_id: uuid.UUID) -> JobRecord:
+    return JobRecord.model_validate_json(storage.objects[job_state_object_key(job_id)])
+
+
+def test_redelivered_request_is_skipped_once_done() -> None:
+    asyncio.run(run_redelivered_done())
+
+
+async def run_redelivered_done() -> None:
+    storage = FakeStorage()
+    event_id, job_id = uuid.uuid4(), uuid.uuid4()
+
+    job = await _store(storage).claim(event_id, job_id)
+    assert job is not None
+    async with _store(storage).hold(job):
+        await _store(storage).finish(job, "transcription.completed")
+
+    assert _stored(storage, job_id).state == "done"
+    # A fresh worker (empty cache) still sees it through the durable record.
+    assert await _store(storage).claim(event_id, job_id) is None
+    # A new request for the same job runs again.
+    assert await _store(storage).claim(uuid.uuid4(), job_id) is not None
+
+
+def test_redelivery_of_job_running_in_process_waits_off_the_claim() -> None:
+    asyncio.run(run_attach())
+
+
+async def run_attach() -> None:
+    storage = FakeStorage()
+    store = _store(storage)
+    event_id, job_id = uuid.uuid4(), uuid.uuid4()
+    job = await store.claim(event_id, job_id)
+    assert job is not None
+
+    async def run_job() -> None:
+        async with store.hold(job):
+            await asyncio.sleep(0.01)
+            await store.finish(job, "transcription.completed")
+
+    running = asyncio.create_task(run_job())
+    await asyncio.sleep(0)
+    assert _stored(storage, job_id).state == "running"
+    with pytest.raises(JobRunningError):
+        await store.claim(event_id, job_id)
+
+    await store.wait(job_id)
+
+    assert running.done()
+    assert await store.claim(event_id, job_id) is None
+
+
+def test_job_running_elsewhere_is_not_waited_on() -> None:
+    asyncio.run(run_elsewhere())
+
+
+async def run_elsewhere() -> None:
+    storage = FakeStorage()
+    event_id, job_id = uuid.uuid4(), uuid.uuid4()
+    live = JobRecord(
+        job_id=job_id,
+        event_id=event_id,
+        state="running",
+        owner="other:1234",
+        updated_at=datetime.now(UTC),
+    )
+    storage.objects[job_state_object_key(job_id)] = live.model_dump_json().encode()
+    store = _store(storage, lease_seconds=0.2)
+
+    with pytest.raises(JobRunningError):
+        await asyncio.wait_for(store.claim(event_id, job_id), timeout=0.05)
+
+    # Once the other worker's heartbeat goes stale, the waiter may take over.
+    await asyncio.wait_for(store.wait(job_id), timeout=1)
+    job = await store.claim(event_id, job_id)
+    assert job is not None
+    assert _stored(storage, job_id).owner != "other:1234"
+
+
+def test_concurrent_claims_admit_one_worker() -> None:
+    asyncio.run(run_concurrent_claims())
+
+
+async def run_concurrent_claims() -> None:
+    storage = FakeStorage()
+    event_id, job_id = uuid.uuid4(), uuid.uuid4()
+
+    # Both workers read "no record" before either writes its claim.
+    results = await asyncio.gather(
+        _store(storage).claim(event_id, job_id),
+        _store(storage).claim(event_id, job_id),
+        return_exceptions=True,
+    )
+
+    claimed = [result for result in results if isinstance(result, JobRecord)]
+    assert len(claimed) == 1
+    assert sum(isinstance(result, JobRunningError) for result in results) == 1
+    assert _stored(storage, job_id).owner == claimed[0].owner
+
+
+def test_taken_over_owner_stops_writing() -> None:
+    asyncio.run(run_taken_over_owner())
+
+
+async def run_taken_over_owner() -> None:
+    storage = FakeStorage()
+    event_id, job_id = uuid.uuid4(), uuid.uuid4()
+    slow = _store(storage)
+    job = await slow.claim(event_id, job_id)
+    assert job is not None
+    taken_over = job.model_copy(update={"owner": "other:1234", "state": "running"})
+    storage.objects[job_state_object_key(job_id)] = taken_over.model_dump_json().encode()
+
+    await slow.finish(job, "transcription.completed")
+
+    assert _stored(storage, job_id).owner == "other:1234"
+
+
+def test_abandoned_claim_is_taken_over() -> None:
+    asyncio.run(run_takeover())
+
+
+async def run_takeover() -> None:
+    storage = FakeStorage()
+    event_id, job_id = uuid.uuid4(), uuid.uuid4()
+    stale = JobRecord(
+        job_id=job_id,
+        event_id=event_id,
+        state="running",
+        owner="gone:1234",
+        updated_at=datetime.now(UTC) - timedelta(seconds=120),
+    )
+    storage.objects[job_state_object_key(job_id)] = stale.model_dump_json().encode()
+
+    job = await _store(storage, lease_seconds=60).claim(event_id, job_id)
+
+    assert job is not None
+    assert _stored(storage, job_id).owner != "gone:1234"
+
+
+def test_failed_run_releases_claim() -> None:
+    asyncio.run(run_release())
+
+
+async def run_release() -> None:
+    storage = FakeStorage()
+    store = _store(storage)
+    job = await store.claim(uuid.uuid4(), uuid.uuid4())
+    assert job is not None
+
+    with pytest.raises(RuntimeError):
+        async with store.hold(job):
+            raise RuntimeError("producer unavailable")
+
+    assert storage.objects == {}
+    assert await store.claim(job.event_id, job.job_id) is not None
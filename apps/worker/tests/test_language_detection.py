@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from sounds_right_worker.audio.vad import VadConfig, select_vocal_window
+from sounds_right_worker.transcription.language import (
+    choose_language_model,
+    model_name_from_path,
+)
+from sounds_right_worker.transcription.schemas import LanguageDetection
+from sounds_right_worker.transcription.whisper_cpp import parse_language_detection
+
+_SAMPLE_RATE = 16000
+
+
+def test_parse_language_detection_reads_whisper_log() -> None:
+    output = "whisper_full_with_state: auto-detected language: de (p = 0.912345)\n"
+
+    detection = parse_language_detection(output)
+
+    assert detection is not None
+    assert detection.language == "de"
+    assert detection.confidence == pytest.approx(0.912345)
+
+
+def test_parse_language_detection_returns_none_without_match() -> None:
+    assert parse_language_detection("whisper_init_from_file: loading model") is None
+
+
+def test_choose_language_model_requires_confidence(tmp_path: Path) -> None:
+    model = tmp_path / "ggml-base.en.bin"
+    model.write_bytes(b"model")
+    models = {"en": model}
+
+    confident = choose_language_model(
+        LanguageDetection(language="en", confidence=0.95), models, 0.8
+    )
+    unsure = choose_language_model(LanguageDetection(language="en", confidence=0.5), models, 0.8)
+    unmapped = choose_language_model(LanguageDetection(language="pl", confidence=0.99), models, 0.8)
+
+    assert confident is not None
+    assert confident.name == "base.en"
+    assert confident.path == model
+    assert unsure is None
+    assert unmapped is None
+
+
+def test_model_name_from_path() -> None:
+    assert model_name_from_path(Path("/models/ggml-small.bin")) == "small"
+
+
+def test_select_vocal_window_finds_loudest_vocal_region() -> None:
+    quiet = np.zeros(20 * _SAMPLE_RATE, dtype=np.float32)
+    t = np.arange(10 * _SAMPLE_RATE) / _SAMPLE_RATE
+    vocal = (0.5 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
+    samples = np.concatenate([quiet, vocal, quiet])
+
+    window = select_vocal_window(samples, _SAMPLE_RATE, 10, VadConfig())
+
+    assert window.start == pytest.approx(20.0, abs=0.1)
+    assert window.duration == pytest.approx(10.0, abs=0.1)
+
+
+def test_select_vocal_window_shorter_than_a_frame() -> None:
+    t = np.arange(2 * _SAMPLE_RATE) / _SAMPLE_RATE
+    samples = (0.5 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
+
+    window = select_vocal_window(samples, _SAMPLE_RATE, 0.001, VadConfig(frame_ms=30))
+
+    assert window.duration == pytest.approx(0.001)
+    assert 0.0 <= window.start < 2.0
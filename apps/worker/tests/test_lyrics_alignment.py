@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import uuid
+
+import numpy as np
+import pytest
+
+from sounds_right_worker.transcription.alignment import (
+    AlignmentError,
+    AlignmentFeatures,
+    align_lyrics_text,
+    count_syllables,
+    parse_lyrics,
+)
+from sounds_right_worker.transcription.parser import build_transcript
+from sounds_right_worker.transcription.realign import realign_transcript
+from sounds_right_worker.transcription.schemas import Transcript
+
+_SAMPLE_RATE = 16000
+
+
+def _note(seconds: float, frequency: float) -> np.ndarray:
+    t = np.arange(int(seconds * _SAMPLE_RATE)) / _SAMPLE_RATE
+    tone = sum(np.sin(2 * np.pi * frequency * h * t) / h for h in (1, 2, 3))
+    return (0.4 * tone * np.minimum(1.0, t * 50)).astype(np.float32)
+
+
+def _rest(seconds: float) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    return (0.001 * rng.standard_normal(int(seconds * _SAMPLE_RATE))).astype(np.float32)
+
+
+def test_parse_lyrics_skips_blank_lines_and_punctuation() -> None:
+    lines = parse_lyrics("Hello  there,\n\n  Don't stop!\n")
+
+    assert [line.text for line in lines] == ["Hello there,", "Don't stop!"]
+    assert lines[1].words == ("Don't", "stop")
+
+
+def test_count_syllables_ignores_silent_e() -> None:
+    assert count_syllables("hello") == 2
+    assert count_syllables("there") == 1
+    assert count_syllables("little") == 2
+
+
+def test_align_lyrics_places_words_on_sung_notes() -> None:
+    # "Hel-lo there" then a rest, then "Go now": one note per syllable.
+    samples = np.concatenate(
+        [
+            _rest(2.0),
+            _note(0.3, 300),
+            _rest(0.05),
+            _note(0.3, 350),
+            _rest(0.05),
+            _note(0.5, 280),
+            _rest(3.0),
+            _note(0.4, 300),
+            _rest(0.05),
+            _note(0.6, 330),
+            _rest(2.0),
+        ]
+    )
+
+    features = AlignmentFeatures.from_samples(samples, _SAMPLE_RATE)
+
+    result = align_lyrics_text(features, "Hello there,\nGo now!", "en")
+
+    first, second = result.segments
+    assert first.text == "Hello there,"
+    assert [word.word for word in first.words] == ["Hello", "there"]
+    assert first.start == pytest.approx(2.0, abs=0.05)
+    assert first.words[1].start == pytest.approx(2.7, abs=0.05)
+    assert first.end == pytest.approx(3.2, abs=0.05)
+    assert second.start == pytest.approx(6.2, abs=0.05)
+    assert second.words[1].start == pytest.approx(6.65, abs=0.05)
+    assert all(word.confidence is not None for word in second.words)
+
+
+def test_align_lyrics_rejects_empty_lyrics() -> None:
+    with pytest.raises(AlignmentError):
+        align_lyrics_text(AlignmentFeatures.from_samples(_rest(1.0), _SAMPLE_RATE), "\n  \n", "en")
+
+
+def _three_line_song() -> tuple[np.ndarray, str]:
+    samples = np.concatenate(
+        [
+            _rest(1.0),
+            _note(0.4, 300),
+            _rest(0.05),
+            _note(0.5, 330),
+            _rest(2.0),
+            _note(0.4, 280),
+            _rest(0.05),
+            _note(0.6, 300),
+            _rest(2.0),
+            _note(0.5, 350),
+            _rest(0.05),
+            _note(0.4, 300),
+            _rest(1.0),
+        ]
+    )
+    return samples, "Run far\nGo now\nStay here"
+
+
+def _transcript(samples: np.ndarray, lyrics: str) -> Transcript:
+    features = AlignmentFeatures.from_samples(samples, _SAMPLE_RATE)
+    result = align_lyrics_text(features, lyrics, "en")
+    return build_transcript(
+        result,
+        schema_version="1.0",
+        track_version_id=uuid.uuid4(),
+        job_id=uuid.uuid4(),
+        engine_name="lyrics-dtw",
+        model="dtw-v1",
+        duration_seconds=len(samples) / _SAMPLE_RATE,
+    )
+
+
+def test_realign_keeps_unchanged_lines_and_aligns_edits_between_neighbours() -> None:
+    samples, lyrics = _three_line_song()
+    transcript = _transcript(samples, lyrics)
+    features = AlignmentFeatures.from_samples(samples, _SAMPLE_RATE)
+
+    outcome = realign_transcript(transcript, "Run far!\nGo home\nStay here", features)
+
+    first, middle, last = outcome.result.segments
+    assert outcome.realigned_segments == 1
+    assert outcome.reused_segments == 2
+    assert first.text == "Run far!"
+    assert (first.start, first.end) == (transcript.segments[0].start, transcript.segments[0].end)
+    assert (last.start, last.end) == (transcript.segments[2].start, transcript.segments[2].end)
+    assert [word.word for word in middle.words] == ["Go", "home"]
+    assert first.end <= middle.start < middle.end <= last.start
+    assert middle.start == pytest.approx(transcript.segments[1].start, abs=0.05)
+
+
+def test_realign_drops_deleted_lines() -> None:
+    samples, lyrics = _three_line_song()
+    transcript = _transcript(samples, lyrics)
+    features = AlignmentFeatures.from_samples(samples, _SAMPLE_RATE)
+
+    outcome = realign_transcript(transcript, "Run far\nStay here", features)
+
+    assert [segment.text for segment in outcome.result.segments] == ["Run far", "Stay here"]
+    assert outcome.realigned_segments == 0
+
+
+def test_alignment_features_round_trip() -> None:
+    samples, _ = _three_line_song()
+    features = AlignmentFeatures.from_samples(samples, _SAMPLE_RATE)
+
+    restored = AlignmentFeatures.from_bytes(features.to_bytes())
+
+    assert len(restored) == len(features)
+    assert np.allclose(restored.voicing, features.voicing, atol=1e-3)
@@ -2,8 +2,14 @@ from __future__ import annotations
 
 import uuid
 
+from sounds_right_contracts.word_timings import WordTimings
+
 from sounds_right_worker.audio.ffprobe import AudioProbeResult
-from sounds_right_worker.transcription.manifest import build_manifest, compute_sha256
+from sounds_right_worker.transcription.manifest import (
+    build_manifest,
+    compute_sha256,
+    manifest_artifact,
+)
 from sounds_right_worker.transcription.parser import build_transcript
 from sounds_right_worker.transcription.whisper_cpp import parse_whisper_output
 
@@ -62,3 +68,38 @@ def test_build_manifest_includes_transcript_artifact() -> None:
     assert manifest.engine.name == "whisper.cpp"
     assert manifest.audio.codec_name == "mp3"
     assert manifest.audio.sample_rate == 44100
+
+
+def test_build_manifest_records_word_timings_artifact() -> None:
+    transcript = _transcript()
+    probe = AudioProbeResult(
+        duration_seconds=3.25,
+        size_bytes=1000,
+        format_name="mp3",
+        codec_name="mp3",
+        sample_rate=44100,
+        channels=2,
+    )
+    timings = WordTimings.from_segments(transcript.segments).to_bytes()  # type: ignore[attr-defined]
+
+    manifest = build_manifest(
+        schema_version="1.0",
+        transcript=transcript,  # type: ignore[arg-type]
+        transcript_object_key="transcripts/x/transcript.json",
+        transcript_sha256="0" * 64,
+        probe=probe,
+        word_timings=manifest_artifact(
+            "transcripts/x/word-timings.bin",
+            timings,
+            "application/vnd.sounds-right.word-timings",
+            "gzip",
+        ),
+    )
+
+    artifact = manifest.artifacts.word_timings
+    assert artifact is not None
+    assert artifact.content_type == "application/vnd.sounds-right.word-timings"
+    assert artifact.content_encoding == "gzip"
+    # The hash is of the uncompressed layout, like the transcript's.
+    assert artifact.sha256 == compute_sha256(timings)
+    assert WordTimings.from_bytes(timings).segment_offsets == [0, 0]
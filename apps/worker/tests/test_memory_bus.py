@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import asyncio
+import uuid
+
+import pytest
+from pydantic import ValidationError
+from sounds_right_contracts.bus import MemoryRecord, get_memory_bus
+from sounds_right_contracts.events import (
+    EventEnvelope,
+    TranscriptionRequestedPayload,
+    decode_event,
+    event_headers,
+)
+
+from sounds_right_worker.config import WorkerSettings
+from sounds_right_worker.events.consumer import ConsumerConfig, consume_requested_events
+from sounds_right_worker.events.producer import EventProducer, EventProducerConfig
+from sounds_right_worker.jobs.mock import MockProfile, process_requested_event
+
+
+def test_mock_worker_round_trip_over_memory_bus() -> None:
+    get_memory_bus.cache_clear()
+    asyncio.run(run_round_trip())
+
+
+async def run_round_trip() -> None:
+    bus = get_memory_bus()
+    job_id = uuid.uuid4()
+    request = EventEnvelope(
+        event_type="transcription.requested",
+        correlation_id=uuid.uuid4(),
+        producer="sounds-right-api",
+        payload=TranscriptionRequestedPayload(
+            job_id=job_id,
+            track_version_id=uuid.uuid4(),
+            track_id=uuid.uuid4(),
+            artist_id=uuid.uuid4(),
+            audio_object_key="temp-audio/version/input.mp3",
+            original_audio_filename="song.mp3",
+            audio_content_type="audio/mpeg",
+            audio_size_bytes=123,
+            engine="whisper.cpp",
+            options={"language": "auto", "model": "base", "separate_vocals": False},
+        ),
+    )
+    await bus.producer().send_and_wait(
+        "commands",
+        request.model_dump_json().encode(),
+        str(job_id).encode(),
+        headers=event_headers(request.event_type),
+    )
+    producer = EventProducer(
+        EventProducerConfig(
+            bootstrap_servers="",
+            client_id="worker",
+            topic="events",
+            backend="memory",
+            transactional_id="worker-1",
+        )
+    )
+    consumer_config = ConsumerConfig(
+        bootstrap_servers="",
+        client_id="worker",
+        topic="commands",
+        group_id="workers",
+        backend="memory",
+        transactional=True,
+    )
+    await producer.start()
+    async for consumed in consume_requested_events(consumer_config):
+        await process_requested_event(
+            consumed.event, producer, "worker-1", MockProfile(step_delay_seconds=0), consumed.offset
+        )
+        break
+    await producer.stop()
+
+    projector = bus.consumer("events", group_id="projector")
+    await projector.start()
+    records: list[MemoryRecord] = []
+    async for record in projector:
+        records.append(record)
+        if len(records) == 6:
+            break
+    await projector.stop()
+
+    events = [decode_event(record.value, headers=record.headers) for record in records]
+    assert [event.event_type for event in events][-1] == "transcription.completed"
+    # The request's offset was committed with the completed event.
+    offsets = [bus.committed("workers", "commands", partition) for partition in range(4)]
+    assert [offset for offset in offsets if offset is not None] == [1]
+
+
+def test_memory_bus_requires_an_in_process_setup() -> None:
+    required = {
+        "KAFKA_BOOTSTRAP_SERVERS": "in-process",
+        "MINIO_ENDPOINT": "in-process",
+        "MINIO_ACCESS_KEY": "test",
+        "MINIO_SECRET_KEY": "test",
+        "MINIO_TEMP_AUDIO_BUCKET": "temp-audio",
+        "MINIO_TRANSCRIPTS_BUCKET": "transcripts",
+        "MINIO_ARTIFACTS_BUCKET": "artifacts",
+        "EVENT_BUS_BACKEND": "memory",
+    }
+
+    with pytest.raises(ValidationError, match="EVENT_BUS_IN_PROCESS"):
+        WorkerSettings.model_validate(required)
+    settings = WorkerSettings.model_validate({**required, "EVENT_BUS_IN_PROCESS": "true"})
+
+    assert settings.event_bus_backend == "memory"
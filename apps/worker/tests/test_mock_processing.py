@@ -1,24 +1,45 @@
 from __future__ import annotations
 
-import uuid
 import asyncio
+import random
+import time
+import uuid
+from pathlib import Path
 from typing import cast
 
-from sounds_right_worker.events.producer import EventProducer
-from sounds_right_worker.events.schemas import (
+import pytest
+from sounds_right_contracts.events import (
     EventEnvelope,
+    TranscriptionFailedPayload,
     TranscriptionRequestedPayload,
     TranscriptionStartedPayload,
 )
-from sounds_right_worker.main import process_requested_event
+
+from sounds_right_worker.config import WorkerSettings
+from sounds_right_worker.events.producer import ConsumedOffset, EventProducer
+from sounds_right_worker.jobs.mock import (
+    MockProfile,
+    MockWorker,
+    load_latency_samples,
+    parse_failure_rates,
+    process_requested_event,
+)
 
 
 class FakeProducer:
     def __init__(self) -> None:
         self.events: list[EventEnvelope] = []
-
-    async def publish(self, event: EventEnvelope, key: uuid.UUID) -> None:
+        self.commits: list[ConsumedOffset | None] = []
+
+    async def publish(
+        self,
+        event: EventEnvelope,
+        key: uuid.UUID,
+        *,
+        commit: ConsumedOffset | None = None,
+    ) -> None:
         self.events.append(event)
+        self.commits.append(commit)
 
 
 def test_mock_worker_emits_started_progress_and_completed() -> None:
@@ -49,7 +70,9 @@ async def run_mock_worker_success() -> None:
         ),
     )
 
-    await process_requested_event(event, cast(EventProducer, producer), "worker-1", False, 0)
+    await process_requested_event(
+        event, cast(EventProducer, producer), "worker-1", MockProfile(step_delay_seconds=0)
+    )
 
     event_types = [published.event_type for published in producer.events]
     assert event_types == [
@@ -91,10 +114,126 @@ async def run_mock_worker_failure() -> None:
         ),
     )
 
-    await process_requested_event(event, cast(EventProducer, producer), "worker-1", True, 0)
+    offset = ConsumedOffset("sounds-right.events", 0, 41, "sounds-right-workers")
+    profile = MockProfile(step_delay_seconds=0, failure_rates={"mock_failure": 1.0})
+    await process_requested_event(event, cast(EventProducer, producer), "worker-1", profile, offset)
 
     assert [published.event_type for published in producer.events] == [
         "transcription.started",
         "transcription.progress",
         "transcription.failed",
     ]
+    # Only the terminal event commits the request's offset.
+    assert producer.commits == [None, None, offset]
+
+
+def _requested() -> EventEnvelope:
+    return EventEnvelope(
+        event_type="transcription.requested",
+        correlation_id=uuid.uuid4(),
+        producer="sounds-right-api",
+        payload=TranscriptionRequestedPayload(
+            job_id=uuid.uuid4(),
+            track_version_id=uuid.uuid4(),
+            track_id=uuid.uuid4(),
+            artist_id=uuid.uuid4(),
+            audio_object_key="temp-audio/version/input.mp3",
+            original_audio_filename="song.mp3",
+            audio_content_type="audio/mpeg",
+            audio_size_bytes=123,
+            engine="whisper.cpp",
+            options={"language": "auto", "model": "base", "separate_vocals": False},
+        ),
+    )
+
+
+def test_mock_profile_draws_durations_and_failure_mix(tmp_path: Path) -> None:
+    samples_file = tmp_path / "durations.txt"
+    samples_file.write_text("# seconds\n40\n\n120.5\n")
+    profile = MockProfile(
+        latency_samples=load_latency_samples(samples_file),
+        time_scale=0.01,
+        failure_rates={"audio_download_failed": 0.2, "whisper_cpp_failed": 0.1},
+    )
+    rng = random.Random(7)
+
+    assert {profile.draw_duration(rng) for _ in range(50)} == {0.4, 1.205}
+    draws = [profile.draw_failure(rng) for _ in range(10_000)]
+    assert 0.17 < draws.count("audio_download_failed") / len(draws) < 0.23
+    assert 0.08 < draws.count("whisper_cpp_failed") / len(draws) < 0.12
+
+
+def test_failure_rates_accept_only_real_error_codes() -> None:
+    assert parse_failure_rates(" audio_download_failed=0.02, mock_failure=0.1,") == {
+        "audio_download_failed": 0.02,
+        "mock_failure": 0.1,
+    }
+    with pytest.raises(ValueError, match="unknown mock failure codes: whisper_failed"):
+        parse_failure_rates("whisper_failed=0.1")
+    with pytest.raises(ValueError, match="unknown mock failure codes"):
+        MockProfile(failure_rates={"whisper_failed": 0.1})
+    with pytest.raises(ValueError, match="expected error_code=probability"):
+        parse_failure_rates("whisper_cpp_failed=often")
+
+
+def test_malformed_failure_rates_setting_is_named() -> None:
+    settings = WorkerSettings.model_validate(
+        {
+            "KAFKA_BOOTSTRAP_SERVERS": "redpanda:9092",
+            "MINIO_ENDPOINT": "minio:9000",
+            "MINIO_ACCESS_KEY": "test",
+            "MINIO_SECRET_KEY": "test",
+            "MINIO_TEMP_AUDIO_BUCKET": "temp-audio",
+            "MINIO_TRANSCRIPTS_BUCKET": "transcripts",
+            "MINIO_ARTIFACTS_BUCKET": "artifacts",
+            "WORKER_MOCK_FAILURE_RATES": "whisper_cpp_failed",
+        }
+    )
+
+    with pytest.raises(ValueError, match="WORKER_MOCK_FAILURE_RATES"):
+        MockProfile.from_settings(settings)
+
+
+def test_late_failure_reports_progress_before_failing() -> None:
+    asyncio.run(run_late_failure())
+
+
+async def run_late_failure() -> None:
+    producer = FakeProducer()
+    profile = MockProfile(
+        step_delay_seconds=0,
+        progress_events=10,
+        failure_rates={"artifact_upload_failed": 1.0},
+    )
+    await process_requested_event(_requested(), cast(EventProducer, producer), "w", profile)
+
+    event_types = [published.event_type for published in producer.events]
+    assert event_types == [
+        "transcription.started",
+        *["transcription.progress"] * 10,
+        "transcription.failed",
+    ]
+    failed = producer.events[-1].payload
+    assert isinstance(failed, TranscriptionFailedPayload)
+    assert failed.error_code == "artifact_upload_failed"
+    assert failed.retryable
+
+
+def test_mock_worker_runs_jobs_concurrently() -> None:
+    asyncio.run(run_concurrent_jobs())
+
+
+async def run_concurrent_jobs() -> None:
+    producer = FakeProducer()
+    profile = MockProfile(step_delay_seconds=0.02, progress_events=4, concurrency=10)
+    worker = MockWorker(cast(EventProducer, producer), "worker-1", profile)
+
+    started = time.monotonic()
+    for _ in range(10):
+        await worker.submit(_requested())
+    await worker.drain()
+
+    # Ten 0.1 s jobs overlap instead of taking a second in sequence.
+    assert time.monotonic() - started < 0.5
+    completed = [e for e in producer.events if e.event_type == "transcription.completed"]
+    assert len(completed) == 10
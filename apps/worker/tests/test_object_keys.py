@@ -5,7 +5,9 @@ import uuid
 from sounds_right_worker.storage.object_keys import (
     input_extension,
     manifest_object_key,
+    seek_index_object_key,
     transcript_object_key,
+    word_timings_object_key,
 )
 
 
@@ -22,6 +24,13 @@ def test_manifest_object_key_is_deterministic() -> None:
     assert key == "transcripts/22222222-2222-2222-2222-222222222222/manifest.json"
 
 
+def test_player_artifacts_sit_beside_the_transcript() -> None:
+    version_id = uuid.UUID("33333333-3333-3333-3333-333333333333")
+    root = "transcripts/33333333-3333-3333-3333-333333333333"
+    assert seek_index_object_key("transcripts", version_id) == f"{root}/seek-index.json"
+    assert word_timings_object_key("transcripts", version_id) == f"{root}/word-timings.bin"
+
+
 def test_input_extension_from_key() -> None:
     assert input_extension("temp-audio/abc/input.mp3") == "mp3"
     assert input_extension("temp-audio/abc/input.WAV") == "wav"
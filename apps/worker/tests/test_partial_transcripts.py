@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import asyncio
+import uuid
+from typing import cast
+
+import pytest
+from sounds_right_contracts.events import (
+    EventEnvelope,
+    TranscriptionPartialPayload,
+    TranscriptionRequestedPayload,
+)
+
+from sounds_right_worker.audio.timemap import TimeMap, TimeSpan
+from sounds_right_worker.config import WorkerSettings
+from sounds_right_worker.events.producer import EventProducer
+from sounds_right_worker.jobs.partial import PartialBatchConfig, PartialTranscriptPublisher
+from sounds_right_worker.jobs.pipeline_events import PipelineEventPublisher
+from sounds_right_worker.transcription.schemas import WhisperSegment
+from sounds_right_worker.transcription.whisper_cpp import parse_segment_line
+
+
+class FakeProducer:
+    def __init__(self) -> None:
+        self.events: list[EventEnvelope] = []
+
+    async def publish(self, event: EventEnvelope, key: uuid.UUID) -> None:
+        self.events.append(event)
+
+
+def _requested() -> EventEnvelope:
+    return EventEnvelope(
+        event_type="transcription.requested",
+        correlation_id=uuid.uuid4(),
+        producer="sounds-right-api",
+        payload=TranscriptionRequestedPayload(
+            job_id=uuid.uuid4(),
+            track_version_id=uuid.uuid4(),
+            track_id=uuid.uuid4(),
+            artist_id=uuid.uuid4(),
+            audio_object_key="temp-audio/version/input.mp3",
+            original_audio_filename="song.mp3",
+            audio_content_type="audio/mpeg",
+            audio_size_bytes=123,
+            engine="whisper.cpp",
+            options={"language": "auto", "model": "base", "separate_vocals": False},
+        ),
+    )
+
+
+def test_parse_segment_line_reads_realtime_output() -> None:
+    segment = parse_segment_line("[00:01:02.500 --> 00:01:05.250]   hold the line\n")
+
+    assert segment is not None
+    assert segment.start == pytest.approx(62.5)
+    assert segment.end == pytest.approx(65.25)
+    assert segment.text == "hold the line"
+    assert parse_segment_line("whisper_print_timings: total time = 100 ms") is None
+
+
+def test_partial_publisher_batches_and_remaps_segments() -> None:
+    asyncio.run(run_partial_publisher())
+
+
+async def run_partial_publisher() -> None:
+    producer = FakeProducer()
+    events = PipelineEventPublisher(
+        WorkerSettings.model_construct(worker_name="worker-1"),
+        cast(EventProducer, producer),
+    )
+    event = _requested()
+    assert isinstance(event.payload, TranscriptionRequestedPayload)
+    partials = PartialTranscriptPublisher(
+        events,
+        event,
+        event.payload,
+        PartialBatchConfig(max_segments=2, interval_seconds=3600),
+        duration_seconds=20.0,
+        time_map=TimeMap((TimeSpan(5.0, 8.0), TimeSpan(12.0, 14.0))),
+    )
+
+    await partials.add(WhisperSegment(start=0.0, end=1.0, text="one"))
+    assert producer.events == []
+    await partials.add(WhisperSegment(start=1.0, end=3.0, text="two"))
+    await partials.add(WhisperSegment(start=3.0, end=4.0, text="three"))
+    await partials.flush()
+
+    assert [published.event_type for published in producer.events] == [
+        "transcription.partial",
+        "transcription.partial",
+    ]
+    first, second = (published.payload for published in producer.events)
+    assert isinstance(first, TranscriptionPartialPayload)
+    assert isinstance(second, TranscriptionPartialPayload)
+    assert [segment.text for segment in first.segments] == ["one", "two"]
+    assert first.segments[0].start == pytest.approx(5.0)
+    assert second.sequence == 1
+    assert second.segments[0].start == pytest.approx(12.0)
+    assert second.decoded_seconds == pytest.approx(13.0)
+    assert 40 <= first.progress <= second.progress < 80
+    assert partials.published_batches == 2
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from sounds_right_worker.audio.timemap import TimeMap, TimeSpan
+from sounds_right_worker.audio.vad import VadConfig, detect_voiced_spans, trim_silence
+from sounds_right_worker.audio.wav import read_pcm16, write_pcm16
+from sounds_right_worker.transcription.parser import remap_result
+from sounds_right_worker.transcription.schemas import (
+    WhisperCppResult,
+    WhisperSegment,
+    WhisperWord,
+)
+
+_SAMPLE_RATE = 16000
+
+
+def _tone(seconds: float, frequency: float = 440.0) -> np.ndarray:
+    t = np.arange(int(seconds * _SAMPLE_RATE)) / _SAMPLE_RATE
+    return (0.5 * np.sin(2 * np.pi * frequency * t)).astype(np.float32)
+
+
+def _silence(seconds: float) -> np.ndarray:
+    return np.zeros(int(seconds * _SAMPLE_RATE), dtype=np.float32)
+
+
+def test_detect_voiced_spans_skips_long_silences() -> None:
+    samples = np.concatenate([_silence(5), _tone(3), _silence(4), _tone(2), _silence(1)])
+
+    spans = detect_voiced_spans(samples, _SAMPLE_RATE, VadConfig(padding_seconds=0.0))
+
+    assert len(spans) == 2
+    assert spans[0].start == pytest.approx(5.0, abs=0.05)
+    assert spans[0].end == pytest.approx(8.0, abs=0.05)
+    assert spans[1].start == pytest.approx(12.0, abs=0.05)
+    assert spans[1].end == pytest.approx(14.0, abs=0.05)
+
+
+def test_detect_voiced_spans_keeps_short_gaps() -> None:
+    samples = np.concatenate([_tone(2), _silence(1), _tone(2)])
+
+    spans = detect_voiced_spans(samples, _SAMPLE_RATE, VadConfig(min_silence_seconds=2.0))
+
+    assert len(spans) == 1
+
+
+def test_trim_silence_writes_shorter_wav(tmp_path: Path) -> None:
+    samples = np.concatenate([_silence(6), _tone(3), _silence(6)])
+    source = tmp_path / "input.wav"
+    trimmed = tmp_path / "trimmed.wav"
+    write_pcm16(source, (samples * 32767).astype(np.int16), _SAMPLE_RATE)
+
+    time_map = trim_silence(source, trimmed, VadConfig())
+
+    assert time_map is not None
+    pcm, sample_rate = read_pcm16(trimmed)
+    assert sample_rate == _SAMPLE_RATE
+    assert len(pcm) / sample_rate == pytest.approx(time_map.kept_seconds, abs=0.01)
+    assert time_map.kept_seconds < 5
+
+
+def test_trim_silence_skips_when_nothing_to_remove(tmp_path: Path) -> None:
+    source = tmp_path / "input.wav"
+    write_pcm16(source, (_tone(4) * 32767).astype(np.int16), _SAMPLE_RATE)
+
+    assert trim_silence(source, tmp_path / "trimmed.wav", VadConfig()) is None
+
+
+def test_time_map_restores_original_timestamps() -> None:
+    time_map = TimeMap((TimeSpan(5.0, 8.0), TimeSpan(12.0, 14.0)))
+
+    assert time_map.to_original(0.0) == pytest.approx(5.0)
+    assert time_map.to_original(2.5) == pytest.approx(7.5)
+    assert time_map.to_original(3.0) == pytest.approx(12.0)
+    assert time_map.to_original(3.0, end=True) == pytest.approx(8.0)
+    assert time_map.to_original(4.5) == pytest.approx(13.5)
+
+
+def test_remap_result_moves_segments_and_words() -> None:
+    time_map = TimeMap((TimeSpan(5.0, 8.0), TimeSpan(12.0, 14.0)))
+    result = WhisperCppResult(
+        language="en",
+        segments=[
+            WhisperSegment(
+                start=0.0,
+                end=3.0,
+                text="first line",
+                words=[WhisperWord(word="first", start=0.0, end=1.0)],
+            ),
+            WhisperSegment(start=3.0, end=5.0, text="second line"),
+        ],
+    )
+
+    remapped = remap_result(result, time_map)
+
+    assert remapped.segments[0].start == pytest.approx(5.0)
+    assert remapped.segments[0].end == pytest.approx(8.0)
+    assert remapped.segments[0].words[0].end == pytest.approx(6.0)
+    assert remapped.segments[1].start == pytest.approx(12.0)
+    assert remapped.segments[1].end == pytest.approx(14.0)
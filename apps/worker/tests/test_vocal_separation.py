@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import asyncio
+import os
+from pathlib import Path
+from typing import cast
+
+import numpy as np
+import pytest
+
+from sounds_right_worker.audio.separation import (
+    SeparationConfig,
+    VocalSeparator,
+    plan_chunks,
+    stitch_chunks,
+)
+from sounds_right_worker.audio.wav import write_pcm16
+from sounds_right_worker.errors import PipelineError
+from sounds_right_worker.storage.minio_client import ObjectNotFoundError, StorageClient
+
+# Fails the first chunk once the other chunks' separators are running; those
+# record their PIDs and sleep as long-running Demucs processes would.
+_FAKE_DEMUCS = """#!/bin/sh
+for chunk; do :; done
+case "$chunk" in
+  *chunk_0000.wav)
+    while [ "$(wc -l < "$SEPARATOR_PIDS" 2>/dev/null || echo 0)" -lt 2 ]; do sleep 0.05; done
+    exit 1 ;;
+esac
+echo $$ >> "$SEPARATOR_PIDS"
+exec sleep 60
+"""
+# Stands in for ffmpeg: copies its input (the argument after ``-i``) to its output.
+_FAKE_FFMPEG = """#!/bin/sh
+while [ "$1" != "-i" ]; do shift; done
+source="$2"
+for output; do :; done
+cp "$source" "$output"
+"""
+
+
+class EmptyStorage:
+    async def download_bytes(self, bucket: str, object_key: str) -> bytes:
+        raise ObjectNotFoundError(object_key)
+
+
+def test_plan_chunks_overlaps_and_covers_the_audio() -> None:
+    spans = plan_chunks(250, 10, chunk_seconds=10, overlap_seconds=2)
+
+    assert spans == [(0, 100), (80, 180), (160, 250)]
+
+
+def test_plan_chunks_short_audio_is_one_chunk() -> None:
+    assert plan_chunks(50, 10, chunk_seconds=10, overlap_seconds=2) == [(0, 50)]
+
+
+def test_stitch_chunks_reconstructs_identical_overlaps() -> None:
+    signal = np.sin(np.linspace(0, 40, 250)).astype(np.float32)
+    spans = plan_chunks(len(signal), 10, chunk_seconds=10, overlap_seconds=2)
+
+    stitched = stitch_chunks([signal[start:end] for start, end in spans], spans, len(signal))
+
+    assert np.allclose(stitched, signal, atol=1e-5)
+
+
+def test_stitch_chunks_crossfades_between_differing_chunks() -> None:
+    spans = plan_chunks(200, 10, chunk_seconds=12, overlap_seconds=4)
+    chunks = [
+        np.full(end - start, float(index), dtype=np.float32)
+        for index, (start, end) in enumerate(spans)
+    ]
+
+    stitched = stitch_chunks(chunks, spans, 200)
+
+    overlap = stitched[spans[1][0] : spans[0][1]]
+    assert stitched[0] == 0.0
+    assert np.all(np.diff(overlap) > 0)
+    assert stitched[spans[0][1]] == 1.0
+
+
+def test_stitch_chunks_keeps_stereo_channels() -> None:
+    left = np.sin(np.linspace(0, 40, 250)).astype(np.float32)
+    signal = np.stack([left, -left], axis=1)
+    spans = plan_chunks(len(signal), 10, chunk_seconds=10, overlap_seconds=2)
+
+    stitched = stitch_chunks([signal[start:end] for start, end in spans], spans, len(signal))
+
+    assert stitched.shape == (250, 2)
+    assert np.allclose(stitched, signal, atol=1e-5)
+
+
+def _script(path: Path, content: str) -> Path:
+    path.write_text(content)
+    path.chmod(0o755)
+    return path
+
+
+def _is_running(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    return True
+
+
+def test_failed_chunk_stops_the_other_separators(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    pids = tmp_path / "pids"
+    monkeypatch.setenv("SEPARATOR_PIDS", str(pids))
+    source = tmp_path / "source.wav"
+    write_pcm16(source, np.zeros((300, 2), dtype=np.int16), 10)
+    work_dir = tmp_path / "work"
+    config = SeparationConfig(
+        binary=str(_script(tmp_path / "demucs", _FAKE_DEMUCS)),
+        chunk_seconds=10,
+        overlap_seconds=0,
+        jobs=3,
+        ffmpeg_path=str(_script(tmp_path / "ffmpeg", _FAKE_FFMPEG)),
+    )
+    separator = VocalSeparator(
+        config,
+        cast(StorageClient, EmptyStorage()),
+        "artifacts",
+    )
+
+    with pytest.raises(PipelineError):
+        asyncio.run(separator.vocals(source, work_dir, "a" * 64))
+
+    started = [int(line) for line in pids.read_text().split()]
+    assert len(started) == 2
+    assert not any(_is_running(pid) for pid in started)
@@ -14,6 +14,14 @@ mc mb --ignore-existing "local/${MINIO_TRANSCRIPTS_BUCKET}"
 mc mb --ignore-existing "local/${MINIO_ARTIFACTS_BUCKET}"
 mc mb --ignore-existing "local/${MINIO_PUBLIC_BUCKET}"
 
+# Expire worker job state records (jobs/{job_id}/state.json). They only dedupe
+# redelivered requests, so they must outlive the commands topic retention.
+job_state_days="${MINIO_JOB_STATE_EXPIRE_DAYS:-7}"
+if ! mc ilm rule ls "local/${MINIO_ARTIFACTS_BUCKET}" 2>/dev/null | grep -q "jobs/"; then
+	mc ilm rule add --prefix "jobs/" --expire-days "${job_state_days}" "local/${MINIO_ARTIFACTS_BUCKET}" ||
+		echo "failed to add job state expiry to ${MINIO_ARTIFACTS_BUCKET}"
+fi
+
 # Determine CORS selection mode. Use MINIO_CORS_MODE if set (local|production),
 # otherwise fall back to auto-detection using MINIO_API_CORS_ALLOW_ORIGIN.
 if [ -n "${MINIO_CORS_MODE:-}" ]; then
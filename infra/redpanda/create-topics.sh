@@ -3,5 +3,7 @@ set -eu
 
 BROKERS="${KAFKA_BOOTSTRAP_SERVERS:-redpanda:9092}"
 TOPIC="${KAFKA_TOPIC:-sounds-right.events}"
+COMMANDS_TOPIC="${KAFKA_COMMANDS_TOPIC:-sounds-right.commands}"
 
 rpk topic create "$TOPIC" --brokers "$BROKERS" --partitions 3 --replicas 1 || true
+rpk topic create "$COMMANDS_TOPIC" --brokers "$BROKERS" --partitions 3 --replicas 1 || true
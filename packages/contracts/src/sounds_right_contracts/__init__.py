@@ -0,0 +1 @@
+"""Sounds Right contracts shared by the API and the worker."""
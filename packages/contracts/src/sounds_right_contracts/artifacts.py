@@ -0,0 +1,75 @@
+"""Storage encodings for JSON artifacts: transcripts, manifests, public files.
+
+Artifacts are stored as compact JSON, optionally compressed, with the
+object's ``Content-Encoding`` naming the compression. HTTP clients and
+browsers fetching an object may therefore hand back either the stored bytes
+or already-decoded JSON; ``decode_artifact`` accepts both, recognising gzip
+and zstd frames by their magic numbers (JSON text never starts with them).
+
+gzip needs nothing extra; zstd needs the optional ``zstd`` extra.
+"""
+
+from __future__ import annotations
+
+import gzip
+import zlib
+from typing import Any
+
+IDENTITY_ENCODING = "identity"
+GZIP_ENCODING = "gzip"
+ZSTD_ENCODING = "zstd"
+ARTIFACT_ENCODINGS = (IDENTITY_ENCODING, GZIP_ENCODING, ZSTD_ENCODING)
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+_GZIP_LEVEL = 6
+_ZSTD_LEVEL = 10
+
+
+class ArtifactEncodingError(ValueError):
+    """An artifact could not be compressed or decompressed."""
+
+
+def encode_artifact(data: bytes, encoding: str) -> bytes:
+    """Compress serialized ``data`` for storage with ``encoding``."""
+    if encoding == IDENTITY_ENCODING:
+        return data
+    if encoding == GZIP_ENCODING:
+        # A fixed mtime keeps the stored bytes (and ETag) stable for equal input.
+        return gzip.compress(data, compresslevel=_GZIP_LEVEL, mtime=0)
+    if encoding == ZSTD_ENCODING:
+        compressed: bytes = _zstd().ZstdCompressor(level=_ZSTD_LEVEL).compress(data)
+        return compressed
+    raise ArtifactEncodingError(f"unsupported artifact encoding {encoding!r}")
+
+
+def content_encoding_header(encoding: str) -> str | None:
+    """The ``Content-Encoding`` to store with an artifact (none for identity)."""
+    return None if encoding == IDENTITY_ENCODING else encoding
+
+
+def decode_artifact(data: bytes) -> bytes:
+    """Return the serialized artifact, decompressing it when it is compressed."""
+    if data.startswith(_GZIP_MAGIC):
+        try:
+            return gzip.decompress(data)
+        except (OSError, EOFError, zlib.error) as exc:
+            raise ArtifactEncodingError("corrupt gzip artifact") from exc
+    if data.startswith(_ZSTD_MAGIC):
+        zstd = _zstd()
+        try:
+            decompressed: bytes = zstd.ZstdDecompressor().decompress(data)
+        except zstd.ZstdError as exc:
+            raise ArtifactEncodingError("corrupt zstd artifact") from exc
+        return decompressed
+    return data
+
+
+def _zstd() -> Any:
+    try:
+        import zstandard  # type: ignore[import-not-found,unused-ignore]
+    except ImportError as exc:
+        raise ArtifactEncodingError(
+            "zstd artifacts need the `sounds-right-contracts[zstd]` extra"
+        ) from exc
+    return zstandard
@@ -0,0 +1,418 @@
+"""Event bus interface and its in-process backend.
+
+The API and the worker use only the small part of the aiokafka producer and
+consumer interface described by ``BusProducer`` and ``BusConsumer``, so Kafka
+clients can be swapped for ``MemoryBus`` clients. ``MemoryBus`` keeps Kafka's
+model: keyed records land on a fixed partition in order, consumer groups split
+a topic's partitions between members and resume from committed offsets, and
+transactions make sends and offset commits visible together or not at all.
+
+It only connects clients in the same process.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import itertools
+import time
+import zlib
+from collections.abc import AsyncIterator, Awaitable, Mapping, Sequence
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Protocol
+
+Headers = Sequence[tuple[str, bytes]]
+# aiokafka's TopicPartition is a (topic, partition) named tuple.
+TopicPartitionKey = tuple[str, int]
+
+DEFAULT_PARTITIONS = 4
+# Records kept per partition; older ones are dropped as in a size-capped log.
+DEFAULT_RETENTION = 100_000
+
+
+class BusMessage(Protocol):
+    @property
+    def topic(self) -> str: ...
+
+    @property
+    def partition(self) -> int: ...
+
+    @property
+    def offset(self) -> int: ...
+
+    @property
+    def key(self) -> bytes | None: ...
+
+    @property
+    def value(self) -> bytes: ...
+
+    @property
+    def headers(self) -> Headers: ...
+
+
+class BusProducer(Protocol):
+    async def start(self) -> None: ...
+
+    async def stop(self) -> None: ...
+
+    async def send(
+        self,
+        topic: str,
+        value: bytes,
+        key: bytes | None = None,
+        *,
+        headers: Headers | None = None,
+    ) -> Awaitable[Any]: ...
+
+    async def send_and_wait(
+        self,
+        topic: str,
+        value: bytes,
+        key: bytes | None = None,
+        *,
+        headers: Headers | None = None,
+    ) -> Any: ...
+
+    def transaction(self) -> contextlib.AbstractAsyncContextManager[Any]: ...
+
+    async def send_offsets_to_transaction(
+        self,
+        offsets: Mapping[Any, int],
+        group_id: str,
+    ) -> None: ...
+
+
+class BusConsumer(Protocol):
+    async def start(self) -> None: ...
+
+    async def stop(self) -> None: ...
+
+    def __aiter__(self) -> AsyncIterator[BusMessage]: ...
+
+    async def commit(self, offsets: Mapping[Any, int] | None = None) -> None: ...
+
+
+@dataclass(frozen=True)
+class MemoryRecord:
+    topic: str
+    partition: int
+    offset: int
+    key: bytes | None
+    value: bytes
+    headers: tuple[tuple[str, bytes], ...]
+    timestamp: float
+
+
+@dataclass(frozen=True)
+class GroupLag:
+    records: int
+    # Seconds the oldest record not yet committed by the group has waited.
+    oldest_age_seconds: float
+
+
+class _Log:
+    def __init__(self, retention: int) -> None:
+        self.records: list[MemoryRecord] = []
+        self.start_offset = 0
+        self._retention = retention
+
+    @property
+    def end_offset(self) -> int:
+        return self.start_offset + len(self.records)
+
+    def append(self, record: MemoryRecord) -> None:
+        self.records.append(record)
+        # Trim in chunks so appends stay amortized O(1).
+        excess = len(self.records) - self._retention
+        if excess > self._retention // 10:
+            del self.records[:excess]
+            self.start_offset += excess
+
+    def read(self, offset: int) -> MemoryRecord | None:
+        offset = max(offset, self.start_offset)
+        if offset >= self.end_offset:
+            return None
+        return self.records[offset - self.start_offset]
+
+
+@dataclass
+class _Group:
+    members: list[MemoryConsumer] = field(default_factory=list)
+    committed: dict[TopicPartitionKey, int] = field(default_factory=dict)
+
+
+class MemoryBus:
+    """Topics, partitions and consumer groups held in this process."""
+
+    def __init__(
+        self,
+        partitions: int = DEFAULT_PARTITIONS,
+        retention: int = DEFAULT_RETENTION,
+    ) -> None:
+        self._partitions = partitions
+        self._retention = retention
+        self._topics: dict[str, list[_Log]] = {}
+        self._groups: dict[str, _Group] = {}
+        self._consumers: set[MemoryConsumer] = set()
+        self._unkeyed = itertools.count()
+
+    def producer(self) -> MemoryProducer:
+        return MemoryProducer(self)
+
+    def consumer(
+        self,
+        *topics: str,
+        group_id: str,
+        enable_auto_commit: bool = True,
+    ) -> MemoryConsumer:
+        """A group member reading ``topics`` from the committed offsets (else the start)."""
+        return MemoryConsumer(self, topics, group_id, enable_auto_commit)
+
+    def committed(self, group_id: str, topic: str, partition: int) -> int | None:
+        group = self._groups.get(group_id)
+        return None if group is None else group.committed.get((topic, partition))
+
+    def end_offsets(self, topic: str) -> list[int]:
+        return [log.end_offset for log in self._logs(topic)]
+
+    def group_lag(self, group_id: str, topic: str) -> GroupLag:
+        """Records of ``topic`` past the group's committed offsets, and their age."""
+        records = 0
+        oldest: float | None = None
+        for partition, log in enumerate(self._logs(topic)):
+            committed = self.committed(group_id, topic, partition) or 0
+            pending = log.read(committed)
+            if pending is None:
+                continue
+            records += log.end_offset - pending.offset
+            oldest = pending.timestamp if oldest is None else min(oldest, pending.timestamp)
+        age = max(time.time() - oldest, 0.0) if oldest is not None else 0.0
+        return GroupLag(records=records, oldest_age_seconds=age)
+
+    def _logs(self, topic: str) -> list[_Log]:
+        logs = self._topics.get(topic)
+        if logs is None:
+            logs = [_Log(self._retention) for _ in range(self._partitions)]
+            self._topics[topic] = logs
+        return logs
+
+    def _append(
+        self,
+        topic: str,
+        key: bytes | None,
+        value: bytes,
+        headers: Headers | None,
+    ) -> MemoryRecord:
+        logs = self._logs(topic)
+        ordinal = zlib.crc32(key) if key is not None else next(self._unkeyed)
+        partition = ordinal % len(logs)
+        log = logs[partition]
+        record = MemoryRecord(
+            topic=topic,
+            partition=partition,
+            offset=log.end_offset,
+            key=key,
+            value=value,
+            headers=tuple(headers or ()),
+            timestamp=time.time(),
+        )
+        log.append(record)
+        for consumer in self._consumers:
+            if topic in consumer.topics:
+                consumer._wakeup.set()
+        return record
+
+    def _read(self, topic_partition: TopicPartitionKey, offset: int) -> MemoryRecord | None:
+        topic, partition = topic_partition
+        return self._logs(topic)[partition].read(offset)
+
+    def _commit(self, group_id: str, offsets: Mapping[Any, int]) -> None:
+        committed = self._groups.setdefault(group_id, _Group()).committed
+        for (topic, partition), offset in offsets.items():
+            committed[(topic, partition)] = offset
+
+    def _join(self, consumer: MemoryConsumer) -> None:
+        group = self._groups.setdefault(consumer.group_id, _Group())
+        group.members.append(consumer)
+        self._consumers.add(consumer)
+        self._rebalance(group)
+
+    def _leave(self, consumer: MemoryConsumer) -> None:
+        group = self._groups[consumer.group_id]
+        group.members.remove(consumer)
+        self._consumers.discard(consumer)
+        self._rebalance(group)
+
+    def _rebalance(self, group: _Group) -> None:
+        for member in group.members:
+            if member._auto_commit:
+                self._commit(member.group_id, member._positions)
+        # Each topic's partitions go round-robin to the members subscribed to it.
+        assignments: dict[int, set[TopicPartitionKey]] = {id(m): set() for m in group.members}
+        topics = sorted({topic for member in group.members for topic in member.topics})
+        for topic in topics:
+            subscribed = [m for m in group.members if topic in m.topics]
+            for partition in range(len(self._logs(topic))):
+                member = subscribed[partition % len(subscribed)]
+                assignments[id(member)].add((topic, partition))
+        for member in group.members:
+            member._assign(assignments[id(member)], group.committed)
+
+
+class MemoryProducer:
+    """``BusProducer`` appending to a ``MemoryBus``; sends complete immediately."""
+
+    def __init__(self, bus: MemoryBus) -> None:
+        self._bus = bus
+        self._transaction: _Transaction | None = None
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    async def send(
+        self,
+        topic: str,
+        value: bytes,
+        key: bytes | None = None,
+        *,
+        headers: Headers | None = None,
+    ) -> asyncio.Future[MemoryRecord | None]:
+        delivery: asyncio.Future[MemoryRecord | None] = asyncio.get_running_loop().create_future()
+        if self._transaction is not None:
+            self._transaction.sends.append((topic, key, value, headers))
+            delivery.set_result(None)
+        else:
+            delivery.set_result(self._bus._append(topic, key, value, headers))
+        return delivery
+
+    async def send_and_wait(
+        self,
+        topic: str,
+        value: bytes,
+        key: bytes | None = None,
+        *,
+        headers: Headers | None = None,
+    ) -> MemoryRecord | None:
+        return await (await self.send(topic, value, key, headers=headers))
+
+    @contextlib.asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        """Apply the block's sends and offset commits together when it exits cleanly."""
+        if self._transaction is not None:
+            raise RuntimeError("a transaction is already in progress")
+        transaction = self._transaction = _Transaction()
+        try:
+            yield
+        finally:
+            self._transaction = None
+        for topic, key, value, headers in transaction.sends:
+            self._bus._append(topic, key, value, headers)
+        for group_id, offsets in transaction.offsets:
+            self._bus._commit(group_id, offsets)
+
+    async def send_offsets_to_transaction(
+        self,
+        offsets: Mapping[Any, int],
+        group_id: str,
+    ) -> None:
+        if self._transaction is None:
+            raise RuntimeError("no transaction in progress")
+        self._transaction.offsets.append((group_id, dict(offsets)))
+
+
+@dataclass
+class _Transaction:
+    sends: list[tuple[str, bytes | None, bytes, Headers | None]] = field(default_factory=list)
+    offsets: list[tuple[str, dict[Any, int]]] = field(default_factory=list)
+
+
+class MemoryConsumer:
+    """``BusConsumer`` for one member of a ``MemoryBus`` consumer group.
+
+    With auto-commit, positions are committed each time the next record is
+    requested and when the consumer stops.
+    """
+
+    def __init__(
+        self,
+        bus: MemoryBus,
+        topics: Sequence[str],
+        group_id: str,
+        enable_auto_commit: bool,
+    ) -> None:
+        self.topics = frozenset(topics)
+        self.group_id = group_id
+        self._bus = bus
+        self._auto_commit = enable_auto_commit
+        self._positions: dict[TopicPartitionKey, int] = {}
+        self._wakeup = asyncio.Event()
+        self._running = False
+        # Partition to look at first on the next poll, for fairness.
+        self._cursor = 0
+
+    async def start(self) -> None:
+        self._running = True
+        self._bus._join(self)
+
+    async def stop(self) -> None:
+        if not self._running:
+            return
+        if self._auto_commit:
+            self._bus._commit(self.group_id, self._positions)
+        self._running = False
+        self._bus._leave(self)
+        self._wakeup.set()
+
+    def assignment(self) -> frozenset[TopicPartitionKey]:
+        return frozenset(self._positions)
+
+    async def commit(self, offsets: Mapping[Any, int] | None = None) -> None:
+        self._bus._commit(self.group_id, self._positions if offsets is None else offsets)
+
+    def __aiter__(self) -> AsyncIterator[MemoryRecord]:
+        return self
+
+    async def __anext__(self) -> MemoryRecord:
+        if self._running and self._auto_commit:
+            self._bus._commit(self.group_id, self._positions)
+        while self._running:
+            record = self._poll()
+            if record is not None:
+                self._positions[(record.topic, record.partition)] = record.offset + 1
+                return record
+            self._wakeup.clear()
+            await self._wakeup.wait()
+        raise StopAsyncIteration
+
+    def _poll(self) -> MemoryRecord | None:
+        assigned = list(self._positions)
+        for step in range(len(assigned)):
+            index = (self._cursor + step) % len(assigned)
+            topic_partition = assigned[index]
+            record = self._bus._read(topic_partition, self._positions[topic_partition])
+            if record is not None:
+                self._cursor = index + 1
+                return record
+        return None
+
+    def _assign(
+        self,
+        partitions: set[TopicPartitionKey],
+        committed: Mapping[TopicPartitionKey, int],
+    ) -> None:
+        # Kept partitions keep their position; new ones resume from the group.
+        self._positions = {
+            topic_partition: self._positions.get(topic_partition, committed.get(topic_partition, 0))
+            for topic_partition in sorted(partitions)
+        }
+        self._wakeup.set()
+
+
+@lru_cache
+def get_memory_bus() -> MemoryBus:
+    """The bus shared by every client in this process."""
+    return MemoryBus()
@@ -0,0 +1,99 @@
+"""Wire encodings for event envelopes, selected by the record's content type.
+
+JSON is the default and what every consumer reads. msgpack (the optional
+``msgpack`` extra) is the compact alternative: the envelope is a positional
+array whose layout is fixed per ``event_version``, UUIDs travel as 16 raw
+bytes and timestamps as msgpack timestamps.
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+from typing import Any
+
+JSON_CONTENT_TYPE = "application/json"
+MSGPACK_CONTENT_TYPE = "application/msgpack"
+CONTENT_TYPES = (JSON_CONTENT_TYPE, MSGPACK_CONTENT_TYPE)
+# Content type by the short name used in settings.
+ENCODINGS = {"json": JSON_CONTENT_TYPE, "msgpack": MSGPACK_CONTENT_TYPE}
+
+# msgpack extension type code for UUIDs.
+_UUID_EXT = 1
+
+# Envelope fields after the leading ``event_version``, by version. A new
+# version may append or reorder fields; existing layouts never change.
+_MSGPACK_LAYOUTS: dict[int, tuple[str, ...]] = {
+    1: (
+        "event_id",
+        "event_type",
+        "occurred_at",
+        "correlation_id",
+        "causation_id",
+        "producer",
+        "payload",
+    ),
+}
+
+
+class UnsupportedEncodingError(ValueError):
+    """The content type or envelope version cannot be decoded here."""
+
+
+def pack_envelope(fields: dict[str, Any]) -> bytes:
+    """Encode envelope fields (``model_dump()`` output) as a msgpack row."""
+    msgpack = _msgpack()
+    version = fields["event_version"]
+    layout = _layout(version)
+    row = [version, *(fields[name] for name in layout)]
+    packed: bytes = msgpack.packb(row, default=_pack_default, datetime=True)
+    return packed
+
+
+def unpack_envelope(raw: bytes) -> dict[str, Any]:
+    """Decode a msgpack row back into envelope fields for validation."""
+    msgpack = _msgpack()
+    try:
+        row = msgpack.unpackb(raw, ext_hook=_unpack_ext, timestamp=3)
+    except (ValueError, msgpack.UnpackException) as exc:
+        raise UnsupportedEncodingError("malformed msgpack envelope") from exc
+    if not isinstance(row, list) or not row or not isinstance(row[0], int):
+        raise UnsupportedEncodingError("msgpack envelope is not a versioned row")
+    layout = _layout(row[0])
+    if len(row) != len(layout) + 1:
+        raise UnsupportedEncodingError(f"msgpack envelope v{row[0]} has {len(row)} fields")
+    return {"event_version": row[0], **dict(zip(layout, row[1:], strict=True))}
+
+
+def _layout(version: object) -> tuple[str, ...]:
+    layout = _MSGPACK_LAYOUTS.get(version) if isinstance(version, int) else None
+    if layout is None:
+        raise UnsupportedEncodingError(f"no msgpack layout for event_version {version!r}")
+    return layout
+
+
+def _pack_default(value: object) -> object:
+    msgpack = _msgpack()
+    if isinstance(value, uuid.UUID):
+        return msgpack.ExtType(_UUID_EXT, value.bytes)
+    if isinstance(value, datetime):
+        # Naive datetimes cannot be packed as timestamps.
+        raise TypeError("event timestamps must be timezone-aware")
+    raise TypeError(f"cannot pack {type(value).__name__}")
+
+
+def _unpack_ext(code: int, data: bytes) -> object:
+    msgpack = _msgpack()
+    if code == _UUID_EXT:
+        return uuid.UUID(bytes=data)
+    return msgpack.ExtType(code, data)
+
+
+def _msgpack() -> Any:
+    try:
+        import msgpack  # type: ignore[import-not-found,unused-ignore]
+    except ImportError as exc:
+        raise UnsupportedEncodingError(
+            "msgpack encoding needs the `sounds-right-contracts[msgpack]` extra"
+        ) from exc
+    return msgpack
@@ -0,0 +1,331 @@
+from __future__ import annotations
+
+import uuid
+from collections.abc import Collection, Sequence
+from datetime import UTC, datetime
+from typing import Annotated, Literal, overload
+
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+from sounds_right_contracts.codec import (
+    CONTENT_TYPES,
+    JSON_CONTENT_TYPE,
+    MSGPACK_CONTENT_TYPE,
+    UnsupportedEncodingError,
+    pack_envelope,
+    unpack_envelope,
+)
+
+EventType = Literal[
+    "transcription.requested",
+    "transcription.realign_requested",
+    "transcription.started",
+    "transcription.progress",
+    "transcription.preview",
+    "transcription.partial",
+    "transcription.completed",
+    "transcription.failed",
+]
+
+# Commands for the worker travel on their own topic, apart from lifecycle events.
+COMMAND_EVENT_TYPES: frozenset[str] = frozenset(
+    {"transcription.requested", "transcription.realign_requested"}
+)
+
+# Kafka record header naming the event type, so consumers can skip records
+# they do not handle without decoding the value.
+EVENT_TYPE_HEADER = "event_type"
+# Kafka record header naming the value's encoding; absent means JSON.
+CONTENT_TYPE_HEADER = "content-type"
+
+
+def event_headers(
+    event_type: str,
+    content_type: str = JSON_CONTENT_TYPE,
+) -> list[tuple[str, bytes]]:
+    """Kafka record headers for an event of ``event_type``."""
+    return [
+        (EVENT_TYPE_HEADER, event_type.encode("utf-8")),
+        (CONTENT_TYPE_HEADER, content_type.encode("utf-8")),
+    ]
+
+
+def header_event_type(headers: Sequence[tuple[str, bytes]] | None) -> str | None:
+    """The event type from Kafka record headers (``None`` for older producers)."""
+    return _header(headers, EVENT_TYPE_HEADER)
+
+
+def header_content_type(headers: Sequence[tuple[str, bytes]] | None) -> str:
+    """The value's content type from Kafka record headers."""
+    return _header(headers, CONTENT_TYPE_HEADER) or JSON_CONTENT_TYPE
+
+
+def _header(headers: Sequence[tuple[str, bytes]] | None, name: str) -> str | None:
+    for key, value in headers or ():
+        if key == name:
+            return value.decode("utf-8", errors="replace")
+    return None
+
+
+class TranscriptionOptionsPayload(BaseModel):
+    language: str = "auto"
+    model: str = "base"
+    separate_vocals: bool = False
+    lyrics_object_key: str | None = None
+
+
+class TranscriptionRequestedPayload(BaseModel):
+    job_id: uuid.UUID
+    track_version_id: uuid.UUID
+    track_id: uuid.UUID
+    artist_id: uuid.UUID
+    audio_object_key: str
+    original_audio_filename: str
+    audio_content_type: str
+    audio_size_bytes: int
+    engine: Literal["whisper.cpp"]
+    options: TranscriptionOptionsPayload
+
+
+class TranscriptionRealignRequestedPayload(BaseModel):
+    """Re-align edited lyric lines against the version's current transcript."""
+
+    job_id: uuid.UUID
+    track_version_id: uuid.UUID
+    transcript_object_key: str
+    lyrics_object_key: str
+    engine: Literal["lyrics-dtw"] = "lyrics-dtw"
+
+
+class TranscriptionStartedPayload(BaseModel):
+    job_id: uuid.UUID
+    track_version_id: uuid.UUID
+    worker_id: str
+    engine: str
+    message: str
+
+
+class TranscriptionProgressPayload(BaseModel):
+    job_id: uuid.UUID
+    track_version_id: uuid.UUID
+    progress: int = Field(ge=0, le=100)
+    stage: str
+    message: str
+
+
+class TranscriptionPreviewPayload(BaseModel):
+    job_id: uuid.UUID
+    track_version_id: uuid.UUID
+    preview_object_key: str
+    model: str
+    language: str | None = None
+    word_count: int | None = None
+    segment_count: int | None = None
+    message: str
+
+
+class PartialSegmentPayload(BaseModel):
+    start: float
+    end: float
+    text: str
+
+
+class TranscriptionPartialPayload(BaseModel):
+    job_id: uuid.UUID
+    track_version_id: uuid.UUID
+    sequence: int = Field(ge=0)
+    segments: list[PartialSegmentPayload]
+    decoded_seconds: float
+    progress: int = Field(ge=0, le=100)
+    message: str
+
+
+class TranscriptionCompletedPayload(BaseModel):
+    job_id: uuid.UUID
+    track_version_id: uuid.UUID
+    transcript_object_key: str | None = None
+    manifest_object_key: str | None = None
+    duration_seconds: float | None = None
+    word_count: int | None = None
+    segment_count: int | None = None
+    engine: str | None = None
+    model: str | None = None
+    language: str | None = None
+    sha256: str | None = None
+    message: str
+
+
+class TranscriptionFailedPayload(BaseModel):
+    job_id: uuid.UUID
+    track_version_id: uuid.UUID
+    error_code: str
+    error_message: str
+    retryable: bool
+
+
+EventPayload = (
+    TranscriptionRequestedPayload
+    | TranscriptionRealignRequestedPayload
+    | TranscriptionStartedPayload
+    | TranscriptionProgressPayload
+    | TranscriptionPreviewPayload
+    | TranscriptionPartialPayload
+    | TranscriptionCompletedPayload
+    | TranscriptionFailedPayload
+)
+
+
+class EventHeader(BaseModel):
+    """Envelope fields without the payload, for routing before a full decode."""
+
+    event_id: uuid.UUID
+    event_type: EventType
+    event_version: int = 1
+    occurred_at: datetime
+    correlation_id: uuid.UUID
+    causation_id: uuid.UUID | None = None
+    producer: str
+
+
+class EventEnvelope(BaseModel):
+    """Envelope for building events; decoded events are one of its typed subclasses."""
+
+    model_config = ConfigDict(use_enum_values=True)
+
+    event_id: uuid.UUID = Field(default_factory=uuid.uuid4)
+    event_type: EventType
+    event_version: int = 1
+    occurred_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    correlation_id: uuid.UUID
+    causation_id: uuid.UUID | None = None
+    producer: str
+    payload: EventPayload
+
+
+class TranscriptionRequestedEvent(EventEnvelope):
+    event_type: Literal["transcription.requested"] = "transcription.requested"
+    payload: TranscriptionRequestedPayload
+
+
+class TranscriptionRealignRequestedEvent(EventEnvelope):
+    event_type: Literal["transcription.realign_requested"] = "transcription.realign_requested"
+    payload: TranscriptionRealignRequestedPayload
+
+
+class TranscriptionStartedEvent(EventEnvelope):
+    event_type: Literal["transcription.started"] = "transcription.started"
+    payload: TranscriptionStartedPayload
+
+
+class TranscriptionProgressEvent(EventEnvelope):
+    event_type: Literal["transcription.progress"] = "transcription.progress"
+    payload: TranscriptionProgressPayload
+
+
+class TranscriptionPreviewEvent(EventEnvelope):
+    event_type: Literal["transcription.preview"] = "transcription.preview"
+    payload: TranscriptionPreviewPayload
+
+
+class TranscriptionPartialEvent(EventEnvelope):
+    event_type: Literal["transcription.partial"] = "transcription.partial"
+    payload: TranscriptionPartialPayload
+
+
+class TranscriptionCompletedEvent(EventEnvelope):
+    event_type: Literal["transcription.completed"] = "transcription.completed"
+    payload: TranscriptionCompletedPayload
+
+
+class TranscriptionFailedEvent(EventEnvelope):
+    event_type: Literal["transcription.failed"] = "transcription.failed"
+    payload: TranscriptionFailedPayload
+
+
+# `event_type` selects the envelope class, and with it the payload model, in
+# a single step inside pydantic-core instead of trying every payload in turn.
+TypedEventEnvelope = Annotated[
+    TranscriptionRequestedEvent
+    | TranscriptionRealignRequestedEvent
+    | TranscriptionStartedEvent
+    | TranscriptionProgressEvent
+    | TranscriptionPreviewEvent
+    | TranscriptionPartialEvent
+    | TranscriptionCompletedEvent
+    | TranscriptionFailedEvent,
+    Field(discriminator="event_type"),
+]
+
+# Built once at import; validating through them reuses the compiled schema.
+event_envelope_adapter: TypeAdapter[EventEnvelope] = TypeAdapter(TypedEventEnvelope)
+event_header_adapter: TypeAdapter[EventHeader] = TypeAdapter(EventHeader)
+
+
+def encode_event(event: EventEnvelope, content_type: str = JSON_CONTENT_TYPE) -> bytes:
+    """Serialize ``event`` for a record whose content type is ``content_type``."""
+    if content_type == JSON_CONTENT_TYPE:
+        return event.model_dump_json().encode("utf-8")
+    if content_type == MSGPACK_CONTENT_TYPE:
+        return pack_envelope(event.model_dump())
+    raise UnsupportedEncodingError(f"unsupported content type {content_type!r}")
+
+
+def decode_event_header(
+    raw: bytes | str,
+    content_type: str = JSON_CONTENT_TYPE,
+) -> EventHeader:
+    """Decode only the envelope fields of a serialized event."""
+    if content_type == MSGPACK_CONTENT_TYPE:
+        return event_header_adapter.validate_python(unpack_envelope(_as_bytes(raw)))
+    _check_content_type(content_type)
+    return event_header_adapter.validate_json(raw)
+
+
+@overload
+def decode_event(raw: bytes | str) -> EventEnvelope: ...
+
+
+@overload
+def decode_event(
+    raw: bytes | str,
+    *,
+    event_types: Collection[str],
+    headers: Sequence[tuple[str, bytes]] | None = None,
+) -> EventEnvelope | None: ...
+
+
+def decode_event(
+    raw: bytes | str,
+    *,
+    event_types: Collection[str] | None = None,
+    headers: Sequence[tuple[str, bytes]] | None = None,
+) -> EventEnvelope | None:
+    """Decode a serialized event into its typed envelope.
+
+    The encoding follows the record's content-type header (JSON without one).
+    With ``event_types``, ``None`` is returned for other event types without
+    validating their payloads. The type is read from the record ``headers``
+    when they carry it, and from the envelope header of ``raw`` otherwise.
+    Raises ``pydantic.ValidationError`` for malformed events and
+    ``UnsupportedEncodingError`` for encodings this process cannot read.
+    """
+    content_type = header_content_type(headers)
+    if event_types is not None:
+        event_type = header_event_type(headers)
+        if event_type is None:
+            event_type = decode_event_header(raw, content_type).event_type
+        if event_type not in event_types:
+            return None
+    if content_type == MSGPACK_CONTENT_TYPE:
+        return event_envelope_adapter.validate_python(unpack_envelope(_as_bytes(raw)))
+    _check_content_type(content_type)
+    return event_envelope_adapter.validate_json(raw)
+
+
+def _check_content_type(content_type: str) -> None:
+    if content_type not in CONTENT_TYPES:
+        raise UnsupportedEncodingError(f"unsupported content type {content_type!r}")
+
+
+def _as_bytes(raw: bytes | str) -> bytes:
+    return raw.encode("utf-8") if isinstance(raw, str) else raw
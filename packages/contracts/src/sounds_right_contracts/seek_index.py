@@ -0,0 +1,256 @@
+"""Seek index for transcripts: find the segments and words in a time window.
+
+The index is built from a serialized ``transcript.json`` and stored beside
+it. For every segment it records the start and end in integer milliseconds
+and the byte span of the segment's JSON inside the (decoded) transcript, so
+a reader can validate just the segments it returns. Words are listed in
+transcript order with their timings and ``word_offsets[i]``, the index of
+segment ``i``'s first word.
+
+Lookups binary-search two derived columns: the running maximum of ends and
+the running minimum of starts taken from the end. Both are sorted even when
+segments overlap or arrive out of order, so a window query is
+``O(log n + k)`` for ``k`` candidates and never misses an overlapping item.
+"""
+
+from __future__ import annotations
+
+import bisect
+import hashlib
+import json
+import re
+from dataclasses import dataclass
+from functools import cached_property
+from itertools import accumulate
+from typing import Any
+
+SEEK_INDEX_FORMAT = "sounds-right-seek-index"
+SEEK_INDEX_VERSION = 1
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DECODER = json.JSONDecoder()
+
+
+class SeekIndexError(ValueError):
+    """The transcript or index cannot be read."""
+
+
+@dataclass(frozen=True)
+class SeekIndex:
+    transcript_sha256: str
+    segment_start_ms: list[int]
+    segment_end_ms: list[int]
+    segment_byte_start: list[int]
+    segment_byte_end: list[int]
+    word_offsets: list[int]
+    word_start_ms: list[int]
+    word_end_ms: list[int]
+
+    @classmethod
+    def from_transcript_json(cls, document: bytes) -> SeekIndex:
+        """Index a serialized transcript, whatever its whitespace."""
+        try:
+            text = document.decode("utf-8")
+            spans = _segment_spans(text)
+        except (UnicodeDecodeError, ValueError) as exc:
+            raise SeekIndexError("transcript is not a JSON object with segments") from exc
+
+        segment_start_ms: list[int] = []
+        segment_end_ms: list[int] = []
+        byte_start: list[int] = []
+        byte_end: list[int] = []
+        word_offsets: list[int] = []
+        word_start_ms: list[int] = []
+        word_end_ms: list[int] = []
+        # Spans are in characters; carry the UTF-8 length forward to get bytes.
+        char_position = byte_position = 0
+        for begin, end, segment in spans:
+            byte_position += len(text[char_position:begin].encode("utf-8"))
+            byte_start.append(byte_position)
+            byte_position += len(text[begin:end].encode("utf-8"))
+            byte_end.append(byte_position)
+            char_position = end
+            try:
+                segment_start_ms.append(_milliseconds(segment["start"]))
+                segment_end_ms.append(_milliseconds(segment["end"]))
+                word_offsets.append(len(word_start_ms))
+                for word in segment.get("words") or ():
+                    word_start_ms.append(_milliseconds(word["start"]))
+                    word_end_ms.append(_milliseconds(word["end"]))
+            except (KeyError, TypeError, ValueError, AttributeError) as exc:
+                raise SeekIndexError("transcript segment has no usable timings") from exc
+        word_offsets.append(len(word_start_ms))
+        return cls(
+            transcript_sha256=hashlib.sha256(document).hexdigest(),
+            segment_start_ms=segment_start_ms,
+            segment_end_ms=segment_end_ms,
+            segment_byte_start=byte_start,
+            segment_byte_end=byte_end,
+            word_offsets=word_offsets,
+            word_start_ms=word_start_ms,
+            word_end_ms=word_end_ms,
+        )
+
+    def describes(self, document: bytes) -> bool:
+        """Whether the index was built from exactly this transcript."""
+        return hashlib.sha256(document).hexdigest() == self.transcript_sha256
+
+    def segments_between(self, start_ms: int, end_ms: int) -> list[int]:
+        """Positions of the segments overlapping ``[start_ms, end_ms]``."""
+        return _overlapping(
+            self.segment_start_ms,
+            self.segment_end_ms,
+            self._segment_floor,
+            self._segment_reach,
+            start_ms,
+            end_ms,
+        )
+
+    def words_between(self, start_ms: int, end_ms: int) -> list[int]:
+        """Positions (across the transcript) of the words overlapping the window."""
+        return _overlapping(
+            self.word_start_ms,
+            self.word_end_ms,
+            self._word_floor,
+            self._word_reach,
+            start_ms,
+            end_ms,
+        )
+
+    def word_segment(self, word: int) -> int:
+        """Position of the segment a word belongs to."""
+        return bisect.bisect_right(self.word_offsets, word) - 1
+
+    def segment_slice(self, document: bytes, segment: int) -> bytes:
+        """The segment's JSON, cut out of the transcript the index describes."""
+        return document[self.segment_byte_start[segment] : self.segment_byte_end[segment]]
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "format": SEEK_INDEX_FORMAT,
+            "version": SEEK_INDEX_VERSION,
+            "transcript_sha256": self.transcript_sha256,
+            "segment_start_ms": self.segment_start_ms,
+            "segment_end_ms": self.segment_end_ms,
+            "segment_byte_start": self.segment_byte_start,
+            "segment_byte_end": self.segment_byte_end,
+            "word_offsets": self.word_offsets,
+            "word_start_ms": self.word_start_ms,
+            "word_end_ms": self.word_end_ms,
+        }
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> SeekIndex:
+        if data.get("format") != SEEK_INDEX_FORMAT:
+            raise SeekIndexError("not a seek index")
+        if data.get("version") != SEEK_INDEX_VERSION:
+            raise SeekIndexError(f"unsupported seek index version {data.get('version')!r}")
+        try:
+            index = cls(
+                transcript_sha256=str(data["transcript_sha256"]),
+                segment_start_ms=list(data["segment_start_ms"]),
+                segment_end_ms=list(data["segment_end_ms"]),
+                segment_byte_start=list(data["segment_byte_start"]),
+                segment_byte_end=list(data["segment_byte_end"]),
+                word_offsets=list(data["word_offsets"]),
+                word_start_ms=list(data["word_start_ms"]),
+                word_end_ms=list(data["word_end_ms"]),
+            )
+        except (KeyError, TypeError) as exc:
+            raise SeekIndexError("incomplete seek index") from exc
+        segments = len(index.segment_start_ms)
+        words = len(index.word_start_ms)
+        if not (
+            len(index.segment_end_ms)
+            == len(index.segment_byte_start)
+            == len(index.segment_byte_end)
+            == segments
+            and len(index.word_end_ms) == words
+            and len(index.word_offsets) == segments + 1
+            and index.word_offsets[-1] == words
+        ):
+            raise SeekIndexError("seek index columns differ in length")
+        return index
+
+    @cached_property
+    def _segment_floor(self) -> list[int]:
+        return _suffix_min(self.segment_start_ms)
+
+    @cached_property
+    def _segment_reach(self) -> list[int]:
+        return list(accumulate(self.segment_end_ms, max))
+
+    @cached_property
+    def _word_floor(self) -> list[int]:
+        return _suffix_min(self.word_start_ms)
+
+    @cached_property
+    def _word_reach(self) -> list[int]:
+        return list(accumulate(self.word_end_ms, max))
+
+
+def _segment_spans(text: str) -> list[tuple[int, int, dict[str, Any]]]:
+    """Character spans and values of the top-level ``segments`` array's items."""
+    position = _skip(text, 0)
+    if text[position : position + 1] != "{":
+        raise ValueError("expected an object")
+    position = _skip(text, position + 1)
+    while text[position : position + 1] != "}":
+        key, position = _DECODER.raw_decode(text, position)
+        position = _skip(text, position)
+        if text[position : position + 1] != ":":
+            raise ValueError("expected ':'")
+        position = _skip(text, position + 1)
+        if key == "segments":
+            return _array_items(text, position)
+        _value, position = _DECODER.raw_decode(text, position)
+        position = _skip(text, position)
+        if text[position : position + 1] == ",":
+            position = _skip(text, position + 1)
+    raise ValueError("no segments")
+
+
+def _array_items(text: str, position: int) -> list[tuple[int, int, dict[str, Any]]]:
+    if text[position : position + 1] != "[":
+        raise ValueError("expected an array")
+    items: list[tuple[int, int, dict[str, Any]]] = []
+    position = _skip(text, position + 1)
+    while text[position : position + 1] != "]":
+        value, end = _DECODER.raw_decode(text, position)
+        if not isinstance(value, dict):
+            raise ValueError("expected segment objects")
+        items.append((position, end, value))
+        position = _skip(text, end)
+        if text[position : position + 1] == ",":
+            position = _skip(text, position + 1)
+        elif text[position : position + 1] != "]":
+            raise ValueError("expected ',' or ']'")
+    return items
+
+
+def _skip(text: str, position: int) -> int:
+    match = _WHITESPACE.match(text, position)
+    return match.end() if match else position
+
+
+def _overlapping(
+    starts: list[int],
+    ends: list[int],
+    floor: list[int],
+    reach: list[int],
+    start_ms: int,
+    end_ms: int,
+) -> list[int]:
+    # Items before ``low`` all end before the window; from ``high`` on, all
+    # start after it. Only the ones in between need checking.
+    low = bisect.bisect_left(reach, start_ms)
+    high = bisect.bisect_right(floor, end_ms)
+    return [i for i in range(low, high) if ends[i] >= start_ms and starts[i] <= end_ms]
+
+
+def _suffix_min(values: list[int]) -> list[int]:
+    return list(accumulate(reversed(values), min))[::-1]
+
+
+def _milliseconds(seconds: Any) -> int:
+    return round(float(seconds) * 1000)
@@ -0,0 +1,211 @@
+"""Columnar word timings: the compact form of ``words.json`` for players.
+
+Instead of one object per word, timings are parallel arrays in transcript
+order: ``start_ms``/``end_ms`` are integer milliseconds, ``words`` indexes a
+table of distinct strings, and ``confidence`` is quantized to whole percent
+(``CONFIDENCE_MISSING`` when the engine gave none). ``segment_offsets[i]`` is
+the index of segment ``i``'s first word, with a final entry equal to the word
+count, so segment ``i`` (by position in ``segments.json``) spans
+``words[segment_offsets[i]:segment_offsets[i + 1]]``. Starts are in transcript
+order, which lets a player find the word at a position by binary search.
+
+The same columns have a binary layout whose sections map straight onto JS
+typed arrays. All integers are little-endian:
+
+    header   magic "SRWT", u16 version, u16 flags (0), u32 word count,
+             u32 segment count, u32 string count, u32 string data bytes
+    u32[n]   start_ms
+    u32[n]   end_ms
+    u32[n]   words (string table indices)
+    u32[s+1] segment_offsets
+    u32[k+1] string offsets into the string data
+    u8[n]    confidence
+    bytes    UTF-8 string data
+
+Every ``u32`` section starts on a four-byte boundary.
+"""
+
+from __future__ import annotations
+
+import struct
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from itertools import pairwise
+from typing import Any, Protocol
+
+WORD_TIMINGS_FORMAT = "sounds-right-word-timings"
+WORD_TIMINGS_VERSION = 1
+WORD_TIMINGS_BINARY_CONTENT_TYPE = "application/vnd.sounds-right.word-timings"
+CONFIDENCE_SCALE = 100
+CONFIDENCE_MISSING = 255
+
+_MAGIC = b"SRWT"
+_HEADER = struct.Struct("<4sHHIIII")
+_U32_MAX = 0xFFFFFFFF
+
+
+class WordTimingsError(ValueError):
+    """Word timings are malformed or in a version this code cannot read."""
+
+
+class TimedWord(Protocol):
+    @property
+    def word(self) -> str: ...
+
+    @property
+    def start(self) -> float: ...
+
+    @property
+    def end(self) -> float: ...
+
+    @property
+    def confidence(self) -> float | None: ...
+
+
+class TimedSegment(Protocol):
+    @property
+    def words(self) -> Sequence[TimedWord]: ...
+
+
+@dataclass(frozen=True)
+class WordTimings:
+    strings: list[str]
+    words: list[int]
+    start_ms: list[int]
+    end_ms: list[int]
+    confidence: list[int]
+    segment_offsets: list[int]
+
+    @classmethod
+    def from_segments(cls, segments: Iterable[TimedSegment]) -> WordTimings:
+        """Build the columns from transcript segments, in transcript order."""
+        table: dict[str, int] = {}
+        words: list[int] = []
+        start_ms: list[int] = []
+        end_ms: list[int] = []
+        confidence: list[int] = []
+        segment_offsets: list[int] = []
+        for segment in segments:
+            segment_offsets.append(len(words))
+            for word in segment.words:
+                words.append(table.setdefault(word.word, len(table)))
+                start_ms.append(_milliseconds(word.start))
+                end_ms.append(_milliseconds(word.end))
+                confidence.append(_quantize(word.confidence))
+        segment_offsets.append(len(words))
+        return cls(list(table), words, start_ms, end_ms, confidence, segment_offsets)
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "format": WORD_TIMINGS_FORMAT,
+            "version": WORD_TIMINGS_VERSION,
+            "confidence_scale": CONFIDENCE_SCALE,
+            "confidence_missing": CONFIDENCE_MISSING,
+            "strings": self.strings,
+            "words": self.words,
+            "start_ms": self.start_ms,
+            "end_ms": self.end_ms,
+            "confidence": self.confidence,
+            "segment_offsets": self.segment_offsets,
+        }
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> WordTimings:
+        if data.get("format") != WORD_TIMINGS_FORMAT:
+            raise WordTimingsError("not a word timings document")
+        if data.get("version") != WORD_TIMINGS_VERSION:
+            raise WordTimingsError(f"unsupported word timings version {data.get('version')!r}")
+        try:
+            timings = cls(
+                strings=list(data["strings"]),
+                words=list(data["words"]),
+                start_ms=list(data["start_ms"]),
+                end_ms=list(data["end_ms"]),
+                confidence=list(data["confidence"]),
+                segment_offsets=list(data["segment_offsets"]),
+            )
+        except (KeyError, TypeError) as exc:
+            raise WordTimingsError("incomplete word timings document") from exc
+        timings._check()
+        return timings
+
+    def to_bytes(self) -> bytes:
+        count = len(self.words)
+        string_data = [value.encode("utf-8") for value in self.strings]
+        string_offsets = [0]
+        for value in string_data:
+            string_offsets.append(string_offsets[-1] + len(value))
+        header = _HEADER.pack(
+            _MAGIC,
+            WORD_TIMINGS_VERSION,
+            0,
+            count,
+            len(self.segment_offsets) - 1,
+            len(self.strings),
+            string_offsets[-1],
+        )
+        columns = (self.start_ms, self.end_ms, self.words, self.segment_offsets, string_offsets)
+        return b"".join(
+            [
+                header,
+                *(struct.pack(f"<{len(column)}I", *column) for column in columns),
+                bytes(self.confidence),
+                *string_data,
+            ]
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> WordTimings:
+        if len(data) < _HEADER.size:
+            raise WordTimingsError("truncated word timings")
+        magic, version, _flags, count, segments, strings, string_bytes = _HEADER.unpack_from(data)
+        if magic != _MAGIC:
+            raise WordTimingsError("not a word timings document")
+        if version != WORD_TIMINGS_VERSION:
+            raise WordTimingsError(f"unsupported word timings version {version!r}")
+        expected = _HEADER.size + 4 * (3 * count + segments + strings + 2) + count + string_bytes
+        if len(data) != expected:
+            raise WordTimingsError("word timings length does not match its header")
+
+        offset = _HEADER.size
+
+        def u32s(length: int) -> list[int]:
+            nonlocal offset
+            values = list(struct.unpack_from(f"<{length}I", data, offset))
+            offset += 4 * length
+            return values
+
+        start_ms, end_ms, words = u32s(count), u32s(count), u32s(count)
+        segment_offsets = u32s(segments + 1)
+        string_offsets = u32s(strings + 1)
+        confidence = list(data[offset : offset + count])
+        text = data[offset + count :]
+        try:
+            table = [text[begin:end].decode("utf-8") for begin, end in pairwise(string_offsets)]
+        except UnicodeDecodeError as exc:
+            raise WordTimingsError("word timings strings are not UTF-8") from exc
+        timings = cls(table, words, start_ms, end_ms, confidence, segment_offsets)
+        timings._check()
+        return timings
+
+    def _check(self) -> None:
+        count = len(self.words)
+        if not (len(self.start_ms) == len(self.end_ms) == len(self.confidence) == count):
+            raise WordTimingsError("word timings columns differ in length")
+        if any(index >= len(self.strings) for index in self.words):
+            raise WordTimingsError("word timings reference a missing string")
+        offsets = self.segment_offsets
+        if not offsets or offsets[0] != 0 or offsets[-1] != count:
+            raise WordTimingsError("word timings segment offsets do not cover the words")
+        if any(later < earlier for earlier, later in pairwise(offsets)):
+            raise WordTimingsError("word timings segment offsets decrease")
+
+
+def _milliseconds(seconds: float) -> int:
+    return min(max(round(seconds * 1000), 0), _U32_MAX)
+
+
+def _quantize(confidence: float | None) -> int:
+    if confidence is None:
+        return CONFIDENCE_MISSING
+    return min(max(round(confidence * CONFIDENCE_SCALE), 0), CONFIDENCE_SCALE)
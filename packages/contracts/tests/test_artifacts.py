@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import pytest
+
+from sounds_right_contracts.artifacts import (
+    GZIP_ENCODING,
+    IDENTITY_ENCODING,
+    ZSTD_ENCODING,
+    ArtifactEncodingError,
+    content_encoding_header,
+    decode_artifact,
+    encode_artifact,
+)
+
+_TRANSCRIPT = b'{"segments":[' + b",".join([b'{"word":"la","start":1.0,"end":1.2}'] * 200) + b"]}"
+
+
+def test_gzip_artifacts_shrink_and_round_trip() -> None:
+    stored = encode_artifact(_TRANSCRIPT, GZIP_ENCODING)
+
+    assert len(stored) < len(_TRANSCRIPT) // 5
+    assert stored == encode_artifact(_TRANSCRIPT, GZIP_ENCODING)
+    assert decode_artifact(stored) == _TRANSCRIPT
+    assert content_encoding_header(GZIP_ENCODING) == "gzip"
+
+
+def test_plain_json_passes_through_decode() -> None:
+    # Identity artifacts, and bodies an HTTP client already decompressed.
+    assert encode_artifact(_TRANSCRIPT, IDENTITY_ENCODING) == _TRANSCRIPT
+    assert decode_artifact(_TRANSCRIPT) == _TRANSCRIPT
+    assert content_encoding_header(IDENTITY_ENCODING) is None
+
+
+def test_zstd_artifacts_round_trip() -> None:
+    pytest.importorskip("zstandard")
+
+    stored = encode_artifact(_TRANSCRIPT, ZSTD_ENCODING)
+
+    assert len(stored) < len(_TRANSCRIPT) // 5
+    assert decode_artifact(stored) == _TRANSCRIPT
+
+
+def test_corrupt_or_unknown_encodings_are_rejected() -> None:
+    with pytest.raises(ArtifactEncodingError):
+        decode_artifact(encode_artifact(_TRANSCRIPT, GZIP_ENCODING)[:20])
+    with pytest.raises(ArtifactEncodingError):
+        encode_artifact(_TRANSCRIPT, "br")
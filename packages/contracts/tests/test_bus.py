@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from sounds_right_contracts.bus import MemoryBus, MemoryConsumer, MemoryRecord
+
+
+async def _take(consumer: MemoryConsumer, count: int) -> list[MemoryRecord]:
+    records = []
+    async for record in consumer:
+        records.append(record)
+        if len(records) == count:
+            break
+    return records
+
+
+def test_keyed_records_keep_their_order_on_one_partition() -> None:
+    asyncio.run(run_keyed_order())
+
+
+async def run_keyed_order() -> None:
+    bus = MemoryBus(partitions=4)
+    producer = bus.producer()
+    for index in range(5):
+        await producer.send_and_wait("events", f"a-{index}".encode(), b"job-a")
+        await producer.send_and_wait("events", f"b-{index}".encode(), b"job-b")
+
+    consumer = bus.consumer("events", group_id="projector")
+    await consumer.start()
+    records = await asyncio.wait_for(_take(consumer, 10), timeout=1)
+    await consumer.stop()
+
+    for key in (b"job-a", b"job-b"):
+        keyed = [record for record in records if record.key == key]
+        assert len({record.partition for record in keyed}) == 1
+        assert [record.offset for record in keyed] == sorted(record.offset for record in keyed)
+        assert [record.value for record in keyed] == [
+            f"{key.decode()[-1]}-{index}".encode() for index in range(5)
+        ]
+
+
+def test_group_members_split_partitions_and_resume_from_commits() -> None:
+    asyncio.run(run_group())
+
+
+async def run_group() -> None:
+    bus = MemoryBus(partitions=4)
+    first = bus.consumer("commands", group_id="workers", enable_auto_commit=False)
+    second = bus.consumer("commands", group_id="workers", enable_auto_commit=False)
+    await first.start()
+    await second.start()
+    assert len(first.assignment()) == len(second.assignment()) == 2
+    assert not first.assignment() & second.assignment()
+
+    producer = bus.producer()
+    for index in range(8):
+        await producer.send_and_wait("commands", b"request", f"job-{index}".encode())
+    record = (await asyncio.wait_for(_take(first, 1), timeout=1))[0]
+    await first.commit({(record.topic, record.partition): record.offset + 1})
+    await first.stop()
+
+    # The survivor takes over the partition after the committed record.
+    assert len(second.assignment()) == 4
+    consumed = await asyncio.wait_for(_take(second, 7), timeout=1)
+    assert record not in consumed
+    assert bus.committed("workers", record.topic, record.partition) == record.offset + 1
+    await second.stop()
+    assert bus.group_lag("workers", "commands").records == 7
+    assert bus.group_lag("other", "commands").records == 8
+
+
+def test_aborted_transaction_publishes_and_commits_nothing() -> None:
+    asyncio.run(run_transaction())
+
+
+async def run_transaction() -> None:
+    bus = MemoryBus(partitions=1)
+    producer = bus.producer()
+
+    with pytest.raises(RuntimeError):
+        async with producer.transaction():
+            await producer.send("events", b"started", b"job")
+            await producer.send_offsets_to_transaction({("commands", 0): 1}, "workers")
+            raise RuntimeError("worker crashed")
+    assert bus.end_offsets("events") == [0]
+    assert bus.committed("workers", "commands", 0) is None
+
+    async with producer.transaction():
+        await producer.send("events", b"completed", b"job")
+        await producer.send_offsets_to_transaction({("commands", 0): 1}, "workers")
+    assert bus.end_offsets("events") == [1]
+    assert bus.committed("workers", "commands", 0) == 1
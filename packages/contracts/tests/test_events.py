@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import json
+import uuid
+
+import pytest
+from pydantic import ValidationError
+
+from sounds_right_contracts.codec import MSGPACK_CONTENT_TYPE, UnsupportedEncodingError
+from sounds_right_contracts.events import (
+    EventEnvelope,
+    PartialSegmentPayload,
+    TranscriptionCompletedEvent,
+    TranscriptionCompletedPayload,
+    TranscriptionPartialEvent,
+    TranscriptionPartialPayload,
+    TranscriptionPreviewPayload,
+    TranscriptionProgressPayload,
+    TranscriptionRealignRequestedPayload,
+    TranscriptionStartedPayload,
+    decode_event,
+    decode_event_header,
+    encode_event,
+    event_envelope_adapter,
+    event_headers,
+    header_event_type,
+)
+
+
+def test_event_envelope_round_trips_started_event() -> None:
+    event = EventEnvelope(
+        event_type="transcription.started",
+        correlation_id=uuid.uuid4(),
+        producer="sounds-right-worker",
+        payload=TranscriptionStartedPayload(
+            job_id=uuid.uuid4(),
+            track_version_id=uuid.uuid4(),
+            worker_id="worker-1",
+            engine="mock",
+            message="Mock transcription started",
+        ),
+    )
+
+    parsed = event_envelope_adapter.validate_json(event.model_dump_json())
+
+    assert parsed.event_id == event.event_id
+    assert parsed.event_type == "transcription.started"
+    assert isinstance(parsed.payload, TranscriptionStartedPayload)
+
+
+def test_preview_event_is_not_parsed_as_completed() -> None:
+    event = EventEnvelope(
+        event_type="transcription.preview",
+        correlation_id=uuid.uuid4(),
+        producer="sounds-right-worker",
+        payload=TranscriptionPreviewPayload(
+            job_id=uuid.uuid4(),
+            track_version_id=uuid.uuid4(),
+            preview_object_key="transcripts/version/preview.json",
+            model="tiny",
+            language="en",
+            word_count=12,
+            segment_count=3,
+            message="Preview transcript available",
+        ),
+    )
+
+    parsed = event_envelope_adapter.validate_json(event.model_dump_json())
+
+    assert isinstance(parsed.payload, TranscriptionPreviewPayload)
+    assert not isinstance(parsed.payload, TranscriptionCompletedPayload)
+    assert parsed.payload.preview_object_key == "transcripts/version/preview.json"
+
+
+def test_progress_payload_rejects_invalid_percent() -> None:
+    try:
+        TranscriptionProgressPayload(
+            job_id=uuid.uuid4(),
+            track_version_id=uuid.uuid4(),
+            progress=101,
+            stage="mock_processing",
+            message="too much",
+        )
+    except ValueError:
+        return
+
+    raise AssertionError("progress above 100 should fail validation")
+
+
+def test_partial_event_round_trips_segments() -> None:
+    event = EventEnvelope(
+        event_type="transcription.partial",
+        correlation_id=uuid.uuid4(),
+        producer="sounds-right-worker",
+        payload=TranscriptionPartialPayload(
+            job_id=uuid.uuid4(),
+            track_version_id=uuid.uuid4(),
+            sequence=0,
+            segments=[PartialSegmentPayload(start=0.0, end=2.5, text="first line")],
+            decoded_seconds=2.5,
+            progress=45,
+            message="1 segments decoded (2s)",
+        ),
+    )
+
+    parsed = event_envelope_adapter.validate_json(event.model_dump_json())
+
+    assert isinstance(parsed.payload, TranscriptionPartialPayload)
+    assert parsed.payload.segments[0].text == "first line"
+
+
+def test_realign_requested_event_keeps_its_payload_type() -> None:
+    event = EventEnvelope(
+        event_type="transcription.realign_requested",
+        correlation_id=uuid.uuid4(),
+        producer="sounds-right-api",
+        payload=TranscriptionRealignRequestedPayload(
+            job_id=uuid.uuid4(),
+            track_version_id=uuid.uuid4(),
+            transcript_object_key="transcripts/version/transcript.json",
+            lyrics_object_key="transcripts/version/lyrics.txt",
+        ),
+    )
+
+    parsed = event_envelope_adapter.validate_json(event.model_dump_json())
+
+    assert isinstance(parsed.payload, TranscriptionRealignRequestedPayload)
+    assert parsed.payload.engine == "lyrics-dtw"
+
+
+def test_decode_picks_payload_model_from_event_type() -> None:
+    event = EventEnvelope(
+        event_type="transcription.completed",
+        correlation_id=uuid.uuid4(),
+        producer="sounds-right-worker",
+        payload=TranscriptionCompletedPayload(
+            job_id=uuid.uuid4(),
+            track_version_id=uuid.uuid4(),
+            message="Transcription completed",
+        ),
+    )
+
+    parsed = decode_event(event.model_dump_json())
+
+    assert isinstance(parsed, TranscriptionCompletedEvent)
+    assert isinstance(parsed.payload, TranscriptionCompletedPayload)
+
+    # A payload that only fits another event type is rejected, not coerced.
+    mismatched = event.model_dump(mode="json")
+    mismatched["event_type"] = "transcription.progress"
+    with pytest.raises(ValidationError):
+        decode_event(json.dumps(mismatched))
+
+
+def test_lazy_decode_skips_payload_of_unwanted_events() -> None:
+    event = EventEnvelope(
+        event_type="transcription.progress",
+        correlation_id=uuid.uuid4(),
+        producer="sounds-right-worker",
+        payload=TranscriptionProgressPayload(
+            job_id=uuid.uuid4(),
+            track_version_id=uuid.uuid4(),
+            progress=40,
+            stage="transcribing",
+            message="transcribing (40%)",
+        ),
+    )
+    raw = event.model_dump(mode="json")
+    # Invalid payload: only a full decode would notice.
+    raw["payload"] = {"progress": "not a number"}
+
+    header = decode_event_header(json.dumps(raw))
+
+    assert header.event_id == event.event_id
+    assert header.event_type == "transcription.progress"
+    assert decode_event(json.dumps(raw), event_types={"transcription.requested"}) is None
+    with pytest.raises(ValidationError):
+        decode_event(json.dumps(raw), event_types={"transcription.progress"})
+
+
+def test_record_header_routes_without_reading_the_value() -> None:
+    headers = event_headers("transcription.progress")
+
+    assert header_event_type(headers) == "transcription.progress"
+    assert header_event_type(None) is None
+    # The value is never looked at when the header rules the event out.
+    assert (
+        decode_event(b"not json", event_types={"transcription.requested"}, headers=headers) is None
+    )
+
+
+def test_msgpack_encoding_round_trips_with_headers() -> None:
+    pytest.importorskip("msgpack")
+    event = EventEnvelope(
+        event_type="transcription.partial",
+        correlation_id=uuid.uuid4(),
+        producer="sounds-right-worker",
+        payload=TranscriptionPartialPayload(
+            job_id=uuid.uuid4(),
+            track_version_id=uuid.uuid4(),
+            sequence=3,
+            segments=[PartialSegmentPayload(start=1.0, end=2.5, text="line")],
+            decoded_seconds=2.5,
+            progress=50,
+            message="1 segments decoded (2s)",
+        ),
+    )
+    raw = encode_event(event, MSGPACK_CONTENT_TYPE)
+    headers = event_headers(event.event_type, MSGPACK_CONTENT_TYPE)
+
+    parsed = decode_event(raw, event_types={"transcription.partial"}, headers=headers)
+
+    assert len(raw) < len(encode_event(event))
+    assert isinstance(parsed, TranscriptionPartialEvent)
+    assert parsed.model_dump() == event.model_dump()
+    assert decode_event_header(raw, MSGPACK_CONTENT_TYPE).event_id == event.event_id
+    # Without the event_type header the msgpack envelope header is read instead.
+    untyped = [header for header in headers if header[0] != "event_type"]
+    assert decode_event(raw, event_types={"transcription.failed"}, headers=untyped) is None
+
+
+def test_unknown_content_type_is_rejected() -> None:
+    headers = event_headers("transcription.started", "application/x-unknown")
+
+    with pytest.raises(UnsupportedEncodingError):
+        decode_event(b"{}", event_types={"transcription.started"}, headers=headers)
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from sounds_right_contracts.seek_index import SeekIndex, SeekIndexError
+
+_TRANSCRIPT = {
+    "schema_version": "1.0",
+    "text": 'la "segments": [ héllo',
+    "segments": [
+        {
+            "id": 1,
+            "start": 0.5,
+            "end": 4.0,
+            "text": "la la",
+            "words": [
+                {"word": "la", "start": 0.5, "end": 1.0},
+                {"word": "la", "start": 1.0, "end": 4.0},
+            ],
+        },
+        # Overlaps the next line, as backing vocals do.
+        {"id": 2, "start": 3.0, "end": 20.0, "text": "ooh", "words": []},
+        {
+            "id": "edited",
+            "start": 5.0,
+            "end": 6.5,
+            "text": "héllo",
+            "words": [{"word": "héllo", "start": 5.0, "end": 6.5}],
+        },
+    ],
+}
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+def test_seek_index_slices_segments_out_of_the_document(indent: int | None) -> None:
+    document = json.dumps(_TRANSCRIPT, ensure_ascii=False, indent=indent).encode("utf-8")
+    index = SeekIndex.from_transcript_json(document)
+
+    assert index.describes(document)
+    assert index.segment_start_ms == [500, 3000, 5000]
+    assert index.word_offsets == [0, 2, 2, 3]
+    for position, segment in enumerate(_TRANSCRIPT["segments"]):  # type: ignore[arg-type]
+        assert json.loads(index.segment_slice(document, position)) == segment
+
+
+def test_seek_index_finds_overlapping_segments_and_words() -> None:
+    document = json.dumps(_TRANSCRIPT).encode("utf-8")
+    index = SeekIndex.from_json(
+        json.loads(json.dumps(SeekIndex.from_transcript_json(document).to_json()))
+    )
+
+    assert index.segments_between(4_500, 4_800) == [1]
+    assert index.segments_between(6_000, 30_000) == [1, 2]
+    assert index.segments_between(0, 400) == []
+    assert index.words_between(900, 1_000) == [0, 1]
+    assert index.words_between(7_000, 9_000) == []
+    assert index.word_segment(2) == 2
+
+
+def test_seek_index_rejects_documents_without_segments() -> None:
+    with pytest.raises(SeekIndexError):
+        SeekIndex.from_transcript_json(b'{"schema_version": "1.0"}')
+    with pytest.raises(SeekIndexError):
+        SeekIndex.from_json({"format": "sounds-right-seek-index", "version": 1})
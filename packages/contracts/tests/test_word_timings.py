@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import bisect
+import json
+from dataclasses import dataclass, field
+
+import pytest
+
+from sounds_right_contracts.word_timings import (
+    CONFIDENCE_MISSING,
+    WordTimings,
+    WordTimingsError,
+)
+
+
+@dataclass
+class Word:
+    word: str
+    start: float
+    end: float
+    confidence: float | None = None
+
+
+@dataclass
+class Segment:
+    words: list[Word] = field(default_factory=list)
+
+
+_SEGMENTS = [
+    Segment([Word("la", 0.5, 0.75, 0.912), Word("la", 0.75, 1.0, 0.5)]),
+    Segment(),
+    Segment([Word("héllo", 1.2, 1.9), Word("la", 2.0004, 2.5, 1.0)]),
+]
+
+
+def test_word_timings_are_columnar() -> None:
+    timings = WordTimings.from_segments(_SEGMENTS)
+
+    assert timings.strings == ["la", "héllo"]
+    assert timings.words == [0, 0, 1, 0]
+    assert timings.start_ms == [500, 750, 1200, 2000]
+    assert timings.end_ms == [750, 1000, 1900, 2500]
+    assert timings.confidence == [91, 50, CONFIDENCE_MISSING, 100]
+    assert timings.segment_offsets == [0, 2, 2, 4]
+    # Starts are sorted, so the word playing at 1.5s is a binary search away.
+    assert bisect.bisect_right(timings.start_ms, 1500) - 1 == 2
+
+
+def test_word_timings_round_trip_json_and_binary() -> None:
+    timings = WordTimings.from_segments(_SEGMENTS)
+
+    from_json = WordTimings.from_json(json.loads(json.dumps(timings.to_json())))
+    binary = timings.to_bytes()
+
+    assert from_json == timings
+    assert WordTimings.from_bytes(binary) == timings
+    assert binary.startswith(b"SRWT")
+    # Typed-array sections after the 24-byte header stay four-byte aligned.
+    assert len(binary) == 24 + 4 * (3 * 4 + 4 + 3) + 4 + len("lahéllo".encode())
+
+
+def test_word_timings_reject_malformed_input() -> None:
+    binary = WordTimings.from_segments(_SEGMENTS).to_bytes()
+
+    with pytest.raises(WordTimingsError):
+        WordTimings.from_bytes(binary[:-1])
+    with pytest.raises(WordTimingsError):
+        WordTimings.from_bytes(b"JSON" + binary[4:])
+    with pytest.raises(WordTimingsError):
+        WordTimings.from_json({"format": "sounds-right-word-timings", "version": 1})
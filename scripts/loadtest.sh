@@ -0,0 +1,26 @@
+#!/bin/sh
+set -eu
+
+# Run the end-to-end load test on the host machine.
+#
+# The API, its projector and mock workers run in this one process, with the
+# event bus and object store replaced by in-process stand-ins. Only Postgres is
+# real, and it must be reachable from the host: set LOADTEST_DATABASE_URL to a
+# migrated database (the dev compose file does not publish Postgres' port).
+# Runs register users and create rows, so do not point it at data you keep.
+#
+# Options are passed through, e.g. `./scripts/loadtest.sh --users 10,20,40`.
+
+SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"
+REPO_ROOT="$(cd "$SCRIPT_DIR/.." && pwd)"
+
+if [ -f "$REPO_ROOT/.env" ]; then
+  set -a
+  . "$REPO_ROOT/.env"
+  set +a
+fi
+
+export DATABASE_URL="${LOADTEST_DATABASE_URL:-${DATABASE_URL:?set LOADTEST_DATABASE_URL}}"
+
+cd "$REPO_ROOT/apps/loadtest"
+uv run python -m sounds_right_loadtest.main "$@"
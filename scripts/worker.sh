@@ -23,6 +23,8 @@ fi
 # Override docker-internal hostnames with the published host ports.
 export KAFKA_BOOTSTRAP_SERVERS="${KAFKA_BOOTSTRAP_SERVERS_HOST:-localhost:19092}"
 export MINIO_ENDPOINT="${MINIO_ENDPOINT_HOST:-localhost:9000}"
+# The container spool directory is usually not writable on the host.
+export WORKER_EVENT_SPOOL_PATH="${WORKER_EVENT_SPOOL_PATH_HOST:-$HOME/.local/state/sounds-right/event-spool.sqlite3}"
 
 cd "$REPO_ROOT/apps/worker"
 uv run python -m sounds_right_worker.main